@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script measures how long it takes to extract the text from 4 files,
+    using 1 and 2 worker processes.
+
+    Run it from the root of the repository:
+
+        python -m benchmarks.batch_extraction_benchmark
+"""
+import time
+
+from ptext.toolkit.batch.batch_extraction import BatchExtraction
+from tests.toolkit.batch.test_batch_extraction import TestBatchExtraction
+
+
+def main():
+    test_case = TestBatchExtraction()
+    test_case._build_input_files()
+    for number_of_workers in [1, 2]:
+        t0: float = time.time()
+        list(
+            BatchExtraction(number_of_workers=number_of_workers).extract(
+                [test_case.output_dir]
+            )
+        )
+        print(
+            "extracting text from 4 files using %d worker(s): %f s"
+            % (number_of_workers, time.time() - t0)
+        )
+
+
+if __name__ == "__main__":
+    main()
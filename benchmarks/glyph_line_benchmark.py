@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script measures how long it takes to decode a line of text,
+    looking up every byte through the Font, and through a GlyphLine (using the GlyphDecodeTable of the Font).
+
+    Run it from the root of the repository:
+
+        python -m benchmarks.glyph_line_benchmark
+"""
+import time
+from decimal import Decimal
+
+from ptext.pdf.canvas.font.glyph_line import GlyphLine
+from ptext.pdf.canvas.font.simple_font.font_type_1 import StandardType1Font
+
+
+def main():
+    n: int = 1000
+    font = StandardType1Font("Helvetica")
+    text: bytes = b"The quick brown fox jumps over the lazy dog"
+
+    # decode every glyph through the Font
+    t0: float = time.time()
+    for _ in range(0, n):
+        for b in text:
+            font.character_identifier_to_unicode(b)
+            font.get_width(b)
+    delta_font: float = time.time() - t0
+
+    # GlyphDecodeTable
+    t0 = time.time()
+    for _ in range(0, n):
+        GlyphLine(text, font, Decimal(12))
+    delta_glyph_line: float = time.time() - t0
+
+    print(
+        "decoding %d bytes, Font: %f ms, GlyphLine: %f ms"
+        % (len(text), delta_font * 1000 / n, delta_glyph_line * 1000 / n)
+    )
+
+
+if __name__ == "__main__":
+    main()
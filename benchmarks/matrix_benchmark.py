@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script compares how long it takes to calculate the geometry of a ChunkOfTextRenderEvent,
+    using float matrices (the default) and Decimal matrices (Matrix.EXACT).
+
+    Run it from the root of the repository:
+
+        python -m benchmarks.matrix_benchmark
+"""
+import time
+
+from ptext.io.read.types import String
+from ptext.pdf.canvas.event.chunk_of_text_render_event import ChunkOfTextRenderEvent
+from ptext.pdf.canvas.geometry.matrix import Matrix
+from tests.misc.matrix.test_matrix_benchmark import TestMatrixBenchmark
+
+
+def _benchmark_text_geometry(n: int) -> float:
+    # the geometry calculated for every ChunkOfTextRenderEvent
+    graphics_state = TestMatrixBenchmark()._build_graphics_state()
+    evt = ChunkOfTextRenderEvent(
+        graphics_state, String("The quick brown fox jumps over the lazy dog")
+    )
+    glyph_line = evt._glyph_line
+    t0: float = time.time()
+    for _ in range(0, n):
+        m = graphics_state.text_matrix.mul(graphics_state.ctm)
+        m[1][1] *= Matrix.to_number(graphics_state.font_size)
+        w = glyph_line._get_width_in_text_space()
+        m.cross(Matrix.to_number(0), Matrix.to_number(0), Matrix.to_number(1))
+        m.cross(w, Matrix.to_number(0.718), Matrix.to_number(1))
+    return time.time() - t0
+
+
+def main():
+    n: int = 5000
+    delta: float = _benchmark_text_geometry(n)
+    Matrix.EXACT = True
+    delta_exact: float = _benchmark_text_geometry(n)
+    Matrix.EXACT = False
+    print(
+        "text geometry, float: %f ms, Decimal: %f ms"
+        % (delta * 1000 / n, delta_exact * 1000 / n)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script measures how long it takes to measure a LayoutElement (the first time, and once it is memoized).
+
+    Run it from the root of the repository:
+
+        python -m benchmarks.measure_benchmark
+"""
+import time
+from decimal import Decimal
+
+from ptext.pdf.canvas.geometry.rectangle import Rectangle
+from tests.pdf.canvas.layout.test_measure import _build_elements
+
+
+def main():
+    box: Rectangle = Rectangle(Decimal(0), Decimal(0), Decimal(400), Decimal(800))
+    for e in _build_elements():
+        t0: float = time.time()
+        e.measure(box)
+        delta_first: float = time.time() - t0
+        t0 = time.time()
+        e.measure(box)
+        delta_second: float = time.time() - t0
+        print(
+            "measuring %s: %f ms, memoized: %f ms"
+            % (e.__class__.__name__, delta_first * 1000, delta_second * 1000)
+        )
+
+
+if __name__ == "__main__":
+    main()
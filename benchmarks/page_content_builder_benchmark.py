@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script measures how long it takes to lay out a Table (of 100, 200 and 400 cells) on a Page,
+    building the content stream of the Page in place.
+
+    Run it from the root of the repository:
+
+        python -m benchmarks.page_content_builder_benchmark
+"""
+import time
+from decimal import Decimal
+
+from ptext.pdf.canvas.geometry.rectangle import Rectangle
+from ptext.pdf.canvas.layout.table.fixed_column_width_table import (
+    FixedColumnWidthTable as Table,
+)
+from ptext.pdf.canvas.layout.text.paragraph import Paragraph
+from ptext.pdf.page.page import Page
+
+
+def main():
+    for number_of_rows in [20, 40, 80]:
+        page = Page()
+        t = Table(number_of_rows=number_of_rows, number_of_columns=5)
+        for i in range(0, number_of_rows * 5):
+            t.add(Paragraph("%d" % i, font_size=Decimal(4)))
+        t0: float = time.time()
+        t.layout(page, Rectangle(Decimal(0), Decimal(0), Decimal(595), Decimal(842)))
+        delta: float = time.time() - t0
+        print(
+            "laying out %d table cells: %f ms (%d bytes of content)"
+            % (
+                number_of_rows * 5,
+                delta * 1000,
+                len(page["Contents"]["DecodedBytes"]),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
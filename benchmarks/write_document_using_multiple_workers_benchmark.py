@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script measures how long it takes to write a Document (of 50 pages),
+    compressing its Stream objects using 1, 2 and 4 workers.
+    The output does not depend on the number of workers, this script checks that as well.
+
+    Run it from the root of the repository:
+
+        python -m benchmarks.write_document_using_multiple_workers_benchmark
+"""
+import time
+
+from tests.pdf.document.parallel_compression.test_write_document_using_multiple_workers import (
+    _build_document,
+    _to_comparable,
+    _write,
+)
+
+
+def main():
+    doc = _build_document(50)
+    expected_output: bytes = _to_comparable(_write(doc, number_of_workers=1))
+    for number_of_workers in [1, 2, 4]:
+        t0: float = time.time()
+        output: bytes = _write(doc, number_of_workers=number_of_workers)
+        print(
+            "writing 50 pages using %d worker(s): %f s"
+            % (number_of_workers, time.time() - t0)
+        )
+        assert _to_comparable(output) == expected_output
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This script measures how long it takes to write a Document with (many) indirect objects.
+    Writing should scale linearly with the number of objects
+    (object numbers are allocated, and duplicate objects are found, without going over all objects).
+
+    Run it from the root of the repository:
+
+        python -m benchmarks.write_xref_benchmark
+"""
+import io
+import time
+
+from ptext.pdf.pdf import PDF
+from tests.pdf.xref.test_write_xref_benchmark import (
+    build_document_with_filler_objects,
+)
+
+
+def main():
+    for number_of_objects in [2000, 10000, 20000]:
+        doc = build_document_with_filler_objects(number_of_objects)
+        out = io.BytesIO()
+        t0: float = time.time()
+        PDF.dumps(out, doc)
+        delta: float = time.time() - t0
+        print(
+            "writing %d objects: %f s (%f ms per object)"
+            % (number_of_objects, delta, delta * 1000 / number_of_objects)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,20 @@
 import argparse
 import datetime
 import json
+import sys
 import typing
 from argparse import RawTextHelpFormatter
 from decimal import Decimal
 from pathlib import Path
 
-from ptext.pdf.canvas.layout.page_layout import PageLayout, SingleColumnLayout
+from ptext.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from ptext.pdf.canvas.layout.page_layout.page_layout import PageLayout
 from ptext.pdf.canvas.layout.text.paragraph import Paragraph
 from ptext.pdf.document import Document
 from ptext.pdf.page.page import Page
 from ptext.pdf.pdf import PDF
+from ptext.toolkit.batch.batch_extraction import BatchExtraction
 from ptext.toolkit.image.simple_image_extraction import SimpleImageExtraction
-from ptext.toolkit.ocr.ocr_as_optional_content_group import \
-    OCRAsOptionalContentGroup
 from ptext.toolkit.text.regular_expression_text_extraction import \
     RegularExpressionTextExtraction
 from ptext.toolkit.text.simple_text_extraction import SimpleTextExtraction
@@ -39,6 +40,11 @@ def _ocr(input_file: Path, tesseract_data_dir: Path, output: typing.Optional[Pat
     :param output:              The output PDF
     :return:                    None
     """
+    # pytesseract (an optional dependency) is only needed for OCR
+    from ptext.toolkit.ocr.ocr_as_optional_content_group import (
+        OCRAsOptionalContentGroup,
+    )
+
     if output is None:
         output = _build_output_path(input_file)
     with open(input_file, "rb") as pdf_file_handle:
@@ -195,6 +201,48 @@ def _text_to_pdf(input_file: Path, output: typing.Optional[Path]):
         PDF.dumps(pdf_file_handle, pdf_doc)
 
 
+def _batch_extract(
+    inputs: typing.List[Path],
+    extraction: str,
+    pattern: typing.Optional[str],
+    number_of_workers: typing.Optional[int],
+    pages_per_task: int,
+    output: typing.Optional[Path],
+    output_dir: typing.Optional[Path],
+    timeout: typing.Optional[float] = None,
+):
+    """
+    This method performs extraction (text, images, regex, fonts) on many PDFs, using multiple processes
+    :param inputs:              The PDFs (or directories containing PDFs) to be read
+    :param extraction:          The kind of extraction (text, images, regex, fonts)
+    :param pattern:             The pattern to be used (regex)
+    :param number_of_workers:   The number of worker processes
+    :param pages_per_task:      The (maximum) number of pages processed in one task
+    :param output:              The output JSON lines file (one line per PDF), stdout if not specified
+    :param output_dir:          The output directory (images)
+    :param timeout:             The maximum time (in seconds) a worker process may spend on one task
+    :return:                    None
+    """
+    if output_dir is not None:
+        assert output_dir.exists() and output_dir.is_dir()
+    batch_extraction = BatchExtraction(
+        extraction=extraction,
+        regular_expression=pattern,
+        number_of_workers=number_of_workers,
+        pages_per_task=pages_per_task,
+        output_dir=output_dir,
+        timeout=timeout,
+    )
+    json_lines_file_handle = open(output, "w") if output is not None else sys.stdout
+    try:
+        for result in batch_extraction.extract(inputs):
+            json_lines_file_handle.write(json.dumps(result) + "\n")
+            json_lines_file_handle.flush()
+    finally:
+        if output is not None:
+            json_lines_file_handle.close()
+
+
 def _images_to_pdf(input: Path, output: typing.Optional[Path]):
     pass
 
@@ -207,6 +255,19 @@ def main():
     )
     command_sub_parser = parser.add_subparsers(dest="command", help="Command Name")
 
+    # batch extract
+    #fmt: off
+    batch_extract_arg_parser = command_sub_parser.add_parser('batch-extract')
+    batch_extract_arg_parser.add_argument('-i', help='input files or directories', nargs='+', default=None, required=True)
+    batch_extract_arg_parser.add_argument('-e', help='extraction', choices=BatchExtraction.EXTRACTIONS, default='text', required=False)
+    batch_extract_arg_parser.add_argument('-p', help='input regex', default=None, required=False)
+    batch_extract_arg_parser.add_argument('-w', help='number of worker processes', type=int, default=None, required=False)
+    batch_extract_arg_parser.add_argument('-n', help='pages per task', type=int, default=16, required=False)
+    batch_extract_arg_parser.add_argument('-o', help='output file (JSON lines)', default=None, required=False)
+    batch_extract_arg_parser.add_argument('-d', help='output directory (images)', default=None, required=False)
+    batch_extract_arg_parser.add_argument('-t', help='timeout (in seconds) per task', type=float, default=None, required=False)
+    #fmt: on
+
     # extract files
     #fmt: off
     extract_files_arg_parser = command_sub_parser.add_parser('extract-files')
@@ -270,7 +331,18 @@ def main():
     args = parser.parse_args()
 
     # execute command
-    if args.command == "extract-files":
+    if args.command == "batch-extract":
+        _batch_extract(
+            [Path(x) for x in args.i],
+            args.e,
+            args.p,
+            args.w,
+            args.n,
+            Path(args.o) if args.o else None,
+            Path(args.d) if args.d else None,
+            args.t,
+        )
+    elif args.command == "extract-files":
         _extract_files(Path(args.i), Path(args.o) if args.o else None)
     elif args.command == "extract-images":
         _extract_images(Path(args.i), Path(args.o) if args.o else None)
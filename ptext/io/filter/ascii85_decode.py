@@ -7,6 +7,13 @@ reproducing the original binary data.
 """
 
 import base64
+import re
+import typing
+
+from ptext.io.filter.incremental_decode import IncrementalDecode
+
+# complete groups (5 characters, or the special character z)
+_COMPLETE_GROUPS = re.compile(rb"(?:z|[!-u]{5})*")
 
 
 class ASCII85Decode:
@@ -50,3 +57,50 @@ class ASCII85Decode:
 
         # we should not be here
         raise exceptions_to_throw[0]
+
+
+class IncrementalASCII85Decode(IncrementalDecode):
+    """
+    This implementation of IncrementalDecode decodes data encoded in an ASCII base-85 representation,
+    one chunk at a time. Only complete groups (of 5 characters) are decoded,
+    the remainder of each chunk is held back until the next chunk arrives.
+    Whitespace is ignored, the (optional) prefix <~ is skipped, and decoding stops at the EOD marker ~>
+    """
+
+    def __init__(self):
+        self._pending: bytes = b""
+        self._has_seen_prefix: bool = False
+        self._has_seen_eod: bool = False
+
+    def decode(
+        self, bytes_in: typing.Union[bytes, memoryview], final: bool = False
+    ) -> bytes:
+        """
+        This function decodes the next chunk of ASCII base-85 encoded bytes
+        """
+        if self._has_seen_eod:
+            return b""
+        bts: bytes = self._pending + bytes(bytes_in).translate(
+            None, b"\x00\t\n\x0c\r "
+        )
+
+        # prefix
+        if not self._has_seen_prefix:
+            if len(bts) < 2 and not final:
+                self._pending = bts
+                return b""
+            if bts.startswith(b"<~"):
+                bts = bts[2:]
+            self._has_seen_prefix = True
+
+        # EOD
+        eod_index: int = bts.find(b"~>")
+        if eod_index >= 0:
+            bts = bts[0:eod_index]
+            self._has_seen_eod = True
+            final = True
+
+        # hold back incomplete group
+        n: int = len(bts) if final else _COMPLETE_GROUPS.match(bts).end()  # type: ignore [union-attr]
+        self._pending = bts[n:]
+        return base64.a85decode(bts[0:n])
@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This class represents a single (incremental) stage in a filter pipeline.
+"""
+import typing
+
+
+class IncrementalDecode:
+    """
+    This class represents a single (incremental) stage in a filter pipeline.
+    Rather than decoding all bytes at once, an IncrementalDecode consumes chunks of (encoded) bytes
+    and produces chunks of (decoded) bytes, keeping whatever state it needs in between chunks.
+    Stages can be chained, the output of one stage being the input of the next.
+    """
+
+    def decode(
+        self, bytes_in: typing.Union[bytes, memoryview], final: bool = False
+    ) -> bytes:
+        """
+        This function decodes the next chunk of bytes, returning whatever (decoded) bytes are available.
+        Set final to True for the last chunk (this flushes any bytes that are still being held back).
+        """
+        raise NotImplementedError()
+
+    def iter_decode(
+        self, bytes_in: typing.Union[bytes, memoryview], final: bool = False
+    ) -> typing.Iterator[bytes]:
+        """
+        This function decodes the next chunk of bytes, yielding the (decoded) bytes in one or more chunks.
+        Implementations whose output can be many times larger than their input (e.g. zlib/deflate)
+        override this function to yield their output in bounded chunks.
+        """
+        bytes_out: bytes = self.decode(bytes_in, final)
+        if len(bytes_out) > 0:
+            yield bytes_out
@@ -6,7 +6,10 @@ Decompresses data encoded using the LZW (Lempel-Ziv-Welch)
 adaptive compression method, reproducing the original
 text or binary data.
 """
-import copy
+import typing
+
+from ptext.io.filter.incremental_decode import IncrementalDecode
+from ptext.io.filter.predictor_decode import IncrementalPredictorDecode
 
 
 class LZWDecode:
@@ -17,44 +20,177 @@ class LZWDecode:
     """
 
     @staticmethod
-    def decode(bytes_in: bytes) -> bytes:
+    def decode(
+        bytes_in: bytes,
+        predictor: int = 1,
+        bits_per_component: int = 8,
+        columns: int = 1,
+        colors: int = 1,
+        early_change: int = 1,
+    ) -> bytes:
         """
         Decompresses data encoded using the LZW (Lempel-Ziv-
         Welch) adaptive compression method
         """
+        return IncrementalLZWDecode(
+            predictor=predictor,
+            bits_per_component=bits_per_component,
+            columns=columns,
+            colors=colors,
+            early_change=early_change,
+        ).decode(bytes_in, final=True)
+
+
+class IncrementalLZWDecode(IncrementalDecode):
+    """
+    This implementation of IncrementalDecode decompresses data encoded using the LZW (Lempel-Ziv-
+    Welch) adaptive compression method, one chunk at a time.
+
+    The encoded data is read as a sequence of codes, 9 to 12 bits wide (high-order bit first).
+    Code 256 clears the table (resetting the code width to 9), code 257 denotes EOD.
+    Codes are 9 bits wide until the table holds 512 entries (or 511, if EarlyChange is 1),
+    then 10 bits until 1024 (1023) entries, and so on.
+
+    Every table entry (but the first 256) is an earlier entry followed by a single byte.
+    Each table entry is kept as a (prefix code, last byte) pair, and unwound (last byte first)
+    whenever it is written out. The memory used by the table is therefore bounded by
+    its size (MAX_TABLE_SIZE entries), no matter how long its entries get.
+    """
+
+    CLEAR_TABLE: int = 256
+    EOD: int = 257
+    MAX_TABLE_SIZE: int = 4096
+
+    def __init__(
+        self,
+        predictor: int = 1,
+        bits_per_component: int = 8,
+        columns: int = 1,
+        colors: int = 1,
+        early_change: int = 1,
+    ):
+        assert early_change in [
+            0,
+            1,
+        ], "Illegal argument exception. early_change must be in [0, 1]."
+        self._early_change: int = early_change
+        self._predictor_decode: IncrementalPredictorDecode = IncrementalPredictorDecode(
+            predictor=predictor,
+            colors=colors,
+            bits_per_component=bits_per_component,
+            columns=columns,
+        )
+
+        # bit reader
+        self._bit_buffer: int = 0
+        self._bit_count: int = 0
+        self._has_seen_eod: bool = False
+
+        # table (codes 256 and 257 are never looked up)
+        # entry i (i >= 258) is entry _prefix[i] followed by byte _suffix[i],
+        # _first[i] and _length[i] are the first byte and the length of entry i
+        size: int = IncrementalLZWDecode.MAX_TABLE_SIZE
+        self._prefix: typing.List[int] = [0] * size
+        self._suffix: bytearray = bytearray(size)
+        self._first: bytearray = bytearray(size)
+        self._first[0:256] = bytes(range(0, 256))
+        self._length: typing.List[int] = [1] * size
+        self._clear_table()
+
+    def _clear_table(self) -> None:
+        self._next_code: int = 258
+        self._code_width: int = 9
+        self._previous: typing.Optional[int] = None
+
+    def decode(
+        self, bytes_in: typing.Union[bytes, memoryview], final: bool = False
+    ) -> bytes:
+        """
+        This function decompresses the next chunk of LZW compressed bytes
+        """
+        if self._has_seen_eod:
+            return self._predictor_decode.decode(b"", final=final)
+
+        # local copies (for speed)
+        bit_buffer: int = self._bit_buffer
+        bit_count: int = self._bit_count
+        code_width: int = self._code_width
+        code_mask: int = (1 << code_width) - 1
+        prefix: typing.List[int] = self._prefix
+        suffix: bytearray = self._suffix
+        first: bytearray = self._first
+        length: typing.List[int] = self._length
+        next_code: int = self._next_code
+        previous: typing.Optional[int] = self._previous
+        early_change: int = self._early_change
+        bytes_out: bytearray = bytearray()
+
+        # codes are at least 9 bits wide, so every byte completes at most one code
+        for b in bytes(bytes_in):
+            bit_buffer = ((bit_buffer << 8) | b) & 0xFFFFF
+            bit_count += 8
+            if bit_count < code_width:
+                continue
+            bit_count -= code_width
+            code: int = (bit_buffer >> bit_count) & code_mask
+
+            # clear table
+            if code == IncrementalLZWDecode.CLEAR_TABLE:
+                self._clear_table()
+                next_code = self._next_code
+                code_width = self._code_width
+                code_mask = (1 << code_width) - 1
+                previous = None
+                continue
+
+            # EOD
+            if code == IncrementalLZWDecode.EOD:
+                self._has_seen_eod = True
+                break
+
+            # known entry (or literal byte)
+            if code < next_code:
+                first_byte: int = first[code]
+
+            # the entry that is about to be added (previous entry + its own first byte)
+            elif code == next_code and previous is not None:
+                first_byte = first[previous]
 
-        # trivial case
-        if len(bytes_in) == 0:
-            return bytes_in
-
-        # Build the dictionary.
-        dict_size = 256
-        dictionary = {i: bytearray() for i in range(dict_size)}
-        for k, v in dictionary.items():
-            v.append(k)
-
-        # use bytearray, otherwise this becomes O(N^2)
-        # due to concatenation in a loop
-        bytes_out = bytearray()
-        w = bytearray()
-        w.append(bytes_in[0])
-        bytes_out.append(bytes_in[0])
-
-        for i in range(1, len(bytes_in)):
-            k = bytes_in[i]
-            if k in dictionary:
-                entry = dictionary[k]
-            elif k == dict_size:
-                entry = copy.deepcopy(w)
-                entry.append(w[0])
             else:
                 assert False, "Unexpected error while performing LZW decode."
-            bytes_out.extend(entry)
 
-            # Add w+entry[0] to the dictionary.
-            dictionary[dict_size] = copy.deepcopy(w)
-            dictionary[dict_size].append(entry[0])
-            dict_size += 1
+            # add (previous entry + first byte of this entry) to the table
+            if (
+                previous is not None
+                and next_code < IncrementalLZWDecode.MAX_TABLE_SIZE
+            ):
+                prefix[next_code] = previous
+                suffix[next_code] = first_byte
+                first[next_code] = first[previous]
+                length[next_code] = length[previous] + 1
+                next_code += 1
+                if next_code + early_change >= (1 << code_width) and code_width < 12:
+                    code_width += 1
+                    code_mask = (1 << code_width) - 1
+
+            # write out the entry, unwinding it from its last byte to its first
+            i: int = len(bytes_out) + length[code]
+            bytes_out.extend(bytes(length[code]))
+            c: int = code
+            while c >= 258:
+                i -= 1
+                bytes_out[i] = suffix[c]
+                c = prefix[c]
+            bytes_out[i - 1] = c
+
+            previous = code
+
+        # store state
+        self._bit_buffer = bit_buffer
+        self._bit_count = bit_count
+        self._code_width = code_width
+        self._next_code = next_code
+        self._previous = previous
 
-            w = entry
-        return bytes(bytes_out)
+        # return whatever was written out in this chunk
+        return self._predictor_decode.decode(bytes(bytes_out), final=final)
@@ -0,0 +1,326 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+LZW and Flate encoding compress more compactly if their input data is highly predictable. One way of
+increasing the predictability of many continuous-tone sampled images is to replace each sample with the
+difference between that sample and a predictor function applied to earlier neighboring samples.
+This module undoes such a predictor function (TIFF Predictor 2, or the PNG predictors 10-15).
+"""
+import array
+import sys
+import typing
+from itertools import accumulate, chain
+from operator import add
+
+from ptext.io.filter.incremental_decode import IncrementalDecode
+
+
+class PredictorDecode:
+    """
+    LZW and Flate encoding compress more compactly if their input data is highly predictable. One way of
+    increasing the predictability of many continuous-tone sampled images is to replace each sample with the
+    difference between that sample and a predictor function applied to earlier neighboring samples.
+    PDF supports two groups of Predictor functions. The first, the TIFF group, consists of the single function that is
+    Predictor 2 in the TIFF 6.0 specification. The second, the PNG group, consists of the filters (None, Sub, Up,
+    Average, Paeth) specified in the PNG specification, each row of data being preceded by its filter type.
+
+    Rather than processing one byte at a time, whole rows are processed at once (where the predictor allows it).
+    """
+
+    @staticmethod
+    def decode(
+        bytes_in: bytes,
+        predictor: int = 1,
+        colors: int = 1,
+        bits_per_component: int = 8,
+        columns: int = 1,
+    ) -> bytes:
+        """
+        This function undoes the given predictor function
+        """
+        PredictorDecode._check_arguments(predictor, colors, bits_per_component)
+
+        # no prediction
+        if predictor == 1:
+            return bytes_in
+
+        # TIFF
+        if predictor == 2:
+            return PredictorDecode._decode_tiff(
+                bytes_in, colors, bits_per_component, columns
+            )
+
+        # PNG
+        return PredictorDecode._decode_png(bytes_in, colors, bits_per_component, columns)
+
+    @staticmethod
+    def _check_arguments(predictor: int, colors: int, bits_per_component: int) -> None:
+
+        # check \Predictor
+        assert predictor in [
+            1,
+            2,
+            10,
+            11,
+            12,
+            13,
+            14,
+            15,
+        ], "Illegal argument exception. predictor must be in [1, 2, 10, 11, 12, 13, 14, 15]."
+
+        # check \BitsPerComponent
+        assert bits_per_component in [
+            1,
+            2,
+            4,
+            8,
+            16,
+        ], "Illegal argument exception. bits_per_component must be in [1, 2, 4, 8, 16]."
+
+        # check \Colors
+        assert colors >= 1, "Illegal argument exception. colors must be >= 1."
+
+    #
+    # TIFF
+    #
+
+    @staticmethod
+    def _decode_tiff(
+        bytes_in: bytes, colors: int, bits_per_component: int, columns: int
+    ) -> bytes:
+        bytes_per_row: int = (colors * bits_per_component * columns + 7) // 8
+        number_of_rows: int = len(bytes_in) // bytes_per_row
+        bytes_out: bytearray = bytearray(bytes_in)
+        for row in range(0, number_of_rows):
+            row_start_index: int = row * bytes_per_row
+            row_end_index: int = row_start_index + bytes_per_row
+            current_row = bytes_in[row_start_index:row_end_index]
+            if bits_per_component == 8:
+                bytes_out[
+                    row_start_index:row_end_index
+                ] = PredictorDecode._accumulate_components(current_row, colors, 0xFF)
+            elif bits_per_component == 16:
+                bytes_out[
+                    row_start_index:row_end_index
+                ] = PredictorDecode._decode_tiff_row_16(current_row, colors)
+            else:
+                bytes_out[
+                    row_start_index:row_end_index
+                ] = PredictorDecode._decode_tiff_row_packed(
+                    current_row, colors, bits_per_component, columns
+                )
+        return bytes(bytes_out)
+
+    @staticmethod
+    def _accumulate_components(
+        components: typing.Sequence[int], colors: int, mask: int
+    ) -> typing.List[int]:
+        # each color component is the (running) sum of its differences (modulo 2^bits_per_component)
+        if colors == 1:
+            return list(map(mask.__and__, accumulate(components)))
+        out: typing.List[int] = list(components)
+        for i in range(0, colors):
+            out[i::colors] = map(mask.__and__, accumulate(components[i::colors]))
+        return out
+
+    @staticmethod
+    def _decode_tiff_row_16(current_row: bytes, colors: int) -> bytes:
+        # 16-bit components are stored high-order byte first
+        components = array.array("H", current_row)
+        if sys.byteorder == "little":
+            components.byteswap()
+        components = array.array(
+            "H", PredictorDecode._accumulate_components(components, colors, 0xFFFF)
+        )
+        if sys.byteorder == "little":
+            components.byteswap()
+        return components.tobytes()
+
+    @staticmethod
+    def _decode_tiff_row_packed(
+        current_row: bytes, colors: int, bits_per_component: int, columns: int
+    ) -> bytes:
+        # unpack (1, 2 or 4 bit) components
+        mask: int = (1 << bits_per_component) - 1
+        shifts: typing.List[int] = list(range(8 - bits_per_component, -1, -bits_per_component))
+        number_of_components: int = colors * columns
+        components = list(
+            chain.from_iterable([(b >> s) & mask for s in shifts] for b in current_row)
+        )[0:number_of_components]
+
+        # accumulate
+        components = PredictorDecode._accumulate_components(components, colors, mask)
+
+        # pack components (padding the last byte)
+        components_per_byte: int = len(shifts)
+        components += [0] * (-len(components) % components_per_byte)
+        bytes_out: bytearray = bytearray()
+        for i in range(0, len(components), components_per_byte):
+            b: int = 0
+            for c in components[i : i + components_per_byte]:
+                b = (b << bits_per_component) | c
+            bytes_out.append(b)
+        return bytes(bytes_out)
+
+    #
+    # PNG
+    #
+
+    @staticmethod
+    def _decode_png(
+        bytes_in: bytes,
+        colors: int,
+        bits_per_component: int,
+        columns: int,
+        prior_row: typing.Optional[bytes] = None,
+    ) -> bytes:
+        # PNG filters operate on bytes, comparing each byte to the corresponding byte of the previous pixel
+        bytes_per_row: int = (colors * bits_per_component * columns + 7) // 8
+        bytes_per_pixel: int = max(1, (colors * bits_per_component + 7) // 8)
+
+        bytes_out: bytearray = bytearray()
+        if prior_row is None:
+            prior_row = bytes(bytes_per_row)
+        pos: int = 0
+        while pos + bytes_per_row <= len(bytes_in):
+
+            # Read the filter type byte and a row of data
+            filter_type: int = bytes_in[pos]
+            current_row: bytes = bytes_in[pos + 1 : pos + 1 + bytes_per_row]
+            pos += 1 + bytes_per_row
+            if len(current_row) < bytes_per_row:
+                prior_row = prior_row[0 : len(current_row)]
+
+            # PNG_FILTER_SUB
+            # Predicts the same as the sample to the left
+            if filter_type == 1:
+                current_row = bytes(
+                    PredictorDecode._accumulate_components(
+                        current_row, bytes_per_pixel, 0xFF
+                    )
+                )
+
+            # PNG_FILTER_UP
+            # Predicts the same as the sample above
+            elif filter_type == 2:
+                current_row = bytes(map((0xFF).__and__, map(add, current_row, prior_row)))
+
+            # PNG_FILTER_AVERAGE
+            # Predicts the average of the sample to the left and the
+            # sample above
+            elif filter_type == 3:
+                current_row = PredictorDecode._decode_png_row_average(
+                    current_row, prior_row, bytes_per_pixel
+                )
+
+            # PNG_FILTER_PAETH
+            elif filter_type == 4:
+                current_row = PredictorDecode._decode_png_row_paeth(
+                    current_row, prior_row, bytes_per_pixel
+                )
+
+            # write current row
+            bytes_out += current_row
+            prior_row = current_row
+
+        # return
+        return bytes(bytes_out)
+
+    @staticmethod
+    def _decode_png_row_average(
+        current_row: bytes, prior_row: bytes, bytes_per_pixel: int
+    ) -> bytes:
+        out: bytearray = bytearray(current_row)
+        for i in range(0, min(bytes_per_pixel, len(out))):
+            out[i] = (out[i] + (prior_row[i] >> 1)) & 0xFF
+        for i in range(bytes_per_pixel, len(out)):
+            out[i] = (out[i] + ((out[i - bytes_per_pixel] + prior_row[i]) >> 1)) & 0xFF
+        return bytes(out)
+
+    @staticmethod
+    def _decode_png_row_paeth(
+        current_row: bytes, prior_row: bytes, bytes_per_pixel: int
+    ) -> bytes:
+        # the first row (or a row following a row of zeroes) reduces to PNG_FILTER_SUB
+        if not any(prior_row):
+            return bytes(
+                PredictorDecode._accumulate_components(
+                    current_row, bytes_per_pixel, 0xFF
+                )
+            )
+        out: bytearray = bytearray(map((0xFF).__and__, map(add, current_row, prior_row)))
+        for i in range(bytes_per_pixel, len(out)):
+            a: int = out[i - bytes_per_pixel]
+            b: int = prior_row[i]
+            c: int = prior_row[i - bytes_per_pixel]
+            # p = a + b - c, pa = |p - a|, pb = |p - b|, pc = |p - c|
+            pa: int = abs(b - c)
+            pb: int = abs(a - c)
+            pc: int = abs(a + b - c - c)
+            if pa <= pb and pa <= pc:
+                out[i] = (current_row[i] + a) & 0xFF
+            elif pb <= pc:
+                out[i] = (current_row[i] + b) & 0xFF
+            else:
+                out[i] = (current_row[i] + c) & 0xFF
+        return bytes(out)
+
+
+class IncrementalPredictorDecode(IncrementalDecode):
+    """
+    This implementation of IncrementalDecode undoes a predictor function, one chunk at a time.
+    Only complete rows are decoded, the remainder of each chunk is held back until the next chunk arrives.
+    The last decoded row is kept, since the PNG predictors refer to the row above.
+    """
+
+    def __init__(
+        self,
+        predictor: int = 1,
+        colors: int = 1,
+        bits_per_component: int = 8,
+        columns: int = 1,
+    ):
+        PredictorDecode._check_arguments(predictor, colors, bits_per_component)
+        self._predictor: int = predictor
+        self._colors: int = colors
+        self._bits_per_component: int = bits_per_component
+        self._columns: int = columns
+        self._bytes_per_row: int = (colors * bits_per_component * columns + 7) // 8
+        # PNG rows are preceded by their filter type
+        self._bytes_per_encoded_row: int = self._bytes_per_row + (
+            1 if predictor >= 10 else 0
+        )
+        self._prior_row: typing.Optional[bytes] = None
+        self._pending: bytes = b""
+
+    def decode(
+        self, bytes_in: typing.Union[bytes, memoryview], final: bool = False
+    ) -> bytes:
+        """
+        This function undoes the predictor function for all complete rows received so far
+        """
+        if self._predictor == 1:
+            return bytes(bytes_in)
+
+        # hold back incomplete row(s)
+        bts: bytes = self._pending + bytes(bytes_in)
+        n: int = len(bts)
+        if not final:
+            n -= n % self._bytes_per_encoded_row
+        self._pending = bts[n:]
+        bts = bts[0:n]
+
+        # TIFF
+        if self._predictor == 2:
+            return PredictorDecode._decode_tiff(
+                bts, self._colors, self._bits_per_component, self._columns
+            )
+
+        # PNG
+        bytes_out: bytes = PredictorDecode._decode_png(
+            bts, self._colors, self._bits_per_component, self._columns, self._prior_row
+        )
+        if len(bytes_out) >= self._bytes_per_row:
+            self._prior_row = bytes_out[len(bytes_out) - self._bytes_per_row :]
+        return bytes_out
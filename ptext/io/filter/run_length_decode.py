@@ -7,6 +7,9 @@ encoding algorithm, reproducing the original text or binary data
 (typically monochrome image data, or any data that contains
 frequent long runs of a single byte value).
 """
+import typing
+
+from ptext.io.filter.incremental_decode import IncrementalDecode
 
 
 class RunLengthDecode:
@@ -23,16 +26,59 @@ class RunLengthDecode:
         Decompresses data encoded using a byte-oriented run-length
         encoding algorithm
         """
+        return IncrementalRunLengthDecode().decode(bytes_in, final=True)
+
 
-        # trivial case
-        if len(bytes_in) == 0:
-            return bytes_in
+class IncrementalRunLengthDecode(IncrementalDecode):
+    """
+    This implementation of IncrementalDecode decompresses data encoded using a byte-oriented run-length
+    encoding algorithm, one chunk at a time.
+    The encoded data is a sequence of runs, where each run consists of a length byte followed by 1 to 128 bytes of data.
+    If the length byte is in the range 0 to 127, the following length + 1 bytes are copied literally.
+    If length is in the range 129 to 255, the following single byte is copied 257 - length times.
+    A length value of 128 denotes EOD.
+    An incomplete run at the end of a chunk is held back until the next chunk arrives.
+    """
 
+    def __init__(self):
+        self._pending: bytes = b""
+        self._has_seen_eod: bool = False
+
+    def decode(
+        self, bytes_in: typing.Union[bytes, memoryview], final: bool = False
+    ) -> bytes:
+        """
+        This function decompresses the next chunk of run-length encoded bytes
+        """
+        if self._has_seen_eod:
+            return b""
+        bts: bytes = self._pending + bytes(bytes_in)
         bytes_out = bytearray()
-        for i in range(0, len(bytes_in), 2):
-            b = bytes_in[i]
-            n = bytes_in[i + 1]
-            for j in range(0, n):
-                bytes_out.append(b)
+        pos: int = 0
+        n: int = len(bts)
+        while pos < n:
+            length: int = bts[pos]
+            # EOD
+            if length == 128:
+                self._has_seen_eod = True
+                pos = n
+                break
+            # literal run
+            if length < 128:
+                if pos + 1 + length + 1 > n:
+                    break
+                bytes_out += bts[pos + 1 : pos + 2 + length]
+                pos += 2 + length
+                continue
+            # repeated byte
+            if pos + 2 > n:
+                break
+            bytes_out += bts[pos + 1 : pos + 2] * (257 - length)
+            pos += 2
 
+        # a truncated run at the end of the data is decoded as far as possible
+        if final and pos < n:
+            bytes_out += bts[pos + 1 : n]
+            pos = n
+        self._pending = bts[pos:]
         return bytes(bytes_out)
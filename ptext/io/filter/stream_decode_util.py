@@ -7,17 +7,21 @@ of its stream dictionary
 """
 import typing
 
-from ptext.io.filter.ascii85_decode import ASCII85Decode
-from ptext.io.filter.flate_decode import FlateDecode
-from ptext.io.filter.lzw_decode import LZWDecode
-from ptext.io.filter.run_length_decode import RunLengthDecode
+from ptext.io.filter.ascii85_decode import IncrementalASCII85Decode
+from ptext.io.filter.flate_decode import IncrementalFlateDecode
+from ptext.io.filter.incremental_decode import IncrementalDecode
+from ptext.io.filter.lzw_decode import IncrementalLZWDecode
+from ptext.io.filter.run_length_decode import IncrementalRunLengthDecode
 from ptext.io.read.types import Decimal, Dictionary, List, Name, Stream
 
+# number of (encoded) bytes fed to the filter pipeline at once
+DEFAULT_CHUNK_SIZE: int = 65536
 
-def decode_stream(s: Stream) -> Stream:
+
+def _get_filter_pipeline(s: Stream) -> typing.List[IncrementalDecode]:
     """
-    This function decodes a Stream, applying the filters specified in the Filter entry
-    of its stream dictionary
+    This function builds the (incremental) filter pipeline,
+    as specified by the Filter and DecodeParms entries of the stream dictionary
     """
     assert isinstance(s, Stream), "decode_stream only works on Stream objects"
     assert (
@@ -44,41 +48,129 @@ def decode_stream(s: Stream) -> Stream:
     else:
         decode_params = [Dictionary() for x in range(0, len(filters))]
 
-    # apply filter(s)
-    transformed_bytes = s["Bytes"]
+    # build stage(s)
+    pipeline: typing.List[IncrementalDecode] = []
     for filter_index, filter_name in enumerate(filters):
+
         # FLATE
         if filter_name in ["FlateDecode", "Fl"]:
-            transformed_bytes = FlateDecode.decode(
-                bytes_in=transformed_bytes,
-                columns=int(decode_params[filter_index].get("Columns", Decimal(1))),
-                predictor=int(decode_params[filter_index].get("Predictor", Decimal(1))),
-                bits_per_component=int(
-                    decode_params[filter_index].get("BitsPerComponent", Decimal(8))
-                ),
+            pipeline.append(
+                IncrementalFlateDecode(
+                    columns=int(decode_params[filter_index].get("Columns", Decimal(1))),
+                    predictor=int(
+                        decode_params[filter_index].get("Predictor", Decimal(1))
+                    ),
+                    bits_per_component=int(
+                        decode_params[filter_index].get("BitsPerComponent", Decimal(8))
+                    ),
+                    colors=int(decode_params[filter_index].get("Colors", Decimal(1))),
+                )
             )
             continue
 
         # ASCII85
         if filter_name in ["ASCII85Decode"]:
-            transformed_bytes = ASCII85Decode.decode(transformed_bytes)
+            pipeline.append(IncrementalASCII85Decode())
             continue
 
         # LZW
         if filter_name in ["LZWDecode"]:
-            transformed_bytes = LZWDecode.decode(transformed_bytes)
+            pipeline.append(
+                IncrementalLZWDecode(
+                    columns=int(decode_params[filter_index].get("Columns", Decimal(1))),
+                    predictor=int(
+                        decode_params[filter_index].get("Predictor", Decimal(1))
+                    ),
+                    bits_per_component=int(
+                        decode_params[filter_index].get("BitsPerComponent", Decimal(8))
+                    ),
+                    colors=int(decode_params[filter_index].get("Colors", Decimal(1))),
+                    early_change=int(
+                        decode_params[filter_index].get("EarlyChange", Decimal(1))
+                    ),
+                )
+            )
             continue
 
         # RunLengthDecode
         if filter_name in ["RunLengthDecode"]:
-            transformed_bytes = RunLengthDecode.decode(transformed_bytes)
+            pipeline.append(IncrementalRunLengthDecode())
             continue
 
         # unknown filter
         assert False, "Unknown /Filter %s" % filter_name
 
-    # set DecodedBytes
-    s[Name("DecodedBytes")] = transformed_bytes
+    # return
+    return pipeline
+
+
+def iter_decode_stream(
+    s: Stream, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> typing.Iterator[bytes]:
+    """
+    This function decodes a Stream, applying the filters specified in the Filter entry
+    of its stream dictionary. Rather than returning all decoded bytes at once, it yields them in chunks.
+    The (encoded) bytes are fed through the filter pipeline chunk_size bytes at a time,
+    so that neither the decoded bytes, nor any intermediate result, need to be held in memory in their entirety.
+    The Stream itself is not modified (DecodedBytes is not set).
+    """
+    assert chunk_size > 0, "chunk_size must be > 0"
+    pipeline: typing.List[IncrementalDecode] = _get_filter_pipeline(s)
+
+    # Bytes may be a (zero-copy) memoryview, slicing it does not copy
+    bytes_in: memoryview = memoryview(s["Bytes"])
+    for i in range(0, len(bytes_in), chunk_size):
+        yield from _iter_filter_pipeline(pipeline, 0, bytes_in[i : i + chunk_size])
+
+    # flush every stage (in order)
+    yield from _iter_filter_pipeline(pipeline, 0, b"", final=True)
+
+
+def _iter_filter_pipeline(
+    pipeline: typing.List[IncrementalDecode],
+    stage_index: int,
+    bytes_in: typing.Union[bytes, memoryview],
+    final: bool = False,
+) -> typing.Iterator[bytes]:
+    # end of the pipeline
+    if stage_index == len(pipeline):
+        if len(bytes_in) > 0:
+            yield bytes(bytes_in)
+        return
+    # feed every chunk this stage produces to the next stage
+    for chunk in pipeline[stage_index].iter_decode(bytes_in, final=final):
+        yield from _iter_filter_pipeline(pipeline, stage_index + 1, chunk)
+    if final:
+        yield from _iter_filter_pipeline(pipeline, stage_index + 1, b"", final=True)
+
+
+def decode_stream_to(
+    s: Stream, sink: typing.IO[bytes], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """
+    This function decodes a Stream, applying the filters specified in the Filter entry
+    of its stream dictionary, and writes the decoded bytes to the given sink (any object with a write method).
+    The Stream itself is not modified (DecodedBytes is not set).
+    This function returns the number of (decoded) bytes written.
+    """
+    number_of_bytes_written: int = 0
+    for chunk in iter_decode_stream(s, chunk_size):
+        sink.write(chunk)
+        number_of_bytes_written += len(chunk)
+    return number_of_bytes_written
+
+
+def decode_stream(s: Stream) -> Stream:
+    """
+    This function decodes a Stream, applying the filters specified in the Filter entry
+    of its stream dictionary. The decoded bytes are kept (as a cache) in the DecodedBytes entry.
+    Use iter_decode_stream or decode_stream_to to decode a Stream without keeping its decoded bytes in memory.
+    """
+    s[Name("DecodedBytes")] = b"".join(iter_decode_stream(s))
+
+    # keep track of the decoded bytes (as they were decoded),
+    # a Stream whose DecodedBytes were not replaced can be written using its (original) Bytes
+    setattr(s, "_decoded_bytes", s["DecodedBytes"])
 
     # set Type if not yet set
     # if "Type" not in s:
@@ -71,6 +71,11 @@ class FunctionDictionaryTransformer(ReadBaseTransformer):
             transformed_object[Name("DecodedBytes")] = object_to_transform[
                 "DecodedBytes"
             ]
+            setattr(
+                transformed_object,
+                "_decoded_bytes",
+                vars(object_to_transform).get("_decoded_bytes", None),
+            )
 
         # add listener(s)
         for l in event_listeners:
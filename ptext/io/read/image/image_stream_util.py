@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+These functions keep track of the Stream an Image was read from,
+so that an Image that was not modified (since it was read) can be written using its original (encoded) bytes
+"""
+import typing
+import zlib
+
+from PIL import Image  # type: ignore [import]
+
+from ptext.io.read.types import Stream
+
+
+def get_image_fingerprint(image: Image.Image) -> typing.Optional[typing.Tuple]:
+    """
+    This function returns a fingerprint (mode, size and checksum of the pixels) of an Image
+    """
+    try:
+        return image.mode, image.size, zlib.crc32(image.tobytes())
+    except Exception:
+        return None
+
+
+def set_image_stream(image: Image.Image, stream: Stream) -> Image.Image:
+    """
+    This function keeps track of the Stream the given Image was read from.
+    The fingerprint of the Image is only computed when its pixels are first accessed
+    (PIL calls Image.load before reading or modifying pixels),
+    Images whose pixels are never accessed are never checksummed.
+    """
+    setattr(image, "_stream", stream)
+    setattr(image, "_stream_fingerprint", None)
+
+    def _load_and_set_fingerprint(*args, **kwargs):
+        # restore Image.load, then fingerprint the pixels (before they are modified)
+        delattr(image, "load")
+        pixel_access = image.load(*args, **kwargs)
+        setattr(image, "_stream_fingerprint", get_image_fingerprint(image))
+        return pixel_access
+
+    setattr(image, "load", _load_and_set_fingerprint)
+    return image
+
+
+def get_unmodified_image_stream(image: Image.Image) -> typing.Optional[Stream]:
+    """
+    This function returns the Stream the given Image was read from,
+    or None if the Image was not read from a Stream, or if it was modified since it was read
+    """
+    stream: typing.Optional[Stream] = vars(image).get("_stream", None)
+    if stream is None or "Bytes" not in stream:
+        return None
+    # the pixels were never accessed (since the Image was read)
+    if "load" in vars(image):
+        return stream
+    fingerprint: typing.Optional[typing.Tuple] = vars(image).get(
+        "_stream_fingerprint", None
+    )
+    if fingerprint is None or fingerprint != get_image_fingerprint(image):
+        return None
+    return stream
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This module contains a (read-only) io source that is backed by a memory-mapped file.
+It allows the tokenizer (and the stream filters) to work on zero-copy memoryview slices of the file.
+"""
+import io
+import mmap
+import typing
+from pathlib import Path
+
+
+class MemoryMappedFile(io.RawIOBase):
+    """
+    This class represents a (read-only) io source that is backed by a memory-mapped file.
+    Rather than copying bytes out of the file (with a syscall for every seek/read),
+    the bytes of the file are mapped into memory, and handed out as memoryview slices.
+    A base offset can be specified, the io source then behaves as if the file starts at that offset.
+    """
+
+    def __init__(
+        self,
+        file_or_mmap: typing.Union[str, Path, mmap.mmap],
+        base_offset: int = 0,
+    ):
+        super(MemoryMappedFile, self).__init__()
+        if isinstance(file_or_mmap, mmap.mmap):
+            self._mmap: mmap.mmap = file_or_mmap
+        else:
+            with open(file_or_mmap, "rb") as file_handle:
+                self._mmap = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+        assert base_offset >= 0
+        self._base_offset: int = base_offset
+        self._view: memoryview = memoryview(self._mmap)[base_offset:]
+        self._pos: int = 0
+
+    def get_base_offset(self) -> int:
+        """
+        This function returns the base offset of this MemoryMappedFile,
+        (byte) offset 0 of this MemoryMappedFile corresponds to this (byte) offset in the underlying file
+        """
+        return self._base_offset
+
+    def with_base_offset(self, base_offset: int) -> "MemoryMappedFile":
+        """
+        This function returns a new MemoryMappedFile (sharing the same memory-mapped file)
+        that starts at the given (byte) offset, relative to the start of this MemoryMappedFile.
+        No bytes are copied.
+        """
+        return MemoryMappedFile(self._mmap, self._base_offset + base_offset)
+
+    def getbuffer(self) -> memoryview:
+        """
+        This function returns a (read-only) memoryview of the entire content of this MemoryMappedFile
+        """
+        return self._view
+
+    def read_view(self, size: int = -1) -> memoryview:
+        """
+        This function reads (at most) size bytes, returning them as a zero-copy memoryview
+        """
+        if size is None or size < 0:
+            size = len(self._view) - self._pos
+        out: memoryview = self._view[self._pos : self._pos + size]
+        self._pos += len(out)
+        return out
+
+    #
+    # io.RawIOBase
+    #
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return False
+
+    def read(self, size: int = -1) -> bytes:
+        return self.read_view(size).tobytes()
+
+    def readinto(self, b) -> int:
+        out: memoryview = self.read_view(len(b))
+        b[0 : len(out)] = out
+        return len(out)
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._pos = pos
+        elif whence == io.SEEK_CUR:
+            self._pos += pos
+        elif whence == io.SEEK_END:
+            self._pos = len(self._view) + pos
+        else:
+            raise ValueError("invalid whence (%d)" % whence)
+        assert self._pos >= 0, "negative seek position %d" % self._pos
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        # the memory-mapped file itself is not closed here,
+        # memoryview slices of it may still be referenced (e.g. by Stream objects)
+        # it is closed once it is garbage collected
+        self._view.release()
+        super(MemoryMappedFile, self).close()
@@ -8,12 +8,17 @@ import io
 import typing
 from typing import Any, Optional, Union
 
-from ptext.io.filter.stream_decode_util import decode_stream
 from ptext.io.read.read_base_transformer import (
     ReadBaseTransformer,
     ReadTransformerContext,
 )
-from ptext.io.read.types import AnyPDFType, Reference, Stream
+from ptext.io.read.types import (
+    AnyPDFType,
+    DecodedBytesProxy,
+    Name,
+    Reference,
+    Stream,
+)
 from ptext.pdf.canvas.event.event_listener import EventListener
 
 
@@ -56,9 +61,6 @@ class ReadStreamTransformer(ReadBaseTransformer):
                 v = xref.get_object(v, context.source, context.tokenizer)
                 object_to_transform[k] = v
 
-        # apply filter(s)
-        object_to_transform = decode_stream(object_to_transform)
-
         # convert (remainder of) stream dictionary
         for k, v in object_to_transform.items():
             if not isinstance(v, Reference):
@@ -68,6 +70,18 @@ class ReadStreamTransformer(ReadBaseTransformer):
                 if v is not None:
                     object_to_transform[k] = v
 
+        # apply filter(s)
+        # the Stream is decoded the first time its DecodedBytes are accessed,
+        # embedded files are never kept as DecodedBytes (they are decoded on demand)
+        if (
+            "Bytes" in object_to_transform
+            and "DecodedBytes" not in object_to_transform
+            and object_to_transform.get("Type", None) != "EmbeddedFile"
+        ):
+            object_to_transform[Name("DecodedBytes")] = DecodedBytesProxy(
+                object_to_transform
+            )
+
         # linkage
         object_to_transform.set_parent(parent_object)  # type: ignore [attr-defined]
 
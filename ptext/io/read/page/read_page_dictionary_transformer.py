@@ -6,7 +6,6 @@ This implementation of ReadBaseTransformer is responsible for reading Page objec
 """
 import io
 import typing
-import zlib
 from typing import Any, Dict, Optional, Union
 
 from ptext.io.read.read_base_transformer import (
@@ -14,11 +13,6 @@ from ptext.io.read.read_base_transformer import (
     ReadTransformerContext,
 )
 from ptext.io.read.types import AnyPDFType, Dictionary, List, Stream, Name
-from ptext.io.read.types import Decimal as pDecimal
-from ptext.pdf.canvas.canvas import Canvas
-from ptext.pdf.canvas.canvas_stream_processor import CanvasStreamProcessor
-from ptext.pdf.canvas.event.begin_page_event import BeginPageEvent
-from ptext.pdf.canvas.event.end_page_event import EndPageEvent
 from ptext.pdf.canvas.event.event_listener import EventListener
 from ptext.pdf.page.page import Page
 
@@ -69,40 +63,31 @@ class ReadPageDictionaryTransformer(ReadBaseTransformer):
             if v is not None:
                 page_out[k] = v
 
-        # send out BeginPageEvent
-        page_out._event_occurred(BeginPageEvent(page_out))
-
         # check whether `Contents` exists
-        if "Contents" not in page_out:
-            return
-        if not isinstance(page_out["Contents"], List) and not isinstance(
-            page_out["Contents"], Stream
-        ):
-            return
+        if "Contents" in page_out and isinstance(page_out["Contents"], List):
 
-        # Force content to be Stream (rather than List)
-        contents = page_out["Contents"]
-        if isinstance(contents, List):
-            bts = b"".join([x["DecodedBytes"] + b" " for x in contents])
+            # Force content to be Stream (rather than List)
+            # the Stream is (re)compressed when it is written, not here
+            bts = b"".join([x["DecodedBytes"] + b" " for x in page_out["Contents"]])
             page_out[Name("Contents")] = Stream()
             assert isinstance(page_out["Contents"], Stream)
             page_out["Contents"][Name("DecodedBytes")] = bts
-            page_out["Contents"][Name("Bytes")] = zlib.compress(bts, 9)
             page_out["Contents"][Name("Filter")] = Name("FlateDecode")
-            page_out["Contents"][Name("Length")] = pDecimal(len(bts))
-            contents = page_out["Contents"]
-            contents.set_parent(page_out)  # type: ignore [attr-defined]
-
-        # create Canvas
-        canvas = Canvas().set_parent(page_out)  # type: ignore [attr-defined]
+            page_out["Contents"].set_parent(page_out)  # type: ignore [attr-defined]
 
-        # create CanvasStreamProcessor
-        CanvasStreamProcessor(page_out, canvas, []).read(
-            io.BytesIO(contents["DecodedBytes"])
-        )
-
-        # send out EndPageEvent
-        page_out._event_occurred(EndPageEvent(page_out))
+        # the content stream is processed only if someone is listening,
+        # otherwise it is processed on demand (see Page.process)
+        if ReadPageDictionaryTransformer._has_event_listeners(page_out):
+            page_out.process()
 
         # return
         return page_out
+
+    @staticmethod
+    def _has_event_listeners(page: Page) -> bool:
+        e = page
+        while e is not None:
+            if len(vars(e).get("_event_listeners", [])) > 0:
+                return True
+            e = e.get_parent()  # type: ignore [attr-defined]
+        return False
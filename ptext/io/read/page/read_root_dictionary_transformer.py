@@ -13,7 +13,12 @@ from ptext.io.read.read_base_transformer import (
     ReadBaseTransformer,
     ReadTransformerContext,
 )
-from ptext.io.read.types import AnyPDFType, Decimal, Dictionary
+from ptext.io.read.types import (
+    AnyPDFType,
+    Decimal,
+    Dictionary,
+    IndirectObjectProxy,
+)
 from ptext.io.read.types import List as pList
 from ptext.io.read.types import Name
 from ptext.pdf.canvas.event.event_listener import EventListener
@@ -70,15 +75,26 @@ class ReadRootDictionaryTransformer(ReadBaseTransformer):
         #
 
         # list to hold Page objects (in order)
-        pages_in_order: typing.List[Page] = []
+        pages_in_order: typing.List[typing.Union[Page, IndirectObjectProxy]] = []
 
         # stack to explore Page(s) DFS
-        stack_to_handle: typing.List[AnyPDFType] = []
+        stack_to_handle: typing.List[typing.Any] = []
         stack_to_handle.append(transformed_root_dictionary["Pages"])
 
         # DFS
         while len(stack_to_handle) > 0:
             obj = stack_to_handle.pop(0)
+            # (lazy) only \Pages objects need to be read, \Page objects are read on first access
+            if isinstance(obj, IndirectObjectProxy):
+                untransformed_obj = obj.peek()
+                if (
+                    isinstance(untransformed_obj, Dictionary)
+                    and "Type" in untransformed_obj
+                    and untransformed_obj["Type"] == "Page"
+                ):
+                    pages_in_order.append(obj)
+                    continue
+                obj = obj.resolve()
             if isinstance(obj, Page):
                 pages_in_order.append(obj)
             # \Pages
@@ -89,7 +105,8 @@ class ReadRootDictionaryTransformer(ReadBaseTransformer):
                 and "Kids" in obj
                 and isinstance(obj["Kids"], List)
             ):
-                for k in obj["Kids"]:
+                # iterate without resolving IndirectObjectProxy object(s)
+                for k in list.__iter__(obj["Kids"]):
                     stack_to_handle.append(k)
 
         # change
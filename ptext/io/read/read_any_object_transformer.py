@@ -9,12 +9,15 @@ import io
 import typing
 from typing import Any, Optional, Union
 
+from PIL import Image  # type: ignore [import]
+
 from ptext.io.read.font.read_font_dictionary_transformer import (
     ReadFontDictionaryTransformer,
 )
 from ptext.io.read.function.read_function_dictionary_transformer import (
     FunctionDictionaryTransformer,
 )
+from ptext.io.read.image.image_stream_util import set_image_stream
 from ptext.io.read.image.read_ccitt_fax_image_transformer import (
     ReadCCITTFaxImageTransformer,
 )
@@ -49,7 +52,7 @@ from ptext.io.read.read_base_transformer import (
 )
 from ptext.io.read.reference.read_reference_transformer import ReadReferenceTransformer
 from ptext.io.read.reference.read_xref_transformer import ReadXREFTransformer
-from ptext.io.read.types import AnyPDFType
+from ptext.io.read.types import AnyPDFType, Stream
 from ptext.pdf.canvas.event.event_listener import EventListener
 
 
@@ -107,13 +110,28 @@ class ReadAnyObjectTransformer(ReadBaseTransformer):
         The object being read depends on the implementation of ReadAnyObjectTransformer.
         """
         if context is None:
-            return super().transform(
-                object_to_transform,
-                parent_object,
-                ReadTransformerContext(),
-                event_listeners,
-            )
-        else:
-            return super().transform(
-                object_to_transform, parent_object, context, event_listeners
-            )
+            context = ReadTransformerContext()
+        out = super().transform(
+            object_to_transform, parent_object, context, event_listeners
+        )
+
+        # Image objects keep the Stream they were read from,
+        # so that they can be written as they were read (unless they are modified)
+        if isinstance(object_to_transform, Stream) and isinstance(out, Image.Image):
+            self._set_image_stream(out, object_to_transform, context)
+
+        # return
+        return out
+
+    def _set_image_stream(
+        self, image: Image.Image, stream: Stream, context: ReadTransformerContext
+    ) -> None:
+        # the (remainder of the) stream dictionary (e.g. \ColorSpace, \SMask) is read,
+        # the (encoded) bytes are kept as they are
+        for k, v in stream.items():
+            if k in ["Bytes", "DecodedBytes"]:
+                continue
+            v = self.transform(v, image, context, [])
+            if v is not None:
+                stream[k] = v
+        set_image_stream(image, stream)
@@ -21,6 +21,7 @@ class ReadTransformerContext:
     - the root object (the Document itself)
     - the tokenizer
     - references that have been resolved (to avoid endless loops)
+    - whether indirect objects are read lazily (on first access)
     - etc
     """
 
@@ -29,11 +30,13 @@ class ReadTransformerContext:
         source: Optional[Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO]] = None,
         tokenizer: Optional[HighLevelTokenizer] = None,
         root_object: Optional[Any] = None,
+        lazy: bool = False,
     ):
         self.source = source
         self.tokenizer = tokenizer
         self.root_object = root_object
         self.indirect_reference_chain: typing.Set[Reference] = set()
+        self.lazy = lazy
 
 
 class ReadBaseTransformer:
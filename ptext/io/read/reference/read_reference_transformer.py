@@ -14,7 +14,7 @@ from ptext.io.read.read_base_transformer import (
     ReadBaseTransformer,
     ReadTransformerContext,
 )
-from ptext.io.read.types import AnyPDFType, Reference
+from ptext.io.read.types import AnyPDFType, IndirectObjectProxy, Reference
 from ptext.pdf.canvas.event.event_listener import EventListener
 from ptext.pdf.xref.xref import XREF
 
@@ -53,9 +53,41 @@ class ReadReferenceTransformer(ReadBaseTransformer):
         """
 
         assert isinstance(object_to_transform, Reference)
+        assert context is not None
+
+        # lazy: defer reading the referenced object until it is accessed
+        if context.lazy and object_to_transform not in self._cache:
+            return IndirectObjectProxy(
+                object_to_transform,
+                lambda: self._read_referenced_object(
+                    object_to_transform, parent_object, context, event_listeners
+                ),
+                lambda: self._peek_referenced_object(object_to_transform, context),
+            )
+
+        return self._read_referenced_object(
+            object_to_transform, parent_object, context, event_listeners
+        )
+
+    def _peek_referenced_object(
+        self, reference: Reference, context: ReadTransformerContext
+    ) -> Optional[AnyPDFType]:
+        assert context.root_object is not None
+        xref = context.root_object["XRef"]
+        assert isinstance(xref, XREF)
+        assert context.source is not None
+        assert context.tokenizer is not None
+        return xref.get_object(reference, context.source, context.tokenizer)
+
+    def _read_referenced_object(
+        self,
+        object_to_transform: Reference,
+        parent_object: Any,
+        context: ReadTransformerContext,
+        event_listeners: typing.List[EventListener],
+    ) -> Any:
 
         # check for circular reference
-        assert context is not None
         if object_to_transform in context.indirect_reference_chain:
             return None
 
@@ -67,6 +99,9 @@ class ReadReferenceTransformer(ReadBaseTransformer):
             if ref_from_cache.get_parent() is None:  # type: ignore[union-attr]
                 ref_from_cache.set_parent(parent_object)  # type: ignore[union-attr]
                 return ref_from_cache
+            # (lazy) objects are shared rather than re-parented, to avoid cyclic parent chains
+            if context.lazy:
+                return ref_from_cache
             # copy because of linkage
             if ref_from_cache.get_parent() != parent_object:  # type: ignore[union-attr]
                 ref_from_cache_copy = ref_from_cache  # TODO
@@ -122,5 +157,10 @@ class ReadReferenceTransformer(ReadBaseTransformer):
             )
             pass
 
+        # (lazy) objects that are read after the Document was read are added to its revision
+        revision = vars(context.root_object).get("_revision", None)
+        if context.lazy and revision is not None:
+            revision.add_object(transformed_referenced_object)
+
         # return
         return transformed_referenced_object
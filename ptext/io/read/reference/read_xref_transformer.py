@@ -10,6 +10,7 @@ import typing
 from decimal import Decimal
 from typing import Any, Optional, Union
 
+from ptext.io.read.memory_mapped_file import MemoryMappedFile
 from ptext.io.read.read_base_transformer import (
     ReadBaseTransformer,
     ReadTransformerContext,
@@ -18,6 +19,7 @@ from ptext.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
 from ptext.io.read.types import AnyPDFType, Dictionary, Name
 from ptext.pdf.canvas.event.event_listener import Event, EventListener
 from ptext.pdf.document import Document
+from ptext.pdf.revision import Revision
 from ptext.pdf.xref.plaintext_xref import PlainTextXREF
 from ptext.pdf.xref.stream_xref import StreamXREF
 from ptext.pdf.xref.xref import XREF
@@ -124,6 +126,19 @@ class ReadXREFTransformer(ReadBaseTransformer):
         # notify
         context.root_object._event_occurred(EndDocumentEvent())  # type: ignore [attr-defined]
 
+        # keep the revision (source, and a snapshot of every indirect object)
+        # this allows the Document to be saved incrementally
+        revision: Revision = Revision(
+            source=context.source,
+            file_length=file_length,
+            size=max(
+                [int(trailer.get("Size", 0))]
+                + [int(r.object_number or 0) + 1 for r in xref._entries]
+            ),
+        )
+        revision.add_all_objects(trailer)
+        setattr(context.root_object, "_revision", revision)
+
         # return
         return context.root_object
 
@@ -147,6 +162,12 @@ class ReadXREFTransformer(ReadBaseTransformer):
         except ValueError:
             pass
 
+        # memory-mapped file: shift the base offset (no copy needed)
+        if index_of_pdf_comment > 0 and isinstance(context.source, MemoryMappedFile):
+            context.source = context.source.with_base_offset(index_of_pdf_comment)
+            context.tokenizer = HighLevelTokenizer(context.source)
+            return
+
         # truncate
         if index_of_pdf_comment > 0:
             # determine end of file
@@ -158,7 +179,7 @@ class ReadXREFTransformer(ReadBaseTransformer):
             bts = bts[index_of_pdf_comment:end_of_file]
             # reset values in context
             context.source = io.BytesIO(bts)
-            context.tokenizer._io_source = context.source
+            context.tokenizer = HighLevelTokenizer(context.source)
 
     @staticmethod
     def _check_header(context: ReadTransformerContext) -> None:
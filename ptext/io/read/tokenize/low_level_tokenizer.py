@@ -8,8 +8,32 @@ The high-level tokenizer will use this first pass to then build complex objects
 """
 import enum
 import io
+import re
+import typing
 from typing import Optional
 
+from ptext.io.read.memory_mapped_file import MemoryMappedFile
+
+# precompiled patterns (over bytes) used by the LowLevelTokenizer
+# each group in _TOKEN matches one kind of Token (see _TOKEN_TYPES),
+# the most frequent kinds of Token are tried first
+_TOKEN = re.compile(
+    rb"[\x00\t\n\x0c\r ]*(?:"
+    rb"([-+.0-9]+)|"
+    rb"([^\x00\t\n\x0c\r %()/<>\[\]]+)|"
+    rb"(/[^\x00\t\n\x0c\r %()/<>\[\]]*)|"
+    rb"(\()|"
+    rb"(\[)|"
+    rb"(\])|"
+    rb"(<<)|"
+    rb"(<[^>]*>?)|"
+    rb"(>>)|"
+    rb"(%[^\r\n]*)|"
+    rb"())"
+)
+_STRING_GROUP: int = 4
+_STRING_SPECIAL_CHARACTER = re.compile(rb"[()\\]")
+
 
 class TokenType(enum.IntEnum):
     """
@@ -32,6 +56,22 @@ class TokenType(enum.IntEnum):
     END_OF_FILE = 14
 
 
+_TOKEN_TYPES: typing.List[Optional[TokenType]] = [
+    None,
+    TokenType.NUMBER,
+    TokenType.OTHER,
+    TokenType.NAME,
+    TokenType.STRING,
+    TokenType.START_ARRAY,
+    TokenType.END_ARRAY,
+    TokenType.START_DICT,
+    TokenType.HEX_STRING,
+    TokenType.END_DICT,
+    TokenType.COMMENT,
+    TokenType.OTHER,
+]
+
+
 class Token:
     """
     This class represents a token in PDF syntax.
@@ -93,14 +133,38 @@ class LowLevelTokenizer:
     although scanner is also a term for the first stage of a lexer.
     A lexer is generally combined with a parser, which together analyze the syntax of programming languages, web pages,
     and so forth.
+
+    This LowLevelTokenizer scans a buffer (rather than reading the io source one byte at a time).
+    An io.BytesIO source is scanned in its entirety, any other source is scanned in (growing) windows.
+    The position of the io source is kept in sync with the tokenizer, so that the io source can still be
+    seeked (or read) directly.
+    Recently scanned Token objects are kept (by byte offset), since the HighLevelTokenizer often
+    goes back to re-read the same Token(s).
     """
 
+    WINDOW_SIZE: int = 65536
+    TOKEN_CACHE_SIZE: int = 4096
+
     def __init__(self, io_source):
         self._io_source = io_source
         self._is_pseudo_digit = set("0123456789+-.").__contains__
         self._is_delimiter = set("\x00\t\n\x0c\r %()/<>[]").__contains__
         self._is_whitespace = set("\x00\t\n\x0c\r ").__contains__
 
+        # buffer
+        self._buffer: typing.Union[bytes, memoryview] = b""
+        self._buffer_offset: int = 0
+        self._buffer_is_final: bool = False
+        if isinstance(io_source, io.BytesIO):
+            self._buffer = io_source.getvalue()
+            self._buffer_is_final = True
+        if isinstance(io_source, MemoryMappedFile):
+            self._buffer = io_source.getbuffer()
+            self._buffer_is_final = True
+
+        # token cache
+        self._token_cache: typing.Dict[int, typing.Tuple[Token, int]] = {}
+
     def next_non_comment_token(self) -> Optional[Token]:
         """
         This function retrieves the next non-comment Token.
@@ -116,124 +180,108 @@ class LowLevelTokenizer:
         This function retrieves the next Token.
         It returns None if no such Token exists (end of stream/file)
         """
-        ch = self._next_char()
-        if len(ch) == 0:
+        pos: int = self._io_source.tell()
+
+        # lookup in cache
+        cached_token = self._token_cache.get(pos)
+        if cached_token is not None:
+            self._io_source.seek(cached_token[1])
+            return cached_token[0]
+
+        # (re)load window if needed
+        window_size: int = LowLevelTokenizer.WINDOW_SIZE
+        if pos < self._buffer_offset or (
+            pos >= self._buffer_offset + len(self._buffer)
+            and not self._buffer_is_final
+        ):
+            self._load_window(pos, window_size)
+
+        # a Token that touches the end of the window may continue beyond it
+        scan_result = self._scan_token(pos)
+        while scan_result is None:
+            window_size *= 2
+            self._load_window(pos, window_size)
+            scan_result = self._scan_token(pos)
+
+        token, end_pos = scan_result
+        self._io_source.seek(end_pos)
+
+        # update cache
+        if token is not None:
+            if len(self._token_cache) >= LowLevelTokenizer.TOKEN_CACHE_SIZE:
+                self._token_cache.clear()
+            self._token_cache[pos] = (token, end_pos)
+
+        # return
+        return token
+
+    def _load_window(self, pos: int, window_size: int) -> None:
+        self._io_source.seek(pos)
+        self._buffer = self._io_source.read(window_size) or b""
+        self._buffer_offset = pos
+        self._buffer_is_final = len(self._buffer) < window_size
+
+    def _scan_token(self, pos: int) -> Optional[typing.Tuple[Optional[Token], int]]:
+        """
+        This function scans the Token starting at (absolute) position pos.
+        It returns the Token, and the (absolute) position immediately after the Token,
+        or None if more input is needed to decide on the Token
+        """
+        buf = self._buffer
+        n: int = len(buf)
+        offset: int = self._buffer_offset
+        final: bool = self._buffer_is_final
+        i: int = pos - offset
+
+        # end of file
+        if i >= n:
+            return None if not final else (None, pos)
+
+        # a Token that touches the end of a (non-final) window may continue beyond it
+        m = _TOKEN.match(buf, i)
+        assert m is not None
+        group: int = m.lastindex  # type: ignore [assignment]
+        start: int = m.start(group)
+        end: int = m.end()
+        if end == n and not final:
             return None
 
-        while len(ch) > 0 and self._is_whitespace(ch):
-            ch = self._next_char()
-
-        # START_ARRAY
-        if ch == "[":
-            return Token(self._io_source.tell() - 1, TokenType.START_ARRAY, "[")
-
-        # END ARRAY
-        if ch == "]":
-            return Token(self._io_source.tell() - 1, TokenType.END_ARRAY, "]")
-
-        # NAME
-        if ch == "/":
-            out_str = "/"
-            out_pos = self._io_source.tell() - 1
-            while True:
-                ch = self._next_char()
-                if len(ch) == 0:
-                    break
-                if self._is_delimiter(ch):
-                    break
-                out_str += ch
-            if len(ch) != 0:
-                self._prev_char()
-            return Token(out_pos, TokenType.NAME, out_str)
-
-        # END_DICT
-        if ch == ">":
-            out_pos = self._io_source.tell() - 1
-            ch = self._next_char()
-            # CHECK UNEXPECTED CHARACTER AFTER >
-            assert ch == ">"
-            return Token(out_pos, TokenType.END_DICT, ">>")
-
-        # COMMENT
-        if ch == "%":
-            out_str = ""
-            out_pos = self._io_source.tell() - 1
-            while len(ch) != 0 and ch != "\r" and ch != "\n":
-                out_str += ch
-                ch = self._next_char()
-            if len(ch) != 0:
-                self._prev_char()
-            return Token(out_pos, TokenType.COMMENT, out_str)
-
-        # HEX_STRING OR DICT
-        if ch == "<":
-            out_pos = self._io_source.tell() - 1
-            ch = self._next_char()
-
-            # DICT
-            if ch == "<":
-                return Token(out_pos, TokenType.START_DICT, "<<")
-
-            # empty hex string
-            if ch == ">":
-                return Token(out_pos, TokenType.HEX_STRING, "<>")
-
-            # HEX_STRING
-            out_str = "<" + ch
-            while True:
-                ch = self._next_char()
-                if len(ch) == 0:
-                    break
-                out_str += ch
-                if ch == ">":
-                    break
-
-            return Token(out_pos, TokenType.HEX_STRING, out_str)
-
-        # NUMBER
-        if ch in "-+.0123456789":
-            out_str = ""
-            out_pos = self._io_source.tell() - 1
-            while len(ch) != 0 and ch in "-+.0123456789":
-                out_str += ch
-                ch = self._next_char()
-            if len(ch) != 0:
-                self._prev_char()
-            return Token(out_pos, TokenType.NUMBER, out_str)
-
         # STRING
-        if ch == "(":
-            bracket_nesting_level = 1
-            out_str = "("
-            out_pos = self._io_source.tell() - 1
-            while True:
-                ch = self._next_char()
-                if len(ch) == 0:
-                    break
-                if ch == "\\":
-                    ch = self._next_char()
-                    out_str += "\\" + ch
+        if group == _STRING_GROUP:
+            bracket_nesting_level: int = 1
+            while bracket_nesting_level > 0:
+                m = _STRING_SPECIAL_CHARACTER.search(buf, end)
+                if m is None or (m.end() == n and buf[m.start()] == 0x5C):
+                    if not final:
+                        return None
+                    assert False, "unterminated string at byte offset %d" % (
+                        offset + start
+                    )
+                end = m.end()
+                ch: int = buf[end - 1]
+                # escaped character
+                if ch == 0x5C:
+                    end += 1
                     continue
-                if ch == "(":
+                if ch == 0x28:
                     bracket_nesting_level += 1
-                if ch == ")":
+                else:
                     bracket_nesting_level -= 1
-                out_str += ch
-                if bracket_nesting_level == 0:
-                    break
-            assert len(ch) != 0
-            assert not out_str.endswith("\\")
-            return Token(out_pos, TokenType.STRING, out_str)
-
-        # OTHER
-        out_str = ""
-        out_pos = self._io_source.tell() - 1
-        while len(ch) != 0 and not self._is_delimiter(ch):
-            out_str += ch
-            ch = self._next_char()
-        if len(ch) != 0:
-            self._prev_char()
-        return Token(out_pos, TokenType.OTHER, out_str)
+
+        # empty Token
+        elif start == end:
+            if start + 1 == n and not final:
+                return None
+            # CHECK UNEXPECTED CHARACTER AFTER >
+            assert start == n or buf[start] != 0x3E
+            # an empty Token marks trailing whitespace
+            if start == n:
+                return Token(offset + n - 1, TokenType.NUMBER, ""), offset + n
+
+        return (
+            Token(offset + start, _TOKEN_TYPES[group], str(buf[start:end], "latin-1")),
+            offset + end,
+        )
 
     def seek(self, pos: int, whence: int = io.SEEK_SET):
         """
@@ -252,6 +300,15 @@ class LowLevelTokenizer:
         """
         return self._io_source.tell()
 
+    def _read_bytes(self, n: int) -> typing.Union[bytes, memoryview]:
+        """
+        This function reads (at most) n bytes from the underlying io source.
+        If the entire io source is held in memory, a zero-copy slice is returned
+        """
+        if isinstance(self._io_source, MemoryMappedFile):
+            return self._io_source.read_view(n)
+        return self._io_source.read(n)
+
     def _next_char(self):
         return self._io_source.read(1).decode("latin-1")
 
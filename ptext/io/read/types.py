@@ -325,6 +325,10 @@ class Dictionary(dict):
     arbitrary order may be imposed upon them when written in a file. That ordering shall be ignored.
     """
 
+    # True for a Dictionary that may hold IndirectObjectProxy objects (Document read lazily), see
+    # _install_proxy_resolution. Otherwise the (faster) dict accessors are used as they are.
+    _resolves_proxies: bool = False
+
     def __init__(self):
         super(Dictionary, self).__init__()
         add_base_methods(self)
@@ -337,11 +341,26 @@ class Dictionary(dict):
 
     def __setitem__(self, key, value):
         assert isinstance(key, Name)
+        if value.__class__ is IndirectObjectProxy and not self._resolves_proxies:
+            _install_proxy_resolution(self, _ProxyResolvingDictionary)
         super(Dictionary, self).__setitem__(key, value)
 
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
+
     def __deepcopy__(self, memodict={}):
         out = Dictionary()
         for k, v in self.items():
+            # memoryview(s) (e.g. zero-copy slices of a memory-mapped file) are read-only, and can be shared
+            if isinstance(v, memoryview):
+                out[copy.deepcopy(k, memodict)] = v
+                continue
             out[copy.deepcopy(k, memodict)] = copy.deepcopy(v, memodict)
         return out
 
@@ -405,6 +424,12 @@ class Stream(Dictionary):
     def __init__(self):
         super(Stream, self).__init__()
 
+    def __setitem__(self, key, value):
+        # DecodedBytes that are decoded the first time they are accessed, see DecodedBytesProxy
+        if value.__class__ is DecodedBytesProxy and not self._resolves_proxies:
+            _install_proxy_resolution(self, _ProxyResolvingDictionary)
+        super(Stream, self).__setitem__(key, value)
+
 
 class Function(Dictionary):
     """
@@ -550,6 +575,10 @@ class Function(Dictionary):
     def __deepcopy__(self, memodict={}):
         out: Function = Function()
         for k, v in self.items():
+            # memoryview(s) (e.g. zero-copy slices of a memory-mapped file) are read-only, and can be shared
+            if isinstance(v, memoryview):
+                out[k] = v
+                continue
             out[k] = copy.deepcopy(v, memodict)
         return out
 
@@ -713,10 +742,35 @@ class List(list):
     elements.
     """
 
+    # True for a List that may hold IndirectObjectProxy objects (Document read lazily), see
+    # _install_proxy_resolution. Otherwise the (faster) list accessors are used as they are.
+    _resolves_proxies: bool = False
+
     def __init__(self):
         super(List, self).__init__()
         add_base_methods(self)
 
+    def __setitem__(self, index, value):
+        if value.__class__ is IndirectObjectProxy and not self._resolves_proxies:
+            _install_proxy_resolution(self, _ProxyResolvingList)
+        super(List, self).__setitem__(index, value)
+
+    def append(self, value):
+        if value.__class__ is IndirectObjectProxy and not self._resolves_proxies:
+            _install_proxy_resolution(self, _ProxyResolvingList)
+        super(List, self).append(value)
+
+    def insert(self, index, value):
+        if value.__class__ is IndirectObjectProxy and not self._resolves_proxies:
+            _install_proxy_resolution(self, _ProxyResolvingList)
+        super(List, self).insert(index, value)
+
+    def extend(self, values):
+        values = list(values)
+        if IndirectObjectProxy in map(type, values) and not self._resolves_proxies:
+            _install_proxy_resolution(self, _ProxyResolvingList)
+        super(List, self).extend(values)
+
     def __hash__(self):
         hashcode: int = 1
         for e in self:
@@ -804,6 +858,227 @@ class Reference:
         )
 
 
+class IndirectObjectProxy:
+    """
+    An IndirectObjectProxy stands in for an indirect object that has not been read (yet).
+    It is used when a Document is read lazily; the first time a Dictionary (or List) value
+    is accessed, the IndirectObjectProxy is (transparently) replaced by the object it refers to.
+    """
+
+    __slots__ = ["_reference", "_resolve", "_peek"]
+
+    def __init__(
+        self,
+        reference: Reference,
+        resolve: typing.Callable[[], typing.Any],
+        peek: typing.Callable[[], typing.Any],
+    ):
+        self._reference: Reference = reference
+        self._resolve = resolve
+        self._peek = peek
+
+    def get_reference(self) -> Reference:
+        """
+        This function returns the Reference this IndirectObjectProxy stands in for
+        """
+        return self._reference
+
+    def resolve(self) -> typing.Any:
+        """
+        This function reads (and transforms) the object this IndirectObjectProxy stands in for
+        """
+        return self._resolve()
+
+    def peek(self) -> typing.Any:
+        """
+        This function reads the object this IndirectObjectProxy stands in for,
+        without transforming it (e.g. to check its /Type)
+        """
+        return self._peek()
+
+    def __repr__(self):
+        return "IndirectObjectProxy(%s %s R)" % (
+            self._reference.object_number,
+            self._reference.generation_number,
+        )
+
+
+class DecodedBytesProxy:
+    """
+    A DecodedBytesProxy stands in for the DecodedBytes of a Stream that have not been decoded (yet).
+    The first time the DecodedBytes are accessed (including through items, values, etc)
+    the Stream is decoded, and the DecodedBytesProxy is replaced by the DecodedBytes.
+    """
+
+    __slots__ = ["_stream"]
+
+    def __init__(self, stream: Stream):
+        self._stream: Stream = stream
+
+    def resolve(self) -> typing.Any:
+        """
+        This function decodes the Stream this DecodedBytesProxy belongs to, and returns its DecodedBytes
+        """
+        from ptext.io.filter.stream_decode_util import decode_stream
+
+        return dict.__getitem__(decode_stream(self._stream), "DecodedBytes")
+
+    def __repr__(self):
+        return "DecodedBytesProxy"
+
+
+# the objects that are replaced (the first time they are accessed) by the object they stand in for
+_PROXY_CLASSES = (IndirectObjectProxy, DecodedBytesProxy)
+
+
+class _ProxyResolvingDictionary:
+    """
+    The accessors of a Dictionary that holds IndirectObjectProxy (or DecodedBytesProxy) objects.
+    Every accessor that returns a value resolves the IndirectObjectProxy (if any) through
+    _resolve_proxy, which replaces the IndirectObjectProxy by the object it refers to.
+    Iterating over the keys is overridden too, so that dict(d), {**d} and update(d)
+    go through __getitem__ (rather than copying the IndirectObjectProxy objects).
+    """
+
+    __slots__: typing.List[str] = []
+
+    _resolves_proxies: bool = True
+
+    def _resolve_proxy(self, key, proxy: typing.Any):
+        # a reference to an object that does not exist is treated as null (None), as in a List
+        value = proxy.resolve()
+        dict.__setitem__(self, key, value)
+        return value
+
+    def _resolve_all_proxies(self) -> None:
+        for k, v in list(dict.items(self)):
+            if v.__class__ in _PROXY_CLASSES:
+                self._resolve_proxy(k, v)
+        _uninstall_proxy_resolution(self)
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)  # type: ignore [misc]
+        if value.__class__ in _PROXY_CLASSES:
+            return self._resolve_proxy(key, value)
+        return value
+
+    def __iter__(self):
+        return dict.__iter__(self)  # type: ignore [arg-type]
+
+    def get(self, key, default=None):
+        value = super().get(key, default)  # type: ignore [misc]
+        if value.__class__ in _PROXY_CLASSES:
+            return self._resolve_proxy(key, value)
+        return value
+
+    def items(self):
+        self._resolve_all_proxies()
+        return dict.items(self)  # type: ignore [arg-type]
+
+    def values(self):
+        self._resolve_all_proxies()
+        return dict.values(self)  # type: ignore [arg-type]
+
+    def copy(self):
+        self._resolve_all_proxies()
+        return dict.copy(self)  # type: ignore [arg-type]
+
+    def pop(self, key, *args):
+        if key in self:  # type: ignore [operator]
+            self[key]  # type: ignore [index]
+        return super().pop(key, *args)  # type: ignore [misc]
+
+    def popitem(self):
+        self._resolve_all_proxies()
+        return dict.popitem(self)  # type: ignore [arg-type]
+
+
+class _ProxyResolvingList:
+    """
+    The accessors of a List that holds IndirectObjectProxy objects.
+    Every accessor that returns an element resolves the IndirectObjectProxy (if any),
+    and replaces the IndirectObjectProxy by the object it refers to.
+    """
+
+    __slots__: typing.List[str] = []
+
+    _resolves_proxies: bool = True
+
+    def _resolve_all_proxies(self) -> None:
+        for i in range(0, len(self)):  # type: ignore [arg-type]
+            self[i]  # type: ignore [index]
+        _uninstall_proxy_resolution(self)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            self._resolve_all_proxies()
+            return list.__getitem__(self, index)  # type: ignore [call-overload]
+        value = list.__getitem__(self, index)  # type: ignore [call-overload]
+        if value.__class__ is IndirectObjectProxy:
+            # a reference to an object that does not exist is treated as null (None), as in a Dictionary
+            value = value.resolve()
+            list.__setitem__(self, index, value)  # type: ignore [call-overload]
+        return value
+
+    def __iter__(self):
+        self._resolve_all_proxies()
+        return list.__iter__(self)  # type: ignore [arg-type]
+
+    def __reversed__(self):
+        self._resolve_all_proxies()
+        return list.__reversed__(self)  # type: ignore [arg-type]
+
+    def __contains__(self, item):
+        self._resolve_all_proxies()
+        return list.__contains__(self, item)  # type: ignore [arg-type]
+
+    def index(self, *args):
+        self._resolve_all_proxies()
+        return list.index(self, *args)  # type: ignore [arg-type]
+
+    def count(self, item):
+        self._resolve_all_proxies()
+        return list.count(self, item)  # type: ignore [arg-type]
+
+    def copy(self):
+        self._resolve_all_proxies()
+        return list.copy(self)  # type: ignore [arg-type]
+
+    def pop(self, *args):
+        self._resolve_all_proxies()
+        return list.pop(self, *args)  # type: ignore [arg-type]
+
+
+# Dictionary (or List) (sub)class -> the same class, with the accessors that resolve IndirectObjectProxy objects
+_proxy_resolving_classes: typing.Dict[type, type] = {}
+
+
+def _install_proxy_resolution(obj: typing.Any, accessors: type) -> None:
+    """
+    This function switches a Dictionary (or List) that is about to hold an IndirectObjectProxy
+    to a subclass of its own class, that resolves IndirectObjectProxy objects on access.
+    Containers that never hold an IndirectObjectProxy keep the plain dict (list) accessors.
+    """
+    cls: type = obj.__class__
+    proxy_resolving_class: typing.Optional[type] = _proxy_resolving_classes.get(cls)
+    if proxy_resolving_class is None:
+        proxy_resolving_class = type(
+            cls.__name__,
+            (accessors, cls),
+            {"__module__": cls.__module__, "__qualname__": cls.__qualname__},
+        )
+        _proxy_resolving_classes[cls] = proxy_resolving_class
+    obj.__class__ = proxy_resolving_class
+
+
+def _uninstall_proxy_resolution(obj: typing.Any) -> None:
+    """
+    This function switches a Dictionary (or List) back to its own class,
+    once all of its IndirectObjectProxy objects are resolved
+    """
+    obj.__class__ = obj.__class__.__mro__[2]
+
+
 AnyPDFType = Union[
     Boolean,
     CanvasOperatorName,
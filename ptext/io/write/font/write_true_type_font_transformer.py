@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This implementation of WriteBaseTransformer is responsible for writing TrueTypeFont objects,
+embedding only the glyphs that are used in the Document
+"""
+import typing
+from typing import Optional
+
+from ptext.io.read.types import AnyPDFType, Dictionary, Reference
+from ptext.io.write.write_base_transformer import (
+    WriteBaseTransformer,
+    WriteTransformerContext,
+)
+from ptext.pdf.canvas.font.simple_font.true_type_font import TrueTypeFont
+from ptext.pdf.document import Document
+
+
+class WriteTrueTypeFontTransformer(WriteBaseTransformer):
+    """
+    This implementation of WriteBaseTransformer is responsible for writing TrueTypeFont objects,
+    embedding only the glyphs that are used in the Document
+    """
+
+    def can_be_transformed(self, any: AnyPDFType):
+        """
+        This function returns True if the object to be converted represents a TrueTypeFont
+        that should be subset when written
+        """
+        return isinstance(any, TrueTypeFont) and any._is_subset_when_written()
+
+    @staticmethod
+    def _collect_used_character_identifiers(
+        document: Document, context: WriteTransformerContext
+    ) -> None:
+        """
+        This function collects the character identifiers used (per font file) by the TrueTypeFont objects
+        on the Page(s) of a Document. Equal TrueTypeFont objects are written (once) as the same object,
+        so their character identifiers are combined.
+        This function is called (by WritePDFTransformer) before any Page is written.
+        """
+        used_character_identifiers: typing.Dict[bytes, typing.Set[int]] = {}
+        pages: typing.List[AnyPDFType] = [
+            document["XRef"]["Trailer"]["Root"]["Pages"]
+        ]
+        while len(pages) > 0:
+            page = pages.pop(0)
+            if not isinstance(page, Dictionary):
+                continue
+            # Page objects that were not read (yet) can not use a (new) TrueTypeFont
+            if "Kids" in page:
+                pages.extend(list.__iter__(page["Kids"]))
+                continue
+            if (
+                "Resources" not in page
+                or not isinstance(page["Resources"], Dictionary)
+                or "Font" not in page["Resources"]
+                or not isinstance(page["Resources"]["Font"], Dictionary)
+            ):
+                continue
+            for f in page["Resources"]["Font"].values():
+                if not isinstance(f, TrueTypeFont) or f._font_file_key is None:
+                    continue
+                if f._font_file_key not in used_character_identifiers:
+                    used_character_identifiers[f._font_file_key] = set()
+                used_character_identifiers[f._font_file_key].update(
+                    f._used_character_identifiers
+                )
+        context.used_character_identifiers_by_font_file = used_character_identifiers
+
+    def _get_used_character_identifiers(
+        self, font: TrueTypeFont, context: WriteTransformerContext
+    ) -> typing.Set[int]:
+        if context.used_character_identifiers_by_font_file is None:
+            return font._used_character_identifiers
+        assert font._font_file_key is not None
+        return context.used_character_identifiers_by_font_file.get(
+            font._font_file_key, font._used_character_identifiers
+        )
+
+    def transform(
+        self,
+        object_to_transform: AnyPDFType,
+        context: Optional[WriteTransformerContext] = None,
+    ):
+        """
+        This method writes a TrueTypeFont to a byte stream
+        """
+        assert (
+            context is not None
+        ), "A WriteTransformerContext must be defined in order to write TrueTypeFont objects."
+        assert isinstance(object_to_transform, TrueTypeFont)
+
+        # avoid resolving objects twice
+        object_ref: typing.Optional[Reference] = object_to_transform.get_reference()  # type: ignore [attr-defined]
+        if object_ref is not None and object_ref in context.resolved_references:
+            return
+
+        # build subset font
+        subset_font: Dictionary = object_to_transform._get_subset_font(
+            self._get_used_character_identifiers(object_to_transform, context)
+        )
+
+        # copy reference
+        subset_font.set_reference(object_ref)  # type: ignore [attr-defined]
+
+        # write
+        self.get_root_transformer().transform(subset_font, context)
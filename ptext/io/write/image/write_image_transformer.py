@@ -10,6 +10,7 @@ from typing import Optional
 
 from PIL import Image as PILImage  # type: ignore [import]
 
+from ptext.io.read.image.image_stream_util import get_unmodified_image_stream
 from ptext.io.read.types import AnyPDFType
 from ptext.io.read.types import Decimal as pDecimal
 from ptext.io.read.types import Name, Reference, Stream, add_base_methods
@@ -68,6 +69,21 @@ class WriteImageTransformer(WriteBaseTransformer):
         assert context.destination is not None
         assert isinstance(object_to_transform, PILImage.Image)
 
+        # avoid resolving objects twice
+        object_ref: typing.Optional[Reference] = object_to_transform.get_reference()  # type: ignore [attr-defined]
+        if object_ref is not None and object_ref in context.resolved_references:
+            return
+
+        # Image objects that were not modified (since they were read)
+        # are written using the Stream they were read from (with their original \Filter)
+        stream: typing.Optional[Stream] = get_unmodified_image_stream(
+            object_to_transform
+        )
+        if stream is not None:
+            stream.set_reference(object_to_transform.get_reference())  # type: ignore [attr-defined]
+            self.get_root_transformer().transform(stream, context)
+            return
+
         # get image bytes
         contents: typing.Optional[bytes] = None
         filter_name: Optional[Name] = None
@@ -80,7 +80,7 @@ class WriteArrayTransformer(WriteBaseTransformer):
             if object_ref.object_number is not None and object_ref.byte_offset is None:
                 started_object = True
                 self._start_object(object_to_transform, context)
-            context.resolved_references.append(object_ref)
+            context.resolved_references.add(object_ref)
 
         # write dictionary at current location
         context.destination.write(bytes("[", "latin1"))
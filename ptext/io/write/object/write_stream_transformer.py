@@ -7,15 +7,19 @@ This implementation of WriteBaseTransformer is responsible for writing Stream ob
 import logging
 import typing
 import zlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-from ptext.io.read.types import AnyPDFType
+from PIL.Image import Image  # type: ignore [import]
+
+from ptext.io.read.types import AnyPDFType, DecodedBytesProxy
 from ptext.io.read.types import Decimal as pDecimal
 from ptext.io.read.types import Dictionary, List, Name, Reference, Stream
 from ptext.io.write.write_base_transformer import (
     WriteBaseTransformer,
     WriteTransformerContext,
 )
+from ptext.pdf.document import Document
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +29,9 @@ class WriteStreamTransformer(WriteBaseTransformer):
     This implementation of WriteBaseTransformer is responsible for writing Stream objects
     """
 
+    # number of Stream objects (per worker) that are compressed ahead of writing
+    COMPRESSION_LOOK_AHEAD: int = 2
+
     def can_be_transformed(self, any: AnyPDFType):
         """
         This function returns True if the object to be converted represents a Stream object
@@ -63,42 +70,46 @@ class WriteStreamTransformer(WriteBaseTransformer):
             if object_ref.object_number is not None and object_ref.byte_offset is None:
                 started_object = True
                 self._start_object(object_to_transform, context)
-            context.resolved_references.append(object_ref)
+            context.resolved_references.add(object_ref)
 
         # build stream dictionary
         stream_dictionary = Dictionary()
 
         # objects to turn into reference
         queue: typing.List[AnyPDFType] = []
-        for k, v in object_to_transform.items():
+        # (the DecodedBytes are not accessed, they may not have been decoded)
+        for k in list(object_to_transform.keys()):
             if k in ["Bytes", "DecodedBytes"]:
                 continue
+            v = object_to_transform[k]
             if (
                 isinstance(v, Dictionary)
                 or isinstance(v, List)
                 or isinstance(v, Stream)
+                or isinstance(v, Image)
             ) and v.can_be_referenced():  # type: ignore [union-attr]
                 stream_dictionary[k] = self.get_reference(v, context)
                 queue.append(v)
             else:
                 stream_dictionary[k] = v
 
-        # if self.compression_level == 0, remove \Filter
-        if context.compression_level == 0 and Name("Filter") in stream_dictionary:
-            stream_dictionary.pop(Name("Filter"))
-
-        # handle compression
-        if "DecodedBytes" in object_to_transform:
+        # Stream objects that were never decoded, or whose DecodedBytes were not replaced
+        # (since they were decoded), are written as they were read, with their \Filter and \DecodeParms
+        if WriteStreamTransformer._is_unmodified(object_to_transform):
+            bts = object_to_transform["Bytes"]
+            stream_dictionary[Name("Length")] = pDecimal(len(bts))
+        else:
+            # the DecodedBytes are (re)compressed using \FlateDecode (without predictor)
+            # if self.compression_level == 0, remove \Filter
+            for k in [Name("Filter"), Name("DecodeParms")]:
+                if k in stream_dictionary:
+                    stream_dictionary.pop(k)
             if context.compression_level == 0:
                 bts = object_to_transform["DecodedBytes"]
             else:
-                bts = zlib.compress(
-                    object_to_transform["DecodedBytes"], context.compression_level
-                )
+                stream_dictionary[Name("Filter")] = Name("FlateDecode")
+                bts = WriteStreamTransformer._compress(object_to_transform, context)
             stream_dictionary[Name("Length")] = pDecimal(len(bts))
-        else:
-            assert "Bytes" in object_to_transform
-            bts = object_to_transform["Bytes"]
 
         # write stream dictionary
         self.get_root_transformer().transform(stream_dictionary, context)
@@ -118,3 +129,115 @@ class WriteStreamTransformer(WriteBaseTransformer):
 
         for e in queue:
             self.get_root_transformer().transform(e, context)
+
+    @staticmethod
+    def _is_unmodified(stream: Stream) -> bool:
+        if "Bytes" not in stream:
+            return False
+        # DecodedBytes (of a Stream that is decoded lazily) are not decoded to check this
+        decoded_bytes = dict.get(stream, "DecodedBytes", None)
+        if decoded_bytes is None or decoded_bytes.__class__ is DecodedBytesProxy:
+            return True
+        return vars(stream).get("_decoded_bytes", None) is decoded_bytes
+
+    @staticmethod
+    def _compress(stream: Stream, context: WriteTransformerContext) -> bytes:
+        # use the compressed bytes (if the Stream was compressed ahead of writing)
+        decoded_bytes = stream["DecodedBytes"]
+        context.streams_to_compress.pop(id(stream), None)
+        compressed_bytes = context.compressed_bytes.pop(id(stream), None)
+        WriteStreamTransformer._compress_ahead(context)
+        if compressed_bytes is not None and compressed_bytes[0] is decoded_bytes:
+            return compressed_bytes[1].result()
+        return zlib.compress(decoded_bytes, context.compression_level)
+
+    @staticmethod
+    def _compress_ahead(context: WriteTransformerContext) -> None:
+        # keep (at most) COMPRESSION_LOOK_AHEAD Stream objects per worker compressing ahead of writing,
+        # so that (at most) that many compressed Stream objects are held in memory
+        if context.compression_executor is None:
+            return
+        max_number_of_streams: int = (
+            context.number_of_workers * WriteStreamTransformer.COMPRESSION_LOOK_AHEAD
+        )
+        while (
+            len(context.compressed_bytes) < max_number_of_streams
+            and len(context.streams_to_compress) > 0
+        ):
+            s: Stream = context.streams_to_compress.popitem(last=False)[1]
+            decoded_bytes = s["DecodedBytes"]
+            context.compressed_bytes[id(s)] = (
+                decoded_bytes,
+                context.compression_executor.submit(
+                    zlib.compress, decoded_bytes, context.compression_level
+                ),
+            )
+
+    @staticmethod
+    def _compress_streams(document: Document, context: WriteTransformerContext) -> None:
+        """
+        This function starts compressing (the DecodedBytes of) the Stream objects in a Document that will be (re-)compressed
+        when they are written, using context.number_of_workers threads (zlib releases the GIL while compressing).
+        Stream objects are compressed (a few at a time) in the order in which they are expected to be written,
+        and written (in order) when the writer gets to them, so the output does not depend on the number of workers.
+        This function is called (by WritePDFTransformer) before any object is written,
+        _stop_compressing_streams is called after all objects are written.
+        """
+        if context.number_of_workers <= 1 or context.compression_level == 0:
+            return
+
+        # find Stream objects (IndirectObjectProxy objects are not read)
+        # depth first, in the order of their entries (as they are written), starting from /Root and /Info
+        trailer: Dictionary = document["XRef"]["Trailer"]
+        objects_done: typing.Set[int] = set()
+        objects_todo: typing.List[AnyPDFType] = [
+            x
+            for x in [trailer.get("Info"), trailer.get("Root"), trailer]
+            if x is not None
+        ]
+        while len(objects_todo) > 0:
+            obj = objects_todo.pop()
+            if id(obj) in objects_done:
+                continue
+            objects_done.add(id(obj))
+            if isinstance(obj, Dictionary):
+                if (
+                    isinstance(obj, Stream)
+                    and "DecodedBytes" in obj
+                    and not WriteStreamTransformer._is_unmodified(obj)
+                    and WriteStreamTransformer._will_be_written(obj, context)
+                ):
+                    context.streams_to_compress[id(obj)] = obj
+                objects_todo.extend(reversed(list(dict.values(obj))))
+            elif isinstance(obj, List):
+                objects_todo.extend(reversed(list(list.__iter__(obj))))
+
+        # compress
+        context.compression_executor = ThreadPoolExecutor(
+            max_workers=context.number_of_workers
+        )
+        WriteStreamTransformer._compress_ahead(context)
+
+    @staticmethod
+    def _stop_compressing_streams(context: WriteTransformerContext) -> None:
+        """
+        This function stops compressing Stream objects ahead of writing,
+        Stream objects that were compressed, but not written, are discarded.
+        """
+        if context.compression_executor is None:
+            return
+        for _, f in context.compressed_bytes.values():
+            f.cancel()
+        context.compression_executor.shutdown(wait=True)
+        context.compression_executor = None
+        context.streams_to_compress.clear()
+        context.compressed_bytes.clear()
+
+    @staticmethod
+    def _will_be_written(stream: Stream, context: WriteTransformerContext) -> bool:
+        # incremental update: Stream objects that were read, and not modified since, are not written
+        if context.revision is None:
+            return True
+        if context.revision.get_reference(stream) is None:
+            return True
+        return context.revision.is_modified(stream)
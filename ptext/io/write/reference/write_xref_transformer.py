@@ -7,7 +7,15 @@ This implementation of WriteBaseTransformer is responsible for writing XREF obje
 import typing
 from typing import Optional
 
-from ptext.io.read.types import AnyPDFType, Decimal, Dictionary, Name, Reference
+from ptext.io.read.types import (
+    AnyPDFType,
+    Decimal,
+    Dictionary,
+    List,
+    Name,
+    Reference,
+    Stream,
+)
 from ptext.io.write.write_base_transformer import (
     WriteBaseTransformer,
     WriteTransformerContext,
@@ -20,6 +28,8 @@ class WriteXREFTransformer(WriteBaseTransformer):
     This implementation of WriteBaseTransformer is responsible for writing XREF objects
     """
 
+    MAX_NUMBER_OF_OBJECTS_PER_OBJECT_STREAM: int = 100
+
     def can_be_transformed(self, any: AnyPDFType):
         """
         This function returns True if the object to be converted represents a cross-reference table
@@ -80,6 +90,20 @@ class WriteXREFTransformer(WriteBaseTransformer):
                 object_to_transform["Trailer"]["Info"], context
             )
 
+        # write (other) objects that were modified since the Document was read
+        if context.revision is not None:
+            for obj in context.revision.get_modified_objects(
+                object_to_transform["Trailer"]
+            ):
+                self.get_reference(obj, context)
+                self.get_root_transformer().transform(obj, context)
+
+        # write object streams, and cross-reference stream
+        if context.use_object_streams:
+            self._write_object_streams(context)
+            self._write_xref_stream(trailer_out, context)
+            return
+
         # write /XREF
         start_of_xref = context.destination.tell()
         context.destination.write(bytes("xref\n", "latin1"))
@@ -90,7 +114,12 @@ class WriteXREFTransformer(WriteBaseTransformer):
             for r in section:
                 if r.is_in_use:
                     context.destination.write(
-                        bytes("{0:010d} 00000 n\r\n".format(r.byte_offset), "latin1")
+                        bytes(
+                            "{0:010d} {1:05d} n\r\n".format(
+                                r.byte_offset, r.generation_number or 0
+                            ),
+                            "latin1",
+                        )
                     )
                 else:
                     context.destination.write(
@@ -98,9 +127,14 @@ class WriteXREFTransformer(WriteBaseTransformer):
                     )
 
         # update /Size
-        trailer_out[Name("Size")] = Decimal(
-            sum([len(v) for k, v in context.indirect_objects_by_hash.items()]) + 1
-        )
+        trailer_out[Name("Size")] = Decimal(len(context.indirect_objects) + 1)
+
+        # incremental update: /Size covers the original objects, /Prev points to the original XREF
+        if context.revision is not None:
+            trailer_out[Name("Size")] = Decimal(
+                max(context.revision.get_size(), context.next_object_number)
+            )
+            trailer_out[Name("Prev")] = Decimal(context.revision.get_start_of_xref())
 
         # write /Trailer
         context.destination.write(bytes("trailer\n", "latin1"))
@@ -119,18 +153,14 @@ class WriteXREFTransformer(WriteBaseTransformer):
         ), "A WriteTransformerContext must be defined in order to write XREF objects."
 
         # get all references
-        indirect_objects: typing.List[AnyPDFType] = [
-            item
-            for sublist in [v for k, v in context.indirect_objects_by_hash.items()]
-            for item in sublist
-        ]
+        # (context.indirect_objects is ordered by object number, unless the Document is saved incrementally)
         references: typing.List[Reference] = []
-        for obj in indirect_objects:
+        for obj in context.indirect_objects:
             ref = obj.get_reference()  # type: ignore [union-attr]
             if ref is not None:
                 references.append(ref)
-        # sort
-        references.sort(key=lambda x: x.object_number)
+        if context.revision is not None:
+            references.sort(key=lambda x: x.object_number or 0)
 
         # insert magic entry if needed
         if len(references) == 0 or references[0].generation_number != 65535:
@@ -157,3 +187,115 @@ class WriteXREFTransformer(WriteBaseTransformer):
 
         # return
         return sections
+
+    def _write_object_streams(self, context: WriteTransformerContext) -> None:
+        """
+        This function packs all objects that were written to a buffer in object streams,
+        and writes those object streams
+        """
+        assert context.destination is not None
+        objects: typing.List[
+            typing.Tuple[int, bytes]
+        ] = context.objects_waiting_for_object_stream
+        context.objects_waiting_for_object_stream = []
+        n: int = WriteXREFTransformer.MAX_NUMBER_OF_OBJECTS_PER_OBJECT_STREAM
+        for i in range(0, len(objects), n):
+
+            # header (object number, byte offset pairs) and objects
+            header: bytearray = bytearray()
+            body: bytearray = bytearray()
+            for object_number, object_bytes in objects[i : i + n]:
+                header += b"%d %d " % (object_number, len(body))
+                body += object_bytes
+
+            # build object stream
+            object_stream: Stream = Stream()
+            object_stream[Name("Type")] = Name("ObjStm")
+            object_stream[Name("N")] = Decimal(len(objects[i : i + n]))
+            object_stream[Name("First")] = Decimal(len(header))
+            object_stream[Name("Filter")] = Name("FlateDecode")
+            object_stream[Name("DecodedBytes")] = bytes(header + body)
+            object_stream_ref: Reference = self.get_reference(object_stream, context)
+            assert object_stream_ref.object_number is not None
+            for j, (object_number, _) in enumerate(objects[i : i + n]):
+                context.object_stream_entries[object_number] = (
+                    object_stream_ref.object_number,
+                    j,
+                )
+
+            # write object stream
+            self.get_root_transformer().transform(object_stream, context)
+
+    def _write_xref_stream(
+        self, trailer: Dictionary, context: WriteTransformerContext
+    ) -> None:
+        """
+        This function writes a cross-reference stream (containing the entries of trailer),
+        followed by startxref and the end-of-file marker
+        """
+        assert context.destination is not None
+
+        # build cross-reference stream
+        # (the cross-reference stream has an entry for itself, it is never shared with another object)
+        xref_stream: Stream = Stream()
+        xref_stream.set_reference(Reference(object_number=context.get_next_object_number()))  # type: ignore [attr-defined]
+        context.indirect_objects_by_id[id(xref_stream)] = xref_stream
+        context.indirect_objects.append(xref_stream)
+        start_of_xref: int = context.destination.tell()
+
+        # (type, field 2, field 3) for every object number
+        entries: typing.List[typing.Tuple[int, int, int]] = [
+            (0, 0, 0) for _ in range(0, len(context.indirect_objects) + 1)
+        ]
+        entries[0] = (0, 0, 65535)
+        for obj in context.indirect_objects:
+            ref = obj.get_reference()  # type: ignore [union-attr]
+            assert ref is not None
+            assert ref.object_number is not None
+            if ref.object_number in context.object_stream_entries:
+                entries[ref.object_number] = (
+                    2,
+                    *context.object_stream_entries[ref.object_number],
+                )
+            elif obj is xref_stream:
+                entries[ref.object_number] = (1, start_of_xref, 0)
+            else:
+                assert ref.byte_offset is not None
+                entries[ref.object_number] = (
+                    1,
+                    ref.byte_offset,
+                    ref.generation_number or 0,
+                )
+
+        # encode entries, using (big-endian) fields that are as wide as needed
+        widths: typing.List[int] = [
+            1,
+            max(1, (max([e[1] for e in entries]).bit_length() + 7) // 8),
+            max(1, (max([e[2] for e in entries]).bit_length() + 7) // 8),
+        ]
+        xref_stream_bytes: bytearray = bytearray()
+        for e in entries:
+            for v, w in zip(e, widths):
+                xref_stream_bytes += v.to_bytes(w, "big")
+
+        # cross-reference stream dictionary (which also acts as trailer)
+        xref_stream[Name("Type")] = Name("XRef")
+        xref_stream[Name("Size")] = Decimal(len(entries))
+        xref_stream[Name("W")] = List().set_can_be_referenced(False)  # type: ignore [attr-defined]
+        for w in widths:
+            xref_stream["W"].append(Decimal(w))
+        for k in ["Root", "Info", "ID"]:
+            if k in trailer:
+                xref_stream[Name(k)] = trailer[k]
+        xref_stream[Name("Filter")] = Name("FlateDecode")
+        xref_stream[Name("DecodedBytes")] = bytes(xref_stream_bytes)
+
+        # write cross-reference stream
+        self.get_root_transformer().transform(xref_stream, context)
+        context.destination.write(bytes("startxref\n", "latin1"))
+
+        # write byte offset of cross-reference stream
+        context.destination.write(bytes(str(start_of_xref) + "\n", "latin1"))
+
+        # write EOF
+        context.destination.write(bytes("%%EOF", "latin1"))
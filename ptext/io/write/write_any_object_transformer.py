@@ -12,6 +12,9 @@ from ptext.io.read.types import AnyPDFType
 from ptext.io.write.ascii_art.write_ascii_art_transformer import (
     WriteASCIIArtTransformer,
 )
+from ptext.io.write.font.write_true_type_font_transformer import (
+    WriteTrueTypeFontTransformer,
+)
 from ptext.io.write.image.write_image_transformer import WriteImageTransformer
 from ptext.io.write.object.write_array_transformer import WriteArrayTransformer
 from ptext.io.write.object.write_dictionary_transformer import (
@@ -52,6 +55,7 @@ class WriteAnyObjectTransformer(WriteBaseTransformer):
         # object types
         self.add_child_transformer(WriteArrayTransformer())
         self.add_child_transformer(WriteStreamTransformer())
+        self.add_child_transformer(WriteTrueTypeFontTransformer())
         self.add_child_transformer(WriteDictionaryTransformer())
         self.add_child_transformer(WriteImageTransformer())
         self.add_child_transformer(WriteXMPTransformer())
@@ -6,9 +6,11 @@ It reads bytes from a PDF document, and converts it to JSON-like datastructures.
 """
 import io
 import typing
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 
-from ptext.io.read.types import AnyPDFType, Reference
+from ptext.io.read.types import AnyPDFType, DecodedBytesProxy, Reference, Stream
 
 
 class WriteTransformerContext:
@@ -16,9 +18,13 @@ class WriteTransformerContext:
     This class represents all the meta-information used in the process of persisting a PDF document.
     This includes:
     - the root object (the Document itself)
-    - a cache of indirect objects (by id and hash)
+    - a cache of indirect objects (by id and structural hash)
+    - the next (free) object number
     - references that have been resolved (to avoid endless loops)
-    - the default compression level
+    - the default compression level, and the number of workers used to compress Stream objects
+    - the character identifiers used (per embedded font file), for font subsetting
+    - whether (non-stream) objects are packed in object streams, and the objects that are waiting to be packed
+    - whether the Document is saved incrementally, and the Revision (as it was read) of the Document
     - etc
     """
 
@@ -26,6 +32,10 @@ class WriteTransformerContext:
         self,
         destination: Optional[typing.Union[io.BufferedIOBase, io.RawIOBase]] = None,
         root_object: Optional[AnyPDFType] = None,
+        use_object_streams: bool = False,
+        incremental_update: bool = False,
+        compression_level: int = 9,
+        number_of_workers: int = 1,
     ):
         self.destination = (
             destination  # this is the destination to write to (file, byte-buffer, etc)
@@ -36,11 +46,52 @@ class WriteTransformerContext:
         self.indirect_objects_by_id: typing.Dict[int, AnyPDFType] = {}
         self.indirect_objects_by_hash: typing.Dict[
             int, typing.List[AnyPDFType]
-        ] = {}  # these are all the indirect objects
-        self.resolved_references: typing.List[
+        ] = {}  # these are all the indirect objects (by structural hash)
+        self.indirect_objects: typing.List[
+            AnyPDFType
+        ] = []  # these are all the indirect objects (in order of object number, unless saved incrementally)
+        self.resolved_references: typing.Set[
             Reference
-        ] = []  # these references have already been written
-        self.compression_level = 9
+        ] = set()  # these references have already been written
+        self.next_object_number: int = 1
+        self.compression_level: int = compression_level
+        self.number_of_workers: int = number_of_workers
+        self.compression_executor: Optional[
+            ThreadPoolExecutor
+        ] = None  # compresses Stream objects ahead of writing (if number_of_workers > 1)
+        self.streams_to_compress: "OrderedDict[int, Stream]" = (
+            OrderedDict()
+        )  # id(Stream) -> Stream objects (in the order they are expected to be written) yet to be compressed ahead of writing
+        self.compressed_bytes: typing.Dict[
+            int, typing.Tuple[bytes, Future]
+        ] = {}  # id(Stream) -> (DecodedBytes, compressed bytes) of Stream objects being compressed ahead of writing
+        self.used_character_identifiers_by_font_file: typing.Optional[
+            typing.Dict[bytes, typing.Set[int]]
+        ] = None
+        # object streams
+        self.use_object_streams: bool = use_object_streams
+        self.destinations_outside_object_stream: typing.List[
+            typing.Union[io.BufferedIOBase, io.RawIOBase]
+        ] = []
+        self.objects_waiting_for_object_stream: typing.List[
+            typing.Tuple[int, bytes]
+        ] = []  # (object number, bytes) of objects that will be written in an object stream
+        self.object_stream_entries: typing.Dict[
+            int, typing.Tuple[int, int]
+        ] = {}  # object number -> (object number of object stream, index in object stream)
+        # incremental update
+        self.incremental_update: bool = incremental_update
+        self.revision: Optional[
+            "Revision"  # type: ignore [name-defined]
+        ] = None  # objects that were read keep their object number, unmodified objects are not written
+
+    def get_next_object_number(self) -> int:
+        """
+        This function allocates a new object number (object numbers are handed out in increasing order)
+        """
+        obj_number: int = self.next_object_number
+        self.next_object_number += 1
+        return obj_number
 
 
 class WriteBaseTransformer:
@@ -117,17 +168,26 @@ class WriteBaseTransformer:
         """
         This function starts a new direct object by writing
         its reference number followed by "obj" (e.g. "12 0 obj").
-        It also does some bookkeeping to ensure the byte offset is stored in the XREF
+        It also does some bookkeeping to ensure the byte offset is stored in the XREF.
+        If object streams are used, (eligible) objects are written to a buffer instead,
+        until they are packed in an object stream.
         """
-        # get offset position
         assert context is not None
         assert context.destination is not None
-        byte_offset = context.destination.tell()
-
-        # update offset
         ref = object_to_transform.get_reference()  # type: ignore [union-attr]
         assert ref is not None
         assert isinstance(ref, Reference)
+
+        # write object to buffer
+        if self._can_be_written_in_object_stream(object_to_transform, context):
+            context.destinations_outside_object_stream.append(context.destination)
+            context.destination = io.BytesIO()
+            return
+
+        # get offset position
+        byte_offset = context.destination.tell()
+
+        # update offset
         ref.byte_offset = byte_offset
 
         # write <object number> <generation number> obj
@@ -147,11 +207,36 @@ class WriteBaseTransformer:
         """
         This function writes the "endobj" bytes whenever a direct object needs to be closed
         """
-        # write endobj
         assert context is not None
         assert context.destination is not None
+
+        # objects in an object stream have no "endobj"
+        if self._can_be_written_in_object_stream(object_to_transform, context):
+            assert isinstance(context.destination, io.BytesIO)
+            ref = object_to_transform.get_reference()  # type: ignore [union-attr]
+            context.objects_waiting_for_object_stream.append(
+                (ref.object_number, context.destination.getvalue())
+            )
+            context.destination = context.destinations_outside_object_stream.pop()
+            return
+
+        # write endobj
         context.destination.write(bytes("endobj\n\n", "latin1"))
 
+    @staticmethod
+    def _can_be_written_in_object_stream(
+        object_to_transform: AnyPDFType,
+        context: WriteTransformerContext,
+    ) -> bool:
+        """
+        This function returns True if the given (indirect) object is to be written in an object stream.
+        Stream objects, and objects with a non-zero generation number, can not be written in an object stream.
+        """
+        if not context.use_object_streams or isinstance(object_to_transform, Stream):
+            return False
+        ref = object_to_transform.get_reference()  # type: ignore [union-attr]
+        return ref is not None and (ref.generation_number or 0) == 0
+
     @staticmethod
     def _hash(obj: typing.Any) -> int:
         h: Optional[int] = None
@@ -169,6 +254,44 @@ class WriteBaseTransformer:
             raise TypeError("unhashable type: %s" % obj.__class__.__name__)
         return h
 
+    @staticmethod
+    def _structural_hash(obj: typing.Any, depth: int = 2) -> int:
+        """
+        This function returns a hash of (the structure of) an object.
+        Unlike Dictionary.__hash__ (which only takes into account the keys), it takes into account
+        the values of a Dictionary (or List), up to the given depth.
+        Objects that are equal have the same structural hash.
+        """
+        if isinstance(obj, dict):
+            if depth == 0:
+                return len(obj)
+            # entries are combined in an order-independent way (like the entries of the dict itself)
+            # (DecodedBytes that were not decoded yet are not decoded to compute the hash)
+            h: int = len(obj)
+            for k in obj.keys():
+                v = dict.__getitem__(obj, k)
+                if v.__class__ is not DecodedBytesProxy:
+                    v = obj[k]
+                h ^= hash((hash(k), WriteBaseTransformer._structural_hash(v, depth - 1)))
+            return h
+        if isinstance(obj, list):
+            if depth == 0:
+                return len(obj)
+            return hash(
+                tuple(
+                    [
+                        WriteBaseTransformer._structural_hash(x, depth - 1)
+                        for x in obj
+                    ]
+                )
+            )
+        if isinstance(obj, bytearray):
+            return hash(bytes(obj))
+        try:
+            return WriteBaseTransformer._hash(obj)
+        except TypeError:
+            return 0
+
     def get_reference(
         self, object: AnyPDFType, context: WriteTransformerContext
     ) -> Reference:
@@ -182,8 +305,21 @@ class WriteBaseTransformer:
             assert not isinstance(cached_indirect_object, Reference)
             return cached_indirect_object.get_reference()  # type: ignore [union-attr]
 
+        # objects that were read (incremental update) keep their object number
+        # unmodified objects are considered to be written already
+        if context.revision is not None:
+            original_ref: Optional[Reference] = context.revision.get_reference(object)
+            if original_ref is not None:
+                object.set_reference(original_ref)  # type: ignore [union-attr]
+                context.indirect_objects_by_id[obj_id] = object
+                if context.revision.is_modified(object):
+                    context.indirect_objects.append(object)
+                else:
+                    context.resolved_references.add(original_ref)
+                return original_ref
+
         # look through existing indirect object hashes
-        obj_hash: int = self._hash(object)
+        obj_hash: int = self._structural_hash(object)
         if obj_hash in context.indirect_objects_by_hash:
             for obj in context.indirect_objects_by_hash[obj_hash]:
                 if obj == object:
@@ -193,20 +329,8 @@ class WriteBaseTransformer:
                     object.set_reference(ref)  # type: ignore [union-attr]
                     return ref
 
-        # generate new object number
-        existing_obj_numbers = set(
-            [
-                item.get_reference().object_number  # type: ignore [union-attr]
-                for sublist in [v for k, v in context.indirect_objects_by_hash.items()]
-                for item in sublist
-            ]
-        )
-        obj_number = len(existing_obj_numbers) + 1
-        while obj_number in existing_obj_numbers:  # type: ignore [union-attr]
-            obj_number += 1
-
         # build reference
-        ref = Reference(object_number=obj_number)
+        ref = Reference(object_number=context.get_next_object_number())
         object.set_reference(ref)  # type: ignore [union-attr]
 
         # insert into context.indirect_objects_by_hash
@@ -215,8 +339,9 @@ class WriteBaseTransformer:
         else:
             context.indirect_objects_by_hash[obj_hash] = [object]
 
-        # insert into context.indirect_objects_by_id
+        # insert into context.indirect_objects_by_id, context.indirect_objects
         context.indirect_objects_by_id[obj_id] = object
+        context.indirect_objects.append(object)
 
         # return
         return ref
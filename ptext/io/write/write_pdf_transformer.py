@@ -18,11 +18,16 @@ from ptext.io.read.types import (
     Name,
     String,
 )
+from ptext.io.write.font.write_true_type_font_transformer import (
+    WriteTrueTypeFontTransformer,
+)
+from ptext.io.write.object.write_stream_transformer import WriteStreamTransformer
 from ptext.io.write.write_base_transformer import (
     WriteBaseTransformer,
     WriteTransformerContext,
 )
 from ptext.pdf.document import Document
+from ptext.pdf.revision import Revision
 
 logger = logging.getLogger(__name__)
 
@@ -46,17 +51,21 @@ class WritePDFTransformer(WriteBaseTransformer):
         """
         This method writes a Document object to a byte stream
         """
-        # write header
         assert context is not None
         assert context.destination is not None
 
-        context.destination.write(b"%PDF-1.7\n")
-        context.destination.write(b"%")
-        context.destination.write(bytes([226, 227, 207, 211]))
-        context.destination.write(b"\n")
+        # incremental update: copy the original bytes, objects keep their object number
+        if context.incremental_update:
+            WritePDFTransformer._start_incremental_update(object_to_transform, context)
+        else:
+            # write header
+            context.destination.write(b"%PDF-1.7\n")
+            context.destination.write(b"%")
+            context.destination.write(bytes([226, 227, 207, 211]))
+            context.destination.write(b"\n")
 
-        # invalidate all references
-        WritePDFTransformer._invalidate_all_references(object_to_transform)
+            # invalidate all references
+            WritePDFTransformer._invalidate_all_references(object_to_transform)
 
         # create Info dictionary if needed
         if "Info" not in object_to_transform["XRef"]["Trailer"]:
@@ -93,8 +102,42 @@ class WritePDFTransformer(WriteBaseTransformer):
             "pText"
         )
 
+        # collect the glyphs used by (subset) TrueTypeFont objects
+        WriteTrueTypeFontTransformer._collect_used_character_identifiers(
+            object_to_transform, context
+        )
+
+        # compress Stream objects (using multiple workers), ahead of writing them
+        WriteStreamTransformer._compress_streams(object_to_transform, context)
+
         # transform XREF
-        self.get_root_transformer().transform(object_to_transform["XRef"], context)
+        try:
+            self.get_root_transformer().transform(object_to_transform["XRef"], context)
+        finally:
+            WriteStreamTransformer._stop_compressing_streams(context)
+
+    @staticmethod
+    def _start_incremental_update(
+        document: Document, context: WriteTransformerContext
+    ) -> None:
+        revision: typing.Optional[Revision] = vars(document).get("_revision", None)
+        assert (
+            revision is not None
+        ), "Only a Document that was read (using PDF.loads) can be saved incrementally."
+        assert (
+            not context.use_object_streams
+        ), "Object streams can not be used when saving a Document incrementally."
+        assert context.destination is not None
+
+        # copy the original bytes
+        revision.write_source(context.destination)
+        context.destination.write(b"\n")
+
+        # new objects are numbered after the original objects
+        context.revision = revision
+        context.next_object_number = max(
+            context.next_object_number, revision.get_size()
+        )
 
     @staticmethod
     def _timestamp_to_str() -> str:
@@ -107,13 +150,14 @@ class WritePDFTransformer(WriteBaseTransformer):
 
     @staticmethod
     def _invalidate_all_references(object: AnyPDFType) -> None:
-        objects_done: typing.List[AnyPDFType] = []
+        # objects are tracked by id (comparing them would make this quadratic)
+        objects_done: typing.Set[int] = set()
         objects_todo: typing.List[AnyPDFType] = [object]
         while len(objects_todo) > 0:
-            obj = objects_todo.pop(0)
-            if obj in objects_done:
+            obj = objects_todo.pop()
+            if id(obj) in objects_done:
                 continue
-            objects_done.append(obj)
+            objects_done.add(id(obj))
             try:
                 obj.set_reference(None)  # type: ignore [union-attr]
             except Exception as ex:
@@ -126,7 +170,9 @@ class WritePDFTransformer(WriteBaseTransformer):
                 continue
             if isinstance(obj, Dictionary):
                 assert isinstance(obj, Dictionary)
-                for k, v in obj.items():
+                # (DecodedBytes are not accessed, they may not have been decoded)
+                for k in list(obj.keys()):
                     objects_todo.append(k)
-                    objects_todo.append(v)
+                    if k != "DecodedBytes":
+                        objects_todo.append(obj[k])
                 continue
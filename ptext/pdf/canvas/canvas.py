@@ -6,9 +6,11 @@
     (lines, shapes, text, frames containing other elements, etc.).
     It takes its name from the canvas used in visual arts.
 """
+import typing
 
 from ptext.io.read.types import Dictionary
 from ptext.pdf.canvas.canvas_graphics_state import CanvasGraphicsState
+from ptext.pdf.canvas.event.event_bus import EventBus
 
 
 class Canvas(Dictionary):
@@ -28,3 +30,39 @@ class Canvas(Dictionary):
         self.marked_content_stack = []
         # set graphics state stack
         self.graphics_state_stack = []
+        # event bus (unless it is set explicitly, built for every content stream that is processed)
+        self._event_bus: typing.Optional[EventBus] = None
+        self._event_bus_is_set: bool = False
+
+    def get_event_bus(self) -> EventBus:
+        """
+        This function returns the EventBus to which this Canvas sends its Event objects.
+        Unless it was set explicitly, it is built from the EventListener(s) attached to this Canvas and its parent(s),
+        the first time it is needed while processing a content stream (see reset_event_bus).
+        """
+        if self._event_bus is None:
+            self._event_bus = EventBus.for_object(self)
+        return self._event_bus
+
+    def set_event_bus(self, event_bus: typing.Optional[EventBus]) -> "Canvas":
+        """
+        This function sets the EventBus to which this Canvas sends its Event objects.
+        Setting it to None makes this Canvas build its EventBus from the EventListener(s)
+        attached to this Canvas and its parent(s) again.
+        This function returns self
+        """
+        self._event_bus = event_bus
+        self._event_bus_is_set = event_bus is not None
+        return self
+
+    def reset_event_bus(self) -> "Canvas":
+        """
+        This function discards the EventBus this Canvas built (if any),
+        so that EventListener(s) added (to this Canvas or its parent(s)) since are subscribed to the next one.
+        It is called (by CanvasStreamProcessor) whenever a content stream is processed.
+        An EventBus that was set explicitly is kept.
+        This function returns self
+        """
+        if not self._event_bus_is_set:
+            self._event_bus = None
+        return self
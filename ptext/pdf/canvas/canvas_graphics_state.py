@@ -34,9 +34,9 @@ class CanvasGraphicsState:
     """
 
     def __init__(self):
-        self.ctm: Matrix = Matrix.identity_matrix()
-        self.text_matrix: Matrix = Matrix.identity_matrix()
-        self.text_line_matrix: Matrix = Matrix.identity_matrix()
+        self.ctm: Matrix = Matrix.affine_matrix()
+        self.text_matrix: Matrix = Matrix.affine_matrix()
+        self.text_line_matrix: Matrix = Matrix.affine_matrix()
         self.text_rise: Decimal = Decimal(0)
         self.character_spacing: Decimal = Decimal(0)
         self.word_spacing: Decimal = Decimal(0)
@@ -61,6 +61,33 @@ class CanvasGraphicsState:
         self.soft_mask = None
         self.alpha_constant = None
         self.alpha_source = None
+        # whether the text matrix is shared with another CanvasGraphicsState
+        self._text_matrix_is_shared: bool = False
+
+    def copy(self) -> "CanvasGraphicsState":
+        """
+        This function returns a copy of this CanvasGraphicsState, in constant time.
+        All members (matrices, colors, the font, etc) are shared (by reference) between both copies,
+        they are never modified in place, but replaced. The only exception is the text matrix,
+        which is copied (on write) by move_text_matrix.
+        The path is not copied.
+        """
+        out: CanvasGraphicsState = CanvasGraphicsState.__new__(CanvasGraphicsState)
+        out.__dict__.update(self.__dict__)
+        out.path = []
+        out._text_matrix_is_shared = True
+        self._text_matrix_is_shared = True
+        return out
+
+    def move_text_matrix(self, tx: Decimal) -> None:
+        """
+        This function translates the text matrix horizontally (by tx unscaled text space units)
+        """
+        assert self.text_matrix is not None
+        if self._text_matrix_is_shared:
+            self.text_matrix = copy.deepcopy(self.text_matrix)
+            self._text_matrix_is_shared = False
+        self.text_matrix[2][0] += Matrix.to_number(tx)
 
     def __deepcopy__(self, memodict={}):
         out = CanvasGraphicsState()
@@ -236,6 +236,9 @@ class CanvasStreamProcessor:
 
         canvas_tokenizer = HighLevelTokenizer(io_source)
 
+        # EventListener(s) may have been added since the previous content stream was processed
+        self._canvas.reset_event_bus()
+
         # process content
         operand_stk = []
         instruction_number: int = 0
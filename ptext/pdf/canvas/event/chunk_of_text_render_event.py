@@ -12,92 +12,185 @@ from ptext.pdf.canvas.canvas_graphics_state import CanvasGraphicsState
 from ptext.pdf.canvas.event.event_listener import Event
 from ptext.pdf.canvas.font.font import Font
 from ptext.pdf.canvas.font.glyph_line import GlyphLine
+from ptext.pdf.canvas.geometry.matrix import Matrix
 from ptext.pdf.canvas.geometry.rectangle import Rectangle
 from ptext.pdf.canvas.layout.text.chunk_of_text import ChunkOfText
 
 
+def _to_rectangle(p0: typing.Tuple, p1: typing.Tuple) -> Rectangle:
+    # build the (Decimal) Rectangle spanned by two points
+    return Rectangle(
+        Matrix.to_decimal(min(p0[0], p1[0])),
+        Matrix.to_decimal(min(p0[1], p1[1])),
+        Matrix.to_decimal(abs(p1[0] - p0[0])),
+        Matrix.to_decimal(abs(p1[1] - p0[1])),
+    )
+
+
 class ChunkOfTextRenderEvent(Event, ChunkOfText):
     """
-    This implementation of Event is triggered right after the Canvas has processed a text-rendering instruction
+    This implementation of Event is triggered right after the Canvas has processed a text-rendering instruction.
+    Building a ChunkOfTextRenderEvent is cheap, it only stores the raw bytes and a (copy-on-write) snapshot of the graphics state.
+    Its glyphs, text, bounding boxes and space-character width estimate are calculated the first time they are needed.
     """
 
     def __init__(self, graphics_state: CanvasGraphicsState, raw_bytes: String):
         assert graphics_state.font is not None
         assert isinstance(graphics_state.font, Font)
-        self._glyph_line: GlyphLine = GlyphLine(
-            raw_bytes.get_value_bytes(),
-            graphics_state.font,
-            graphics_state.font_size,
-            graphics_state.character_spacing,
-            graphics_state.word_spacing,
-            graphics_state.horizontal_scaling,
-        )
+
+        # snapshot (see CanvasGraphicsState.copy)
+        self._graphics_state: CanvasGraphicsState = graphics_state.copy()
+        self._raw_bytes: String = raw_bytes
+
+        # lazily calculated members
+        self._glyph_line_value: typing.Optional[GlyphLine] = None
+        self._text_value: typing.Optional[str] = None
+        self._baseline_points: typing.Optional[
+            typing.Tuple[Matrix, typing.Tuple, typing.Tuple]
+        ] = None
+        self._baseline_bounding_box_value: typing.Optional[Rectangle] = None
+        self._bounding_box_value: typing.Optional[Rectangle] = None
+        self._space_character_width_estimate_value: typing.Optional[Decimal] = None
+
+        # geometry is calculated using the number type of the graphics state (see Matrix.EXACT),
+        # and converted to Decimal at the end
         super(ChunkOfTextRenderEvent, self).__init__(
             font=graphics_state.font,
-            font_size=graphics_state.font_size * graphics_state.text_matrix[1][1],
+            font_size=Matrix.to_decimal(
+                Matrix.to_number(graphics_state.font_size)
+                * graphics_state.text_matrix[0][0]
+            ),
             font_color=graphics_state.non_stroke_color,
-            text=self._glyph_line.get_text(),
-        )
-        m = graphics_state.text_matrix.mul(graphics_state.ctm)
-        m[1][1] *= graphics_state.font_size
-
-        # calculate baseline box
-        p0 = m.cross(Decimal(0), graphics_state.text_rise, Decimal(1))
-        p1 = m.cross(
-            self._glyph_line.get_width_in_text_space(),
-            graphics_state.text_rise
-            + graphics_state.font.get_ascent() * Decimal(0.001),
-            Decimal(1),
+            text=None,  # type: ignore [arg-type]
         )
 
-        # set baseline box
-        self._baseline_bounding_box = Rectangle(
-            min(p0[0], p1[0]), min(p0[1], p1[1]), abs(p1[0] - p0[0]), abs(p1[1] - p0[1])
-        )
+    #
+    # lazily calculated members
+    #
 
-        # calculate bounding box
-        uses_descent = any(
-            [x in self._text.lower() for x in ["y", "p", "q", "f", "g", "j"]]
-        )
-        if uses_descent:
-            p0 = m.cross(
-                Decimal(0),
-                graphics_state.text_rise
-                + graphics_state.font.get_descent() * Decimal(0.001),
-                Decimal(1),
+    @property
+    def _glyph_line(self) -> GlyphLine:
+        if self._glyph_line_value is None:
+            assert isinstance(self._graphics_state.font, Font)
+            self._glyph_line_value = GlyphLine(
+                self._raw_bytes.get_value_bytes(),
+                self._graphics_state.font,
+                self._graphics_state.font_size,
+                self._graphics_state.character_spacing,
+                self._graphics_state.word_spacing,
+                self._graphics_state.horizontal_scaling,
+            )
+        return self._glyph_line_value
+
+    @_glyph_line.setter
+    def _glyph_line(self, glyph_line: GlyphLine) -> None:
+        self._glyph_line_value = glyph_line
+        self._baseline_points = None
+
+    @property
+    def _text(self) -> str:  # type: ignore [override]
+        if self._text_value is None:
+            self._text_value = self._glyph_line.get_text()
+        return self._text_value
+
+    @_text.setter
+    def _text(self, text: str) -> None:
+        self._text_value = text
+
+    @property
+    def _baseline_bounding_box(self) -> Rectangle:
+        if self._baseline_bounding_box_value is None:
+            _, p0, p1 = self._get_baseline_points_of_glyph_line()
+            self._baseline_bounding_box_value = _to_rectangle(p0, p1)
+        return self._baseline_bounding_box_value
+
+    @_baseline_bounding_box.setter
+    def _baseline_bounding_box(self, baseline_bounding_box: Rectangle) -> None:
+        self._baseline_bounding_box_value = baseline_bounding_box
+
+    @property
+    def bounding_box(self) -> typing.Optional[Rectangle]:  # type: ignore [override]
+        if self._bounding_box_value is None:
+            uses_descent = any(
+                [x in self._text.lower() for x in ["y", "p", "q", "f", "g", "j"]]
             )
-            p1 = m.cross(
-                self._glyph_line.get_width_in_text_space(),
-                graphics_state.text_rise
-                + graphics_state.font.get_ascent() * Decimal(0.001),
-                Decimal(1),
+            if uses_descent:
+                assert isinstance(self._graphics_state.font, Font)
+                n = Matrix.to_number
+                m, _, p1 = self._get_baseline_points_of_glyph_line()
+                descent = n(self._graphics_state.font.get_descent()) * n(0.001)
+                p0 = m.cross(n(0), n(self._graphics_state.text_rise) + descent, n(1))
+                self._bounding_box_value = _to_rectangle(p0, p1)
+            else:
+                self._bounding_box_value = self._baseline_bounding_box
+        return self._bounding_box_value
+
+    @bounding_box.setter
+    def bounding_box(self, bounding_box: typing.Optional[Rectangle]) -> None:
+        self._bounding_box_value = bounding_box
+
+    @property
+    def _space_character_width_estimate_in_user_space(self) -> Decimal:
+        if self._space_character_width_estimate_value is None:
+            assert isinstance(self._graphics_state.font, Font)
+            n = Matrix.to_number
+            self._space_character_width_estimate_value = Matrix.to_decimal(
+                n(self._graphics_state.font.get_space_character_width_estimate())
+                * n(self._graphics_state.font_size)
+                * self._graphics_state.text_matrix[0][0]
+                * n(0.001)
             )
-            self.set_bounding_box(
-                Rectangle(
-                    min(p0[0], p1[0]),
-                    min(p0[1], p1[1]),
-                    abs(p1[0] - p0[0]),
-                    abs(p1[1] - p0[1]),
-                )
+        return self._space_character_width_estimate_value
+
+    @_space_character_width_estimate_in_user_space.setter
+    def _space_character_width_estimate_in_user_space(self, width: Decimal) -> None:
+        self._space_character_width_estimate_value = width
+
+    def _get_baseline_points_of_glyph_line(
+        self,
+    ) -> typing.Tuple[Matrix, typing.Tuple, typing.Tuple]:
+        if self._baseline_points is None:
+            self._baseline_points = ChunkOfTextRenderEvent._get_baseline_points(
+                self._graphics_state, self._glyph_line
             )
-        else:
-            self.set_bounding_box(self._baseline_bounding_box)
-
-        # calculate space character width estimate
-        current_font: Font = graphics_state.font
-        self._space_character_width_estimate_in_user_space = (
-            current_font.get_space_character_width_estimate()
-            * graphics_state.font_size
-            * graphics_state.text_matrix[0][0]
-            * Decimal(0.001)
+        return self._baseline_points
+
+    @staticmethod
+    def _get_baseline_points(
+        graphics_state: CanvasGraphicsState, glyph_line: GlyphLine
+    ) -> typing.Tuple[Matrix, typing.Tuple, typing.Tuple]:
+        # calculate the (text rendering) matrix,
+        # and the (user space) points spanning the baseline box of the given GlyphLine
+        assert isinstance(graphics_state.font, Font)
+        n = Matrix.to_number
+        m = graphics_state.text_matrix.mul(graphics_state.ctm)
+        m[1][1] *= n(graphics_state.font_size)
+        text_rise = n(graphics_state.text_rise)
+        ascent = n(graphics_state.font.get_ascent()) * n(0.001)
+        p0 = m.cross(n(0), text_rise, n(1))
+        p1 = m.cross(glyph_line._get_width_in_text_space(), text_rise + ascent, n(1))
+        return m, p0, p1
+
+    @staticmethod
+    def _get_baseline_width(
+        graphics_state: CanvasGraphicsState, raw_bytes: String
+    ) -> Decimal:
+        # calculate the width of the baseline box (the distance the text matrix is moved by)
+        # of the ChunkOfTextRenderEvent that would be built for the given bytes,
+        # without building it
+        assert isinstance(graphics_state.font, Font)
+        glyph_line: GlyphLine = GlyphLine(
+            raw_bytes.get_value_bytes(),
+            graphics_state.font,
+            graphics_state.font_size,
+            graphics_state.character_spacing,
+            graphics_state.word_spacing,
+            graphics_state.horizontal_scaling,
         )
-        assert graphics_state.font_size is not None
-        self._font_size: Decimal = (
-            graphics_state.font_size * graphics_state.text_matrix[0][0]
+        _, p0, p1 = ChunkOfTextRenderEvent._get_baseline_points(
+            graphics_state, glyph_line
         )
-
-        # store graphics state
-        self._graphics_state = graphics_state
+        return Matrix.to_decimal(abs(p1[0] - p0[0]))
 
     def get_font_size(self) -> Decimal:
         """
@@ -130,61 +223,44 @@ class ChunkOfTextRenderEvent(Event, ChunkOfText):
 
     def split_on_glyphs(self) -> typing.List["ChunkOfTextRenderEvent"]:
         """
-        This function splits this ChunkOfTextRenderEvent on every Glyph
+        This function splits this ChunkOfTextRenderEvent on every Glyph.
+        The Glyph objects (and the text rendering matrix) of this ChunkOfTextRenderEvent are re-used.
         """
         chunks_of_text: typing.List[ChunkOfTextRenderEvent] = []
-        x: Decimal = Decimal(0)
-        y: Decimal = self._graphics_state.text_rise
         assert isinstance(self._graphics_state.font, Font)
         assert self._graphics_state.font is not None
         font: Font = self._graphics_state.font
+        n = Matrix.to_number
+        x = n(0)
+        y = n(self._graphics_state.text_rise)
+        ascent = n(font.get_ascent()) * n(0.001)
+        descent = n(font.get_descent()) * n(0.001)
+        m, _, _ = self._get_baseline_points_of_glyph_line()
         for g in self._glyph_line.split():
-            e = ChunkOfTextRenderEvent(self._graphics_state, String(" "))
-            e._font_size = self._font_size
-            e._font_color = self._font_color
-            e._font = self._font
-            e._text = g.get_text()
-            e._space_character_width_estimate_in_user_space = (
-                self._space_character_width_estimate_in_user_space
-            )
-            e._graphics_state = self._graphics_state
+            e = ChunkOfTextRenderEvent.__new__(ChunkOfTextRenderEvent)
+            e.__dict__.update(self.__dict__)
             e._glyph_line = g
+            e._text = g.get_text()
 
             # set baseline bounding box
-            m = self._graphics_state.text_matrix.mul(self._graphics_state.ctm)
-            m[1][1] *= self._graphics_state.font_size
-            p0 = m.cross(x, y, Decimal(1))
-            p1 = m.cross(
-                x + g.get_width_in_text_space(),
-                y + font.get_ascent() * Decimal(0.001),
-                Decimal(1),
-            )
+            w = g._get_width_in_text_space()
+            p0 = m.cross(x, y, n(1))
+            p1 = m.cross(x + w, y + ascent, n(1))
             e._baseline_bounding_box = Rectangle(
-                p0[0], p0[1], p1[0] - p0[0], p1[1] - p0[1]
+                Matrix.to_decimal(p0[0]),
+                Matrix.to_decimal(p0[1]),
+                Matrix.to_decimal(p1[0] - p0[0]),
+                Matrix.to_decimal(p1[1] - p0[1]),
             )
             e.bounding_box = e._baseline_bounding_box
 
             # change bounding box (descent)
             if g.uses_descent():
-                p0 = m.cross(
-                    x,
-                    y + font.get_descent() * Decimal(0.001),
-                    Decimal(1),
-                )
-                p1 = m.cross(
-                    x + g.get_width_in_text_space(),
-                    y + font.get_ascent() * Decimal(0.001),
-                    Decimal(1),
-                )
-                e.bounding_box = Rectangle(
-                    min(p0[0], p1[0]),
-                    min(p0[1], p1[1]),
-                    abs(p1[0] - p0[0]),
-                    abs(p1[1] - p0[1]),
-                )
+                p0 = m.cross(x, y + descent, n(1))
+                e.bounding_box = _to_rectangle(p0, p1)
 
             # update x
-            x += g.get_width_in_text_space()
+            x += w
 
             # append
             chunks_of_text.append(e)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This class dispatches Event objects to the EventListener(s) that subscribed to their type
+"""
+import typing
+
+from ptext.pdf.canvas.event.event_listener import Event, EventListener
+
+
+class EventBus:
+    """
+    This class dispatches Event objects to the EventListener(s) that subscribed to their type.
+    An EventListener subscribes to a list of Event types (including their subclasses),
+    or to all Event objects. The EventListener(s) for a given Event type are looked up once,
+    and cached, so that dispatching an Event takes constant time.
+    Since the EventBus knows which Event types have subscribers, the content-stream interpreter
+    can skip building the Event objects nobody is listening for.
+    """
+
+    def __init__(self):
+        self._subscriptions: typing.List[
+            typing.Tuple[EventListener, typing.Optional[typing.List[type]]]
+        ] = []
+        self._event_listeners_per_type: typing.Dict[
+            type, typing.List[EventListener]
+        ] = {}
+
+    @staticmethod
+    def for_object(obj: typing.Any) -> "EventBus":
+        """
+        This function returns an EventBus to which all EventListener(s) attached to the given object,
+        and its parent(s), are subscribed (in that order)
+        """
+        event_bus: EventBus = EventBus()
+        while obj is not None:
+            for l in vars(obj).get("_event_listeners", []):
+                event_bus.subscribe(l)
+            obj = obj.get_parent()
+        return event_bus
+
+    def subscribe(
+        self,
+        event_listener: EventListener,
+        event_types: typing.Optional[typing.List[type]] = None,
+    ) -> "EventBus":
+        """
+        This function subscribes an EventListener to the given Event types.
+        If no Event types are given, the Event types returned by EventListener._get_event_types are used.
+        This function returns self
+        """
+        if event_types is None:
+            event_types = event_listener._get_event_types()
+        self._subscriptions.append((event_listener, event_types))
+        self._event_listeners_per_type.clear()
+        return self
+
+    def get_event_listeners(self, event_type: type) -> typing.List[EventListener]:
+        """
+        This function returns the EventListener(s) subscribed to the given Event type
+        """
+        event_listeners: typing.Optional[
+            typing.List[EventListener]
+        ] = self._event_listeners_per_type.get(event_type)
+        if event_listeners is None:
+            event_listeners = [
+                l
+                for l, ts in self._subscriptions
+                if ts is None or any([issubclass(event_type, t) for t in ts])
+            ]
+            self._event_listeners_per_type[event_type] = event_listeners
+        return event_listeners
+
+    def has_subscribers(self, event_type: type) -> bool:
+        """
+        This function returns True if any EventListener is subscribed to the given Event type,
+        False otherwise
+        """
+        return len(self.get_event_listeners(event_type)) > 0
+
+    def publish(self, event: Event) -> "EventBus":
+        """
+        This function sends the given Event to all EventListener(s) subscribed to its type.
+        This function returns self
+        """
+        for l in self.get_event_listeners(type(event)):
+            l._event_occurred(event)
+        return self
@@ -4,6 +4,7 @@
 """
     This module contains the basis for events and eventlisteners
 """
+import typing
 
 
 class Event:
@@ -26,3 +27,11 @@ class EventListener:
         EventListeners can then choose to act on those Event objects.
         """
         pass
+
+    def _get_event_types(self) -> typing.Optional[typing.List[type]]:
+        """
+        This method returns the Event types (including their subclasses) this EventListener wants to be notified of.
+        By default it returns None, meaning this EventListener is notified of every Event.
+        Events that no EventListener is interested in are not built by the Canvas.
+        """
+        return None
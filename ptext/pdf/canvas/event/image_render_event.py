@@ -10,6 +10,7 @@ from PIL import Image  # type: ignore [import]
 
 from ptext.pdf.canvas.canvas_graphics_state import CanvasGraphicsState
 from ptext.pdf.canvas.event.event_listener import Event
+from ptext.pdf.canvas.geometry.matrix import Matrix
 
 
 class ImageRenderEvent(Event):
@@ -22,13 +23,13 @@ class ImageRenderEvent(Event):
 
         # calculate position
         v = graphics_state.ctm.cross(Decimal(0), Decimal(0), Decimal(1))
-        self._x: Decimal = v[0]
-        self._y: Decimal = v[1]
+        self._x: Decimal = Matrix.to_decimal(v[0])
+        self._y: Decimal = Matrix.to_decimal(v[1])
 
         # calculate display size
         v = graphics_state.ctm.cross(Decimal(1), Decimal(1), Decimal(0))
-        self._width: Decimal = max(abs(v[0]), Decimal(1))
-        self._height: Decimal = max(abs(v[1]), Decimal(1))
+        self._width: Decimal = max(Matrix.to_decimal(abs(v[0])), Decimal(1))
+        self._height: Decimal = max(Matrix.to_decimal(abs(v[1])), Decimal(1))
 
     def get_image(self) -> Image:
         """
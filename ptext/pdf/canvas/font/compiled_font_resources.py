@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This module compiles the font resources bundled with pText (predefined CMaps, AFM files)
+    into a compact binary form, which is stored in a per-user cache directory and re-used on subsequent runs
+"""
+import array
+import bisect
+import hashlib
+import logging
+import os
+import pickle
+import typing
+from pathlib import Path
+
+import fontTools  # type: ignore [import]
+from fontTools.afmLib import AFM  # type: ignore [import]
+
+from ptext.pdf.canvas.font.font import Font
+
+logger = logging.getLogger(__name__)
+
+
+class CompiledCMap(typing.Mapping[int, str]):
+    """
+    This class represents a (read-only) mapping of character codes to unicode str,
+    stored as sorted, non-overlapping ranges of character codes.
+    A range either maps to consecutive unicode code points, or (if it holds a single character code) to a str.
+    Looking up a character code is a binary search over the ranges.
+    """
+
+    def __init__(
+        self,
+        starts: array.array,
+        stops: array.array,
+        values: array.array,
+        strings: typing.List[str],
+    ):
+        # ranges [starts[i], stops[i]]
+        self._starts: array.array = starts
+        self._stops: array.array = stops
+        # values[i] >= 0 is the unicode code point of starts[i]
+        # values[i] < 0 refers to strings[-values[i] - 1]
+        self._values: array.array = values
+        self._strings: typing.List[str] = strings
+        self._length: int = sum([b - a + 1 for a, b in zip(starts, stops)])
+
+    @staticmethod
+    def from_dict(
+        character_code_to_unicode: typing.Dict[int, str]
+    ) -> "CompiledCMap":
+        """
+        This function builds a CompiledCMap from a dictionary mapping character codes to unicode str
+        """
+        starts: array.array = array.array("L")
+        stops: array.array = array.array("L")
+        values: array.array = array.array("l")
+        strings: typing.List[str] = []
+        for c in sorted(character_code_to_unicode.keys()):
+            s: str = character_code_to_unicode[c]
+            # extend the previous range
+            if (
+                len(s) == 1
+                and len(starts) > 0
+                and stops[-1] == c - 1
+                and values[-1] >= 0
+                and values[-1] + c - starts[-1] == ord(s)
+            ):
+                stops[-1] = c
+                continue
+            # new range
+            starts.append(c)
+            stops.append(c)
+            if len(s) == 1:
+                values.append(ord(s))
+            else:
+                strings.append(s)
+                values.append(-len(strings))
+        return CompiledCMap(starts, stops, values, strings)
+
+    def get_number_of_ranges(self) -> int:
+        """
+        This function returns the number of ranges in this CompiledCMap
+        """
+        return len(self._starts)
+
+    def get(  # type: ignore [override]
+        self, character_code: int, default: typing.Optional[str] = None
+    ) -> typing.Optional[str]:
+        """
+        This function returns the unicode str for the given character code,
+        or the default value if the character code is not mapped
+        """
+        i: int = bisect.bisect_right(self._starts, character_code) - 1
+        if i < 0 or character_code > self._stops[i]:
+            return default
+        v: int = self._values[i]
+        if v < 0:
+            return self._strings[-v - 1]
+        return chr(v + character_code - self._starts[i])
+
+    def __getitem__(self, character_code: int) -> str:
+        s: typing.Optional[str] = self.get(character_code)
+        if s is None:
+            raise KeyError(character_code)
+        return s
+
+    def __contains__(self, character_code: object) -> bool:
+        return isinstance(character_code, int) and self.get(character_code) is not None
+
+    def __iter__(self) -> typing.Iterator[int]:
+        for a, b in zip(self._starts, self._stops):
+            yield from range(a, b + 1)
+
+    def __len__(self) -> int:
+        return self._length
+
+
+class CompiledAFM:
+    """
+    This class represents the (compiled) font metrics of an AFM file,
+    i.e. its global attributes, its character metrics and its kerning pairs.
+    """
+
+    def __init__(
+        self,
+        attributes: typing.Dict[str, typing.Any],
+        character_metrics: typing.Dict[
+            str, typing.Tuple[int, int, typing.Tuple[int, int, int, int]]
+        ],
+        kerning: typing.Dict[typing.Tuple[str, str], int],
+    ):
+        self._attributes: typing.Dict[str, typing.Any] = attributes
+        self._character_metrics: typing.Dict[
+            str, typing.Tuple[int, int, typing.Tuple[int, int, int, int]]
+        ] = character_metrics
+        self._kerning: typing.Dict[typing.Tuple[str, str], int] = kerning
+
+    @staticmethod
+    def from_afm(afm: AFM) -> "CompiledAFM":
+        """
+        This function builds a CompiledAFM from a (parsed) fontTools AFM object
+        """
+        return CompiledAFM(
+            {k: v for k, v in afm._attrs.items()},
+            {
+                k: (int(v[0]), int(v[1]), tuple([int(x) for x in v[2]]))
+                for k, v in afm._chars.items()
+            },
+            {k: int(v) for k, v in afm._kerning.items()},
+        )
+
+    def get_attribute(self, attribute_name: str) -> typing.Optional[typing.Any]:
+        """
+        This function returns the value of a global attribute (e.g. FontName, Ascender),
+        or None if the AFM file does not define it
+        """
+        return self._attributes.get(attribute_name)
+
+    def get_character_metrics(
+        self,
+    ) -> typing.Dict[str, typing.Tuple[int, int, typing.Tuple[int, int, int, int]]]:
+        """
+        This function returns the character metrics, mapping each glyph name
+        to its character code, width and bounding box
+        """
+        return self._character_metrics
+
+    def get_kerning(self, left_glyph_name: str, right_glyph_name: str) -> int:
+        """
+        This function returns the kerning (adjustment of the width) between two glyph names
+        """
+        return self._kerning.get((left_glyph_name, right_glyph_name), 0)
+
+
+class CompiledFontResources:
+    """
+    This class compiles the font resources bundled with pText (predefined CMaps, AFM files) into a compact binary form.
+    A resource is compiled the first time it is used, and stored in a per-user cache directory
+    ($XDG_CACHE_HOME/ptext or ~/.cache/ptext). Compiled resources are rebuilt whenever their source
+    (or the version of fontTools) changes. If the compiled form can not be read or stored,
+    the resource is compiled in memory.
+    """
+
+    # increment whenever the compiled form changes
+    VERSION: int = 2
+
+    @staticmethod
+    def _get_cache_directory() -> typing.Optional[Path]:
+        try:
+            cache_home: str = os.environ.get("XDG_CACHE_HOME", "")
+            if cache_home == "":
+                return Path.home() / ".cache" / "ptext"
+            return Path(cache_home) / "ptext"
+        except RuntimeError:
+            # home directory can not be determined
+            return None
+
+    @staticmethod
+    def _get_compiled_path(source: Path) -> typing.Optional[Path]:
+        cache_directory: typing.Optional[Path] = (
+            CompiledFontResources._get_cache_directory()
+        )
+        if cache_directory is None:
+            return None
+        # resources with the same name, but in different directories (e.g. installations) do not collide
+        source_directory_hash: str = hashlib.sha1(
+            str(source.parent.resolve()).encode("utf-8")
+        ).hexdigest()[:16]
+        return (
+            cache_directory
+            / "compiled_font_resources"
+            / source_directory_hash
+            / (source.name + ".pickle")
+        )
+
+    @staticmethod
+    def _get_source_key(source: Path) -> typing.Tuple[int, str, int, int]:
+        stat = source.stat()
+        return (
+            CompiledFontResources.VERSION,
+            fontTools.version,
+            stat.st_size,
+            stat.st_mtime_ns,
+        )
+
+    @staticmethod
+    def _get_compiled(
+        source: Path, compile_function: typing.Callable[[Path], typing.Any]
+    ) -> typing.Any:
+        source_key = CompiledFontResources._get_source_key(source)
+        compiled_path: typing.Optional[
+            Path
+        ] = CompiledFontResources._get_compiled_path(source)
+
+        # read compiled form
+        if compiled_path is not None and compiled_path.exists():
+            try:
+                with open(compiled_path, "rb") as compiled_file_handle:
+                    compiled_key, compiled_value = pickle.load(compiled_file_handle)
+                if compiled_key == source_key:
+                    return compiled_value
+            except Exception:
+                # an unreadable (e.g. truncated, or outdated) compiled form is a cache miss
+                logger.debug("unable to read compiled form of %s" % source)
+
+        # compile
+        compiled_value = compile_function(source)
+
+        # write compiled form
+        if compiled_path is None:
+            return compiled_value
+        try:
+            compiled_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path: Path = compiled_path.with_name(
+                compiled_path.name + ".%d.tmp" % os.getpid()
+            )
+            with open(tmp_path, "wb") as compiled_file_handle:
+                pickle.dump(
+                    (source_key, compiled_value),
+                    compiled_file_handle,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, compiled_path)
+        except OSError:
+            logger.debug("unable to store compiled form of %s" % source)
+
+        return compiled_value
+
+    @staticmethod
+    def _compile_cmap(source: Path) -> CompiledCMap:
+        with open(source, "rb") as cmap_file_handle:
+            cmap_bytes: bytes = cmap_file_handle.read()
+        return CompiledCMap.from_dict(Font._read_cmap(cmap_bytes))
+
+    @staticmethod
+    def _compile_afm(source: Path) -> CompiledAFM:
+        return CompiledAFM.from_afm(AFM(source))
+
+    @staticmethod
+    def read_cmap(source: Path) -> CompiledCMap:
+        """
+        This function returns the (compiled) predefined CMap stored at the given path
+        """
+        return CompiledFontResources._get_compiled(
+            source, CompiledFontResources._compile_cmap
+        )
+
+    @staticmethod
+    def read_afm(source: Path) -> CompiledAFM:
+        """
+        This function returns the (compiled) AFM file stored at the given path
+        """
+        return CompiledFontResources._get_compiled(
+            source, CompiledFontResources._compile_afm
+        )
+
+    @staticmethod
+    def compile_all() -> None:
+        """
+        This function compiles all font resources bundled with pText (e.g. to warm the cache after installation)
+        """
+        font_dir: Path = Path(__file__).parent
+        for cmap_file in sorted((font_dir / "composite_font" / "cmaps").iterdir()):
+            if cmap_file.is_file():
+                CompiledFontResources.read_cmap(cmap_file)
+        for afm_file in sorted((font_dir / "simple_font" / "afm").glob("*.afm")):
+            CompiledFontResources.read_afm(afm_file)
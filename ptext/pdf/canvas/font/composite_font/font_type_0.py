@@ -12,7 +12,9 @@ from pathlib import Path
 
 from ptext.io.read.types import Decimal as pDecimal
 from ptext.io.read.types import List, Name, Stream
+from ptext.pdf.canvas.font.compiled_font_resources import CompiledFontResources
 from ptext.pdf.canvas.font.font import Font
+from ptext.pdf.canvas.font.font_cache import FontCache
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +30,9 @@ class Type0Font(Font):
         super(Type0Font, self).__init__()
         self[Name("Type")] = Name("Font")
         self[Name("Subtype")] = Name("Type0")
-        self._character_identifier_to_unicode_lookup: typing.Dict[int, str] = {}
+        self._character_identifier_to_unicode_lookup: typing.Mapping[
+            int, str
+        ] = {}
         self._unicode_lookup_to_character_identifier: typing.Dict[str, int] = {}
         self._byte_to_char_identifier: typing.Dict[int, int] = {}
 
@@ -38,7 +42,9 @@ class Type0Font(Font):
         assert "ToUnicode" in self
         assert "DecodedBytes" in self["ToUnicode"]
         cmap_bytes: bytes = self["ToUnicode"]["DecodedBytes"]
-        self._character_identifier_to_unicode_lookup = self._read_cmap(cmap_bytes)
+        self._character_identifier_to_unicode_lookup = self._read_embedded_cmap(
+            cmap_bytes
+        )
         self._unicode_lookup_to_character_identifier: typing.Dict[str, int] = {
             v: k for k, v in self._character_identifier_to_unicode_lookup.items()
         }
@@ -50,7 +56,7 @@ class Type0Font(Font):
         assert "DecodedBytes" in self["Encoding"]
         cmap_bytes: bytes = self["Encoding"]["DecodedBytes"]
         self._byte_to_char_identifier = {
-            k: v for k, v in self._read_cmap(cmap_bytes).items()
+            k: v for k, v in self._read_embedded_cmap(cmap_bytes).items()
         }
 
     def character_identifier_to_unicode(
@@ -106,10 +112,6 @@ class Type0Font(Font):
                 self._character_identifier_to_unicode_lookup = (
                     Type0Font._find_best_matching_predefined_cmap(cmap_name)
                 )
-                self._unicode_lookup_to_character_identifier = {
-                    v: k
-                    for k, v in self._character_identifier_to_unicode_lookup.items()
-                }
 
             # e) Map the CID obtained in step (a) according to the CMap obtained in step (d), producing a
             # Unicode value.
@@ -119,7 +121,21 @@ class Type0Font(Font):
         return None
 
     @staticmethod
-    def _find_best_matching_predefined_cmap(cmap_name: str) -> typing.Dict[int, str]:
+    def _find_best_matching_predefined_cmap(
+        cmap_name: str,
+    ) -> typing.Mapping[int, str]:
+        # predefined CMaps are parsed once (per process), see FontCache,
+        # the returned dictionary is shared, it must not be modified
+        return FontCache.get(
+            "cmap",
+            cmap_name,
+            lambda: Type0Font._read_best_matching_predefined_cmap(cmap_name),
+        )
+
+    @staticmethod
+    def _read_best_matching_predefined_cmap(
+        cmap_name: str,
+    ) -> typing.Mapping[int, str]:
         cmap_dir: Path = Path(__file__).parent / "cmaps"
         assert cmap_dir.exists()
         predefined_cmaps: typing.List[str] = [x.name for x in cmap_dir.iterdir()]
@@ -146,12 +162,8 @@ class Type0Font(Font):
                 )
                 cmap_name = "Adobe-Identity-H"
 
-        cmap_bytes: typing.Optional[bytes] = None
-        with open(cmap_dir / cmap_name, "rb") as cmap_file_handle:
-            cmap_bytes = cmap_file_handle.read()
-
-        assert cmap_bytes is not None
-        return Font._read_cmap(cmap_bytes)
+        # predefined CMaps are compiled (to sorted ranges) on first use
+        return CompiledFontResources.read_cmap(cmap_dir / cmap_name)
 
     def unicode_to_character_identifier(self, unicode: str) -> typing.Optional[int]:
         """
@@ -205,7 +217,8 @@ class Type0Font(Font):
         # fmt: off
         f_out: Type0Font = super(Type0Font, self).__deepcopy__(memodict)
         f_out[Name("Subtype")] = Name("Type0")
-        f_out._character_identifier_to_unicode_lookup: typing.Dict[int, str] = {k: v for k, v in self._character_identifier_to_unicode_lookup.items()}
+        # CMaps are read-only (and shared), see FontCache
+        f_out._character_identifier_to_unicode_lookup = self._character_identifier_to_unicode_lookup
         f_out._unicode_lookup_to_character_identifier: typing.Dict[str, int] = {k: v for k, v in self._unicode_lookup_to_character_identifier.items()}
         return f_out
         # fmt: on
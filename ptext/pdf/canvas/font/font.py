@@ -22,6 +22,8 @@ from ptext.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
 from ptext.io.read.tokenize.low_level_tokenizer import Token, TokenType
 from ptext.io.read.types import Decimal as pDecimal
 from ptext.io.read.types import Dictionary, List, Name
+from ptext.pdf.canvas.font.font_cache import FontCache
+from ptext.pdf.canvas.font.glyph_decode_table import GlyphDecodeTable
 
 
 class Font(Dictionary):
@@ -31,6 +33,34 @@ class Font(Dictionary):
     Today, the font is a digital file.
     """
 
+    def __init__(self):
+        super(Font, self).__init__()
+        self._glyph_decode_table: typing.Optional[GlyphDecodeTable] = None
+
+    def __setitem__(self, key, value):
+        # changing the Font invalidates its GlyphDecodeTable
+        self._glyph_decode_table = None
+        super(Font, self).__setitem__(key, value)
+
+    def get_glyph_decode_table(self) -> GlyphDecodeTable:
+        """
+        This function returns the GlyphDecodeTable of this Font,
+        which maps character codes to (character code, unicode str, width) in a single lookup
+        """
+        if self._glyph_decode_table is None:
+            self._glyph_decode_table = GlyphDecodeTable(self)
+        return self._glyph_decode_table
+
+    def _add_used_character_identifiers(
+        self, character_identifiers: typing.Iterable[int]
+    ) -> None:
+        # keep track of the character identifiers written with this Font (e.g. for subsetting)
+        pass
+
+    def _has_multi_byte_character_codes(self) -> bool:
+        # whether character_identifier_to_unicode may map (two byte) character codes above 255
+        return True
+
     def character_identifier_to_unicode(
         self, character_identifier: int
     ) -> typing.Optional[str]:
@@ -151,6 +181,16 @@ class Font(Dictionary):
         # 5. helvetica
         return Decimal(278)
 
+    @staticmethod
+    def _read_embedded_cmap(cmap_bytes: bytes) -> typing.Dict[int, str]:
+        # parse an embedded CMap (e.g. ToUnicode), or look it up in the (process-wide) FontCache,
+        # the returned dictionary is shared, it must not be modified
+        return FontCache.get(
+            "embedded_cmap",
+            FontCache.hash_bytes(cmap_bytes),
+            lambda: Font._read_cmap(cmap_bytes),
+        )
+
     # fmt: off
     @staticmethod
     def _read_cmap(cmap_bytes: bytes) -> typing.Dict[int, str]:
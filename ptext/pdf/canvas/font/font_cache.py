@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This class is a process-wide, size-bounded (least recently used) cache of parsed font resources,
+    such as AFM font metrics, predefined CMaps and embedded ToUnicode CMaps
+"""
+import collections
+import hashlib
+import typing
+
+
+class FontCache:
+    """
+    This class is a process-wide, size-bounded (least recently used) cache of parsed font resources,
+    such as AFM font metrics, predefined CMaps and embedded ToUnicode CMaps.
+    Each entry is identified by its kind (e.g. "afm", "cmap", "to_unicode") and a key (e.g. a font name,
+    a CMap name or the hash of a ToUnicode stream). Cached values are shared, they must not be modified.
+    """
+
+    # maximum number of entries (of all kinds) held by the cache
+    MAX_SIZE: int = 256
+
+    _entries: "collections.OrderedDict[typing.Tuple[str, typing.Any], typing.Any]" = (
+        collections.OrderedDict()
+    )
+    _hits: typing.Dict[str, int] = {}
+    _misses: typing.Dict[str, int] = {}
+
+    @staticmethod
+    def get(kind: str, key: typing.Any, build: typing.Callable[[], typing.Any]) -> typing.Any:
+        """
+        This function returns the cached value for the given kind and key.
+        If no such value is cached, it is built (by calling build), and cached
+        (evicting the least recently used entry if the cache is full)
+        """
+        k = (kind, key)
+        if k in FontCache._entries:
+            FontCache._entries.move_to_end(k)
+            FontCache._hits[kind] = FontCache._hits.get(kind, 0) + 1
+            return FontCache._entries[k]
+        FontCache._misses[kind] = FontCache._misses.get(kind, 0) + 1
+        value = build()
+        FontCache._entries[k] = value
+        while len(FontCache._entries) > max(FontCache.MAX_SIZE, 0):
+            FontCache._entries.popitem(last=False)
+        return value
+
+    @staticmethod
+    def hash_bytes(bts: bytes) -> bytes:
+        """
+        This function returns a key for the given bytes (e.g. the content of a ToUnicode stream)
+        """
+        return hashlib.sha1(bts).digest()
+
+    @staticmethod
+    def get_statistics() -> typing.Dict[str, typing.Dict[str, int]]:
+        """
+        This function returns the number of hits and misses (per kind of entry),
+        and the number of entries held by the cache
+        """
+        kinds: typing.List[str] = sorted(
+            set(FontCache._hits.keys()) | set(FontCache._misses.keys())
+        )
+        out: typing.Dict[str, typing.Dict[str, int]] = {
+            k: {
+                "hits": FontCache._hits.get(k, 0),
+                "misses": FontCache._misses.get(k, 0),
+                "size": len([x for x in FontCache._entries.keys() if x[0] == k]),
+            }
+            for k in kinds
+        }
+        return out
+
+    @staticmethod
+    def clear() -> None:
+        """
+        This function removes all entries from the cache, and resets its statistics
+        """
+        FontCache._entries.clear()
+        FontCache._hits.clear()
+        FontCache._misses.clear()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This module contains GlyphDecodeTable, which maps the character codes of a Font
+    to (character code, unicode str, width) in a single lookup.
+"""
+import typing
+from decimal import Decimal
+
+from ptext.io.read.types import Decimal as pDecimal
+
+# entry that has not yet been calculated
+_UNKNOWN: typing.Tuple = tuple()
+
+
+class GlyphDecodeTable:
+    """
+    This class maps the character codes of a Font to (character code, unicode str, width) in a single lookup.
+    Single byte character codes are kept in a 256-entry list, multi byte (two byte) character codes in a dictionary.
+    Entries are calculated (using the Font) the first time a character code is decoded, and re-used afterwards.
+    """
+
+    def __init__(self, font: "Font"):  # type: ignore [name-defined]
+        self._font = font
+        self._single_byte_entries: typing.List[
+            typing.Tuple[int, str, Decimal]
+        ] = [_UNKNOWN] * 256
+        self._multi_byte_entries: typing.Dict[
+            int, typing.Optional[typing.Tuple[int, str, Decimal]]
+        ] = {}
+        self._has_multi_byte_character_codes: typing.Optional[bool] = None
+
+    def _get_single_byte_entry(
+        self, character_code: int
+    ) -> typing.Tuple[int, str, Decimal]:
+        unicode_str: typing.Optional[
+            str
+        ] = self._font.character_identifier_to_unicode(character_code)
+        if unicode_str is None:
+            # no mapping found
+            return character_code, "�", Decimal(250)
+        width: typing.Optional[Decimal] = self._font.get_width(character_code)
+        return character_code, unicode_str, width or Decimal(0)
+
+    def _get_multi_byte_entry(
+        self, character_code: int
+    ) -> typing.Optional[typing.Tuple[int, str, Decimal]]:
+        unicode_str: typing.Optional[
+            str
+        ] = self._font.character_identifier_to_unicode(character_code)
+        if unicode_str is None:
+            return None
+        width: typing.Optional[Decimal] = self._font.get_width(character_code)
+        return character_code, unicode_str, width or pDecimal(0)
+
+    def decode(
+        self, text_bytes: bytes
+    ) -> typing.List[typing.Tuple[int, str, Decimal]]:
+        """
+        This function decodes the given bytes into (character code, unicode str, width) tuples.
+        Two bytes are decoded as one character code if the Font maps that character code, otherwise a single byte is.
+        """
+        if self._has_multi_byte_character_codes is None:
+            self._has_multi_byte_character_codes = (
+                self._font._has_multi_byte_character_codes()
+            )
+        single_byte_entries = self._single_byte_entries
+        multi_byte_entries = self._multi_byte_entries
+        out: typing.List[typing.Tuple[int, str, Decimal]] = []
+        n: int = len(text_bytes)
+        i: int = 0
+        while i < n:
+            b: int = text_bytes[i]
+
+            # sometimes, 2 bytes make up 1 unicode char
+            if self._has_multi_byte_character_codes and i + 1 < n:
+                c: int = b * 256 + text_bytes[i + 1]
+                e = multi_byte_entries.get(c, _UNKNOWN)
+                if e is _UNKNOWN:
+                    e = self._get_multi_byte_entry(c)
+                    multi_byte_entries[c] = e
+                if e is not None:
+                    out.append(e)
+                    i += 2
+                    continue
+
+            # usually it's 1 byte though
+            e = single_byte_entries[b]
+            if e is _UNKNOWN:
+                e = self._get_single_byte_entry(b)
+                single_byte_entries[b] = e
+            out.append(e)
+            i += 1
+
+        return out
@@ -10,8 +10,8 @@ import typing
 from curses.ascii import isspace
 from decimal import Decimal
 
-from ptext.io.read.types import Decimal as pDecimal
 from ptext.pdf.canvas.font.font import Font
+from ptext.pdf.canvas.geometry.matrix import Matrix
 
 
 class Glyph:
@@ -62,43 +62,11 @@ class GlyphLine:
         horizontal_scaling: Decimal = Decimal(100),
     ):
         assert isinstance(font, Font)
-        self._glyphs: typing.List[Glyph] = []
-        i: int = 0
-        while i < len(text_bytes):
-            # sometimes, 2 bytes make up 1 unicode char
-            unicode_chars: typing.Optional[str] = None
-            if i + 1 < len(text_bytes):
-                multi_byte_char_code: int = text_bytes[i] * 256 + text_bytes[i + 1]
-                unicode_chars = font.character_identifier_to_unicode(
-                    multi_byte_char_code
-                )
-                if unicode_chars is not None:
-                    self._glyphs.append(
-                        Glyph(
-                            multi_byte_char_code,
-                            unicode_chars,
-                            font.get_width(multi_byte_char_code) or pDecimal(0),
-                        )
-                    )
-                    i += 2
-                    continue
-            # usually it's 1 byte though
-            if i < len(text_bytes):
-                unicode_chars = font.character_identifier_to_unicode(text_bytes[i])
-                if unicode_chars is not None:
-                    self._glyphs.append(
-                        Glyph(
-                            text_bytes[i],
-                            unicode_chars,
-                            font.get_width(text_bytes[i]) or Decimal(0),
-                        )
-                    )
-                    i += 1
-                    continue
-            # no mapping found
-            if i < len(text_bytes):
-                self._glyphs.append(Glyph(text_bytes[i], "�", Decimal(250)))
-                i += 1
+        # the GlyphDecodeTable of the Font maps character codes to (character code, unicode str, width)
+        self._glyphs: typing.List[Glyph] = [
+            Glyph(c, u, w)
+            for c, u, w in font.get_glyph_decode_table().decode(text_bytes)
+        ]
 
         self._font = font
         self._font_size = font_size
@@ -150,25 +118,35 @@ class GlyphLine:
         """
         This function calculates the width (in text space) of this GlyphLine
         """
-        w: Decimal = Decimal(0)
+        return Matrix.to_decimal(self._get_width_in_text_space())
+
+    def _get_width_in_text_space(self) -> typing.Union[Decimal, float]:
+        # calculate the width (in text space) of this GlyphLine,
+        # using the number type of the content-stream interpreter (see Matrix.EXACT)
+        n = Matrix.to_number
+        font_size_in_text_space = n(self._font_size) * n(0.001)
+        word_spacing = n(self._word_spacing)
+        horizontal_scaling = n(self._horizontal_scaling) / n(100)
+        character_spacing = n(self._character_spacing)
+        w = n(0)
         for g in self._glyphs:
-            glyph_width_in_text_space = g.get_width() * self._font_size * Decimal(0.001)
+            glyph_width_in_text_space = n(g.get_width()) * font_size_in_text_space
 
             # add word spacing where applicable
             if len(g.get_unicode_str()) == 1 and isspace(g.get_unicode_str()):
-                glyph_width_in_text_space += self._word_spacing
+                glyph_width_in_text_space += word_spacing
 
             # horizontal scaling
-            glyph_width_in_text_space *= self._horizontal_scaling / Decimal(100)
+            glyph_width_in_text_space *= horizontal_scaling
 
             # add character spacing to character_width
-            glyph_width_in_text_space += self._character_spacing
+            glyph_width_in_text_space += character_spacing
 
             # add character width to total
             w += glyph_width_in_text_space
 
         # subtract character spacing once (there are only N-1 spacings in a string of N characters)
-        w -= self._character_spacing
+        w -= character_spacing
 
         # return
         return w
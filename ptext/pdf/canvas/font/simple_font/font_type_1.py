@@ -9,7 +9,6 @@ import logging
 import typing
 from pathlib import Path
 
-from fontTools.afmLib import AFM  # type: ignore [import]
 from fontTools.agl import toUnicode  # type: ignore [import]
 
 from ptext.io.read.types import Decimal as pDecimal
@@ -18,7 +17,13 @@ from ptext.pdf.canvas.font.adobe_standard_encoding import (
     adobe_standard_decode,
     adobe_standard_encode,
 )
+from ptext.pdf.canvas.font.compiled_font_resources import (
+    CompiledAFM,
+    CompiledFontResources,
+)
 from ptext.pdf.canvas.font.font import Font
+from ptext.pdf.canvas.font.font_cache import FontCache
+from ptext.pdf.canvas.font.glyph_decode_table import GlyphDecodeTable
 from ptext.pdf.canvas.font.simple_font.simple_font import SimpleFont
 from ptext.pdf.canvas.font.symbol_encoding import symbol_decode, zapfdingbats_decode
 
@@ -105,11 +110,32 @@ class Type1Font(SimpleFont):
         assert "ToUnicode" in self
         assert "DecodedBytes" in self["ToUnicode"]
         cmap_bytes: bytes = self["ToUnicode"]["DecodedBytes"]
-        self._character_identifier_to_unicode_lookup = self._read_cmap(cmap_bytes)
+        self._character_identifier_to_unicode_lookup = self._read_embedded_cmap(
+            cmap_bytes
+        )
         self._unicode_lookup_to_character_identifier: typing.Dict[str, int] = {
             v: k for k, v in self._character_identifier_to_unicode_lookup.items()
         }
 
+    def get_glyph_decode_table(self) -> GlyphDecodeTable:
+        """
+        This function returns the GlyphDecodeTable of this Font,
+        which maps character codes to (character code, unicode str, width) in a single lookup
+        """
+        # the first lookup may set the (implied) Encoding, which would invalidate a GlyphDecodeTable
+        # that was already built, so it is done before the GlyphDecodeTable is built
+        if self._glyph_decode_table is None:
+            self.character_identifier_to_unicode(0)
+        return super(Type1Font, self).get_glyph_decode_table()
+
+    def _has_multi_byte_character_codes(self) -> bool:
+        # character codes above 255 can only be mapped by a ToUnicode CMap, or by Differences
+        # (both of which are read into _character_identifier_to_unicode_lookup on first use)
+        self.character_identifier_to_unicode(0)
+        return any(
+            [k > 255 for k in self._character_identifier_to_unicode_lookup.keys()]
+        )
+
     def character_identifier_to_unicode(
         self, character_identifier: int
     ) -> typing.Optional[str]:
@@ -328,7 +354,55 @@ class StandardType1Font(Type1Font):
         """
         return StandardType1Font._canonical_name(font_name) is not None
 
-    # fmt: off
+    @staticmethod
+    def _read_font_metrics(
+        font_name: str,
+    ) -> typing.Tuple[
+        CompiledAFM,
+        typing.Dict[int, str],
+        typing.Dict[str, int],
+        typing.Dict[int, pDecimal],
+    ]:
+        # parse the AFM file of a standard 14 font, and build its encoding (and widths) lookup tables
+
+        # assert whether AFM directory exists
+        afm_directory: Path = Path(__file__).parent / "afm"
+        assert afm_directory.exists()
+
+        # assert whether AFM file exists
+        afm_file: Path = afm_directory / (font_name.lower() + ".afm")
+        assert afm_file.exists()
+
+        # build AFM datastructure (AFM files are compiled on first use)
+        afm: CompiledAFM = CompiledFontResources.read_afm(afm_file)
+
+        # fmt: off
+        character_identifier_to_unicode_lookup: typing.Dict[int, str] = {}
+        if font_name == "Symbol":
+            character_identifier_to_unicode_lookup  = {c:symbol_decode(bytes([c])) for c in range(0, 256)}
+        elif font_name == "ZapfDingbats":
+            character_identifier_to_unicode_lookup = {c:zapfdingbats_decode(bytes([c])) for c in range(0, 256)}
+        else:
+            for c in range(0, 256):
+                try:
+                    character_identifier_to_unicode_lookup[c] = bytes([c]).decode("cp1252")
+                except:
+                    character_identifier_to_unicode_lookup[c] = ""
+        unicode_lookup_to_character_identifier: typing.Dict[str, int] = {v:k for k,v in character_identifier_to_unicode_lookup.items()}
+        # fmt: on
+
+        # widths (character identifiers that occur more than once have no width)
+        widths: typing.Dict[int, pDecimal] = {}
+        for k, v in afm.get_character_metrics().items():
+            widths[v[0]] = pDecimal(0) if v[0] in widths else pDecimal(v[1])
+
+        return (
+            afm,
+            character_identifier_to_unicode_lookup,
+            unicode_lookup_to_character_identifier,
+            widths,
+        )
+
     def __init__(self, font_name: typing.Optional[str] = None):
         super(StandardType1Font, self).__init__()
         if font_name is not None:
@@ -336,41 +410,22 @@ class StandardType1Font(Type1Font):
             font_name = StandardType1Font._canonical_name(font_name)
             assert font_name is not None
 
-            # assert whether AFM directory exists
-            afm_directory: Path = Path(__file__).parent / "afm"
-            assert afm_directory.exists()
-
-            # assert whether AFM file exists
-            afm_file: Path = afm_directory / (font_name.lower() + ".afm")
-            assert afm_file.exists()
-
-            # build AFM datastructure
-            self._afm: AFM = AFM(afm_file)
+            # AFM files are parsed once (per process), see FontCache
+            # the lookup tables are shared (between all StandardType1Font objects with the same name)
+            (
+                self._afm,
+                self._character_identifier_to_unicode_lookup,
+                self._unicode_lookup_to_character_identifier,
+                self._widths,
+            ) = FontCache.get(
+                "afm",
+                font_name,
+                lambda: StandardType1Font._read_font_metrics(font_name),  # type: ignore [arg-type]
+            )
 
             self[Name("Type")] = Name("Font")
             self[Name("Subtype")] = Name("Type1")
-            self[Name("BaseFont")] = Name(self._afm._attrs["FontName"])
-
-            self._character_identifier_to_unicode_lookup: typing.Dict[int, str] = {}
-            self._unicode_lookup_to_character_identifier: typing.Dict[str, int] = {}
-
-            if font_name == "Symbol":
-                self._character_identifier_to_unicode_lookup  = {c:symbol_decode(bytes([c])) for c in range(0, 256)}
-                self._unicode_lookup_to_character_identifier = {v:k for k,v in self._character_identifier_to_unicode_lookup.items()}
-
-            elif font_name == "ZapfDingbats":
-                self._character_identifier_to_unicode_lookup = {c:zapfdingbats_decode(bytes([c])) for c in range(0, 256)}
-                self._unicode_lookup_to_character_identifier = {v:k for k,v in self._character_identifier_to_unicode_lookup.items()}
-
-            else:
-                for c in range(0, 256):
-                    try:
-                        self._character_identifier_to_unicode_lookup[c] = bytes([c]).decode("cp1252")
-                    except:
-                        self._character_identifier_to_unicode_lookup[c] = ""
-                self._unicode_lookup_to_character_identifier = {v:k for k,v in self._character_identifier_to_unicode_lookup.items()}
-
-    # fmt: on
+            self[Name("BaseFont")] = Name(self._afm.get_attribute("FontName"))
 
     def character_identifier_to_unicode(
         self, character_identifier: int
@@ -394,22 +449,16 @@ class StandardType1Font(Type1Font):
         If this Font is unable to represent the glyph that corresponds to the character identifier,
         this function returns None
         """
-        widths: typing.List[pDecimal] = [
-            pDecimal(v[1])
-            for k, v in self._afm._chars.items()
-            if v[0] == character_identifier
-        ]
-        if len(widths) == 1:
-            return widths[0]
-        return pDecimal(0)
+        return self._widths.get(character_identifier, pDecimal(0))
 
     def get_ascent(self) -> pDecimal:
         """
         This function returns the maximum height above the baseline reached by glyphs in this font.
         The height of glyphs for accented characters shall be excluded.
         """
-        if "Ascender" in self._afm._attrs:
-            return pDecimal(self._afm._attrs["Ascender"])
+        ascender: typing.Optional[int] = self._afm.get_attribute("Ascender")
+        if ascender is not None:
+            return pDecimal(ascender)
         return pDecimal(0)
 
     def get_descent(self) -> pDecimal:
@@ -417,8 +466,9 @@ class StandardType1Font(Type1Font):
         This function returns the maximum depth below the baseline reached by glyphs in this font.
         The value shall be a negative number.
         """
-        if "Descender" in self._afm._attrs:
-            return pDecimal(self._afm._attrs["Descender"])
+        descender: typing.Optional[int] = self._afm.get_attribute("Descender")
+        if descender is not None:
+            return pDecimal(descender)
         return pDecimal(0)
 
     def _empty_copy(self) -> "Font":
@@ -431,5 +481,6 @@ class StandardType1Font(Type1Font):
         f_out._character_identifier_to_unicode_lookup: typing.Dict[int, str] = {k: v for k, v in self._character_identifier_to_unicode_lookup.items()}
         f_out._unicode_lookup_to_character_identifier: typing.Dict[str, int] = {k: v for k, v in self._unicode_lookup_to_character_identifier.items()}
         f_out._afm = self._afm
+        f_out._widths = self._widths
         return f_out
         # fmt: on
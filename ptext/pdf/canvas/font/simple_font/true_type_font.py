@@ -6,15 +6,17 @@ format for the Microsoft Windows operating system. Specifications for the TrueTy
 available in Apple’s TrueType Reference Manual and Microsoft’s TrueType 1.0 Font Files Technical
 Specification (see Bibliography).
 """
+import io
 import typing
-import zlib
 from decimal import Decimal
 from pathlib import Path
 
+from fontTools import subset  # type: ignore [import]
 from fontTools.ttLib import TTFont  # type: ignore [import]
 
 from ptext.io.read.types import Decimal as pDecimal
 from ptext.io.read.types import Dictionary, List, Name, Stream, String
+from ptext.pdf.canvas.font.font_cache import FontCache
 from ptext.pdf.canvas.font.simple_font.font_type_1 import Type1Font
 
 
@@ -33,23 +35,17 @@ class TrueTypeFont(Type1Font):
     """
 
     @staticmethod
-    def true_type_font_from_file(path_to_font_file: Path) -> "TrueTypeFont":
-        """
-        This function returns the PDF TrueTypeFont object for a given TTF file
-        """
-        assert path_to_font_file.exists()
-        assert path_to_font_file.name.endswith(".ttf")
-
+    def _read_font_file(path_to_font_file: Path) -> typing.Dict[str, typing.Any]:
+        # parse a TTF file (this is cached per process, see FontCache)
         font_file_bytes: typing.Optional[bytes] = None
         with open(path_to_font_file, "rb") as ffh:
             font_file_bytes = ffh.read()
         assert font_file_bytes
 
         # read file
-        ttf_font_file = TTFont(path_to_font_file)
+        ttf_font_file = TTFont(io.BytesIO(font_file_bytes))
 
-        # build font
-        font: TrueTypeFont = TrueTypeFont()
+        # font name
         font_name: str = str(
             [
                 x
@@ -62,9 +58,7 @@ class TrueTypeFont(Type1Font):
             [x for x in font_name if x.lower() in "abcdefghijklmnopqrstuvwxyz"]
         )
 
-        font[Name("Name")] = Name(font_name)
-        font[Name("BaseFont")] = Name(font_name)
-
+        # glyph order
         cmap: typing.Optional[typing.Dict[int, str]] = ttf_font_file.getBestCmap()
         assert cmap is not None
         cmap_reverse: typing.Dict[str, int] = {}
@@ -74,22 +68,65 @@ class TrueTypeFont(Type1Font):
             else:
                 cmap_reverse[v] = k
         glyph_order: typing.List[str] = [
-            x for x in ttf_font_file.glyphOrder if x in cmap_reverse
+            x for x in ttf_font_file.getGlyphOrder() if x in cmap_reverse
         ]
 
-        # build widths
+        # widths
         units_per_em: pDecimal = pDecimal(ttf_font_file["head"].unitsPerEm)
-        if cmap is not None:
-            font[Name("FirstChar")] = pDecimal(0)
-            font[Name("LastChar")] = pDecimal(len(glyph_order))
-            font[Name("Widths")] = List()
-            for glyph_name in glyph_order:
-                w: typing.Union[pDecimal, Decimal] = (
-                    pDecimal(ttf_font_file.getGlyphSet()[glyph_name].width)
-                    / units_per_em
-                ) * Decimal(1000)
-                w = pDecimal(round(w, 2))
-                font["Widths"].append(w)
+        glyph_set = ttf_font_file.getGlyphSet()
+        widths: typing.List[pDecimal] = []
+        for glyph_name in glyph_order:
+            w: typing.Union[pDecimal, Decimal] = (
+                pDecimal(glyph_set[glyph_name].width) / units_per_em
+            ) * Decimal(1000)
+            widths.append(pDecimal(round(w, 2)))
+
+        # fmt: off
+        return {
+            "bytes": font_file_bytes,
+            "key": FontCache.hash_bytes(font_file_bytes),
+            "font_name": font_name,
+            "glyph_order": glyph_order,
+            "widths": widths,
+            "italic_angle": pDecimal(ttf_font_file["post"].italicAngle),
+            "ascent": pDecimal(pDecimal(ttf_font_file["hhea"].ascent) / units_per_em * Decimal(1000)),
+            "descent": pDecimal(pDecimal(ttf_font_file["hhea"].descent) / units_per_em * Decimal(1000)),
+        }
+        # fmt: on
+
+    @staticmethod
+    def true_type_font_from_file(
+        path_to_font_file: Path, subset: bool = True
+    ) -> "TrueTypeFont":
+        """
+        This function returns the PDF TrueTypeFont object for a given TTF file.
+        If subset is True, only the glyphs that are used (by the Document being written) are embedded.
+        """
+        assert path_to_font_file.exists()
+        assert path_to_font_file.name.endswith(".ttf")
+
+        # read file (or fetch it from the FontCache)
+        stat = path_to_font_file.stat()
+        font_file: typing.Dict[str, typing.Any] = FontCache.get(
+            "ttf",
+            (str(path_to_font_file.resolve()), stat.st_size, stat.st_mtime_ns),
+            lambda: TrueTypeFont._read_font_file(path_to_font_file),
+        )
+        font_file_bytes: bytes = font_file["bytes"]
+        font_name: str = font_file["font_name"]
+        glyph_order: typing.List[str] = font_file["glyph_order"]
+
+        # build font
+        font: TrueTypeFont = TrueTypeFont()
+        font[Name("Name")] = Name(font_name)
+        font[Name("BaseFont")] = Name(font_name)
+
+        # build widths
+        font[Name("FirstChar")] = pDecimal(0)
+        font[Name("LastChar")] = pDecimal(len(glyph_order))
+        font[Name("Widths")] = List()
+        for w in font_file["widths"]:
+            font["Widths"].append(w)
 
         font[Name("FontDescriptor")] = Dictionary()
         font["FontDescriptor"][Name("Type")] = Name("FontDescriptor")
@@ -104,9 +141,9 @@ class TrueTypeFont(Type1Font):
             font["FontDescriptor"]["FontBBox"].append(pDecimal(0))
 
         # fmt: off
-        font["FontDescriptor"][Name("ItalicAngle")] = pDecimal(ttf_font_file["post"].italicAngle)
-        font["FontDescriptor"][Name("Ascent")] = pDecimal(pDecimal(ttf_font_file["hhea"].ascent) / units_per_em * Decimal(1000))
-        font["FontDescriptor"][Name("Descent")] = pDecimal(pDecimal(ttf_font_file["hhea"].descent) / units_per_em * Decimal(1000))
+        font["FontDescriptor"][Name("ItalicAngle")] = font_file["italic_angle"]
+        font["FontDescriptor"][Name("Ascent")] = font_file["ascent"]
+        font["FontDescriptor"][Name("Descent")] = font_file["descent"]
         font["FontDescriptor"][Name("CapHeight")] = pDecimal(0)         # TODO
         font["FontDescriptor"][Name("StemV")] = pDecimal(0)             # TODO
         # fmt: on
@@ -119,6 +156,7 @@ class TrueTypeFont(Type1Font):
             font["Encoding"]["Differences"].append(Name(glyph_order[i]))
 
         # embed font file
+        # (it is compressed when the Document is written)
         font_stream: Stream = Stream()
         font_stream[Name("Type")] = Name("Font")
         font_stream[Name("Subtype")] = Name("TrueType")
@@ -126,16 +164,135 @@ class TrueTypeFont(Type1Font):
         font_stream[Name("Length1")] = pDecimal(len(font_file_bytes))
         font_stream[Name("Filter")] = Name("FlateDecode")
         font_stream[Name("DecodedBytes")] = font_file_bytes
-        font_stream[Name("Bytes")] = zlib.compress(font_file_bytes, 9)
 
         font["FontDescriptor"][Name("FontFile2")] = font_stream
 
+        # keep track of the font file (for subsetting)
+        if subset:
+            font._font_file_bytes = font_file_bytes
+            font._font_file_key = font_file["key"]
+            font._glyph_order = glyph_order
+
         # return
         return font
 
     def __init__(self):
         super(TrueTypeFont, self).__init__()
         self[Name("Subtype")] = Name("TrueType")
+        # font file (only for TrueTypeFont objects that are subset when written)
+        self._font_file_bytes: typing.Optional[bytes] = None
+        self._font_file_key: typing.Optional[bytes] = None
+        self._glyph_order: typing.List[str] = []
+        self._used_character_identifiers: typing.Set[int] = set()
+
+    def _add_used_character_identifiers(
+        self, character_identifiers: typing.Iterable[int]
+    ) -> None:
+        if self._font_file_bytes is not None:
+            self._used_character_identifiers.update(character_identifiers)
+
+    def _is_subset_when_written(self) -> bool:
+        # whether only the glyphs that are used are embedded (when the Document is written)
+        return self._font_file_bytes is not None
+
+    @staticmethod
+    def _subset_font_file(
+        font_file_bytes: bytes, glyph_names: typing.List[str]
+    ) -> bytes:
+        ttf_font_file = TTFont(io.BytesIO(font_file_bytes))
+        options = subset.Options()
+        # the Differences array refers to glyphs by name
+        options.glyph_names = True
+        options.notdef_outline = True
+        options.name_IDs = ["*"]
+        options.name_languages = ["*"]
+        options.name_legacy = True
+        options.layout_features = []
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(glyphs=glyph_names)
+        subsetter.subset(ttf_font_file)
+        with io.BytesIO() as output:
+            ttf_font_file.save(output)
+            return output.getvalue()
+
+    def _get_subset_font(
+        self, character_identifiers: typing.Set[int]
+    ) -> "TrueTypeFont":
+        """
+        This function returns a copy of this TrueTypeFont, embedding only the glyphs
+        for the given character identifiers (with its Widths and Encoding trimmed accordingly).
+        Subset font files are cached per process (see FontCache).
+        """
+        assert self._font_file_bytes is not None
+        character_identifiers_in_font: typing.List[int] = sorted(
+            [x for x in character_identifiers if 0 <= x < len(self._glyph_order)]
+        )
+
+        # shallow copy
+        font_out: TrueTypeFont = TrueTypeFont()
+        for k, v in self.items():
+            font_out[k] = v
+        if len(character_identifiers_in_font) == 0:
+            return font_out
+
+        # subset font file
+        glyph_names: typing.List[str] = [
+            self._glyph_order[x] for x in character_identifiers_in_font
+        ]
+        font_file_bytes: bytes = FontCache.get(
+            "ttf_subset",
+            (self._font_file_key, tuple(character_identifiers_in_font)),
+            lambda: TrueTypeFont._subset_font_file(
+                self._font_file_bytes, glyph_names  # type: ignore [arg-type]
+            ),
+        )
+
+        # subset tag (6 uppercase letters, determined by the subset)
+        tag: str = "".join(
+            [
+                chr(ord("A") + x % 26)
+                for x in FontCache.hash_bytes(
+                    (self._font_file_key or b"")
+                    + bytes(str(character_identifiers_in_font), "latin1")
+                )[0:6]
+            ]
+        )
+        font_name: str = tag + "+" + str(self["BaseFont"])
+        font_out[Name("BaseFont")] = Name(font_name)
+
+        # Widths
+        first_char: int = character_identifiers_in_font[0]
+        last_char: int = character_identifiers_in_font[-1]
+        font_out[Name("FirstChar")] = pDecimal(first_char)
+        font_out[Name("LastChar")] = pDecimal(last_char)
+        font_out[Name("Widths")] = List()
+        for i in range(first_char, last_char + 1):
+            font_out["Widths"].append(self["Widths"][i - int(self["FirstChar"])])
+
+        # Encoding
+        font_out[Name("Encoding")] = Dictionary()
+        font_out["Encoding"][Name("BaseEncoding")] = self["Encoding"]["BaseEncoding"]
+        font_out["Encoding"][Name("Differences")] = List()
+        for i, glyph_name in zip(character_identifiers_in_font, glyph_names):
+            font_out["Encoding"]["Differences"].append(pDecimal(i))
+            font_out["Encoding"]["Differences"].append(Name(glyph_name))
+
+        # FontDescriptor
+        font_out[Name("FontDescriptor")] = Dictionary()
+        for k, v in self["FontDescriptor"].items():
+            font_out["FontDescriptor"][k] = v
+        font_out["FontDescriptor"][Name("FontName")] = String(font_name)
+        font_stream: Stream = Stream()
+        font_stream[Name("Type")] = Name("Font")
+        font_stream[Name("Subtype")] = Name("TrueType")
+        font_stream[Name("Length")] = pDecimal(len(font_file_bytes))
+        font_stream[Name("Length1")] = pDecimal(len(font_file_bytes))
+        font_stream[Name("Filter")] = Name("FlateDecode")
+        font_stream[Name("DecodedBytes")] = font_file_bytes
+        font_out["FontDescriptor"][Name("FontFile2")] = font_stream
+
+        # return
+        return font_out
 
     def _empty_copy(self) -> "Font":  # type: ignore [name-defined]
         return TrueTypeFont()
@@ -146,5 +303,9 @@ class TrueTypeFont(Type1Font):
         f_out[Name("Subtype")] = Name("TrueType")
         f_out._character_identifier_to_unicode_lookup: typing.Dict[int, str] = {k: v for k, v in self._character_identifier_to_unicode_lookup.items()}
         f_out._unicode_lookup_to_character_identifier: typing.Dict[str, int] = {k: v for k, v in self._unicode_lookup_to_character_identifier.items()}
+        f_out._font_file_bytes = self._font_file_bytes
+        f_out._font_file_key = self._font_file_key
+        f_out._glyph_order = self._glyph_order
+        f_out._used_character_identifiers = {x for x in self._used_character_identifiers}
         return f_out
         # fmt: on
@@ -47,4 +47,5 @@ class LineSegment:
         """
         p0 = matrix.cross(self.x0, self.y0, Decimal(1))
         p1 = matrix.cross(self.x1, self.y1, Decimal(1))
-        return LineSegment(p0[0], p0[1], p1[0], p1[1])
+        n = Matrix.to_decimal
+        return LineSegment(n(p0[0]), n(p0[1]), n(p1[0]), n(p1[1]))
@@ -22,11 +22,60 @@ class Matrix:
     Any matrix can be multiplied element-wise by a scalar from its associated field.
     """
 
+    # By default, the matrices built by affine_matrix (which are the matrices used when processing a content stream)
+    # hold float values. Setting EXACT to True makes them hold Decimal values instead,
+    # which is exact, but considerably slower. It should not be changed while content streams
+    # (or the Event objects they produced) are being processed.
+    EXACT: bool = False
+
     def __init__(self):
         """
         Initialize a new Matrix
         """
-        self.mtx: typing.List[typing.List[Decimal]] = [[], [], []]
+        self.mtx: typing.List[typing.List[typing.Any]] = [[], [], []]
+
+    @staticmethod
+    def to_number(x: typing.Any) -> typing.Union[Decimal, float]:
+        """
+        This function converts a number to the type used by affine_matrix,
+        float (by default) or Decimal (when Matrix.EXACT is True)
+        """
+        if Matrix.EXACT:
+            return Matrix.to_decimal(x)
+        return float(x)
+
+    @staticmethod
+    def to_decimal(x: typing.Any) -> Decimal:
+        """
+        This function converts a number (e.g. a value of a Matrix built by affine_matrix) to Decimal.
+        A float is rounded to 15 significant digits (the precision of a float) first,
+        so 0.1 becomes Decimal("0.1") rather than the exact binary value of the float
+        (0.1000000000000000055511151231257827...), and 0.1 * 3 becomes Decimal("0.3")
+        """
+        if isinstance(x, Decimal):
+            return x
+        if isinstance(x, float):
+            return Decimal("%.15g" % x)
+        return Decimal(x)
+
+    @staticmethod
+    def affine_matrix(
+        a: typing.Any = 1,
+        b: typing.Any = 0,
+        c: typing.Any = 0,
+        d: typing.Any = 1,
+        e: typing.Any = 0,
+        f: typing.Any = 0,
+    ) -> "Matrix":
+        """
+        This method returns the matrix [[a, b, 0], [c, d, 0], [e, f, 1]],
+        holding float values (by default) or Decimal values (when Matrix.EXACT is True).
+        Called without arguments, it returns the identity matrix.
+        """
+        n = Matrix.to_number
+        m = Matrix()
+        m.mtx = [[n(a), n(b), n(0)], [n(c), n(d), n(0)], [n(e), n(f), n(1)]]
+        return m
 
     @staticmethod
     def identity_matrix() -> "Matrix":
@@ -57,31 +106,47 @@ class Matrix:
         This function multiplies this Matrix with another Matrix,
         returning the result
         """
-        m_vals = [
-            [Decimal(0), Decimal(0), Decimal(0)],
-            [Decimal(0), Decimal(0), Decimal(0)],
-            [Decimal(0), Decimal(0), Decimal(0)],
-        ]
-        for i in range(3):
-            for j in range(3):
-                for k in range(3):
-                    m_vals[i][j] += self.mtx[i][k] * y.mtx[k][j]
+        a0, a1, a2 = self.mtx
+        b0, b1, b2 = y.mtx
         m = Matrix()
-        m.mtx = m_vals
+        m.mtx = [
+            [
+                a0[0] * b0[0] + a0[1] * b1[0] + a0[2] * b2[0],
+                a0[0] * b0[1] + a0[1] * b1[1] + a0[2] * b2[1],
+                a0[0] * b0[2] + a0[1] * b1[2] + a0[2] * b2[2],
+            ],
+            [
+                a1[0] * b0[0] + a1[1] * b1[0] + a1[2] * b2[0],
+                a1[0] * b0[1] + a1[1] * b1[1] + a1[2] * b2[1],
+                a1[0] * b0[2] + a1[1] * b1[2] + a1[2] * b2[2],
+            ],
+            [
+                a2[0] * b0[0] + a2[1] * b1[0] + a2[2] * b2[0],
+                a2[0] * b0[1] + a2[1] * b1[1] + a2[2] * b2[1],
+                a2[0] * b0[2] + a2[1] * b1[2] + a2[2] * b2[2],
+            ],
+        ]
         return m
 
-    def cross(self, x: Decimal, y: Decimal, z: Decimal):
+    def cross(
+        self,
+        x: typing.Union[Decimal, float],
+        y: typing.Union[Decimal, float],
+        z: typing.Union[Decimal, float],
+    ):
         """
         This method calculates the dot-product of this Matrix
-        with an input vector (represented by 3 input Decimal objects)
+        with an input vector (represented by 3 input Decimal (or float) objects)
         and returns the result
         """
+        if isinstance(self.mtx[0][0], float):
+            x, y, z = float(x), float(y), float(z)
         x2 = x * self[0][0] + y * self[1][0] + z * self[2][0]
         y2 = x * self[0][1] + y * self[1][1] + z * self[2][1]
         z2 = x * self[0][2] + y * self[1][2] + z * self[2][2]
         return x2, y2, z2
 
-    def __getitem__(self, item) -> List[Decimal]:
+    def __getitem__(self, item) -> List[typing.Any]:
         return self.mtx[item]
 
     def __str__(self):
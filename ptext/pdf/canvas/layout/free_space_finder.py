@@ -138,6 +138,9 @@ class FreeSpaceFinder(EventListener):
             needed_space.height,
         )
 
+    def _get_event_types(self) -> typing.Optional[typing.List[type]]:
+        return [ChunkOfTextRenderEvent, ImageRenderEvent]
+
     def _event_occurred(self, event: Event) -> None:
         if isinstance(event, ChunkOfTextRenderEvent):
             assert isinstance(event, ChunkOfTextRenderEvent)
@@ -36,17 +36,22 @@ class HorizontalRule(LayoutElement):
         self._line_width: Decimal = line_width
         self._line_color: Color = line_color
 
-    def _calculate_layout_box_without_padding(
-        self, page: "Page", bounding_box: Rectangle  # type: ignore[name-defined]
-    ) -> Rectangle:
-        layout_box: Rectangle = Rectangle(
+    def _get_measurement_key(
+        self, bounding_box: Rectangle
+    ) -> typing.Tuple[Decimal, ...]:
+        return (
+            bounding_box.x,
+            bounding_box.y + bounding_box.height,
+            bounding_box.width,
+        )
+
+    def _measure_without_padding(self, bounding_box: Rectangle) -> Rectangle:
+        return Rectangle(
             bounding_box.x,
             bounding_box.y + bounding_box.height - self._line_width,
             bounding_box.width,
             self._line_width,
         )
-        self.set_bounding_box(layout_box)
-        return layout_box
 
     def _do_layout_without_padding(
         self, page: Page, bounding_box: Rectangle
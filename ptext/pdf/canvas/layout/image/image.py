@@ -76,19 +76,22 @@ class Image(LayoutElement):
             page["Resources"]["XObject"][Name("Im%d" % image_index)] = image
             return Name("Im%d" % image_index)
 
-    def _calculate_layout_box_without_padding(
-        self, page: "Page", bounding_box: Rectangle  # type: ignore[name-defined]
-    ) -> Rectangle:
+    def _get_measurement_key(
+        self, bounding_box: Rectangle
+    ) -> typing.Tuple[Decimal, ...]:
+        return (
+            bounding_box.x,
+            bounding_box.y + bounding_box.height,
+            bounding_box.width,
+        )
 
-        # return
-        layout_box: Rectangle = Rectangle(
+    def _measure_without_padding(self, bounding_box: Rectangle) -> Rectangle:
+        return Rectangle(
             bounding_box.x,
             bounding_box.y + bounding_box.get_height() - self._height,
             self._width,
             self._height,
         )
-        self.set_bounding_box(layout_box)
-        return layout_box
 
     def _do_layout_without_padding(
         self, page: Page, bounding_box: Rectangle
@@ -6,14 +6,13 @@ This file contains all the classes needed to perform layout.
 This includes an Alignment Enum type, and the base implementation of LayoutElement
 """
 import typing
-import zlib
 from decimal import Decimal
 from enum import Enum
 
-from ptext.io.read.types import Decimal as pDecimal
-from ptext.io.read.types import Name, Stream
 from ptext.pdf.canvas.color.color import Color, X11Color
 from ptext.pdf.canvas.geometry.rectangle import Rectangle
+from ptext.pdf.canvas.layout.page_content_builder import PageContentBuilder
+from ptext.pdf.page.page import Page
 
 
 class Alignment(Enum):
@@ -114,6 +113,7 @@ class LayoutElement:
 
         # layout
         self.bounding_box: typing.Optional[Rectangle] = None
+        self._measurements: typing.Dict[typing.Tuple[Decimal, ...], Rectangle] = {}
 
     def get_font_size(self) -> Decimal:
         """
@@ -158,46 +158,33 @@ class LayoutElement:
         """
         return self.bounding_box
 
-    def _initialize_page_content_stream(self, page: "Page"):  # type: ignore[name-defined]
-        if "Contents" in page:
-            return
-
-        # build content stream object
-        content_stream = Stream()
-        content_stream[Name("DecodedBytes")] = b""
-        content_stream[Name("Bytes")] = zlib.compress(content_stream["DecodedBytes"], 9)
-        content_stream[Name("Filter")] = Name("FlateDecode")
-        content_stream[Name("Length")] = pDecimal(len(content_stream["Bytes"]))
-
-        # set content of page
-        page[Name("Contents")] = content_stream
-
     def _append_to_content_stream(self, page: "Page", instructions: str):  # type: ignore[name-defined]
-        self._initialize_page_content_stream(page)
-        content_stream = page["Contents"]
-        content_stream[Name("DecodedBytes")] += instructions.encode("latin1")
-        content_stream[Name("Bytes")] = zlib.compress(content_stream["DecodedBytes"], 9)
-        content_stream[Name("Length")] = pDecimal(len(content_stream["Bytes"]))
+        PageContentBuilder.get(page).append_instructions(instructions)
 
-    def _calculate_layout_box(self, page: "Page", bounding_box: Rectangle) -> Rectangle:  # type: ignore[name-defined]
+    def measure(self, available_box: Rectangle) -> Rectangle:
+        """
+        This function returns the layout box (including padding) this LayoutElement would occupy
+        when it is laid out in the given (available) box, without writing to the content stream of a Page.
+        Measurements are memoized, so performing layout after measuring does not repeat the measurement.
+        """
 
         # modify bounding box (to take into account padding)
         modified_layout_box = Rectangle(
-            bounding_box.x + self._padding_left,
-            bounding_box.y + self._padding_bottom,
+            available_box.x + self._padding_left,
+            available_box.y + self._padding_bottom,
             max(
-                bounding_box.width - self._padding_right - self._padding_left,
+                available_box.width - self._padding_right - self._padding_left,
                 Decimal(0),
             ),
             max(
-                bounding_box.height - self._padding_top - self._padding_bottom,
+                available_box.height - self._padding_top - self._padding_bottom,
                 Decimal(0),
             ),
         )
 
         # delegate
-        returned_layout_box = self._calculate_layout_box_without_padding(
-            page, modified_layout_box
+        returned_layout_box = self._get_measurement_without_padding(
+            modified_layout_box
         )
 
         # modify rectangle (to take into account padding)
@@ -214,27 +201,52 @@ class LayoutElement:
         # return
         return modified_returned_layout_box
 
-    def _calculate_layout_box_without_padding(
-        self, page: "Page", bounding_box: Rectangle  # type: ignore[name-defined]
-    ) -> Rectangle:
+    def _get_measurement_without_padding(self, bounding_box: Rectangle) -> Rectangle:
 
-        # store previous contents
-        if "Contents" not in page:
-            self._initialize_page_content_stream(page)
-        previous_decoded_bytes = page["Contents"]["DecodedBytes"]
+        # re-use previous measurements
+        key: typing.Tuple[Decimal, ...] = self._get_measurement_key(bounding_box)
+        layout_rect: typing.Optional[Rectangle] = self._measurements.get(key)
+        if layout_rect is None:
+            layout_rect = self._measure_without_padding(bounding_box)
+            assert layout_rect is not None
+            self._measurements[key] = layout_rect
 
-        # layout without padding
-        layout_rect = self._do_layout_without_padding(page, bounding_box)
-        assert layout_rect is not None
+        # return (a copy of) the measurement
+        layout_rect = Rectangle(
+            layout_rect.x, layout_rect.y, layout_rect.width, layout_rect.height
+        )
+        self.set_bounding_box(layout_rect)
+        return layout_rect
 
-        # restore
-        content_stream = page["Contents"]
-        content_stream[Name("DecodedBytes")] = previous_decoded_bytes
-        content_stream[Name("Bytes")] = zlib.compress(content_stream["DecodedBytes"], 9)
-        content_stream[Name("Length")] = pDecimal(len(content_stream["Bytes"]))
+    def _get_measurement_key(
+        self, bounding_box: Rectangle
+    ) -> typing.Tuple[Decimal, ...]:
+        """
+        This function returns the key under which the measurement of this LayoutElement
+        (in the given bounding box) is memoized. LayoutElement implementations that are laid out
+        from the top left corner of their bounding box, and whose layout box does not depend on
+        the height of their bounding box, only need the top left corner and the width.
+        """
+        return bounding_box.x, bounding_box.y, bounding_box.width, bounding_box.height
 
-        # return
-        return layout_rect
+    def _measure_without_padding(self, bounding_box: Rectangle) -> Rectangle:
+        """
+        This function returns the layout box (without padding) this LayoutElement would occupy
+        in the given bounding box, without writing to the content stream of a Page.
+        By default, this LayoutElement is laid out on a scratch Page.
+        """
+        return self._do_layout_without_padding(Page(), bounding_box)
+
+    def _measure_layout(self, bounding_box: Rectangle) -> Rectangle:
+        """
+        This function returns the layout box calculate_layout_box_and_do_layout would return
+        for the given bounding box (taking into account alignment), without performing layout
+        """
+        layout_box: Rectangle = self.measure(bounding_box)
+        return self.measure(self._align_bounding_box(bounding_box, layout_box))
+
+    def _clear_measurements(self) -> None:
+        self._measurements.clear()
 
     def _do_layout(self, page: "Page", layout_box: Rectangle) -> Rectangle:  # type: ignore[name-defined]
 
@@ -275,22 +287,9 @@ class LayoutElement:
         """
         return self.calculate_layout_box_and_do_layout(page, bounding_box)
 
-    def calculate_layout_box_and_do_layout(
-        self, page: "Page", bounding_box: Rectangle  # type: ignore[name-defined]
+    def _align_bounding_box(
+        self, bounding_box: Rectangle, layout_box: Rectangle
     ) -> Rectangle:
-        """
-        This function calculates the layout box and performs layout for this LayoutElement.
-        e.g. for a Paragraph this might involve taking into account the word hyphenation,
-        and enforcing vertical and horizontal alignment.
-        """
-
-        # calculate initial layout box
-        layout_box = self._calculate_layout_box(page, bounding_box)
-
-        self._initialize_page_content_stream(page)
-        content_stream = page["Contents"]
-        len_decoded_bytes_before = len(content_stream[Name("DecodedBytes")])
-
         # set the vertical alignment
         if self._vertical_alignment == Alignment.MIDDLE:
             bounding_box = Rectangle(
@@ -325,6 +324,26 @@ class LayoutElement:
                 bounding_box.height,
             )
 
+        # return
+        return bounding_box
+
+    def calculate_layout_box_and_do_layout(
+        self, page: "Page", bounding_box: Rectangle  # type: ignore[name-defined]
+    ) -> Rectangle:
+        """
+        This function calculates the layout box and performs layout for this LayoutElement.
+        e.g. for a Paragraph this might involve taking into account the word hyphenation,
+        and enforcing vertical and horizontal alignment.
+        """
+
+        # calculate initial layout box
+        layout_box = self.measure(bounding_box)
+
+        mark: int = PageContentBuilder.get(page).get_mark()
+
+        # set the alignment
+        bounding_box = self._align_bounding_box(bounding_box, layout_box)
+
         # perform layout
         final_layout_box = self._do_layout(page, bounding_box)
         self.set_bounding_box(final_layout_box)
@@ -332,23 +351,15 @@ class LayoutElement:
         # add background
         if self._background_color is not None:
 
-            # change content stream to put background before rendering of the content
-            added_content = content_stream[Name("DecodedBytes")][
-                len_decoded_bytes_before:
-            ]
-            content_stream[Name("DecodedBytes")] = content_stream[Name("DecodedBytes")][
-                0:len_decoded_bytes_before
-            ]
-
             # add background
+            page_content: PageContentBuilder = PageContentBuilder.get(page)
+            background_mark: int = page_content.get_mark()
             self._draw_background(page, final_layout_box)
 
-            # re-add content
-            content_stream[Name("DecodedBytes")] += added_content
-            content_stream[Name("Bytes")] = zlib.compress(
-                content_stream[Name("DecodedBytes")], 9
-            )
-            content_stream[Name("Length")] = len(content_stream[Name("Bytes")])
+            # change content stream to put background before rendering of the content
+            background_content: bytes = bytes(page_content[background_mark:])
+            page_content.rewind(background_mark)
+            page_content.insert_before(mark, background_content)
 
         return final_layout_box
 
@@ -69,6 +69,7 @@ class List(LayoutElement):
         if self._margin_bottom is None:
             self._margin_bottom = element.get_font_size()
         self._items.append(element)
+        self._clear_measurements()
         element._parent = self
         return self
 
@@ -85,13 +86,34 @@ class List(LayoutElement):
     def _do_layout_without_padding(
         self, page: Page, bounding_box: Rectangle
     ) -> Rectangle:
+        layout_rect: Rectangle = self._layout_items(
+            bounding_box, lambda e, r: e.layout(page, r)
+        )
+
+        # set bounding box
+        self.set_bounding_box(layout_rect)
+
+        # return
+        return layout_rect
+
+    def _measure_without_padding(self, bounding_box: Rectangle) -> Rectangle:
+        return self._layout_items(bounding_box, lambda e, r: e._measure_layout(r))
+
+    def _layout_items(
+        self,
+        bounding_box: Rectangle,
+        layout_function: typing.Callable[[LayoutElement, Rectangle], Rectangle],
+    ) -> Rectangle:
+        """
+        This function lays out the items (and their bullets) of this List,
+        using the given function to lay out (or measure) each LayoutElement
+        """
 
         # calculate the height of each item
         bullet_margin: Decimal = Decimal(20)
         for i in self._items:
-            i._calculate_layout_box(
-                page,
-                bounding_box=Rectangle(
+            i.measure(
+                Rectangle(
                     bounding_box.x + i.get_margin_left() + bullet_margin,
                     bounding_box.y + i.get_margin_bottom(),
                     bounding_box.width
@@ -99,7 +121,7 @@ class List(LayoutElement):
                     - i.get_margin_right()
                     - i.get_margin_left(),
                     bounding_box.height - i.get_margin_top(),
-                ),
+                )
             )
 
         for index, item in enumerate(self._items):
@@ -119,9 +141,9 @@ class List(LayoutElement):
             # fmt: on
 
             # bullet character
-            self._get_bullet_layout_element(index, item).layout(
-                page=page,
-                bounding_box=Rectangle(
+            layout_function(
+                self._get_bullet_layout_element(index, item),
+                Rectangle(
                     bounding_box.x,
                     previous_item_bottom - item_height,
                     bullet_margin,
@@ -129,9 +151,9 @@ class List(LayoutElement):
                 ),
             )
             # content
-            item.layout(
-                page,
-                bounding_box=Rectangle(
+            layout_function(
+                item,
+                Rectangle(
                     bounding_box.x + bullet_margin + item.get_margin_left(),
                     previous_item_bottom - item_height,
                     bounding_box.width
@@ -151,8 +173,5 @@ class List(LayoutElement):
         )
         # fmt: on
 
-        # set bounding box
-        self.set_bounding_box(layout_rect)
-
         # return
         return layout_rect
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This module contains PageContentBuilder, which holds the (decoded) content stream of a Page during layout
+"""
+import typing
+
+from ptext.io.read.types import Name, Stream
+
+
+class PageContentBuilder(bytearray):
+    """
+    This class represents the (decoded) content stream of a Page that is being laid out.
+    Content is appended in place (rather than building a new bytes object for every LayoutElement),
+    and marks (offsets in the content) allow a LayoutElement to rewind its content,
+    or to insert content (e.g. a background) before content that was added earlier.
+    The content is compressed only once, when the Document is written.
+    """
+
+    @staticmethod
+    def get(page: "Page") -> "PageContentBuilder":  # type: ignore [name-defined]
+        """
+        This function returns the PageContentBuilder of the given Page,
+        creating the content stream of the Page if needed
+        """
+        if "Contents" not in page:
+            content_stream = Stream()
+            content_stream[Name("DecodedBytes")] = PageContentBuilder()
+            content_stream[Name("Filter")] = Name("FlateDecode")
+            page[Name("Contents")] = content_stream
+        content_stream = page["Contents"]
+        content: typing.Union[bytes, PageContentBuilder] = content_stream[
+            "DecodedBytes"
+        ]
+        if not isinstance(content, PageContentBuilder):
+            content = PageContentBuilder(content)
+            content_stream[Name("DecodedBytes")] = content
+            # the encoded bytes (if any) no longer match the content
+            for k in [Name("Bytes"), Name("Length")]:
+                if k in content_stream:
+                    content_stream.pop(k)
+        return content
+
+    def append_instructions(self, instructions: str) -> "PageContentBuilder":
+        """
+        This function appends (latin1 encoded) instructions to this PageContentBuilder
+        """
+        self += instructions.encode("latin1")
+        return self
+
+    def get_mark(self) -> int:
+        """
+        This function returns a mark (the current length of the content),
+        which can later be used to rewind the content, or to insert content before what comes after it
+        """
+        return len(self)
+
+    def rewind(self, mark: int) -> "PageContentBuilder":
+        """
+        This function removes all content that was added after the given mark
+        """
+        del self[mark:]
+        return self
+
+    def insert_before(self, mark: int, content: bytes) -> "PageContentBuilder":
+        """
+        This function inserts content at the given mark (before all content that was added after the mark)
+        """
+        self[mark:mark] = content
+        return self
@@ -9,13 +9,13 @@ import typing
 from decimal import Decimal
 from enum import Enum
 
-from ptext.io.read.types import Name
 from ptext.pdf.canvas.geometry.rectangle import Rectangle
 from ptext.pdf.canvas.layout.horizontal_rule import HorizontalRule
 from ptext.pdf.canvas.layout.image.image import Image
 from ptext.pdf.canvas.layout.layout_element import LayoutElement
 from ptext.pdf.canvas.layout.list.ordered_list import OrderedList
 from ptext.pdf.canvas.layout.list.unordered_list import UnorderedList
+from ptext.pdf.canvas.layout.page_content_builder import PageContentBuilder
 from ptext.pdf.canvas.layout.page_layout.page_layout import PageLayout
 from ptext.pdf.canvas.layout.table.base_table import BaseTable
 from ptext.pdf.canvas.layout.text.chunk_of_text import ChunkOfText
@@ -150,9 +150,9 @@ class BrowserLayout(PageLayout):
         # fmt: on
 
         # page content
-        self._page_content_stream_restore: bytes = b""
-        if "Contents" in self._page and "DecodedBytes" in self._page["Contents"]:
-            self._page_content_stream_restore = self._page["Contents"]["DecodedBytes"]
+        self._page_content_stream_restore: int = PageContentBuilder.get(
+            self._page
+        ).get_mark()
 
         # margins
         if horizontal_margin is None:
@@ -212,6 +212,7 @@ class BrowserLayout(PageLayout):
 
         # reset layout
         self._page = page
+        self._page_content_stream_restore = 0
         self._layout_elements = []
 
     def _check_layout_element_dimensions(self, layout_element: LayoutElement) -> None:
@@ -252,9 +253,7 @@ class BrowserLayout(PageLayout):
         # fmt: on
 
         # catch potential layout problems as early as possible
-        suggested_layout_box: Rectangle = layout_element._calculate_layout_box(
-            self._page, Rectangle(x, y, w, h)
-        )
+        suggested_layout_box: Rectangle = layout_element.measure(Rectangle(x, y, w, h))
         self._check_layout_element_dimensions(layout_element)
 
         # if the height + y exceeds the page height --> new page
@@ -265,7 +264,9 @@ class BrowserLayout(PageLayout):
 
         # else append to new row
         layout_element.layout(self._page, layout_element.get_bounding_box())  # type: ignore [arg-type]
-        self._page_content_stream_restore = self._page["Contents"][Name("DecodedBytes")]
+        self._page_content_stream_restore = PageContentBuilder.get(
+            self._page
+        ).get_mark()
         self._rows.append(BrowserLayoutRow(DisplayValue.BLOCK).append(layout_element))
 
     def _add_inline_element(self, layout_element: LayoutElement) -> None:
@@ -301,9 +302,7 @@ class BrowserLayout(PageLayout):
         # fmt: on
 
         # catch potential layout problems as early as possible
-        suggested_layout_box: Rectangle = layout_element._calculate_layout_box(
-            self._page, Rectangle(x, y, w, h)
-        )
+        suggested_layout_box: Rectangle = layout_element.measure(Rectangle(x, y, w, h))
         self._check_layout_element_dimensions(layout_element)
 
         # if the height + y exceeds the page height --> new page
@@ -321,14 +320,12 @@ class BrowserLayout(PageLayout):
         ):
 
             # ensure page content is correct
-            self._page["Contents"][
-                Name("DecodedBytes")
-            ] = self._page_content_stream_restore
+            PageContentBuilder.get(self._page).rewind(self._page_content_stream_restore)
             for e in self._rows[-1]._layout_elements:
                 e.layout(self._page, e.get_bounding_box())  # type: ignore [arg-type]
-            self._page_content_stream_restore = self._page["Contents"][
-                Name("DecodedBytes")
-            ]
+            self._page_content_stream_restore = PageContentBuilder.get(
+                self._page
+            ).get_mark()
 
             # append new row
             self._rows.append(BrowserLayoutRow(DisplayValue.INLINE))
@@ -342,7 +339,7 @@ class BrowserLayout(PageLayout):
         self._rows[-1]._align_ys()
 
         # ensure page content is correct
-        self._page["Contents"][Name("DecodedBytes")] = self._page_content_stream_restore
+        PageContentBuilder.get(self._page).rewind(self._page_content_stream_restore)
         for e in self._rows[-1]._layout_elements:
             e.layout(self._page, e.get_bounding_box())  # type: ignore [arg-type]
 
@@ -7,13 +7,11 @@ This module contains various implementations of `PageLayout`.
 having to specify coordinates.
 """
 import typing
-import zlib
 from decimal import Decimal
 
-from ptext.io.read.types import Decimal as pDecimal
-from ptext.io.read.types import Name
 from ptext.pdf.canvas.geometry.rectangle import Rectangle
 from ptext.pdf.canvas.layout.layout_element import LayoutElement
+from ptext.pdf.canvas.layout.page_content_builder import PageContentBuilder
 from ptext.pdf.canvas.layout.page_layout.page_layout import PageLayout
 from ptext.pdf.document import Document
 from ptext.pdf.page.page import Page
@@ -131,9 +129,7 @@ class MultiColumnLayout(PageLayout):
         # fmt: on
 
         # store previous contents
-        if "Contents" not in self._page:
-            layout_element._initialize_page_content_stream(self._page)
-        previous_decoded_bytes = self._page["Contents"]["DecodedBytes"]
+        mark: int = PageContentBuilder.get(self._page).get_mark()
 
         # attempt layout
         layout_rect = layout_element.layout(
@@ -156,12 +152,7 @@ class MultiColumnLayout(PageLayout):
 
         # switch to next column
         if layout_rect.y < self._vertical_margin:
-            content_stream = self._page["Contents"]
-            content_stream[Name("DecodedBytes")] = previous_decoded_bytes
-            content_stream[Name("Bytes")] = zlib.compress(
-                content_stream["DecodedBytes"], 9
-            )
-            content_stream[Name("Length")] = pDecimal(len(content_stream["Bytes"]))
+            PageContentBuilder.get(self._page).rewind(mark)
             self.switch_to_next_column()
             return self.add(layout_element)
 
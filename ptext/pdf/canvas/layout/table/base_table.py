@@ -83,9 +83,8 @@ class TableCell(LayoutElement):
         in this TableCell. It uses an iterative process to gradually hone in on the
         minimum width, which can be quite labour-intensive.
         """
-        max_bounding_box: Rectangle = self._calculate_layout_box(
-            Page(),
-            Rectangle(Decimal(0), Decimal(0), Decimal(2048), Decimal(2048)),
+        max_bounding_box: Rectangle = self.measure(
+            Rectangle(Decimal(0), Decimal(0), Decimal(2048), Decimal(2048))
         )
         self._max_width = ceil(max_bounding_box.get_width()) + Decimal(1)
         self._min_height = ceil(max_bounding_box.get_height()) + Decimal(1)
@@ -98,9 +97,8 @@ class TableCell(LayoutElement):
             midpoint = Decimal(int(midpoint))
             try:
                 # attempt layout
-                self._calculate_layout_box(
-                    Page(),
-                    Rectangle(Decimal(0), Decimal(0), Decimal(midpoint), Decimal(2048)),
+                self.measure(
+                    Rectangle(Decimal(0), Decimal(0), Decimal(midpoint), Decimal(2048))
                 )
 
                 # check bounding box to see if layout made it
@@ -117,24 +115,34 @@ class TableCell(LayoutElement):
         # copy bounds
         self._min_width = min_width_upper_bound
 
-    def _calculate_layout_box_without_padding(
-        self, page: Page, bounding_box: Rectangle
-    ) -> Rectangle:
-        return self._layout_element._calculate_layout_box(page, bounding_box)
+    def _measure_without_padding(self, bounding_box: Rectangle) -> Rectangle:
+        return self._layout_element.measure(bounding_box)
+
+    def _measure_layout(self, bounding_box: Rectangle) -> Rectangle:
+        return self._layout_inner_element(
+            bounding_box, lambda e, r: e._measure_layout(r)
+        )
 
     def layout(self, page: Page, layout_box: Rectangle) -> Rectangle:
         """
         This function calculates the layout box and performs layout for this LayoutElement.
         TableCell propagates the padding to its inner LayoutElement.
         """
+        return self._layout_inner_element(layout_box, lambda e, r: e.layout(page, r))
+
+    def _layout_inner_element(
+        self,
+        layout_box: Rectangle,
+        layout_function: typing.Callable[[LayoutElement, Rectangle], Rectangle],
+    ) -> Rectangle:
         modified_layout_box: Rectangle = Rectangle(
             layout_box.x + self._padding_left,
             layout_box.y + self._padding_bottom,
             layout_box.width - self._padding_left - self._padding_right,
             layout_box.height - self._padding_top - self._padding_bottom,
         )
-        returned_layout_box: Rectangle = self._layout_element.layout(
-            page, modified_layout_box
+        returned_layout_box: Rectangle = layout_function(
+            self._layout_element, modified_layout_box
         )
 
         modified_returned_layout_box: Rectangle = Rectangle(
@@ -261,6 +269,7 @@ class BaseTable(LayoutElement):
             e._padding_right = padding_right
             e._padding_bottom = padding_bottom
             e._padding_left = padding_left
+        self._clear_measurements()
         return self
 
     def set_borders_on_all_cells(
@@ -339,6 +348,15 @@ class BaseTable(LayoutElement):
                     tc._background_color = odd_row_color
         return self
 
+    def _get_measurement_key(
+        self, bounding_box: Rectangle
+    ) -> typing.Tuple[Decimal, ...]:
+        return (
+            bounding_box.x,
+            bounding_box.y + bounding_box.height,
+            bounding_box.width,
+        )
+
     def _get_cells_at_column(self, column: int) -> typing.List[TableCell]:
         out: typing.List[TableCell] = []
         for t in self._content:
@@ -362,6 +380,7 @@ class BaseTable(LayoutElement):
         # embed LayoutElement in TableCell (if needed)
         if not isinstance(layout_element, TableCell):
             layout_element = TableCell(layout_element)
+        self._clear_measurements()
 
         # add content
         self._content.append(layout_element)
@@ -5,14 +5,13 @@
 This class represents a Table with columns of fixed width
 """
 import typing
-import zlib
 from decimal import Decimal
 from math import floor
 
-from ptext.io.read.types import Name
 from ptext.pdf.canvas.color.color import Color, X11Color
 from ptext.pdf.canvas.geometry.rectangle import Rectangle
-from ptext.pdf.canvas.layout.layout_element import Alignment
+from ptext.pdf.canvas.layout.layout_element import Alignment, LayoutElement
+from ptext.pdf.canvas.layout.page_content_builder import PageContentBuilder
 from ptext.pdf.canvas.layout.table.base_table import BaseTable
 from ptext.pdf.canvas.layout.text.paragraph import Paragraph
 from ptext.pdf.page.page import Page
@@ -76,6 +75,54 @@ class FixedColumnWidthTable(BaseTable):
         self, page: Page, bounding_box: Rectangle
     ) -> Rectangle:
 
+        # We are going to store the offset, to ensure we can draw backgrounds and borders later.
+        # We want backgrounds and borders to be drawn first, which requires us to mess around
+        # with the raw content bytes a bit.
+        # This is not exactly an ideal solution, but it is a fast solution.
+        page_content: PageContentBuilder = PageContentBuilder.get(page)
+        page_content_stream_marker: int = page_content.get_mark()
+
+        # lay out content
+        bounding_box = self._layout_cells(bounding_box, lambda e, r: e.layout(page, r))
+
+        # store the offset at which the borders and backgrounds are drawn
+        border_and_background_marker: int = page_content.get_mark()
+
+        # draw borders
+        for t in self._content:
+            assert t.bounding_box is not None
+            t._draw_border_after_layout(page)
+
+        # draw backgrounds
+        for t in self._content:
+            assert t.bounding_box is not None
+            t._draw_background_after_layout(page, t.bounding_box)
+
+        # move borders and backgrounds before the content of the table
+        border_and_background_bytes: bytes = bytes(
+            page_content[border_and_background_marker:]
+        )
+        page_content.rewind(border_and_background_marker)
+        page_content.insert_before(
+            page_content_stream_marker, border_and_background_bytes
+        )
+
+        # return
+        return bounding_box
+
+    def _measure_without_padding(self, bounding_box: Rectangle) -> Rectangle:
+        return self._layout_cells(bounding_box, lambda e, r: e._measure_layout(r))
+
+    def _layout_cells(
+        self,
+        bounding_box: Rectangle,
+        layout_function: typing.Callable[[LayoutElement, Rectangle], Rectangle],
+    ) -> Rectangle:
+        """
+        This function lays out the TableCell objects of this Table,
+        using the given function to lay out (or measure) each TableCell in its bounding box
+        """
+
         # calculate column_bounds
         column_bounds: typing.List[Decimal] = [bounding_box.get_x()]
         total_column_width: Decimal = Decimal(sum(self._column_widths))
@@ -93,12 +140,6 @@ class FixedColumnWidthTable(BaseTable):
         for _ in range(0, empty_cells):
             self.add(Paragraph(" ", respect_spaces_in_text=True))
 
-        # We are going to store the offset, to ensure we can draw backgrounds and borders later.
-        # We want backgrounds and borders to be drawn first, which requires us to mess around
-        # with the raw content bytes a bit.
-        # This is not exactly an ideal solution, but it is a fast solution.
-        page_content_stream_marker = len(page["Contents"][Name("DecodedBytes")])
-
         # lay out content
         row_bounds: typing.List[Decimal] = [
             Decimal(floor(bounding_box.get_y() + bounding_box.get_height()))
@@ -116,7 +157,7 @@ class FixedColumnWidthTable(BaseTable):
             # fmt: on
 
             # layout
-            t.layout(page, Rectangle(x, y, w, h))
+            layout_function(t, Rectangle(x, y, w, h))
             tbb: typing.Optional[Rectangle] = t.get_bounding_box()
             assert tbb is not None
 
@@ -144,30 +185,5 @@ class FixedColumnWidthTable(BaseTable):
         )
         # fmt: on
 
-        # change content stream to put background before rendering of the content
-        table_content_bytes = page["Contents"][Name("DecodedBytes")][
-            page_content_stream_marker:
-        ]
-        page["Contents"][Name("DecodedBytes")] = page["Contents"][Name("DecodedBytes")][
-            0:page_content_stream_marker
-        ]
-
-        # draw borders
-        for t in self._content:
-            assert t.bounding_box is not None
-            t._draw_border_after_layout(page)
-
-        # draw backgrounds
-        for t in self._content:
-            assert t.bounding_box is not None
-            t._draw_background_after_layout(page, t.bounding_box)
-
-        # re-add content
-        page["Contents"][Name("DecodedBytes")] += table_content_bytes
-        page["Contents"][Name("Bytes")] = zlib.compress(
-            page["Contents"][Name("DecodedBytes")], 9
-        )
-        page["Contents"][Name("Length")] = len(page["Contents"][Name("Bytes")])
-
         # return
         return bounding_box
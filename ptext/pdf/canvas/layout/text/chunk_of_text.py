@@ -163,6 +163,7 @@ class ChunkOfText(LayoutElement):
         rgb_color = self._font_color.to_rgb()
         COLOR_MAX = Decimal(255.0)
         assert self._font_size is not None
+        font_resource_name: Name = self._get_font_resource_name(self._font, page)
         content = """
             q
             BT
@@ -176,7 +177,7 @@ class ChunkOfText(LayoutElement):
             Decimal(rgb_color.red / COLOR_MAX),  # rg
             Decimal(rgb_color.green / COLOR_MAX),  # rg
             Decimal(rgb_color.blue / COLOR_MAX),  # rg
-            self._get_font_resource_name(self._font, page),  # Tf
+            font_resource_name,  # Tf
             Decimal(1),  # Tf
             float(self._font_size),  # Tm
             float(self._font_size),  # Tm
@@ -185,20 +186,34 @@ class ChunkOfText(LayoutElement):
             self._write_text_bytes(),  # Tj
         )
         self._append_to_content_stream(page, content)
-        encoded_bytes: bytes = [
-            self._font.unicode_to_character_identifier(c) or 0 for c in self._text
-        ]
-        layout_rect = Rectangle(
+
+        # keep track of the glyphs used (by the Font in the resources of the Page)
+        page["Resources"]["Font"][font_resource_name]._add_used_character_identifiers(
+            self._get_character_identifiers()
+        )
+
+        # return
+        return self._get_measurement_without_padding(bounding_box)
+
+    def _get_character_identifiers(self) -> typing.List[int]:
+        return [self._font.unicode_to_character_identifier(c) or 0 for c in self._text]
+
+    def _get_measurement_key(
+        self, bounding_box: Rectangle
+    ) -> typing.Tuple[Decimal, ...]:
+        return (
+            bounding_box.x,
+            bounding_box.y + bounding_box.height,
+            bounding_box.width,
+        )
+
+    def _measure_without_padding(self, bounding_box: Rectangle) -> Rectangle:
+        assert self._font_size is not None
+        return Rectangle(
             bounding_box.x,
             bounding_box.y + bounding_box.height - self._font_size,
             GlyphLine(
-                encoded_bytes, self._font, self._font_size
+                self._get_character_identifiers(), self._font, self._font_size
             ).get_width_in_text_space(),
             self._font_size,
         )
-
-        # set bounding box
-        self.set_bounding_box(layout_rect)
-
-        # return
-        return layout_rect
@@ -11,7 +11,7 @@ from decimal import Decimal
 
 from ptext.pdf.canvas.color.color import Color, X11Color
 from ptext.pdf.canvas.geometry.rectangle import Rectangle
-from ptext.pdf.canvas.layout.layout_element import Alignment
+from ptext.pdf.canvas.layout.layout_element import Alignment, LayoutElement
 from ptext.pdf.canvas.layout.text.chunk_of_text import ChunkOfText
 from ptext.pdf.canvas.layout.text.paragraph import Paragraph
 from ptext.pdf.page.page import Page
@@ -88,6 +88,9 @@ class Span(Paragraph):
         assert line_height >= Decimal(1)
         self._line_height: Decimal = line_height
 
+        # measurements
+        self._measurements: typing.Dict[typing.Tuple[Decimal, ...], Rectangle] = {}
+
         # store chunks
         self._chunks_of_text: typing.List[ChunkOfText] = []
         for c in chunks_of_text:
@@ -103,6 +106,7 @@ class Span(Paragraph):
                 self.add(c)
             return self
         self._chunks_of_text.append(chunk_of_text)
+        self._clear_measurements()
         if self._font_size is None:
             self._font_size = self._chunks_of_text[0].get_font_size()
         return self
@@ -115,7 +119,7 @@ class Span(Paragraph):
         return self.add(LineBreakChunk())
 
     def _split_chunks_to_lines(
-        self, page: Page, bounding_box: Rectangle
+        self, bounding_box: Rectangle
     ) -> typing.List[typing.Tuple[typing.List[ChunkOfText], Decimal]]:
         lines: typing.List[typing.Tuple[typing.List[ChunkOfText], Decimal]] = []
         previous_line: typing.List[ChunkOfText] = []
@@ -130,9 +134,7 @@ class Span(Paragraph):
                 previous_line_width = Decimal(0)
                 continue
             # process ChunkOfText
-            w: Decimal = c._calculate_layout_box_without_padding(
-                page, bounding_box
-            ).get_width()
+            w: Decimal = c._get_measurement_without_padding(bounding_box).get_width()
             if round(previous_line_width + w, 2) > round(bounding_box.get_width(), 2):
                 lines.append((copy.deepcopy(previous_line), previous_line_width))
                 previous_line.clear()
@@ -145,12 +147,45 @@ class Span(Paragraph):
             lines.append((copy.deepcopy(previous_line), previous_line_width))
         return lines
 
-    def _do_layout_without_padding(self, page: Page, bounding_box: Rectangle):
+    def _get_measurement_key(
+        self, bounding_box: Rectangle
+    ) -> typing.Tuple[Decimal, ...]:
+        return (
+            bounding_box.get_x(),
+            bounding_box.get_y() + bounding_box.get_height(),
+            bounding_box.get_width(),
+        )
+
+    def _do_layout_without_padding(
+        self, page: Page, bounding_box: Rectangle
+    ) -> Rectangle:
+        layout_rect: Rectangle = self._layout_lines(
+            bounding_box, lambda e, r: e.layout(page, r)
+        )
+
+        # set bounding box
+        self.set_bounding_box(layout_rect)
+
+        # return
+        return layout_rect
+
+    def _measure_without_padding(self, bounding_box: Rectangle) -> Rectangle:
+        return self._layout_lines(bounding_box, lambda e, r: e._measure_layout(r))
+
+    def _layout_lines(
+        self,
+        bounding_box: Rectangle,
+        layout_function: typing.Callable[[LayoutElement, Rectangle], Rectangle],
+    ) -> Rectangle:
+        """
+        This function splits the ChunkOfText objects of this Span into lines,
+        and uses the given function to lay out (or measure) each ChunkOfText
+        """
 
         # split text to lines
         lines: typing.List[
             typing.Tuple[typing.List[ChunkOfText], Decimal]
-        ] = self._split_chunks_to_lines(page, bounding_box)
+        ] = self._split_chunks_to_lines(bounding_box)
 
         assert self._horizontal_alignment in [
             Alignment.LEFT,
@@ -188,8 +223,8 @@ class Span(Paragraph):
 
             # layout line
             for chunk_of_text in line_of_chunks:
-                r: Rectangle = chunk_of_text.layout(
-                    page,
+                r: Rectangle = layout_function(
+                    chunk_of_text,
                     Rectangle(
                         prev_x,
                         line_y,
@@ -215,13 +250,8 @@ class Span(Paragraph):
                 * self._line_height
             )
 
-        layout_rect = Rectangle(min_x, min_y, max_x - min_x, max_y - min_y)
-
-        # set bounding box
-        self.set_bounding_box(layout_rect)
-
         # return
-        return layout_rect
+        return Rectangle(min_x, min_y, max_x - min_x, max_y - min_y)
 
 
 class HeterogeneousParagraph(Span):
@@ -289,6 +319,7 @@ class HeterogeneousParagraph(Span):
                 self.add(c)
             return self
         self._chunks_of_text.append(chunk_of_text)
+        self._clear_measurements()
         if self._font_size is None:
             self._font_size = self._chunks_of_text[0].get_font_size()
         if self._margin_top is None:
@@ -91,8 +91,21 @@ class Paragraph(LineOfText):
         self.text_alignment = text_alignment
         assert line_height >= Decimal(1)
         self._line_height = line_height
+        self._lines_of_text_by_width: typing.Dict[Decimal, typing.List[str]] = {}
 
     def _split_text(self, bounding_box: Rectangle) -> typing.List[str]:
+        # splitting the text only depends on the width of the bounding box
+        lines_of_text: typing.Optional[
+            typing.List[str]
+        ] = self._lines_of_text_by_width.get(bounding_box.width)
+        if lines_of_text is None:
+            lines_of_text = self._split_text_without_memoization(bounding_box)
+            self._lines_of_text_by_width[bounding_box.width] = lines_of_text
+        return lines_of_text
+
+    def _split_text_without_memoization(
+        self, bounding_box: Rectangle
+    ) -> typing.List[str]:
         # asserts
         assert self._font_size is not None
 
@@ -171,6 +184,24 @@ class Paragraph(LineOfText):
         return lines_of_text if len(lines_of_text) > 0 else [""]
 
     def _do_layout_without_padding(self, page: Page, bounding_box: Rectangle):
+        return self._layout_lines_of_text(
+            bounding_box, lambda e, r: e.layout(page, bounding_box=r)
+        )
+
+    def _measure_without_padding(self, bounding_box: Rectangle) -> Rectangle:
+        return self._layout_lines_of_text(
+            bounding_box, lambda e, r: e._measure_layout(r)
+        )
+
+    def _layout_lines_of_text(
+        self,
+        bounding_box: Rectangle,
+        layout_function: typing.Callable[[LayoutElement, Rectangle], Rectangle],
+    ) -> Rectangle:
+        """
+        This function lays out the lines of text of this Paragraph,
+        using the given function to lay out (or measure) each line in its bounding box
+        """
         # easy case
         if len(self._text) == 0:
             return Rectangle(bounding_box.x, bounding_box.y, Decimal(0), Decimal(0))
@@ -182,8 +213,8 @@ class Paragraph(LineOfText):
 
         # separate method for the harder case of Alignment.JUSTIFIED
         if self.text_alignment == Alignment.JUSTIFIED:
-            return self._do_layout_without_padding_text_alignment_justified(
-                lines_of_text, page, bounding_box
+            return self._layout_lines_of_text_text_alignment_justified(
+                lines_of_text, bounding_box, layout_function
             )
 
         # delegate
@@ -196,16 +227,16 @@ class Paragraph(LineOfText):
         line_height: Decimal = self._font_size * self._line_height
         assert self._font_size is not None
         for i, l in enumerate(lines_of_text):
-            r = LineOfText(
-                l,
-                font=self._font,
-                font_size=self._font_size,
-                font_color=self._font_color,
-                horizontal_alignment=self.text_alignment,
-                parent=self,
-            ).layout(
-                page,
-                bounding_box=Rectangle(
+            r = layout_function(
+                LineOfText(
+                    l,
+                    font=self._font,
+                    font_size=self._font_size,
+                    font_color=self._font_color,
+                    horizontal_alignment=self.text_alignment,
+                    parent=self,
+                ),
+                Rectangle(
                     bounding_box.x,
                     bounding_box.y
                     + bounding_box.height
@@ -227,8 +258,11 @@ class Paragraph(LineOfText):
         # return
         return layout_rect
 
-    def _do_layout_without_padding_text_alignment_justified(
-        self, lines_of_text: typing.List[str], page: Page, bounding_box: Rectangle
+    def _layout_lines_of_text_text_alignment_justified(
+        self,
+        lines_of_text: typing.List[str],
+        bounding_box: Rectangle,
+        layout_function: typing.Callable[[LayoutElement, Rectangle], Rectangle],
     ) -> Rectangle:
         min_x: Decimal = Decimal(2048)
         min_y: Decimal = Decimal(2048)
@@ -244,15 +278,15 @@ class Paragraph(LineOfText):
             #  it is customary to treat the last line of a paragraph separately by simply left or right aligning it,
             #  depending on the language direction.
             if i == len(lines_of_text) - 1 and len(lines_of_text) > 1:
-                last_line_rectangle: Rectangle = LineOfText(
-                    line_of_text,
-                    font=self._font,
-                    font_size=self._font_size,
-                    font_color=self._font_color,
-                    parent=self,
-                ).layout(
-                    page,
-                    bounding_box=Rectangle(
+                last_line_rectangle: Rectangle = layout_function(
+                    LineOfText(
+                        line_of_text,
+                        font=self._font,
+                        font_size=self._font_size,
+                        font_color=self._font_color,
+                        parent=self,
+                    ),
+                    Rectangle(
                         bounding_box.x,
                         bounding_box.y
                         + bounding_box.height
@@ -293,15 +327,15 @@ class Paragraph(LineOfText):
             x: Decimal = bounding_box.x
             for w in words:
                 s = w + " "
-                r: Rectangle = ChunkOfText(
-                    s,
-                    font=self._font,
-                    font_size=self._font_size,
-                    font_color=self._font_color,
-                    parent=self,
-                ).layout(
-                    page,
-                    bounding_box=Rectangle(
+                r: Rectangle = layout_function(
+                    ChunkOfText(
+                        s,
+                        font=self._font,
+                        font_size=self._font_size,
+                        font_color=self._font_color,
+                        parent=self,
+                    ),
+                    Rectangle(
                         x,
                         bounding_box.y
                         + bounding_box.height
@@ -29,8 +29,10 @@ class StrokePath(CanvasOperator):
         gs = canvas.graphics_state
 
         # notify listeners
-        for l in gs.path:
-            canvas._event_occurred(LineRenderEvent(gs, l))
+        event_bus = canvas.get_event_bus()
+        if event_bus.has_subscribers(LineRenderEvent):
+            for l in gs.path:
+                event_bus.publish(LineRenderEvent(gs, l))
 
         # clear path
         gs.path = []
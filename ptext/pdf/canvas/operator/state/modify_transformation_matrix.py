@@ -36,7 +36,7 @@ class ModifyTransformationMatrix(CanvasOperator):
         assert isinstance(operands[3], Decimal), "Operand 3 of cm must be a Decimal"
         assert isinstance(operands[4], Decimal), "Operand 4 of cm must be a Decimal"
         assert isinstance(operands[5], Decimal), "Operand 5 of cm must be a Decimal"
-        mtx = Matrix.matrix_from_six_values(
+        mtx = Matrix.affine_matrix(
             operands[0],
             operands[1],
             operands[2],
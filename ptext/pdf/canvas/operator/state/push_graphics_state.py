@@ -5,7 +5,6 @@
 Save the current graphics state on the graphics state stack (see
 8.4.2, "Graphics State Stack").
 """
-import copy
 from typing import List
 
 from ptext.io.read.types import AnyPDFType
@@ -26,4 +25,5 @@ class PushGraphicsState(CanvasOperator):
         Invoke the q operator
         """
         canvas = canvas_stream_processor.get_canvas()
-        canvas.graphics_state_stack.append(copy.deepcopy(canvas.graphics_state))
+        # the (saved) copy shares all its members with the current graphics state
+        canvas.graphics_state_stack.append(canvas.graphics_state.copy())
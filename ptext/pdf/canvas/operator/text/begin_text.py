@@ -30,6 +30,8 @@ class BeginTextObject(CanvasOperator):
         Invoke the BT operator
         """
         canvas = canvas_stream_processor.get_canvas()
-        canvas.graphics_state.text_matrix = Matrix.identity_matrix()
-        canvas.graphics_state.text_line_matrix = Matrix.identity_matrix()
-        canvas._event_occurred(BeginTextEvent())
+        canvas.graphics_state.text_matrix = Matrix.affine_matrix()
+        canvas.graphics_state.text_line_matrix = Matrix.affine_matrix()
+        event_bus = canvas.get_event_bus()
+        if event_bus.has_subscribers(BeginTextEvent):
+            event_bus.publish(BeginTextEvent())
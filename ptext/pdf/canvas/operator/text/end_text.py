@@ -26,4 +26,6 @@ class EndTextObject(CanvasOperator):
         canvas = canvas_stream_processor.get_canvas()
         canvas.graphics_state.text_matrix = None
         canvas.graphics_state.text_line_matrix = None
-        canvas._event_occurred(EndTextEvent())
+        event_bus = canvas.get_event_bus()
+        if event_bus.has_subscribers(EndTextEvent):
+            event_bus.publish(EndTextEvent())
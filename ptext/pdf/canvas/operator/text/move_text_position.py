@@ -37,9 +37,7 @@ class MoveTextPosition(CanvasOperator):
         tx = operands[0]
         ty = operands[1]
 
-        m = Matrix.identity_matrix()
-        m[2][0] = tx
-        m[2][1] = ty
+        m = Matrix.affine_matrix(e=tx, f=ty)
 
         canvas = canvas_stream_processor.get_canvas()
         canvas.graphics_state.text_matrix = m.mul(
@@ -43,7 +43,7 @@ class SetTextMatrix(CanvasOperator):
         assert isinstance(operands[4], Decimal)
         assert isinstance(operands[5], Decimal)
 
-        mtx = Matrix.matrix_from_six_values(
+        mtx = Matrix.affine_matrix(
             operands[0],
             operands[1],
             operands[2],
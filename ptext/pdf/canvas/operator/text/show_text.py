@@ -36,13 +36,19 @@ class ShowText(CanvasOperator):
                 "Font", canvas.graphics_state.font
             )
 
-        tri = ChunkOfTextRenderEvent(canvas.graphics_state, operands[0])
-
-        # render
-        canvas._event_occurred(tri)
+        # render (if anyone is listening)
+        event_bus = canvas.get_event_bus()
+        if event_bus.has_subscribers(ChunkOfTextRenderEvent):
+            tri = ChunkOfTextRenderEvent(canvas.graphics_state, operands[0])
+            event_bus.publish(tri)
+            w = tri.get_baseline().width
+        else:
+            w = ChunkOfTextRenderEvent._get_baseline_width(
+                canvas.graphics_state, operands[0]
+            )
 
         # update text rendering location
-        canvas.graphics_state.text_matrix[2][0] += tri.get_baseline().width
+        canvas.graphics_state.move_text_matrix(w)
 
         # restore
         if font_name is not None:
@@ -49,17 +49,25 @@ class ShowTextWithGlyphPositioning(CanvasOperator):
                 "Font", canvas.graphics_state.font
             )
 
+        event_bus = canvas.get_event_bus()
+        is_rendered: bool = event_bus.has_subscribers(ChunkOfTextRenderEvent)
         for i in range(0, len(operands[0])):
             obj = operands[0][i]
 
             # display string
             if isinstance(obj, String):
                 assert isinstance(obj, String)
-                tri = ChunkOfTextRenderEvent(canvas.graphics_state, obj)
-                # render
-                canvas._event_occurred(tri)
+                # render (if anyone is listening)
+                if is_rendered:
+                    tri = ChunkOfTextRenderEvent(canvas.graphics_state, obj)
+                    event_bus.publish(tri)
+                    w = tri.get_baseline().width
+                else:
+                    w = ChunkOfTextRenderEvent._get_baseline_width(
+                        canvas.graphics_state, obj
+                    )
                 # update text rendering location
-                canvas.graphics_state.text_matrix[2][0] += tri.get_baseline().width
+                canvas.graphics_state.move_text_matrix(w)
                 continue
 
             # adjust
@@ -73,7 +81,7 @@ class ShowTextWithGlyphPositioning(CanvasOperator):
                     * gs.font_size
                     * (gs.horizontal_scaling / 100)
                 )
-                gs.text_matrix[2][0] -= adjust_scaled
+                gs.move_text_matrix(-adjust_scaled)
 
         # restore
         if font_name is not None:
@@ -52,9 +52,11 @@ class Do(CanvasOperator):
 
         # render Image objects
         if isinstance(xobject, PIL.Image.Image):
-            canvas._event_occurred(
-                ImageRenderEvent(graphics_state=canvas.graphics_state, image=xobject)
-            )
+            event_bus = canvas.get_event_bus()
+            if event_bus.has_subscribers(ImageRenderEvent):
+                event_bus.publish(
+                    ImageRenderEvent(graphics_state=canvas.graphics_state, image=xobject)
+                )
             return
 
         # Form XObject
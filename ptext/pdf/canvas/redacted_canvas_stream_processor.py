@@ -141,7 +141,7 @@ class ShowTextMod(CanvasOperator):
 
             if letter_should_be_redacted:
                 # update text_matrix
-                graphics_state.text_matrix[2][0] += w
+                graphics_state.move_text_matrix(w)
                 # this flag is useful to ensure we only write the Tm command once
                 # it could not hurt to write it several times, but it would be a wasted effort
                 jump_from_redacted = True
@@ -162,7 +162,7 @@ class ShowTextMod(CanvasOperator):
                     canvas_stream_processor, evt.get_text(), evt.get_font()
                 )
                 # update text_matrix
-                graphics_state.text_matrix[2][0] += w
+                graphics_state.move_text_matrix(w)
 
         # restore
         if font_name is not None:
@@ -234,7 +234,7 @@ class ShowTextWithGlyphPositioningMod(CanvasOperator):
 
                     if letter_should_be_redacted:
                         # update text_matrix
-                        graphics_state.text_matrix[2][0] += w
+                        graphics_state.move_text_matrix(w)
                         # this flag is useful to ensure we only write the Tm command once
                         # it could not hurt to write it several times, but it would be a wasted effort
                         jump_from_redacted = True
@@ -255,7 +255,7 @@ class ShowTextWithGlyphPositioningMod(CanvasOperator):
                             canvas_stream_processor, evt.get_text(), evt.get_font()
                         )
                         # update text_matrix
-                        graphics_state.text_matrix[2][0] += w
+                        graphics_state.move_text_matrix(w)
 
             # process Decimal objects
             if isinstance(obj, Decimal):
@@ -270,7 +270,7 @@ class ShowTextWithGlyphPositioningMod(CanvasOperator):
                     * gs.font_size
                     * (gs.horizontal_scaling / 100)
                 )
-                gs.text_matrix[2][0] -= adjust_scaled
+                gs.move_text_matrix(-adjust_scaled)
 
                 # write operator
                 canvas_stream_processor._redacted_content += "\n%f %f %f %f %f %f Tm" % (  # type: ignore [attr-defined]
@@ -8,6 +8,7 @@
 import typing
 import zlib
 
+from ptext.io.filter.stream_decode_util import iter_decode_stream
 from ptext.io.read.types import Decimal, Dictionary, List, Name, Stream, String
 from ptext.pdf.page.page import DestinationType, Page
 from ptext.pdf.trailer.document_info import DocumentInfo, XMPDocumentInfo
@@ -37,6 +38,21 @@ class Document(Dictionary):
         """
         return self["XRef"]["Trailer"]["Root"]["Pages"]["Kids"][page_number]
 
+    def iter_pages(
+        self, event_listeners: typing.List["EventListener"] = []  # type: ignore [name-defined]
+    ) -> typing.Iterator[Page]:
+        """
+        This function iterates over the Page(s) in this Document (in order).
+        If EventListener(s) are given, the content stream of each Page is processed (on demand)
+        and its events are sent to the given EventListener(s).
+        """
+        number_of_pages: int = int(self.get_document_info().get_number_of_pages() or 0)
+        for i in range(0, number_of_pages):
+            page: Page = self.get_page(i)
+            if len(event_listeners) > 0:
+                page.process(event_listeners)
+            yield page
+
     def append_document(self, document: "Document") -> "Document":
         """
         This method appends another Document to this one
@@ -519,7 +535,11 @@ class Document(Dictionary):
                     assert isinstance(file_spec_leaf["EF"]["F"], Stream)
 
                     # extract bytes from Stream
-                    return file_spec_leaf["EF"]["F"]["DecodedBytes"]
+                    # embedded files are decoded on demand (they are not kept as DecodedBytes)
+                    embedded_file_stream = file_spec_leaf["EF"]["F"]
+                    if "DecodedBytes" in embedded_file_stream:
+                        return embedded_file_stream["DecodedBytes"]
+                    return b"".join(iter_decode_stream(embedded_file_stream))
 
                 if lower_limit < file_name < upper_limit:
                     parent = k
@@ -118,6 +118,52 @@ class Page(Dictionary):
         """
         return self.get_root()  # type: ignore [attr-defined]
 
+    #
+    # CONTENT
+    #
+
+    def process(self, event_listeners: typing.List["EventListener"] = []) -> "Page":  # type: ignore [name-defined]
+        """
+        This function processes the content stream of this Page, sending out BeginPageEvent,
+        the (render) events of the content stream, and EndPageEvent.
+        These events are sent to the given EventListener(s), and to those attached to this Page (or its parent(s)).
+        While a Document is being read, content streams are only processed if an EventListener is attached.
+        """
+        from ptext.pdf.canvas.canvas_stream_processor import CanvasStreamProcessor
+        from ptext.pdf.canvas.event.begin_page_event import BeginPageEvent
+        from ptext.pdf.canvas.event.end_page_event import EndPageEvent
+        from ptext.pdf.canvas.event.event_bus import EventBus
+
+        # subscribe the listener(s) attached to this Page, the given listener(s),
+        # and the listener(s) attached to the parent(s) of this Page
+        if "_event_listeners" not in vars(self):
+            setattr(self, "_event_listeners", [])
+        prev_event_listeners = self._event_listeners
+        self._event_listeners = prev_event_listeners + event_listeners
+        try:
+            event_bus: EventBus = EventBus.for_object(self)
+        finally:
+            self._event_listeners = prev_event_listeners
+
+        # send out BeginPageEvent
+        if event_bus.has_subscribers(BeginPageEvent):
+            event_bus.publish(BeginPageEvent(self))
+
+        # process content stream
+        if "Contents" in self and isinstance(self["Contents"], Stream):
+            canvas = Canvas().set_parent(self)  # type: ignore [attr-defined]
+            canvas.set_event_bus(event_bus)
+            CanvasStreamProcessor(self, canvas, []).read(
+                io.BytesIO(self["Contents"]["DecodedBytes"])
+            )
+
+        # send out EndPageEvent
+        if event_bus.has_subscribers(EndPageEvent):
+            event_bus.publish(EndPageEvent(self))
+
+        # return
+        return self
+
     #
     # ANNOTATIONS
     #
@@ -9,10 +9,15 @@
     PDF was standardized as ISO 32000 in 2008, and no longer requires any royalties for its implementation.
 """
 import io
+import mmap
+from pathlib import Path
 from typing import List, Union
 
+from ptext.io.read.memory_mapped_file import MemoryMappedFile
 from ptext.io.read.read_any_object_transformer import ReadAnyObjectTransformer
+from ptext.io.read.read_base_transformer import ReadTransformerContext
 from ptext.io.write.write_any_object_transformer import WriteAnyObjectTransformer
+from ptext.io.write.write_base_transformer import WriteTransformerContext
 from ptext.pdf.canvas.event.event_listener import EventListener
 from ptext.pdf.document import Document
 
@@ -35,22 +40,57 @@ class PDF:
 
     @staticmethod
     def loads(
-        file: Union[io.BufferedIOBase, io.RawIOBase],
+        file: Union[io.BufferedIOBase, io.RawIOBase, str, Path, mmap.mmap],
         event_listeners: List[EventListener] = [],
+        lazy: bool = False,
     ) -> Document:
         """
         This function reads a byte-stream input (which may be presented as an io.BufferedIOBase o io.RawIOBase)
         and returns a Document.
+        The input may also be a path (str or Path) or an mmap.mmap,
+        in which case the file is memory-mapped, and its bytes are read without copying.
+        If lazy is True, indirect objects (pages, fonts, images, etc) are only read when they are first accessed.
+        The input must then remain open for as long as the Document is being used.
         """
+        if isinstance(file, (str, Path, mmap.mmap)):
+            file = MemoryMappedFile(file)
         return ReadAnyObjectTransformer().transform(
-            file, parent_object=None, context=None, event_listeners=event_listeners
+            file,
+            parent_object=None,
+            context=ReadTransformerContext(lazy=lazy),
+            event_listeners=event_listeners,
         )
 
     @staticmethod
-    def dumps(file: Union[io.BufferedIOBase, io.RawIOBase], document: Document) -> None:
+    def dumps(
+        file: Union[io.BufferedIOBase, io.RawIOBase],
+        document: Document,
+        use_object_streams: bool = False,
+        incremental_update: bool = False,
+        compression_level: int = 9,
+        number_of_workers: int = 1,
+    ) -> None:
         """
         This function writes a Document to a byte-stream output (which may be presented as an io.BufferedIOBase o io.RawIOBase)
+        If use_object_streams is True, (non-stream) objects are packed in compressed object streams,
+        and a cross-reference stream is written (rather than a plaintext cross-reference table).
+        This requires PDF 1.5 (or higher) to read the Document.
+        If incremental_update is True, the bytes of the Document (as it was read using PDF.loads) are copied,
+        and only the objects that were created or modified since are appended (followed by a new cross-reference section).
+        The input of PDF.loads must then remain open until the Document is written.
+        Stream objects that need to be (re-)compressed are compressed using the given compression_level (0-9),
+        by number_of_workers threads. The output does not depend on the number of workers.
         """
+        assert 0 <= compression_level <= 9, "compression_level must be in [0, 9]"
+        assert number_of_workers >= 1, "number_of_workers must be >= 1"
         WriteAnyObjectTransformer().transform(
-            object_to_transform=document, context=None, destination=file
+            object_to_transform=document,
+            context=WriteTransformerContext(
+                destination=file,
+                root_object=document,
+                use_object_streams=use_object_streams,
+                incremental_update=incremental_update,
+                compression_level=compression_level,
+                number_of_workers=number_of_workers,
+            ),
         )
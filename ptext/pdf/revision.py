@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This class represents the revision of a Document, as it was read.
+    It allows the Document to be saved incrementally, by appending
+    (only) the objects that were created or modified since the Document was read.
+"""
+import io
+import re
+import typing
+from typing import Optional, Union
+
+from ptext.io.filter.stream_decode_util import iter_decode_stream
+from ptext.io.read.types import (
+    AnyPDFType,
+    DecodedBytesProxy,
+    Dictionary,
+    IndirectObjectProxy,
+    List,
+    Reference,
+    Stream,
+)
+
+
+class Revision:
+    """
+    This class represents the revision of a Document, as it was read.
+    It keeps the source of the Document, the byte offset of its (last) cross-reference section,
+    and a (shallow) snapshot of every indirect object that was read.
+    By comparing an indirect object to its snapshot, objects that were modified can be found,
+    without serializing the object (or the objects it refers to).
+    """
+
+    def __init__(
+        self,
+        source: Union[io.BufferedIOBase, io.RawIOBase],
+        file_length: int,
+        size: int,
+    ):
+        self._source: Union[io.BufferedIOBase, io.RawIOBase] = source
+        self._file_length: int = file_length
+        self._size: int = size
+        self._start_of_xref: Optional[int] = None
+        self._references: typing.Dict[int, Reference] = {}
+        self._snapshots: typing.Dict[int, typing.Tuple[AnyPDFType, typing.Any]] = {}
+
+    def get_size(self) -> int:
+        """
+        This function returns the number of entries in the (original) cross-reference table,
+        (new) objects are given an object number starting from this number
+        """
+        return self._size
+
+    def get_start_of_xref(self) -> int:
+        """
+        This function returns the byte offset of the last cross-reference section of the (original) source
+        """
+        if self._start_of_xref is None:
+            self._source.seek(max(0, self._file_length - 1024))
+            tail: bytes = bytes(self._source.read(1024) or b"")
+            start_of_xref: typing.List[bytes] = re.findall(rb"startxref\s+(\d+)", tail)
+            assert len(start_of_xref) > 0, "unable to find startxref"
+            self._start_of_xref = int(start_of_xref[-1])
+        return self._start_of_xref
+
+    def write_source(
+        self, destination: Union[io.BufferedIOBase, io.RawIOBase]
+    ) -> "Revision":
+        """
+        This function copies the (original) source, byte for byte, to the given destination.
+        The source must remain open for this to be possible.
+        """
+        assert (
+            not self._source.closed
+        ), "The source of a Document must remain open to save the Document incrementally."
+        self.get_start_of_xref()
+        self._source.seek(0)
+        number_of_bytes_to_copy: int = self._file_length
+        while number_of_bytes_to_copy > 0:
+            bts = self._source.read(min(number_of_bytes_to_copy, 1 << 20))
+            if not bts:
+                break
+            destination.write(bts)
+            number_of_bytes_to_copy -= len(bts)
+        return self
+
+    def add_object(self, object: AnyPDFType) -> "Revision":
+        """
+        This function takes a snapshot of an indirect object (as it was read)
+        """
+        if not hasattr(object, "get_reference"):
+            return self
+        ref: Optional[Reference] = object.get_reference()  # type: ignore [union-attr]
+        if ref is None or ref.object_number is None:
+            return self
+        self._references[id(object)] = ref
+        self._snapshots[id(object)] = (object, Revision._get_fingerprint(object))
+        return self
+
+    def add_all_objects(self, object: AnyPDFType) -> "Revision":
+        """
+        This function takes a snapshot of every indirect object that is reachable from the given object,
+        without reading any IndirectObjectProxy
+        """
+        for obj in Revision._iter_objects(object):
+            self.add_object(obj)
+        return self
+
+    def get_reference(self, object: AnyPDFType) -> Optional[Reference]:
+        """
+        This function returns a (new) Reference with the original object number and generation number
+        of the given object, or None if the given object was not read from the source
+        """
+        ref: Optional[Reference] = self._references.get(id(object), None)
+        if ref is None or self._snapshots[id(object)][0] is not object:
+            return None
+        return Reference(
+            object_number=ref.object_number,
+            generation_number=ref.generation_number,
+        )
+
+    def is_modified(self, object: AnyPDFType) -> bool:
+        """
+        This function returns True if the given indirect object was modified since it was read,
+        or if it was not read from the source
+        """
+        snapshot = self._snapshots.get(id(object), None)
+        if snapshot is None or snapshot[0] is not object:
+            return True
+        fingerprint = Revision._get_fingerprint(object)
+        if fingerprint == snapshot[1]:
+            return False
+
+        # a Stream may have been decoded (after it was read)
+        if (
+            isinstance(object, Stream)
+            and snapshot[1][2] is None
+            and fingerprint[0:2] == snapshot[1][0:2]
+        ):
+            try:
+                if b"".join(iter_decode_stream(object)) == fingerprint[2]:
+                    self._snapshots[id(object)] = (object, fingerprint)
+                    return False
+            except Exception:
+                pass
+        return True
+
+    def get_modified_objects(self, object: AnyPDFType) -> typing.List[AnyPDFType]:
+        """
+        This function returns all indirect objects (that were read from the source),
+        reachable from the given object, that were modified since they were read.
+        IndirectObjectProxy objects are not read (they can not have been modified).
+        """
+        return [
+            x
+            for x in Revision._iter_objects(object)
+            if id(x) in self._snapshots and self.is_modified(x)
+        ]
+
+    @staticmethod
+    def _iter_objects(object: AnyPDFType) -> typing.Iterator[AnyPDFType]:
+        # objects are tracked by id, IndirectObjectProxy objects are not resolved
+        objects_done: typing.Set[int] = set()
+        objects_todo: typing.List[AnyPDFType] = [object]
+        while len(objects_todo) > 0:
+            obj = objects_todo.pop()
+            if id(obj) in objects_done or obj.__class__ is IndirectObjectProxy:
+                continue
+            objects_done.add(id(obj))
+            if not hasattr(obj, "get_reference"):
+                continue
+            yield obj
+            if isinstance(obj, dict):
+                objects_todo.extend(dict.values(obj))
+            elif isinstance(obj, list):
+                objects_todo.extend(list.__iter__(obj))
+
+    @staticmethod
+    def _get_bytes_fingerprint(bts: typing.Any) -> typing.Any:
+        # (mutable) bytearray objects may be modified in place, they are copied
+        if isinstance(bts, bytearray):
+            return bytes(bts)
+        return bts
+
+    @staticmethod
+    def _get_fingerprint(object: typing.Any, is_indirect_object: bool = True):
+        """
+        This function returns a (shallow) fingerprint of an object.
+        Indirect objects (other than the object itself) are represented by their object number,
+        (byte) values are compared by identity first, so unmodified objects are compared cheaply.
+        """
+        if isinstance(object, Reference):
+            return ("R", object.object_number, object.generation_number)
+        if not is_indirect_object:
+            if object.__class__ is IndirectObjectProxy:
+                ref = object.get_reference()
+                return ("R", ref.object_number, ref.generation_number)
+            if hasattr(object, "get_reference"):
+                ref = object.get_reference()
+                if isinstance(ref, Reference) and ref.object_number is not None:
+                    return ("R", ref.object_number, ref.generation_number)
+        if isinstance(object, Stream):
+            # DecodedBytes that were decoded from the Bytes (and not replaced since) are left out,
+            # so that decoding a Stream (lazily) does not count as a modification
+            decoded_bytes = dict.get(object, "DecodedBytes", None)
+            if (
+                decoded_bytes.__class__ is DecodedBytesProxy
+                or decoded_bytes is vars(object).get("_decoded_bytes", None)
+            ):
+                decoded_bytes = None
+            return (
+                tuple(
+                    [
+                        (k, Revision._get_fingerprint(v, False))
+                        for k, v in dict.items(object)
+                        if k not in ["Bytes", "DecodedBytes"]
+                    ]
+                ),
+                Revision._get_bytes_fingerprint(dict.get(object, "Bytes", None)),
+                Revision._get_bytes_fingerprint(decoded_bytes),
+            )
+        if isinstance(object, dict):
+            return tuple(
+                [
+                    (k, Revision._get_fingerprint(v, False))
+                    for k, v in dict.items(object)
+                ]
+            )
+        if isinstance(object, list):
+            return (
+                "L",
+                tuple(
+                    [Revision._get_fingerprint(v, False) for v in list.__iter__(object)]
+                ),
+            )
+        return (object.__class__, object)
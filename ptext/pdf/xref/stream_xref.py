@@ -6,6 +6,7 @@
     cross-reference table.
 """
 import io
+import typing
 from decimal import Decimal
 from typing import Optional, Union
 
@@ -74,6 +75,9 @@ class StreamXREF(XREF):
                 document=document,
             )
         ]
+        indirect_references_by_object_number: typing.Dict[int, Reference] = {
+            0: indirect_references[0]
+        }
 
         # check size
         assert "Size" in xref_stream
@@ -178,16 +182,8 @@ class StreamXREF(XREF):
                 assert pdf_indirect_reference is not None
 
                 # append
-                existing_indirect_ref = next(
-                    iter(
-                        [
-                            x
-                            for x in indirect_references
-                            if x.object_number is not None
-                            and x.object_number == Decimal(object_number)
-                        ]
-                    ),
-                    None,
+                existing_indirect_ref = indirect_references_by_object_number.get(
+                    object_number, None
                 )
                 ref_is_in_reading_state = (
                     existing_indirect_ref is not None
@@ -203,6 +199,9 @@ class StreamXREF(XREF):
                 if ref_is_first_encountered:
                     assert pdf_indirect_reference is not None
                     indirect_references.append(pdf_indirect_reference)
+                    indirect_references_by_object_number.setdefault(
+                        object_number, pdf_indirect_reference
+                    )
                 elif ref_is_in_reading_state:
                     assert existing_indirect_ref is not None
                     assert pdf_indirect_reference is not None
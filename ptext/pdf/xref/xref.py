@@ -11,6 +11,7 @@
 """
 import io
 import logging
+import re
 import typing
 from decimal import Decimal
 from typing import Optional, Union
@@ -33,9 +34,17 @@ class XREF(Dictionary):
     It does not need to parse or load the whole file.
     """
 
+    # if True, all objects in an object stream are read (in a single tokenizer pass)
+    # as soon as the first of them is requested, rather than one at a time
+    MATERIALIZE_OBJECT_STREAMS: bool = False
+
     def __init__(self):
         super(XREF, self).__init__()
         self._entries: typing.List[Reference] = []
+        self._entries_by_object_number: typing.Dict[int, Reference] = {}
+        self._entries_by_parent_stream: typing.Dict[
+            typing.Tuple[int, int], Reference
+        ] = {}
         self._cache: typing.Dict[int, Union[AnyPDFType, None]] = {}
 
     ##
@@ -62,8 +71,8 @@ class XREF(Dictionary):
 
         while pos > 0:
             src.seek(pos)
-            bytes_near_eof = "".join([tok._next_char() for _ in range(0, str_len)])
-            idx = bytes_near_eof.find(text_to_find)
+            bytes_near_eof = src.read(str_len).decode("latin-1")
+            idx = bytes_near_eof.rfind(text_to_find)
             if idx >= 0:
                 return pos + idx
             pos = pos - str_len + len(text_to_find)
@@ -108,6 +117,17 @@ class XREF(Dictionary):
         Add a new Reference to this XREF
         """
         self._entries.append(r)
+        # index (the first Reference for a given key takes precedence)
+        if r.object_number is not None:
+            self._entries_by_object_number.setdefault(int(r.object_number), r)
+        if (
+            r.parent_stream_object_number is not None
+            and r.index_in_parent_stream is not None
+        ):
+            self._entries_by_parent_stream.setdefault(
+                (int(r.parent_stream_object_number), int(r.index_in_parent_stream)),
+                r,
+            )
         return self
 
     def merge(self, other_xref: "XREF") -> "XREF":
@@ -115,19 +135,18 @@ class XREF(Dictionary):
         Merge this XREF with another XREF
         """
         for r in other_xref._entries:
-            duplicate_entries = []
+            is_duplicate: bool = False
             if r.object_number is not None:
-                duplicate_entries = [
-                    x for x in self._entries if x.object_number == r.object_number
-                ]
-            elif r.parent_stream_object_number is not None:
-                duplicate_entries = [
-                    x
-                    for x in self._entries
-                    if x.parent_stream_object_number == r.parent_stream_object_number
-                    and x.index_in_parent_stream == r.index_in_parent_stream
-                ]
-            if len(duplicate_entries) == 0:
+                is_duplicate = int(r.object_number) in self._entries_by_object_number
+            elif (
+                r.parent_stream_object_number is not None
+                and r.index_in_parent_stream is not None
+            ):
+                is_duplicate = (
+                    int(r.parent_stream_object_number),
+                    int(r.index_in_parent_stream),
+                ) in self._entries_by_parent_stream
+            if not is_duplicate:
                 self.append(r)
         return self
 
@@ -150,29 +169,33 @@ class XREF(Dictionary):
             cached_obj = self._cache.get(indirect_reference.object_number, None)
             if cached_obj is not None:
                 return cached_obj
+        if isinstance(indirect_reference, int) or isinstance(
+            indirect_reference, Decimal
+        ):
+            cached_obj = self._cache.get(int(indirect_reference), None)
+            if cached_obj is not None:
+                return cached_obj
 
         # lookup Reference object for int
         obj = None
         if isinstance(indirect_reference, int) or isinstance(
             indirect_reference, Decimal
         ):
-            refs = [
-                x for x in self._entries if x.object_number == int(indirect_reference)
-            ]
-            if len(refs) == 0:
+            ref = self._entries_by_object_number.get(int(indirect_reference))
+            if ref is None:
                 return None
-            indirect_reference = refs[0]
+            indirect_reference = ref
 
         # lookup Reference (in self) for Reference
         elif isinstance(indirect_reference, Reference):
-            refs = [
-                x
-                for x in self._entries
-                if x.object_number == indirect_reference.object_number
-            ]
-            if len(refs) == 0:
+            if indirect_reference.object_number is None:
                 return None
-            indirect_reference = refs[0]
+            ref = self._entries_by_object_number.get(
+                int(indirect_reference.object_number)
+            )
+            if ref is None:
+                return None
+            indirect_reference = ref
 
         # reference points to an object that is not in use
         assert isinstance(indirect_reference, Reference)
@@ -212,7 +235,6 @@ class XREF(Dictionary):
                     stream_object["First"], src=src, tok=tok
                 )
 
-            first_byte = int(stream_object.get("First", 0))
             if "DecodedBytes" not in stream_object:
                 try:
                     stream_object = decode_stream(stream_object)
@@ -222,15 +244,14 @@ class XREF(Dictionary):
                         % indirect_reference.parent_stream_object_number
                     )
                     raise ex
-            stream_bytes = stream_object["DecodedBytes"][first_byte:]
 
-            # tokenize parent stream
+            # look up the object (using the offsets in the header of the parent stream)
             index = int(indirect_reference.index_in_parent_stream)
-            length = int(stream_object["Length"])
-            if index < length:
-                tok = HighLevelTokenizer(io.BytesIO(stream_bytes))
-                list_of_objs = [tok.read_object() for x in range(0, index + 1)]
-                obj = list_of_objs[-1]
+            if index < len(self._get_object_stream_index(stream_object)):
+                if self.MATERIALIZE_OBJECT_STREAMS:
+                    obj = self._get_object_stream_objects(stream_object)[index]
+                else:
+                    obj = self._read_object_stream_object(stream_object, index)
             else:
                 obj = None
 
@@ -242,6 +263,83 @@ class XREF(Dictionary):
         # return
         return obj
 
+    ##
+    ## OBJECT STREAMS
+    ##
+
+    def _get_object_stream_index(
+        self, stream_object: Stream
+    ) -> typing.List[typing.Tuple[int, int]]:
+        """
+        This function returns the (object number, byte offset) pairs in the header of an object stream.
+        The header is parsed once, after which it is kept on the Stream.
+        """
+        object_stream_index = vars(stream_object).get("_object_stream_index", None)
+        if object_stream_index is not None:
+            return object_stream_index
+
+        # The header consists of N pairs of integers separated by white space,
+        # it ends at the byte offset specified by /First
+        first_byte: int = int(stream_object.get("First", 0))
+        numbers: typing.List[int] = [
+            int(x) for x in re.findall(rb"\d+", stream_object["DecodedBytes"][0:first_byte])
+        ]
+        object_stream_index = [
+            (numbers[i], numbers[i + 1]) for i in range(0, len(numbers) - 1, 2)
+        ]
+        if "N" in stream_object:
+            object_stream_index = object_stream_index[0 : int(stream_object["N"])]
+        setattr(stream_object, "_object_stream_index", object_stream_index)
+        return object_stream_index
+
+    def _read_object_stream_object(
+        self, stream_object: Stream, index: int
+    ) -> Optional[AnyPDFType]:
+        """
+        This function reads the object at a given index in an object stream,
+        by seeking directly to its byte offset
+        """
+        tok: Optional[HighLevelTokenizer] = vars(stream_object).get(
+            "_object_stream_tokenizer", None
+        )
+        if tok is None:
+            tok = HighLevelTokenizer(io.BytesIO(stream_object["DecodedBytes"]))
+            setattr(stream_object, "_object_stream_tokenizer", tok)
+        first_byte: int = int(stream_object.get("First", 0))
+        tok.seek(first_byte + self._get_object_stream_index(stream_object)[index][1])
+        return tok.read_object()
+
+    def _get_object_stream_objects(
+        self, stream_object: Stream
+    ) -> typing.List[Optional[AnyPDFType]]:
+        """
+        This function reads all objects in an object stream (in a single pass)
+        The objects are read in the order of their byte offset, using one tokenizer,
+        which only seeks when the next object does not immediately follow the previous one.
+        The objects are kept on the Stream.
+        """
+        objs = vars(stream_object).get("_object_stream_objects", None)
+        if objs is not None:
+            return objs
+        bts: bytes = stream_object["DecodedBytes"]
+        first_byte: int = int(stream_object.get("First", 0))
+        object_stream_index = self._get_object_stream_index(stream_object)
+        objs = [None for _ in range(0, len(object_stream_index))]
+        tok: HighLevelTokenizer = HighLevelTokenizer(io.BytesIO(bts))
+        tok.seek(first_byte)
+        for i in sorted(
+            range(0, len(object_stream_index)),
+            key=lambda x: object_stream_index[x][1],
+        ):
+            # seek only if something other than whitespace precedes this object
+            byte_offset: int = first_byte + object_stream_index[i][1]
+            pos: int = tok.tell()
+            if pos > byte_offset or len(bts[pos:byte_offset].strip()) > 0:
+                tok.seek(byte_offset)
+            objs[i] = tok.read_object()
+        setattr(stream_object, "_object_stream_objects", objs)
+        return objs
+
     ##
     ## OVERRIDES
     ##
@@ -0,0 +1,463 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    This class extracts information (text, images, regular expression matches, fonts)
+    from many Document(s) at once, using a pool of worker processes
+"""
+import collections
+import logging
+import math
+import multiprocessing
+import multiprocessing.connection
+import time
+import typing
+from pathlib import Path
+
+from ptext.pdf.canvas.event.event_listener import EventListener
+from ptext.pdf.document import Document
+from ptext.pdf.pdf import PDF
+from ptext.toolkit.image.simple_image_extraction import SimpleImageExtraction
+from ptext.toolkit.text.font_extraction import FontExtraction
+from ptext.toolkit.text.regular_expression_text_extraction import (
+    RegularExpressionTextExtraction,
+)
+from ptext.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+logger = logging.getLogger(__name__)
+
+# (file, index of the file, extraction, regular expression, output directory for images)
+_ExtractionSettings = typing.Tuple[
+    str, int, str, typing.Optional[str], typing.Optional[str]
+]
+
+
+def _count_pages(file: str) -> typing.Tuple[int, typing.Optional[str]]:
+    # a Document is read lazily, only the page tree is read to count its pages
+    try:
+        doc: Document = PDF.loads(Path(file), lazy=True)
+        return int(doc.get_document_info().get_number_of_pages() or 0), None
+    except Exception as e:
+        return 0, "%s: %s" % (e.__class__.__name__, str(e))
+
+
+def _build_event_listener(
+    extraction: str, regular_expression: typing.Optional[str]
+) -> EventListener:
+    if extraction == "fonts":
+        return FontExtraction()
+    if extraction == "images":
+        return SimpleImageExtraction()
+    if extraction == "regex":
+        return RegularExpressionTextExtraction(regular_expression)
+    return SimpleTextExtraction()
+
+
+def _get_page_result(
+    settings: _ExtractionSettings,
+    l: EventListener,
+    page_number: int,
+    index_in_range: int,
+) -> typing.Dict[str, typing.Any]:
+    file, file_index, extraction, _, output_dir = settings
+    if extraction == "fonts":
+        assert isinstance(l, FontExtraction)
+        return {
+            "page": page_number,
+            "fonts": l.get_font_names_per_page(index_in_range),
+        }
+    if extraction == "images":
+        assert isinstance(l, SimpleImageExtraction)
+        images: typing.List[typing.Dict[str, typing.Any]] = []
+        for i, img in enumerate(l.get_images_per_page(index_in_range)):
+            image_dict: typing.Dict[str, typing.Any] = {
+                "width": img.width,
+                "height": img.height,
+                "mode": img.mode,
+            }
+            if output_dir is not None:
+                # files in different directories may have the same name, the index of the file is unique
+                path: Path = Path(output_dir) / (
+                    "%06d_%s_page_%d_image_%d.jpg"
+                    % (file_index, Path(file).stem, page_number, i)
+                )
+                img.convert("RGB").save(path, format="JPEG")
+                image_dict["path"] = str(path)
+            images.append(image_dict)
+        return {"page": page_number, "images": images}
+    if extraction == "regex":
+        assert isinstance(l, RegularExpressionTextExtraction)
+        return {
+            "page": page_number,
+            "matches": [
+                {
+                    "string": m.group(0),
+                    "start": m.start(),
+                    "end": m.end(),
+                    "bounding_boxes": [
+                        [
+                            float(x.get_x()),
+                            float(x.get_y()),
+                            float(x.get_width()),
+                            float(x.get_height()),
+                        ]
+                        for x in m.get_bounding_boxes()
+                    ],
+                }
+                for m in l.get_all_matches(index_in_range)
+            ],
+        }
+    assert isinstance(l, SimpleTextExtraction)
+    return {"page": page_number, "text": l.get_text(index_in_range)}
+
+
+def _extract_pages(
+    task: typing.Tuple[_ExtractionSettings, int, int]
+) -> typing.Tuple[typing.List[typing.Dict[str, typing.Any]], typing.Optional[str]]:
+    # a Document is read lazily, only the Page(s) in [first_page, last_page) are read (and processed)
+    settings, first_page, last_page = task
+    file, _, extraction, regular_expression, _ = settings
+    try:
+        doc: Document = PDF.loads(Path(file), lazy=True)
+        l: EventListener = _build_event_listener(extraction, regular_expression)
+        results: typing.List[typing.Dict[str, typing.Any]] = []
+        for i in range(first_page, last_page):
+            doc.get_page(i).process([l])
+            results.append(_get_page_result(settings, l, i, i - first_page))
+        return results, None
+    except Exception as e:
+        return [], "%s: %s" % (e.__class__.__name__, str(e))
+
+
+def _run_worker(connection: multiprocessing.connection.Connection) -> None:
+    # a worker process runs (function, task) tuples until it receives None
+    while True:
+        function_and_task = connection.recv()
+        if function_and_task is None:
+            break
+        function, task = function_and_task
+        try:
+            result = function(task)
+        except Exception as e:
+            result = (None, "%s: %s" % (e.__class__.__name__, str(e)))
+        connection.send(result)
+    connection.close()
+
+
+class _Worker:
+    """
+    This class represents a worker process (and the Connection used to send it tasks, and receive their results)
+    """
+
+    def __init__(self):
+        self._connection, child_connection = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_run_worker, args=(child_connection,), daemon=True
+        )
+        self._process.start()
+        child_connection.close()
+        self._number_of_tasks: int = 0
+        # (index of the task, deadline) of the task that is running
+        self._task: typing.Optional[typing.Tuple[int, float]] = None
+
+    def is_idle(self) -> bool:
+        """
+        This function returns True if this _Worker is not running a task, False otherwise
+        """
+        return self._task is None
+
+    def get_number_of_tasks(self) -> int:
+        """
+        This function returns the number of tasks sent to the worker process
+        """
+        return self._number_of_tasks
+
+    def get_deadline(self) -> float:
+        """
+        This function returns the time (time.monotonic) at which the running task times out
+        """
+        assert self._task is not None
+        return self._task[1]
+
+    def get_task_index(self) -> int:
+        """
+        This function returns the index of the running task
+        """
+        assert self._task is not None
+        return self._task[0]
+
+    def get_wait_objects(self) -> typing.List[typing.Any]:
+        """
+        This function returns the objects (to be used with multiprocessing.connection.wait)
+        that become ready when the running task finishes, or when the worker process dies
+        """
+        return [self._connection, self._process.sentinel]
+
+    def receive(
+        self,
+    ) -> typing.Optional[typing.Tuple[typing.Any, typing.Optional[str]]]:
+        """
+        This function returns the result of the running task, or None if it has not finished (yet)
+        """
+        if not self._connection.poll():
+            return None
+        try:
+            result = self._connection.recv()
+        except (EOFError, OSError):
+            return None
+        self._task = None
+        return result
+
+    def is_alive(self) -> bool:
+        """
+        This function returns True if the worker process is alive, False otherwise
+        """
+        return self._process.is_alive()
+
+    def get_exit_code(self) -> typing.Optional[int]:
+        """
+        This function returns the exit code of the worker process
+        """
+        return self._process.exitcode
+
+    def submit(
+        self, function: typing.Callable, task: typing.Any, index: int, deadline: float
+    ) -> None:
+        """
+        This function sends a task to the worker process
+        """
+        self._connection.send((function, task))
+        self._number_of_tasks += 1
+        self._task = (index, deadline)
+
+    def stop(self, terminate: bool = False) -> None:
+        """
+        This function stops the worker process.
+        A worker process that is running a task can not be stopped, it is terminated.
+        """
+        if terminate or self._task is not None:
+            self._process.terminate()
+        else:
+            try:
+                self._connection.send(None)
+            except OSError:
+                self._process.terminate()
+        self._process.join()
+        self._connection.close()
+
+
+class BatchExtraction:
+    """
+    This class extracts information (text, images, regular expression matches, fonts) from many Document(s).
+    The work is distributed over a pool of worker processes, per Document and (for large Document(s)) per range of Page(s).
+    Extraction always runs in (at least one) worker process, never in the calling process.
+    Worker processes are replaced after a number of tasks, to keep their memory bounded.
+    A Document that can not be read does not affect the other Document(s), its result contains an error instead.
+    The same goes for a Document whose worker process dies, or that takes longer than the timeout (per task),
+    that worker process is then replaced, the other worker processes keep running.
+    """
+
+    EXTRACTIONS: typing.List[str] = ["fonts", "images", "regex", "text"]
+
+    def __init__(
+        self,
+        extraction: str = "text",
+        regular_expression: typing.Optional[str] = None,
+        number_of_workers: typing.Optional[int] = None,
+        pages_per_task: int = 16,
+        tasks_per_worker: int = 64,
+        output_dir: typing.Optional[Path] = None,
+        timeout: typing.Optional[float] = None,
+    ):
+        assert extraction in BatchExtraction.EXTRACTIONS, (
+            "extraction must be one of %s" % BatchExtraction.EXTRACTIONS
+        )
+        assert (
+            extraction != "regex" or regular_expression is not None
+        ), "a regular expression is needed to extract regular expression matches"
+        assert pages_per_task >= 1, "pages_per_task must be >= 1"
+        assert tasks_per_worker >= 1, "tasks_per_worker must be >= 1"
+        assert timeout is None or timeout > 0, "timeout must be > 0"
+        self._extraction: str = extraction
+        self._regular_expression: typing.Optional[str] = regular_expression
+        self._number_of_workers: int = max(
+            1, number_of_workers or multiprocessing.cpu_count()
+        )
+        self._pages_per_task: int = pages_per_task
+        self._tasks_per_worker: int = tasks_per_worker
+        self._output_dir: typing.Optional[Path] = output_dir
+        self._timeout: typing.Optional[float] = timeout
+
+        # pool of worker processes
+        self._workers: typing.List[_Worker] = []
+
+    @staticmethod
+    def find_files(paths: typing.Iterable[Path]) -> typing.List[Path]:
+        """
+        This function returns the given file(s), replacing every directory by the PDF file(s) in it (recursively)
+        """
+        files: typing.List[Path] = []
+        for p in paths:
+            if p.is_dir():
+                files.extend(
+                    sorted([x for x in p.rglob("*") if x.suffix.lower() == ".pdf"])
+                )
+            else:
+                files.append(p)
+        return files
+
+    def extract(
+        self, files: typing.Iterable[Path]
+    ) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        """
+        This function extracts information from the given file(s) (directories are searched for PDF files).
+        It yields one (JSON serializable) dictionary per file, in order, as soon as all of its Page(s) are done.
+        Each dictionary contains the file, its number of pages and (in page order) the result for every Page,
+        or an error if the file could not be read.
+        """
+        all_files: typing.List[Path] = BatchExtraction.find_files(files)
+
+        # files are handed out in batches, so results can be yielded before every file is done
+        batch_size: int = self._number_of_workers * 4
+        try:
+            for i in range(0, len(all_files), batch_size):
+                yield from self._extract_batch(all_files[i : i + batch_size], i)
+        finally:
+            self._stop_workers()
+
+    def _stop_workers(self) -> None:
+        for w in self._workers:
+            w.stop()
+        self._workers = []
+
+    def _map(
+        self, function: typing.Callable, tasks: typing.List[typing.Any]
+    ) -> typing.Iterator[typing.Tuple[typing.Any, typing.Optional[str]]]:
+        """
+        This function runs function on every task (using the pool of worker processes), yielding the results in order.
+        Every result is a (value, error) tuple. A task that does not finish within the timeout,
+        or whose worker process dies, has (None, error) as its result, and its worker process is replaced.
+        """
+        results: typing.Dict[int, typing.Tuple[typing.Any, typing.Optional[str]]] = {}
+        tasks_todo: typing.Deque[int] = collections.deque(range(0, len(tasks)))
+        next_result: int = 0
+        while next_result < len(tasks):
+
+            # worker processes are replaced after tasks_per_worker tasks (or when they died while idle)
+            for w in [x for x in self._workers if x.is_idle()]:
+                if (
+                    not w.is_alive()
+                    or w.get_number_of_tasks() >= self._tasks_per_worker
+                ):
+                    w.stop()
+                    self._workers.remove(w)
+
+            # submit tasks (at most one per worker process, so they start right away)
+            while len(tasks_todo) > 0:
+                idle_workers: typing.List[_Worker] = [
+                    x for x in self._workers if x.is_idle()
+                ]
+                if len(idle_workers) == 0:
+                    if len(self._workers) >= self._number_of_workers:
+                        break
+                    self._workers.append(_Worker())
+                    idle_workers = self._workers[-1:]
+                i: int = tasks_todo.popleft()
+                idle_workers[0].submit(
+                    function,
+                    tasks[i],
+                    i,
+                    time.monotonic() + (self._timeout or math.inf),
+                )
+
+            # wait for a task to finish (or its worker process to die, or to time out)
+            busy_workers: typing.List[_Worker] = [
+                x for x in self._workers if not x.is_idle()
+            ]
+            timeout: typing.Optional[float] = None
+            if self._timeout is not None:
+                timeout = max(
+                    0, min([w.get_deadline() for w in busy_workers]) - time.monotonic()
+                )
+            multiprocessing.connection.wait(
+                [x for w in busy_workers for x in w.get_wait_objects()],
+                timeout=timeout,
+            )
+            now: float = time.monotonic()
+            for w in busy_workers:
+                task_index: int = w.get_task_index()
+                result = w.receive()
+                if result is not None:
+                    results[task_index] = result
+                    continue
+                if not w.is_alive():
+                    results[task_index] = (
+                        None,
+                        "ProcessError: the worker process died (exit code %s)"
+                        % w.get_exit_code(),
+                    )
+                elif w.get_deadline() <= now:
+                    results[task_index] = (
+                        None,
+                        "TimeoutError: the task did not finish within %s seconds"
+                        % self._timeout,
+                    )
+                else:
+                    continue
+                # the worker process (that died, or did not finish in time) is replaced
+                w.stop(terminate=True)
+                self._workers.remove(w)
+
+            # yield results (in order)
+            while next_result in results:
+                yield results.pop(next_result)
+                next_result += 1
+
+    def _extract_batch(
+        self,
+        files: typing.List[Path],
+        first_file_index: int,
+    ) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+
+        # count pages (per file)
+        number_of_pages: typing.List[typing.Tuple[int, typing.Optional[str]]] = list(
+            self._map(_count_pages, [str(f) for f in files])
+        )
+
+        # split every file in ranges of pages
+        tasks: typing.List[typing.Tuple[_ExtractionSettings, int, int]] = []
+        number_of_tasks_per_file: typing.List[int] = []
+        for file_index, (f, (n, error)) in enumerate(
+            zip(files, number_of_pages), first_file_index
+        ):
+            settings: _ExtractionSettings = (
+                str(f),
+                file_index,
+                self._extraction,
+                self._regular_expression,
+                str(self._output_dir) if self._output_dir is not None else None,
+            )
+            ranges: typing.List[typing.Tuple[int, int]] = []
+            if error is None:
+                ranges = [
+                    (i, min(n, i + self._pages_per_task))
+                    for i in range(0, n, self._pages_per_task)
+                ]
+            tasks.extend([(settings, r[0], r[1]) for r in ranges])
+            number_of_tasks_per_file.append(len(ranges))
+
+        # merge the results (in order) per file
+        results = iter(self._map(_extract_pages, tasks))
+        for f, (n, error), number_of_tasks in zip(
+            files, number_of_pages, number_of_tasks_per_file
+        ):
+            pages: typing.List[typing.Dict[str, typing.Any]] = []
+            for _ in range(0, number_of_tasks):
+                pages_in_range, range_error = next(results)
+                pages.extend(pages_in_range or [])
+                error = error or range_error
+            if error is not None:
+                logger.debug("unable to process %s, %s" % (str(f), error))
+                yield {"file": str(f), "error": error}
+                continue
+            yield {"file": str(f), "number_of_pages": n, "pages": pages}
@@ -36,6 +36,9 @@ class ColorSpectrumExtraction(EventListener):
         ] = {}
         self._current_page: int = -1
 
+    def _get_event_types(self) -> typing.Optional[typing.List[type]]:
+        return [BeginPageEvent, ChunkOfTextRenderEvent, ImageRenderEvent]
+
     def _event_occurred(self, event: Event) -> None:
         if isinstance(event, BeginPageEvent):
             self._begin_page(event.get_page())
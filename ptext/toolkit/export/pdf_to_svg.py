@@ -49,6 +49,9 @@ class PDFToSVG(EventListener):
         self._page_nr = Decimal(-1)
         self._svg_per_page: typing.Dict[int, ET.Element] = {}
 
+    def _get_event_types(self) -> typing.Optional[typing.List[type]]:
+        return [BeginPageEvent, ImageRenderEvent, ChunkOfTextRenderEvent]
+
     def _event_occurred(self, event: Event) -> None:
         # BeginPageEvent
         if isinstance(event, BeginPageEvent):
@@ -4,7 +4,7 @@
 """
 This implementation of EventListener extracts all Image objects on a Page
 """
-from typing import List
+from typing import List, Optional
 
 from PIL import Image  # type: ignore [import]
 
@@ -26,6 +26,9 @@ class SimpleImageExtraction(EventListener):
         self._image_render_info_per_page = {}
         self._current_page: int = -1
 
+    def _get_event_types(self) -> Optional[List[type]]:
+        return [BeginPageEvent, ImageRenderEvent]
+
     def _event_occurred(self, event: "Event") -> None:
         if isinstance(event, BeginPageEvent):
             self._begin_page(event.get_page())
@@ -33,6 +33,9 @@ class SimpleLineOfTextExtraction(EventListener):
         self._current_page: typing.Optional[Page] = None
         self._lines_of_text_per_page: typing.Dict[int, typing.List[LineOfText]] = {}
 
+    def _get_event_types(self) -> typing.Optional[typing.List[type]]:
+        return [ChunkOfTextRenderEvent, BeginPageEvent, EndPageEvent]
+
     def _event_occurred(self, event: Event) -> None:
         if isinstance(event, ChunkOfTextRenderEvent):
             self._chunks_of_text.append(event)
@@ -23,6 +23,9 @@ class FontExtraction(EventListener):
         self._fonts_per_page: typing.Dict[int, typing.List[Font]] = {}
         self._current_page: int = -1
 
+    def _get_event_types(self) -> typing.Optional[typing.List[type]]:
+        return [BeginPageEvent]
+
     def _event_occurred(self, event: Event) -> None:
         if isinstance(event, BeginPageEvent):
             self._begin_page(event)
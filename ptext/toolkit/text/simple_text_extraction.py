@@ -31,6 +31,9 @@ class SimpleTextExtraction(EventListener):
         self._text_per_page: typing.Dict[int, str] = {}
         self._current_page: int = -1
 
+    def _get_event_types(self) -> typing.Optional[typing.List[type]]:
+        return [ChunkOfTextRenderEvent, BeginPageEvent, EndPageEvent]
+
     def _event_occurred(self, event: Event) -> None:
         if isinstance(event, ChunkOfTextRenderEvent):
             self._render_text(event)
@@ -0,0 +1,237 @@
+import base64
+import copy
+import io
+import random
+import time
+import tracemalloc
+import typing
+import unittest
+import zlib
+
+from ptext.io.filter.ascii85_decode import ASCII85Decode, IncrementalASCII85Decode
+from ptext.io.filter.flate_decode import FlateDecode
+from ptext.io.filter.lzw_decode import LZWDecode
+from ptext.io.filter.run_length_decode import RunLengthDecode
+from ptext.io.filter.stream_decode_util import (
+    decode_stream,
+    decode_stream_to,
+    iter_decode_stream,
+)
+from ptext.io.read.types import (
+    Decimal,
+    DecodedBytesProxy,
+    Dictionary,
+    List,
+    Name,
+    Stream,
+)
+from ptext.io.write.object.write_stream_transformer import WriteStreamTransformer
+from tests.misc.filter.test_lzw_decode import lzw_encode
+from tests.misc.filter.test_predictor_decode import png_encode
+
+
+def run_length_encode(bytes_in: bytes) -> bytes:
+    """
+    This function applies a (straightforward) run-length encoding
+    """
+    out: bytearray = bytearray()
+    i: int = 0
+    while i < len(bytes_in):
+        j: int = i
+        while j < len(bytes_in) and j - i < 128 and bytes_in[j] == bytes_in[i]:
+            j += 1
+        if j - i > 1:
+            out += bytes([257 - (j - i), bytes_in[i]])
+        else:
+            j = i
+            while (
+                j < len(bytes_in)
+                and j - i < 128
+                and (j + 1 >= len(bytes_in) or bytes_in[j] != bytes_in[j + 1])
+            ):
+                j += 1
+            j = max(j, i + 1)
+            out += bytes([j - i - 1]) + bytes_in[i:j]
+        i = j
+    out.append(128)
+    return bytes(out)
+
+
+class TestIncrementalDecode(unittest.TestCase):
+    """
+    This test checks whether decoding a Stream chunk by chunk (for any chunk size) gives the same result
+    as decoding it all at once, and compares the peak memory usage of both approaches
+    """
+
+    def _random_bytes(self, n: int) -> bytes:
+        rnd = random.Random(0)
+        # runs of repeated bytes (so that run-length and zlib encoding matter)
+        out: bytearray = bytearray()
+        while len(out) < n:
+            out += bytes([rnd.randint(0, 255)]) * rnd.choice([1, 1, 2, 7, 200])
+        return bytes(out[0:n])
+
+    def _build_stream(
+        self,
+        bytes_in: bytes,
+        filters: typing.List[str],
+        decode_parms: typing.Optional[Dictionary] = None,
+    ) -> Stream:
+        s = Stream()
+        s[Name("Bytes")] = bytes_in
+        s[Name("Length")] = Decimal(len(bytes_in))
+        if len(filters) == 1:
+            s[Name("Filter")] = Name(filters[0])
+        else:
+            s[Name("Filter")] = List()
+            for f in filters:
+                s["Filter"].append(Name(f))
+        if decode_parms is not None:
+            s[Name("DecodeParms")] = decode_parms
+        return s
+
+    def _check_all_chunk_sizes(self, s: Stream, expected_output: bytes) -> None:
+        for chunk_size in [1, 2, 3, 5, 7, 64, 1000, 65536]:
+            output = b"".join(iter_decode_stream(s, chunk_size=chunk_size))
+            assert output == expected_output, "chunk_size %d" % chunk_size
+        assert "DecodedBytes" not in s
+
+    def test_flate_decode(self):
+        data = self._random_bytes(20000)
+        s = self._build_stream(zlib.compress(data), ["FlateDecode"])
+        self._check_all_chunk_sizes(s, data)
+
+    def test_flate_decode_with_png_predictor(self):
+        columns: int = 97
+        data = self._random_bytes(columns * 3 * 50)
+        encoded = zlib.compress(png_encode(data, 3, 8, columns))
+        decode_parms = Dictionary()
+        decode_parms[Name("Predictor")] = Decimal(15)
+        decode_parms[Name("Colors")] = Decimal(3)
+        decode_parms[Name("Columns")] = Decimal(columns)
+        s = self._build_stream(encoded, ["FlateDecode"], decode_parms)
+        assert (
+            FlateDecode.decode(encoded, predictor=15, colors=3, columns=columns)
+            == data
+        )
+        self._check_all_chunk_sizes(s, data)
+
+    def test_ascii85_decode(self):
+        data = self._random_bytes(5003)
+        for encoded in [
+            base64.a85encode(data),
+            base64.a85encode(data, adobe=True, wrapcol=64),
+            base64.a85encode(data, wrapcol=75) + b"~>\r\n",
+        ]:
+            s = self._build_stream(encoded, ["ASCII85Decode"])
+            self._check_all_chunk_sizes(s, data)
+        assert ASCII85Decode.decode(base64.a85encode(data)) == data
+
+    def test_ascii85_decode_stops_at_eod(self):
+        decoder = IncrementalASCII85Decode()
+        output = decoder.decode(b"<~87cURD]i,\"Ebo80~>garbage")
+        output += decoder.decode(b"more garbage", final=True)
+        assert output == b"Hello World!"
+
+    def test_run_length_decode(self):
+        data = self._random_bytes(10000)
+        encoded = run_length_encode(data)
+        assert RunLengthDecode.decode(encoded) == data
+        s = self._build_stream(encoded, ["RunLengthDecode"])
+        self._check_all_chunk_sizes(s, data)
+
+    def test_lzw_decode(self):
+        data = self._random_bytes(30000)
+        encoded = lzw_encode(data, clear_table_at=1000)
+        assert LZWDecode.decode(encoded) == data
+        s = self._build_stream(encoded, ["LZWDecode"])
+        self._check_all_chunk_sizes(s, data)
+
+    def test_chained_filters(self):
+        data = self._random_bytes(30000)
+        encoded = base64.a85encode(zlib.compress(data), adobe=True, wrapcol=80)
+        s = self._build_stream(encoded, ["ASCII85Decode", "FlateDecode"])
+        self._check_all_chunk_sizes(s, data)
+
+        # write to sink
+        sink = io.BytesIO()
+        assert decode_stream_to(s, sink) == len(data)
+        assert sink.getvalue() == data
+        assert "DecodedBytes" not in s
+
+        # cache
+        assert decode_stream(s)["DecodedBytes"] == data
+
+    def test_decode_on_first_access(self):
+        data = self._random_bytes(20000)
+        s = self._build_stream(zlib.compress(data), ["FlateDecode"])
+
+        # this is how ReadStreamTransformer marks a Stream it read
+        s[Name("DecodedBytes")] = DecodedBytesProxy(s)
+        assert "DecodedBytes" in s
+        assert "DecodedBytes" in s.keys()
+
+        # a Stream that was never decoded is written using its (original) Bytes
+        assert WriteStreamTransformer._is_unmodified(s)
+        assert isinstance(dict.__getitem__(s, "DecodedBytes"), DecodedBytesProxy)
+
+        # decoded (once) on first access
+        assert s["DecodedBytes"] == data
+        assert dict.__getitem__(s, "DecodedBytes") == data
+        assert s.get("DecodedBytes") is s["DecodedBytes"]
+        assert WriteStreamTransformer._is_unmodified(s)
+
+        # items (and therefore a copy) hold the DecodedBytes
+        s = self._build_stream(zlib.compress(data), ["FlateDecode"])
+        s[Name("DecodedBytes")] = DecodedBytesProxy(s)
+        assert dict(s.items())["DecodedBytes"] == data
+        s = self._build_stream(zlib.compress(data), ["FlateDecode"])
+        s[Name("DecodedBytes")] = DecodedBytesProxy(s)
+        assert copy.deepcopy(s)["DecodedBytes"] == data
+
+    def test_memoryview_input(self):
+        data = self._random_bytes(20000)
+        s = self._build_stream(memoryview(zlib.compress(data)), ["FlateDecode"])
+        self._check_all_chunk_sizes(s, data)
+
+    def test_benchmark_peak_memory(self):
+        # 8 MB (highly compressible) payload, ASCII85 and Flate encoded
+        data = bytes(range(0, 256)) * 32768
+        encoded = base64.a85encode(zlib.compress(data), adobe=True, wrapcol=80)
+
+        # decode all at once
+        tracemalloc.start()
+        t0: float = time.time()
+        s = self._build_stream(encoded, ["ASCII85Decode", "FlateDecode"])
+        assert len(decode_stream(s)["DecodedBytes"]) == len(data)
+        delta_batch: float = time.time() - t0
+        peak_batch: int = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        s.pop("DecodedBytes")
+
+        # decode to a sink (that only counts bytes)
+        class ByteCounter:
+            def __init__(self):
+                self.number_of_bytes: int = 0
+
+            def write(self, bts: bytes) -> None:
+                self.number_of_bytes += len(bts)
+
+        tracemalloc.start()
+        t0 = time.time()
+        sink = ByteCounter()
+        decode_stream_to(s, sink)  # type: ignore [arg-type]
+        delta_streamed: float = time.time() - t0
+        peak_streamed: int = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert sink.number_of_bytes == len(data)
+
+        assert peak_streamed < peak_batch
+        print(
+            "%d bytes, decode_stream: %f s (peak %d bytes), decode_stream_to: %f s (peak %d bytes)"
+            % (len(data), delta_batch, peak_batch, delta_streamed, peak_streamed)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
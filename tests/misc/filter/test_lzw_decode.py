@@ -0,0 +1,186 @@
+import random
+import time
+import tracemalloc
+import typing
+import unittest
+
+from ptext.io.filter.lzw_decode import IncrementalLZWDecode, LZWDecode
+from ptext.io.filter.stream_decode_util import iter_decode_stream
+from ptext.io.read.types import Decimal, Dictionary, Name, Stream
+from tests.misc.filter.test_predictor_decode import png_encode
+
+
+def lzw_encode(
+    bytes_in: bytes, early_change: int = 1, clear_table_at: int = 4094
+) -> bytes:
+    """
+    This function applies a (straightforward) LZW encoding,
+    it emits a clear-table code whenever the table holds clear_table_at entries
+    """
+    codes_and_widths: typing.List[typing.Tuple[int, int]] = []
+    code_width: int = 9
+    decoder_next_code: int = 258
+    has_previous_code: bool = False
+
+    def emit(code: int) -> None:
+        # mirror the decoder (which adds an entry after reading every code but the first)
+        nonlocal code_width, decoder_next_code, has_previous_code
+        codes_and_widths.append((code, code_width))
+        if code == 256:
+            code_width = 9
+            decoder_next_code = 258
+            has_previous_code = False
+            return
+        if has_previous_code and decoder_next_code < 4096:
+            decoder_next_code += 1
+            if decoder_next_code + early_change >= (1 << code_width) and code_width < 12:
+                code_width += 1
+        has_previous_code = True
+
+    table: typing.Dict[bytes, int] = {}
+    emit(256)
+    w: bytes = b""
+    for b in bytes_in:
+        wc: bytes = w + bytes([b])
+        if len(wc) == 1 or wc in table:
+            w = wc
+            continue
+        emit(table[w] if len(w) > 1 else w[0])
+        if 258 + len(table) < 4096:
+            table[wc] = 258 + len(table)
+        if 258 + len(table) >= clear_table_at:
+            emit(256)
+            table = {}
+        w = bytes([b])
+    if len(w) > 0:
+        emit(table[w] if len(w) > 1 else w[0])
+    emit(257)
+
+    # pack codes (high-order bit first)
+    out: bytearray = bytearray()
+    bit_buffer: int = 0
+    bit_count: int = 0
+    for code, width in codes_and_widths:
+        bit_buffer = ((bit_buffer << width) | code) & 0xFFFFF
+        bit_count += width
+        while bit_count >= 8:
+            bit_count -= 8
+            out.append((bit_buffer >> bit_count) & 0xFF)
+    if bit_count > 0:
+        out.append((bit_buffer << (8 - bit_count)) & 0xFF)
+    return bytes(out)
+
+
+class TestLZWDecode(unittest.TestCase):
+    """
+    This test checks LZWDecode against the example in the PDF specification,
+    and against a straightforward encoder (for all code widths), and measures its throughput
+    """
+
+    def _random_text(self, n: int) -> bytes:
+        rnd = random.Random(0)
+        words: typing.List[bytes] = [
+            bytes([rnd.randint(97, 122) for _ in range(0, rnd.randint(1, 8))])
+            for _ in range(0, 500)
+        ]
+        out: bytearray = bytearray()
+        while len(out) < n:
+            out += rnd.choice(words) + b" "
+        return bytes(out[0:n])
+
+    def test_example_from_specification(self):
+        assert (
+            LZWDecode.decode(bytes([0x80, 0x0B, 0x60, 0x50, 0x22, 0x0C, 0x0C, 0x85, 0x01]))
+            == b"-----A---B"
+        )
+
+    def test_decode_all_code_widths(self):
+        data = self._random_text(100000)
+        for early_change in [0, 1]:
+            for clear_table_at in [300, 1000, 4094, 4096]:
+                encoded = lzw_encode(data, early_change, clear_table_at)
+                assert (
+                    LZWDecode.decode(encoded, early_change=early_change) == data
+                ), "early_change %d, clear_table_at %d" % (early_change, clear_table_at)
+
+    def test_decode_without_clear_table_code(self):
+        # the table stays full (4096 entries) once it is filled
+        data = self._random_text(200000)
+        encoded = lzw_encode(data, clear_table_at=100000)
+        assert LZWDecode.decode(encoded) == data
+
+    def test_decode_incrementally_in_bounded_memory(self):
+        # without clear-table codes, the memory used does not grow with the bytes written out
+        data = self._random_text(2000000)
+        encoded = lzw_encode(data, clear_table_at=len(data))
+        decoder = IncrementalLZWDecode()
+        number_of_bytes: int = 0
+        tracemalloc.start()
+        for i in range(0, len(encoded), 4096):
+            number_of_bytes += len(decoder.decode(encoded[i : i + 4096]))
+        number_of_bytes += len(decoder.decode(b"", final=True))
+        peak: int = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert number_of_bytes == len(data)
+        assert peak < len(data) // 4, "peak %d bytes" % peak
+
+    def test_table_memory_does_not_grow_with_entry_length(self):
+        # a run of the same byte builds ever longer entries (1, 2, 3, ... bytes)
+        data = bytes(2000000)
+        encoded = lzw_encode(data, clear_table_at=len(data))
+        decoder = IncrementalLZWDecode()
+        number_of_bytes: int = 0
+        tracemalloc.start()
+        for i in range(0, len(encoded), 64):
+            number_of_bytes += len(decoder.decode(encoded[i : i + 64]))
+        number_of_bytes += len(decoder.decode(b"", final=True))
+        peak: int = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert number_of_bytes == len(data)
+        assert peak < len(data) // 4, "peak %d bytes" % peak
+
+    def test_decode_incrementally(self):
+        data = self._random_text(50000)
+        encoded = lzw_encode(data, clear_table_at=1000)
+        for chunk_size in [1, 3, 17, 4096]:
+            decoder = IncrementalLZWDecode()
+            output = b"".join(
+                [
+                    decoder.decode(encoded[i : i + chunk_size])
+                    for i in range(0, len(encoded), chunk_size)
+                ]
+            )
+            output += decoder.decode(b"", final=True)
+            assert output == data
+
+    def test_decode_with_predictor(self):
+        columns: int = 50
+        data = self._random_text(columns * 3 * 40)
+        encoded = lzw_encode(png_encode(data, 3, 8, columns))
+        assert LZWDecode.decode(encoded, predictor=15, colors=3, columns=columns) == data
+
+        # using DecodeParms
+        s = Stream()
+        s[Name("Bytes")] = encoded
+        s[Name("Filter")] = Name("LZWDecode")
+        s[Name("DecodeParms")] = Dictionary()
+        s["DecodeParms"][Name("Predictor")] = Decimal(15)
+        s["DecodeParms"][Name("Colors")] = Decimal(3)
+        s["DecodeParms"][Name("Columns")] = Decimal(columns)
+        assert b"".join(iter_decode_stream(s, chunk_size=100)) == data
+
+    def test_benchmark_lzw_decode(self):
+        data = self._random_text(2000000)
+        encoded = lzw_encode(data)
+        t0: float = time.time()
+        output = LZWDecode.decode(encoded)
+        delta: float = time.time() - t0
+        assert output == data
+        print(
+            "LZWDecode, %d bytes (%d encoded): %f s, %f MB/s"
+            % (len(data), len(encoded), delta, len(data) / (delta * 1024 * 1024))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
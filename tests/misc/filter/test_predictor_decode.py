@@ -0,0 +1,260 @@
+import copy
+import random
+import time
+import typing
+import unittest
+import zlib
+
+from ptext.io.filter.flate_decode import FlateDecode
+from ptext.io.filter.predictor_decode import PredictorDecode
+
+
+def legacy_predictor_decode(
+    bytes_after_zlib: bytes, predictor: int, bits_per_component: int, columns: int
+) -> bytes:
+    """
+    This is the (byte-by-byte) implementation FlateDecode used before PredictorDecode,
+    it is kept here as a reference (it only supports 8 bits per component, and 1 color)
+    """
+    if predictor == 1:
+        return bytes_after_zlib
+    bytes_per_row: int = int((columns * bits_per_component + 7) / 8)
+    bytes_per_pixel = int(bits_per_component / 8)
+    prior_row: typing.List[int] = [0 for _ in range(0, bytes_per_row)]
+    number_of_rows = int(len(bytes_after_zlib) / bytes_per_row)
+    bytes_after_predictor = [int(x) for x in bytes_after_zlib]
+    if predictor == 2:
+        for row in range(0, number_of_rows):
+            row_start_index = row * bytes_per_row
+            for col in range(1, bytes_per_row):
+                bytes_after_predictor[row_start_index + col] = (
+                    bytes_after_predictor[row_start_index + col]
+                    + bytes_after_predictor[row_start_index + col - 1]
+                ) % 256
+        return bytes([(int(x) % 256) for x in bytes_after_predictor])
+    bytes_after_predictor = []
+    pos = 0
+    while pos + bytes_per_row <= len(bytes_after_zlib):
+        filter_type = bytes_after_zlib[pos]
+        pos += 1
+        current_row = [x for x in bytes_after_zlib[pos : pos + bytes_per_row]]
+        pos += bytes_per_row
+        if filter_type == 1:
+            for i in range(bytes_per_pixel, bytes_per_row):
+                current_row[i] = (current_row[i] + current_row[i - bytes_per_pixel]) % 256
+        if filter_type == 2:
+            for i in range(0, bytes_per_row):
+                current_row[i] = (current_row[i] + prior_row[i]) % 256
+        if filter_type == 3:
+            for i in range(0, bytes_per_pixel):
+                current_row[i] += int(prior_row[i] / 2)
+            for i in range(bytes_per_pixel, bytes_per_row):
+                current_row[i] += (int)(
+                    (current_row[i - bytes_per_pixel] + prior_row[i]) / 2
+                )
+                current_row[i] %= 256
+        if filter_type == 4:
+            for i in range(0, bytes_per_pixel):
+                current_row[i] += prior_row[i]
+            for i in range(bytes_per_pixel, bytes_per_row):
+                a = current_row[i - bytes_per_pixel]
+                b = prior_row[i]
+                c = prior_row[i - bytes_per_pixel]
+                p = a + b - c
+                pa = abs(p - a)
+                pb = abs(p - b)
+                pc = abs(p - c)
+                ret = 0
+                if pa <= pb and pa <= pc:
+                    ret = a
+                elif pb <= pc:
+                    ret = b
+                else:
+                    ret = c
+                current_row[i] = (current_row[i] + ret) % 256
+        for i in range(0, len(current_row)):
+            bytes_after_predictor.append(current_row[i])
+        prior_row = copy.deepcopy(current_row)
+    return bytes([(int(x) % 256) for x in bytes_after_predictor])
+
+
+def png_encode(
+    bytes_in: bytes,
+    colors: int,
+    bits_per_component: int,
+    columns: int,
+    filter_types: typing.List[int] = [0, 1, 2, 3, 4],
+) -> bytes:
+    """
+    This function applies the PNG predictors (cycling through the given filter types, one per row)
+    """
+    bytes_per_row: int = (colors * bits_per_component * columns + 7) // 8
+    bytes_per_pixel: int = max(1, (colors * bits_per_component + 7) // 8)
+    prior_row: bytes = bytes(bytes_per_row)
+    out: bytearray = bytearray()
+    for row in range(0, len(bytes_in) // bytes_per_row):
+        current_row = bytes_in[row * bytes_per_row : (row + 1) * bytes_per_row]
+        filter_type: int = filter_types[row % len(filter_types)]
+        out.append(filter_type)
+        for i in range(0, bytes_per_row):
+            a = current_row[i - bytes_per_pixel] if i >= bytes_per_pixel else 0
+            b = prior_row[i]
+            c = prior_row[i - bytes_per_pixel] if i >= bytes_per_pixel else 0
+            prediction: int = 0
+            if filter_type == 1:
+                prediction = a
+            if filter_type == 2:
+                prediction = b
+            if filter_type == 3:
+                prediction = (a + b) // 2
+            if filter_type == 4:
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                prediction = a if (pa <= pb and pa <= pc) else (b if pb <= pc else c)
+            out.append((current_row[i] - prediction) % 256)
+        prior_row = current_row
+    return bytes(out)
+
+
+def tiff_encode(
+    bytes_in: bytes, colors: int, bits_per_component: int, columns: int
+) -> bytes:
+    """
+    This function applies TIFF Predictor 2 (horizontal differencing)
+    """
+    bytes_per_row: int = (colors * bits_per_component * columns + 7) // 8
+    components_per_byte: int = max(1, 8 // bits_per_component)
+    mask: int = (1 << bits_per_component) - 1
+    out: bytearray = bytearray()
+    for row in range(0, len(bytes_in) // bytes_per_row):
+        current_row = bytes_in[row * bytes_per_row : (row + 1) * bytes_per_row]
+        # unpack
+        components: typing.List[int] = []
+        if bits_per_component == 16:
+            components = [
+                (current_row[i] << 8) + current_row[i + 1]
+                for i in range(0, len(current_row), 2)
+            ]
+        else:
+            for b in current_row:
+                for j in range(0, components_per_byte):
+                    components.append(
+                        (b >> (8 - bits_per_component * (j + 1))) & mask
+                    )
+        n: int = colors * columns
+        padding = components[n:]
+        components = components[0:n]
+        # difference
+        diffs = [
+            (components[i] - (components[i - colors] if i >= colors else 0)) & mask
+            for i in range(0, n)
+        ]
+        # pack
+        if bits_per_component == 16:
+            for d in diffs:
+                out += bytes([d >> 8, d & 0xFF])
+        else:
+            diffs += [0 for _ in padding]
+            for i in range(0, len(diffs), components_per_byte):
+                b = 0
+                for d in diffs[i : i + components_per_byte]:
+                    b = (b << bits_per_component) | d
+                out.append(b)
+    return bytes(out)
+
+
+class TestPredictorDecode(unittest.TestCase):
+    """
+    This test checks PredictorDecode against a straightforward encoder (for all combinations
+    of bits per component and colors) and against the previous implementation, and compares their speed
+    """
+
+    def _random_image(
+        self, colors: int, bits_per_component: int, columns: int, rows: int
+    ) -> bytes:
+        rnd = random.Random(0)
+        bytes_per_row: int = (colors * bits_per_component * columns + 7) // 8
+        # smooth data (so predictors matter), with the padding bits of each row set to 0
+        out = bytearray()
+        for _ in range(0, rows):
+            row = bytearray(
+                [(x * 7 + rnd.randint(0, 3)) & 0xFF for x in range(0, bytes_per_row)]
+            )
+            padding_bits: int = bytes_per_row * 8 - colors * bits_per_component * columns
+            if padding_bits > 0:
+                row[-1] &= (0xFF << padding_bits) & 0xFF
+            out += row
+        return bytes(out)
+
+    def test_png_predictor_all_bits_per_component(self):
+        for bits_per_component in [1, 2, 4, 8, 16]:
+            for colors in [1, 3, 4]:
+                for columns in [1, 7, 33]:
+                    data = self._random_image(colors, bits_per_component, columns, 11)
+                    encoded = png_encode(data, colors, bits_per_component, columns)
+                    for predictor in [10, 11, 12, 13, 14, 15]:
+                        decoded = PredictorDecode.decode(
+                            encoded,
+                            predictor=predictor,
+                            colors=colors,
+                            bits_per_component=bits_per_component,
+                            columns=columns,
+                        )
+                        assert decoded == data
+
+    def test_tiff_predictor_all_bits_per_component(self):
+        for bits_per_component in [1, 2, 4, 8, 16]:
+            for colors in [1, 3, 4]:
+                for columns in [1, 7, 33]:
+                    data = self._random_image(colors, bits_per_component, columns, 11)
+                    encoded = tiff_encode(data, colors, bits_per_component, columns)
+                    decoded = PredictorDecode.decode(
+                        encoded,
+                        predictor=2,
+                        colors=colors,
+                        bits_per_component=bits_per_component,
+                        columns=columns,
+                    )
+                    assert decoded == data
+
+    def test_flate_decode_matches_legacy_implementation(self):
+        # the legacy implementation did not wrap the first pixel of a row around (modulo 256)
+        # for PNG_FILTER_AVERAGE and PNG_FILTER_PAETH, so only the other filter types are compared
+        columns: int = 300
+        data = self._random_image(1, 8, columns, 300)
+        for predictor, encoded in [
+            (2, tiff_encode(data, 1, 8, columns)),
+            (12, png_encode(data, 1, 8, columns, [0, 1, 2])),
+        ]:
+            t0: float = time.time()
+            expected_output = legacy_predictor_decode(encoded, predictor, 8, columns)
+            delta_legacy: float = time.time() - t0
+
+            t0 = time.time()
+            output = FlateDecode.decode(
+                zlib.compress(encoded), predictor=predictor, columns=columns
+            )
+            delta: float = time.time() - t0
+
+            assert output == expected_output
+            assert output == data
+            print(
+                "predictor %d, %d bytes, legacy: %f s, PredictorDecode: %f s"
+                % (predictor, len(data), delta_legacy, delta)
+            )
+
+    def test_benchmark_png_predictor(self):
+        columns: int = 300
+        data = self._random_image(3, 8, columns, 300)
+        encoded = png_encode(data, 3, 8, columns)
+        t0: float = time.time()
+        output = PredictorDecode.decode(
+            encoded, predictor=15, colors=3, bits_per_component=8, columns=columns
+        )
+        delta: float = time.time() - t0
+        assert output == data
+        print("PNG predictor (all filter types), %d bytes: %f s" % (len(data), delta))
+
+
+if __name__ == "__main__":
+    unittest.main()
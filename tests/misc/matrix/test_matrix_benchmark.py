@@ -0,0 +1,90 @@
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from ptext.io.read.types import String
+from ptext.pdf.canvas.canvas_graphics_state import CanvasGraphicsState
+from ptext.pdf.canvas.event.chunk_of_text_render_event import ChunkOfTextRenderEvent
+from ptext.pdf.canvas.font.simple_font.true_type_font import TrueTypeFont
+from ptext.pdf.canvas.geometry.line_segment import LineSegment
+from ptext.pdf.canvas.geometry.matrix import Matrix
+
+
+class TestMatrixBenchmark(unittest.TestCase):
+    """
+    This test checks whether float matrices (the default) and Decimal matrices (Matrix.EXACT)
+    give the same results, benchmarks/matrix_benchmark.py compares their speed
+    """
+
+    def tearDown(self) -> None:
+        Matrix.EXACT = False
+
+    def _build_graphics_state(self) -> CanvasGraphicsState:
+        graphics_state = CanvasGraphicsState()
+        graphics_state.font = TrueTypeFont.true_type_font_from_file(
+            Path(__file__).parent.parent.parent
+            / "pdf"
+            / "canvas"
+            / "font"
+            / "Jsfont-Regular.ttf"
+        )
+        graphics_state.font_size = Decimal(12)
+        graphics_state.ctm = Matrix.affine_matrix(2, 0, 0, 2, 50, 60)
+        graphics_state.text_matrix = Matrix.affine_matrix(1, 0, 0, 1, 72, 700)
+        return graphics_state
+
+    def test_affine_matrix(self):
+        m0 = Matrix.affine_matrix(2, 0, 0, 3, 121, 613)
+        m1 = Matrix.affine_matrix(e=-7, f=-10)
+        assert isinstance(m0[0][0], float)
+        m2 = m0.mul(m1)
+        assert m2[0][0] == 2 and m2[1][1] == 3
+        assert m2[2][0] == 114 and m2[2][1] == 603
+
+        # same result as Decimal matrices
+        m3 = Matrix.matrix_from_six_values(
+            *[Decimal(x) for x in [2, 0, 0, 3, 121, 613]]
+        ).mul(Matrix.matrix_from_six_values(*[Decimal(x) for x in [1, 0, 0, 1, -7, -10]]))
+        for i in range(0, 3):
+            for j in range(0, 3):
+                assert m2[i][j] == m3[i][j]
+
+        # exact mode
+        Matrix.EXACT = True
+        m4 = Matrix.affine_matrix(Decimal("0.1"), 0, 0, 1, 0, 0)
+        assert m4[0][0] == Decimal("0.1")
+        assert m4.mul(m4)[0][0] == Decimal("0.01")
+
+    def test_chunk_of_text_render_event(self):
+        evt = ChunkOfTextRenderEvent(self._build_graphics_state(), String("Hello"))
+        rectangles = [evt.get_baseline(), evt.get_bounding_box()]
+        Matrix.EXACT = True
+        evt_exact = ChunkOfTextRenderEvent(self._build_graphics_state(), String("Hello"))
+        rectangles_exact = [evt_exact.get_baseline(), evt_exact.get_bounding_box()]
+        for r0, r1 in zip(rectangles, rectangles_exact):
+            assert isinstance(r0.x, Decimal)
+            assert abs(r0.x - r1.x) < Decimal(0.0001)
+            assert abs(r0.y - r1.y) < Decimal(0.0001)
+            assert abs(r0.width - r1.width) < Decimal(0.0001)
+            assert abs(r0.height - r1.height) < Decimal(0.0001)
+        assert evt.get_baseline().x == 194
+        assert evt.get_font_size() == 12
+
+    def test_to_decimal(self):
+        # floats are rounded to 15 significant digits
+        assert str(Matrix.to_decimal(0.1)) == "0.1"
+        assert str(Matrix.to_decimal(0.1 * 3)) == "0.3"
+        assert str(Matrix.to_decimal(1 / 3)) == "0.333333333333333"
+        assert str(Matrix.to_decimal(-612.5)) == "-612.5"
+        assert Matrix.to_decimal(2) == 2
+        d: Decimal = Decimal("0.1")
+        assert Matrix.to_decimal(d) is d
+
+        # (Decimal) results of float matrices do not carry the binary expansion of the float
+        s = LineSegment(Decimal(1), Decimal(3), Decimal(7), Decimal(9)).transform_by(
+            Matrix.affine_matrix(0.1, 0, 0, 0.1, 0.2, 0)
+        )
+        assert [str(x) for x in [s.x0, s.y0, s.x1, s.y1]] == ["0.3", "0.3", "0.9", "0.9"]
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+import io
+import time
+import typing
+import unittest
+
+from ptext.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
+from ptext.io.read.tokenize.low_level_tokenizer import (
+    LowLevelTokenizer,
+    Token,
+    TokenType,
+)
+
+
+class CharByCharTokenizer(LowLevelTokenizer):
+    """
+    This is the (previous) implementation of LowLevelTokenizer,
+    it reads its io source one byte at a time. It serves as a reference.
+    """
+
+    def next_token(self) -> typing.Optional[Token]:
+        ch = self._next_char()
+        if len(ch) == 0:
+            return None
+
+        while len(ch) > 0 and self._is_whitespace(ch):
+            ch = self._next_char()
+
+        if ch == "[":
+            return Token(self._io_source.tell() - 1, TokenType.START_ARRAY, "[")
+
+        if ch == "]":
+            return Token(self._io_source.tell() - 1, TokenType.END_ARRAY, "]")
+
+        if ch == "/":
+            out_str = "/"
+            out_pos = self._io_source.tell() - 1
+            while True:
+                ch = self._next_char()
+                if len(ch) == 0:
+                    break
+                if self._is_delimiter(ch):
+                    break
+                out_str += ch
+            if len(ch) != 0:
+                self._prev_char()
+            return Token(out_pos, TokenType.NAME, out_str)
+
+        if ch == ">":
+            out_pos = self._io_source.tell() - 1
+            ch = self._next_char()
+            assert ch == ">"
+            return Token(out_pos, TokenType.END_DICT, ">>")
+
+        if ch == "%":
+            out_str = ""
+            out_pos = self._io_source.tell() - 1
+            while len(ch) != 0 and ch != "\r" and ch != "\n":
+                out_str += ch
+                ch = self._next_char()
+            if len(ch) != 0:
+                self._prev_char()
+            return Token(out_pos, TokenType.COMMENT, out_str)
+
+        if ch == "<":
+            out_pos = self._io_source.tell() - 1
+            ch = self._next_char()
+            if ch == "<":
+                return Token(out_pos, TokenType.START_DICT, "<<")
+            if ch == ">":
+                return Token(out_pos, TokenType.HEX_STRING, "<>")
+            out_str = "<" + ch
+            while True:
+                ch = self._next_char()
+                if len(ch) == 0:
+                    break
+                out_str += ch
+                if ch == ">":
+                    break
+            return Token(out_pos, TokenType.HEX_STRING, out_str)
+
+        if ch in "-+.0123456789":
+            out_str = ""
+            out_pos = self._io_source.tell() - 1
+            while len(ch) != 0 and ch in "-+.0123456789":
+                out_str += ch
+                ch = self._next_char()
+            if len(ch) != 0:
+                self._prev_char()
+            return Token(out_pos, TokenType.NUMBER, out_str)
+
+        if ch == "(":
+            bracket_nesting_level = 1
+            out_str = "("
+            out_pos = self._io_source.tell() - 1
+            while True:
+                ch = self._next_char()
+                if len(ch) == 0:
+                    break
+                if ch == "\\":
+                    ch = self._next_char()
+                    out_str += "\\" + ch
+                    continue
+                if ch == "(":
+                    bracket_nesting_level += 1
+                if ch == ")":
+                    bracket_nesting_level -= 1
+                out_str += ch
+                if bracket_nesting_level == 0:
+                    break
+            return Token(out_pos, TokenType.STRING, out_str)
+
+        out_str = ""
+        out_pos = self._io_source.tell() - 1
+        while len(ch) != 0 and not self._is_delimiter(ch):
+            out_str += ch
+            ch = self._next_char()
+        if len(ch) != 0:
+            self._prev_char()
+        return Token(out_pos, TokenType.OTHER, out_str)
+
+
+class TestLowLevelTokenizerBenchmark(unittest.TestCase):
+    """
+    This test compares the (buffer-based) LowLevelTokenizer against
+    the (previous) char-by-char implementation, on content streams and xref tables
+    """
+
+    @staticmethod
+    def _build_content_stream(number_of_lines: int = 2000) -> bytes:
+        out: str = ""
+        for i in range(0, number_of_lines):
+            out += "q 1 0 0 1 %d.5 %d cm\n" % (i % 72, 800 - i % 700)
+            out += "BT /F1 12 Tf 72 %d Td (Lorem \\(ipsum\\) dolor sit amet, consectetur adipiscing elit) Tj\n" % i
+            out += "[(Sed do eiusmod tempor) -120 (incididunt ut labore) 30 <FEFF0041004200430044>] TJ ET\n"
+            out += "% a comment\n"
+            out += "/GS0 gs 0.5 0.25 0.125 rg 10 10 %d 20 re f /Im%d Do Q\n" % (i, i)
+        return out.encode("latin-1")
+
+    @staticmethod
+    def _build_xref_table(number_of_objects: int = 5000) -> bytes:
+        out: str = "xref\n0 %d\n0000000000 65535 f\r\n" % number_of_objects
+        for i in range(1, number_of_objects):
+            out += "%010d 00000 n\r\n" % (i * 97)
+        out += "trailer\n<</Size %d /Root 1 0 R /ID [<ABCDEF> <ABCDEF>]>>\nstartxref\n123\n%%%%EOF" % number_of_objects
+        return out.encode("latin-1")
+
+    @staticmethod
+    def _tokenize(
+        tokenizer: LowLevelTokenizer,
+    ) -> typing.List[typing.Tuple[int, TokenType, str]]:
+        out: typing.List[typing.Tuple[int, TokenType, str]] = []
+        t = tokenizer.next_token()
+        while t is not None:
+            out.append((t.get_byte_offset(), t.get_token_type(), t.get_text()))
+            t = tokenizer.next_token()
+        return out
+
+    def _compare(self, bts: bytes, label: str) -> None:
+
+        delta_0: float = time.time()
+        tokens_0 = TestLowLevelTokenizerBenchmark._tokenize(
+            CharByCharTokenizer(io.BytesIO(bts))
+        )
+        delta_0 = time.time() - delta_0
+
+        delta_1: float = time.time()
+        tokens_1 = TestLowLevelTokenizerBenchmark._tokenize(
+            LowLevelTokenizer(io.BytesIO(bts))
+        )
+        delta_1 = time.time() - delta_1
+
+        print(
+            "%s, %d bytes, %d tokens, char-by-char: %f s, buffer: %f s, speedup: %.1fx"
+            % (
+                label,
+                len(bts),
+                len(tokens_1),
+                delta_0,
+                delta_1,
+                delta_0 / max(delta_1, 10 ** -6),
+            )
+        )
+
+        # check
+        assert tokens_0 == tokens_1
+
+    def test_tokenize_content_stream(self):
+        self._compare(
+            TestLowLevelTokenizerBenchmark._build_content_stream(), "content stream"
+        )
+
+    def test_tokenize_xref_table(self):
+        self._compare(TestLowLevelTokenizerBenchmark._build_xref_table(), "xref table")
+
+    def test_read_objects_in_content_stream(self):
+
+        # the HighLevelTokenizer goes back to re-read the same Token(s) often
+        bts: bytes = TestLowLevelTokenizerBenchmark._build_content_stream(500)
+
+        class CharByCharHighLevelTokenizer(HighLevelTokenizer):
+            next_token = CharByCharTokenizer.next_token
+
+        objs: typing.List[typing.List[typing.Any]] = []
+        for tokenizer_class in [CharByCharHighLevelTokenizer, HighLevelTokenizer]:
+            tokenizer = tokenizer_class(io.BytesIO(bts))
+            delta: float = time.time()
+            objs.append([])
+            while tokenizer.tell() != len(bts):
+                obj = tokenizer.read_object()
+                if obj is None:
+                    break
+                objs[-1].append(obj.to_json_serializable())
+            delta = time.time() - delta
+            print(
+                "%s, %d objects: %f s"
+                % (tokenizer_class.__name__, len(objs[-1]), delta)
+            )
+
+        # check
+        assert objs[0] == objs[1]
+
+    def test_tokenize_using_small_windows(self):
+
+        # a non-BytesIO source is tokenized in windows,
+        # use an absurdly small window to force tokens to cross window boundaries
+        bts: bytes = TestLowLevelTokenizerBenchmark._build_content_stream(100)
+        prev_window_size: int = LowLevelTokenizer.WINDOW_SIZE
+        LowLevelTokenizer.WINDOW_SIZE = 7
+        try:
+            tokens_0 = TestLowLevelTokenizerBenchmark._tokenize(
+                LowLevelTokenizer(io.BufferedReader(io.BytesIO(bts)))  # type: ignore [arg-type]
+            )
+        finally:
+            LowLevelTokenizer.WINDOW_SIZE = prev_window_size
+        tokens_1 = TestLowLevelTokenizerBenchmark._tokenize(
+            CharByCharTokenizer(io.BytesIO(bts))
+        )
+        assert tokens_0 == tokens_1
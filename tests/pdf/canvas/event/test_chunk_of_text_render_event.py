@@ -0,0 +1,88 @@
+import time
+import unittest
+from decimal import Decimal
+
+from ptext.io.read.types import String
+from ptext.pdf.canvas.canvas_graphics_state import CanvasGraphicsState
+from ptext.pdf.canvas.event.chunk_of_text_render_event import ChunkOfTextRenderEvent
+from ptext.pdf.canvas.font.simple_font.font_type_1 import StandardType1Font
+from ptext.pdf.canvas.geometry.matrix import Matrix
+
+
+class TestChunkOfTextRenderEvent(unittest.TestCase):
+    """
+    This test checks whether ChunkOfTextRenderEvent calculates its text and geometry on demand
+    (from a snapshot of the graphics state), and whether split_on_glyphs matches the (unsplit) event
+    """
+
+    def _build_graphics_state(self) -> CanvasGraphicsState:
+        graphics_state = CanvasGraphicsState()
+        graphics_state.font = StandardType1Font("Helvetica")
+        graphics_state.font_size = Decimal(12)
+        graphics_state.text_matrix = Matrix.affine_matrix(1, 0, 0, 1, 72, 700)
+        return graphics_state
+
+    def test_lazy_event(self):
+        graphics_state = self._build_graphics_state()
+        evt = ChunkOfTextRenderEvent(graphics_state, String("Hello World"))
+        assert evt._glyph_line_value is None
+
+        # changing the graphics state does not change the event
+        x: Decimal = ChunkOfTextRenderEvent(
+            graphics_state, String("Hello World")
+        ).get_baseline().x
+        graphics_state.move_text_matrix(Decimal(100))
+        assert evt.get_baseline().x == x
+        assert evt.get_text() == "Hello World"
+        assert evt.get_font_size() == 12
+
+        # the bounding box includes the descent (if needed)
+        evt = ChunkOfTextRenderEvent(graphics_state, String("gjpqy"))
+        assert evt.get_bounding_box().y < evt.get_baseline().y
+        assert evt.get_baseline().x == x + 100
+
+    def test_split_on_glyphs(self):
+        evt = ChunkOfTextRenderEvent(self._build_graphics_state(), String("Hey you"))
+        chunks = evt.split_on_glyphs()
+        assert "".join([c.get_text() for c in chunks]) == "Hey you"
+        assert chunks[0].get_baseline().x == evt.get_baseline().x
+        for i in range(1, len(chunks)):
+            prev_baseline = chunks[i - 1].get_baseline()
+            assert abs(
+                prev_baseline.x + prev_baseline.width - chunks[i].get_baseline().x
+            ) < Decimal(0.0001)
+        last_baseline = chunks[-1].get_baseline()
+        assert abs(
+            last_baseline.x + last_baseline.width - evt.get_baseline().x - evt.get_baseline().width
+        ) < Decimal(0.0001)
+        assert chunks[2].get_bounding_box().y < chunks[2].get_baseline().y
+
+    def test_benchmark_lazy_event(self):
+        n: int = 1000
+        graphics_state = self._build_graphics_state()
+        text = String("The quick brown fox jumps over the lazy dog")
+
+        # build only
+        t0: float = time.time()
+        for _ in range(0, n):
+            ChunkOfTextRenderEvent(graphics_state, text)
+        delta_build: float = time.time() - t0
+
+        # build, and calculate everything
+        t0 = time.time()
+        for _ in range(0, n):
+            evt = ChunkOfTextRenderEvent(graphics_state, text)
+            evt.get_text()
+            evt.get_bounding_box()
+            evt.get_space_character_width_estimate_in_user_space()
+        delta_all: float = time.time() - t0
+
+        print(
+            "ChunkOfTextRenderEvent, build: %f ms, build and calculate: %f ms"
+            % (delta_build * 1000 / n, delta_all * 1000 / n)
+        )
+        assert delta_build < delta_all
+
+
+if __name__ == "__main__":
+    unittest.main()
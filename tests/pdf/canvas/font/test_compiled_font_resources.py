@@ -0,0 +1,146 @@
+import os
+import shutil
+import tempfile
+import time
+import typing
+import unittest
+from pathlib import Path
+
+from ptext.pdf.canvas.font.compiled_font_resources import (
+    CompiledCMap,
+    CompiledFontResources,
+)
+from ptext.pdf.canvas.font.font import Font
+from ptext.pdf.canvas.font.simple_font.font_type_1 import StandardType1Font
+
+
+class TestCompiledFontResources(unittest.TestCase):
+    """
+    This test checks whether the (compiled) predefined CMaps and AFM files
+    give the same results as parsing the original resources
+    """
+
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        self.font_dir: Path = (
+            Path(__file__).parent.parent.parent.parent.parent
+            / "ptext"
+            / "pdf"
+            / "canvas"
+            / "font"
+        )
+        self.cmap_dir: Path = self.font_dir / "composite_font" / "cmaps"
+
+    def test_compiled_cmap(self):
+        m = CompiledCMap.from_dict({1: "A", 2: "B", 3: "C", 5: "ff", 6: "Z", 7: "["})
+        assert m.get_number_of_ranges() == 3
+        assert len(m) == 6
+        assert [m.get(i) for i in range(0, 9)] == [
+            None,
+            "A",
+            "B",
+            "C",
+            None,
+            "ff",
+            "Z",
+            "[",
+            None,
+        ]
+        assert 4 not in m and 5 in m
+        assert list(m) == [1, 2, 3, 5, 6, 7]
+        with self.assertRaises(KeyError):
+            m[4]
+
+    def test_predefined_cmaps(self):
+        for cmap_name in ["Adobe-Identity-H", "Adobe-Japan1-0", "UniGB-UCS2-H"]:
+            with open(self.cmap_dir / cmap_name, "rb") as cmap_file_handle:
+                expected = Font._read_cmap(cmap_file_handle.read())
+            compiled = CompiledFontResources.read_cmap(self.cmap_dir / cmap_name)
+            assert len(compiled) == len(expected)
+            assert compiled.get_number_of_ranges() <= len(expected)
+            for k, v in expected.items():
+                assert compiled.get(k) == v
+        identity = CompiledFontResources.read_cmap(self.cmap_dir / "Adobe-Identity-H")
+        assert identity.get_number_of_ranges() < 10
+
+    def _set_cache_home(self, cache_home: typing.Optional[str]) -> None:
+        if cache_home is None:
+            os.environ.pop("XDG_CACHE_HOME", None)
+        else:
+            os.environ["XDG_CACHE_HOME"] = cache_home
+
+    def test_recompile_on_change(self):
+        previous_cache_home = os.environ.get("XDG_CACHE_HOME")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self._set_cache_home(str(Path(tmp_dir) / "cache"))
+            try:
+                cmap_file: Path = Path(tmp_dir) / "Adobe-Japan1-0"
+                shutil.copy(self.cmap_dir / "Adobe-Japan1-0", cmap_file)
+                m0 = CompiledFontResources.read_cmap(cmap_file)
+                compiled_path = CompiledFontResources._get_compiled_path(cmap_file)
+                assert compiled_path.exists()
+                assert Path(tmp_dir) / "cache" / "ptext" in compiled_path.parents
+                assert not (Path(tmp_dir) / "__compiled__").exists()
+                m1 = CompiledFontResources.read_cmap(cmap_file)
+                assert dict(m1.items()) == dict(m0.items())
+
+                # change the source
+                with open(cmap_file, "wb") as cmap_file_handle:
+                    cmap_file_handle.write(b"1 beginbfchar\n<01> <0041>\nendbfchar\n")
+                m2 = CompiledFontResources.read_cmap(cmap_file)
+                assert len(m2) == 1 and m2.get(1) == "A"
+
+                # a corrupt compiled form is a cache miss
+                with open(compiled_path, "wb") as compiled_file_handle:
+                    compiled_file_handle.write(b"\x80\x05garbage")
+                m3 = CompiledFontResources.read_cmap(cmap_file)
+                assert len(m3) == 1 and m3.get(1) == "A"
+            finally:
+                self._set_cache_home(previous_cache_home)
+
+    def test_unwritable_cache_directory(self):
+        previous_cache_home = os.environ.get("XDG_CACHE_HOME")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # a file where the cache directory should be
+            with open(Path(tmp_dir) / "cache", "wb") as cache_file_handle:
+                cache_file_handle.write(b"")
+            self._set_cache_home(str(Path(tmp_dir) / "cache"))
+            try:
+                afm = CompiledFontResources.read_afm(
+                    self.font_dir / "simple_font" / "afm" / "courier.afm"
+                )
+                assert afm.get_attribute("FontName") == "Courier"
+            finally:
+                self._set_cache_home(previous_cache_home)
+
+    def test_afm(self):
+        afm = CompiledFontResources.read_afm(
+            self.font_dir / "simple_font" / "afm" / "helvetica.afm"
+        )
+        assert afm.get_attribute("FontName") == "Helvetica"
+        assert afm.get_character_metrics()["H"][:2] == (72, 722)
+        assert afm.get_kerning("A", "C") == -30
+        assert StandardType1Font("Helvetica").get_width(ord("H")) == 722
+
+    def test_benchmark_predefined_cmap(self):
+        cmap_file: Path = self.cmap_dir / "UniGB-UCS2-H"
+        CompiledFontResources.read_cmap(cmap_file)
+
+        t0: float = time.time()
+        with open(cmap_file, "rb") as cmap_file_handle:
+            Font._read_cmap(cmap_file_handle.read())
+        delta_parse: float = time.time() - t0
+
+        t0 = time.time()
+        CompiledFontResources.read_cmap(cmap_file)
+        delta_compiled: float = time.time() - t0
+
+        print(
+            "UniGB-UCS2-H, parse: %f ms, load compiled: %f ms"
+            % (delta_parse * 1000, delta_compiled * 1000)
+        )
+        assert delta_compiled < delta_parse
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import time
+import unittest
+from decimal import Decimal
+
+from ptext.pdf.canvas.font.font import Font
+from ptext.pdf.canvas.font.font_cache import FontCache
+from ptext.pdf.canvas.font.simple_font.font_type_1 import StandardType1Font
+
+
+class TestFontCache(unittest.TestCase):
+    """
+    This test checks whether parsed font resources (AFM metrics, CMaps) are cached process-wide,
+    whether the cache keeps track of its hits and misses, and whether it evicts the least recently used entries
+    """
+
+    def setUp(self) -> None:
+        self._max_size: int = FontCache.MAX_SIZE
+        FontCache.clear()
+
+    def tearDown(self) -> None:
+        FontCache.MAX_SIZE = self._max_size
+        FontCache.clear()
+
+    def test_standard_type_1_font(self):
+        f0 = StandardType1Font("Helvetica")
+        f1 = StandardType1Font("helvetica")
+        assert f0._afm is f1._afm
+        assert FontCache.get_statistics()["afm"] == {"hits": 1, "misses": 1, "size": 1}
+
+        # widths, encoding
+        assert f0.get_width(ord("H")) == Decimal(722)
+        assert f0.get_width(ord("i")) == Decimal(222)
+        assert f0.get_width(-2) == Decimal(0)
+        assert f0.character_identifier_to_unicode(ord("H")) == "H"
+        assert f0.unicode_to_character_identifier("H") == ord("H")
+
+        # other fonts
+        StandardType1Font("Courier")
+        assert FontCache.get_statistics()["afm"] == {"hits": 1, "misses": 2, "size": 2}
+
+    def test_embedded_cmap(self):
+        cmap_bytes: bytes = b"""
+        /CIDInit /ProcSet findresource begin
+        12 dict begin
+        begincmap
+        1 begincodespacerange
+        <00> <FF>
+        endcodespacerange
+        2 beginbfchar
+        <01> <0048>
+        <02> <0069>
+        endbfchar
+        endcmap
+        CMapName currentdict /CMap defineresource pop
+        end
+        end
+        """
+        m0 = Font._read_embedded_cmap(cmap_bytes)
+        m1 = Font._read_embedded_cmap(bytes(cmap_bytes))
+        assert m0 is m1
+        assert m0[1] == "H" and m0[2] == "i"
+        assert FontCache.get_statistics()["embedded_cmap"]["hits"] == 1
+        assert FontCache.get_statistics()["embedded_cmap"]["misses"] == 1
+
+    def test_evict_least_recently_used(self):
+        FontCache.MAX_SIZE = 2
+        FontCache.get("test", "a", lambda: 1)
+        FontCache.get("test", "b", lambda: 2)
+        FontCache.get("test", "a", lambda: -1)
+        FontCache.get("test", "c", lambda: 3)
+        assert FontCache.get("test", "a", lambda: -1) == 1
+        assert FontCache.get("test", "b", lambda: -2) == -2
+        assert FontCache.get_statistics()["test"] == {"hits": 2, "misses": 4, "size": 2}
+
+    def test_benchmark_standard_type_1_font(self):
+        n: int = 100
+
+        # parse the AFM file every time
+        t0: float = time.time()
+        for _ in range(0, n):
+            FontCache.clear()
+            StandardType1Font("Helvetica")
+        delta_uncached: float = time.time() - t0
+
+        # cached
+        t0 = time.time()
+        for _ in range(0, n):
+            StandardType1Font("Helvetica")
+        delta_cached: float = time.time() - t0
+
+        print(
+            "StandardType1Font, uncached: %f ms, cached: %f ms"
+            % (delta_uncached * 1000 / n, delta_cached * 1000 / n)
+        )
+        assert delta_cached < delta_uncached
+
+
+if __name__ == "__main__":
+    unittest.main()
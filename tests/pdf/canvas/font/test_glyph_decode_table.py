@@ -0,0 +1,97 @@
+import typing
+import unittest
+from decimal import Decimal
+
+from ptext.io.read.types import Decimal as pDecimal
+from ptext.io.read.types import List, Name
+from ptext.pdf.canvas.font.font import Font
+from ptext.pdf.canvas.font.glyph_line import GlyphLine
+from ptext.pdf.canvas.font.simple_font.font_type_1 import (
+    StandardType1Font,
+    Type1Font,
+)
+
+
+class CountingFont(Font):
+    """
+    This Font maps 0x4142 (two bytes) to "Ω", and single bytes to their ASCII character
+    """
+
+    def __init__(self):
+        super(CountingFont, self).__init__()
+        self.number_of_lookups: int = 0
+
+    def character_identifier_to_unicode(
+        self, character_identifier: int
+    ) -> typing.Optional[str]:
+        self.number_of_lookups += 1
+        if character_identifier == 0x4142:
+            return "Ω"
+        if 32 <= character_identifier < 127:
+            return chr(character_identifier)
+        return None
+
+    def get_width(self, character_identifier: int) -> typing.Optional[pDecimal]:
+        return pDecimal(1000 if character_identifier == 0x4142 else 500)
+
+
+class TestGlyphDecodeTable(unittest.TestCase):
+    """
+    This test checks whether GlyphLine (using the GlyphDecodeTable of a Font)
+    decodes single and multi byte character codes, and whether each character code is looked up only once
+    """
+
+    def test_standard_type_1_font(self):
+        font = StandardType1Font("Helvetica")
+        glyph_line = GlyphLine(b"Hello World", font, Decimal(12))
+        assert glyph_line.get_text() == "Hello World"
+        assert [g.get_width() for g in glyph_line._glyphs[0:2]] == [722, 556]
+        assert not font._has_multi_byte_character_codes()
+        assert font.get_glyph_decode_table() is font.get_glyph_decode_table()
+
+    def test_type_1_font_with_implied_encoding(self):
+        font = Type1Font()
+        font[Name("BaseFont")] = Name("Helvetica")
+        font[Name("FirstChar")] = pDecimal(0)
+        font[Name("LastChar")] = pDecimal(255)
+        font[Name("Widths")] = List()
+        for _ in range(0, 256):
+            font["Widths"].append(pDecimal(500))
+
+        # setting the implied Encoding (on first use) does not invalidate the GlyphDecodeTable
+        glyph_decode_table = font.get_glyph_decode_table()
+        assert GlyphLine(b"Hello", font, Decimal(12)).get_text() == "Hello"
+        assert font["Encoding"] == "StandardEncoding"
+        assert font.get_glyph_decode_table() is glyph_decode_table
+
+    def test_multi_byte_character_codes(self):
+        font = CountingFont()
+        glyph_line = GlyphLine(b"ABC\x01", font, Decimal(12))
+        assert glyph_line.get_text() == "ΩC�"
+        assert [g.get_character_code() for g in glyph_line._glyphs] == [0x4142, 67, 1]
+        assert [g.get_width() for g in glyph_line._glyphs] == [1000, 500, 250]
+
+        # each character code is looked up once
+        n: int = font.number_of_lookups
+        GlyphLine(b"ABC\x01", font, Decimal(12))
+        assert font.number_of_lookups == n
+
+        # changing the Font rebuilds the GlyphDecodeTable
+        font[Name("FirstChar")] = pDecimal(0)
+        GlyphLine(b"ABC\x01", font, Decimal(12))
+        assert font.number_of_lookups == 2 * n
+
+    def test_glyph_line_decodes_like_font(self):
+        font = StandardType1Font("Helvetica")
+        text: bytes = bytes(range(32, 127))
+        glyph_line = GlyphLine(text, font, Decimal(12))
+        assert [g.get_character_code() for g in glyph_line._glyphs] == list(text)
+        assert [g.get_unicode_str() for g in glyph_line._glyphs] == [
+            font.character_identifier_to_unicode(b) for b in text
+        ]
+        assert [g.get_width() for g in glyph_line._glyphs] == [
+            font.get_width(b) for b in text
+        ]
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import io
+import time
+import unittest
+from pathlib import Path
+
+from fontTools.ttLib import TTFont  # type: ignore [import]
+
+from ptext.io.read.types import Decimal
+from ptext.pdf.canvas.font.font_cache import FontCache
+from ptext.pdf.canvas.font.simple_font.true_type_font import TrueTypeFont
+from ptext.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from ptext.pdf.canvas.layout.text.paragraph import Paragraph
+from ptext.pdf.document import Document
+from ptext.pdf.page.page import Page
+from ptext.pdf.pdf import PDF
+from ptext.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+class TestSubsetTrueTypeFont(unittest.TestCase):
+    """
+    This test checks whether TrueTypeFont objects only embed the glyphs that are used in the Document,
+    and whether their Widths and Encoding are trimmed accordingly
+    """
+
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        self.font_path: Path = Path(__file__).parent / "Jsfont-Regular.ttf"
+
+    def _write_document(self, subset: bool = True) -> bytes:
+        pdf = Document()
+        page = Page()
+        pdf.append_page(page)
+        layout = SingleColumnLayout(page)
+        # equal TrueTypeFont objects are written as the same object
+        for text in ["Hello", "World"]:
+            layout.add(
+                Paragraph(
+                    text,
+                    font=TrueTypeFont.true_type_font_from_file(
+                        self.font_path, subset=subset
+                    ),
+                    font_size=Decimal(20),
+                )
+            )
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, pdf)
+            return pdf_file_handle.getvalue()
+
+    def _read_font(self, pdf_bytes: bytes):
+        l = SimpleTextExtraction()
+        doc = PDF.loads(io.BytesIO(pdf_bytes), [l])
+        fonts = [
+            f
+            for f in doc.get_page(0)["Resources"]["Font"].values()
+            if f["Subtype"] == "TrueType"
+        ]
+        assert len(fonts) == 1
+        return fonts[0], l.get_text(0)
+
+    def test_subset(self):
+        pdf_bytes: bytes = self._write_document()
+        font, text = self._read_font(pdf_bytes)
+        assert "Hello" in text and "World" in text
+
+        # BaseFont has a subset tag
+        assert str(font["BaseFont"])[6] == "+"
+
+        # only the glyphs that are used are embedded
+        ttf_font_file = TTFont(
+            io.BytesIO(font["FontDescriptor"]["FontFile2"]["DecodedBytes"])
+        )
+        assert sorted(ttf_font_file.getGlyphOrder()) == sorted(
+            [".notdef", "H", "W", "d", "e", "l", "o", "r"]
+        )
+
+        # Widths, Differences are trimmed
+        first_char: int = int(font["FirstChar"])
+        last_char: int = int(font["LastChar"])
+        assert len(font["Widths"]) == last_char - first_char + 1
+        assert len(font["Encoding"]["Differences"]) == 2 * 7
+
+        # not subset
+        full_pdf_bytes: bytes = self._write_document(subset=False)
+        font, text = self._read_font(full_pdf_bytes)
+        assert "Hello" in text and "World" in text
+        assert "+" not in str(font["BaseFont"])
+        assert len(pdf_bytes) < len(full_pdf_bytes)
+
+    def test_subset_cache(self):
+        FontCache.clear()
+        t0: float = time.time()
+        self._write_document()
+        delta_first: float = time.time() - t0
+        t0 = time.time()
+        self._write_document()
+        delta_second: float = time.time() - t0
+        assert FontCache.get_statistics()["ttf"]["hits"] == 3
+        assert FontCache.get_statistics()["ttf_subset"] == {
+            "hits": 1,
+            "misses": 1,
+            "size": 1,
+        }
+        print(
+            "writing Document with subset TrueTypeFont, first: %f s, second: %f s"
+            % (delta_first, delta_second)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
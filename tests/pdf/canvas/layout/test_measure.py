@@ -0,0 +1,102 @@
+import unittest
+from decimal import Decimal
+
+from ptext.pdf.canvas.geometry.rectangle import Rectangle
+from ptext.pdf.canvas.layout.list.unordered_list import UnorderedList
+from ptext.pdf.canvas.layout.table.fixed_column_width_table import (
+    FixedColumnWidthTable,
+)
+from ptext.pdf.canvas.layout.table.flexible_column_width_table import (
+    FlexibleColumnWidthTable,
+)
+from ptext.pdf.canvas.layout.text.chunk_of_text import ChunkOfText
+from ptext.pdf.canvas.layout.text.chunks_of_text import Span
+from ptext.pdf.canvas.layout.text.paragraph import Paragraph
+from ptext.pdf.page.page import Page
+
+LOREM: str = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, "
+    "sed do eiusmod tempor incididunt ut labore et dolore magna aliqua."
+)
+
+
+def _build_elements():
+    span = Span()
+    for i, w in enumerate(LOREM.split(" ")):
+        span.add(
+            ChunkOfText(
+                w + " ",
+                font="Helvetica-Bold" if i % 2 == 0 else "Helvetica",
+                font_size=Decimal(10 + i % 3),
+            )
+        )
+    ul = UnorderedList()
+    for i in range(0, 3):
+        ul.add(Paragraph(LOREM[: 20 * (i + 1)]))
+    fixed_table = FixedColumnWidthTable(number_of_rows=2, number_of_columns=2)
+    flexible_table = FlexibleColumnWidthTable(number_of_rows=2, number_of_columns=2)
+    for i in range(0, 4):
+        fixed_table.add(Paragraph(LOREM[: 10 * (i + 1)]))
+        flexible_table.add(Paragraph(LOREM[: 10 * (i + 1)]))
+    return [Paragraph(LOREM), span, ul, fixed_table, flexible_table]
+
+
+class TestMeasure(unittest.TestCase):
+    """
+    This test checks whether LayoutElement.measure calculates the same layout box as LayoutElement.layout,
+    without writing to a Page, and whether measurements are memoized
+    """
+
+    def test_measure_equals_layout(self):
+        box: Rectangle = Rectangle(
+            Decimal(59), Decimal(100), Decimal(300), Decimal(600)
+        )
+        for e in _build_elements():
+            m: Rectangle = e.measure(box)
+            page = Page()
+            r: Rectangle = e.layout(page, box)
+            assert "Contents" in page
+            assert (m.x, m.y, m.width, m.height) == (r.x, r.y, r.width, r.height)
+
+    def test_measurements_are_memoized(self):
+        t = FixedColumnWidthTable(number_of_rows=2, number_of_columns=2)
+        p = Paragraph(LOREM)
+        t.add(p).add(Paragraph("Hello World"))
+        box: Rectangle = Rectangle(
+            Decimal(0), Decimal(0), Decimal(300), Decimal(800)
+        )
+        r0: Rectangle = t.measure(box)
+        n: int = len(p._measurements)
+        r1: Rectangle = t.measure(box)
+        assert len(p._measurements) == n
+        assert r0 is not r1 and r0.height == r1.height
+
+        # a different width leads to a different measurement
+        r2: Rectangle = t.measure(
+            Rectangle(Decimal(0), Decimal(0), Decimal(150), Decimal(800))
+        )
+        assert r2.height > r0.height
+
+        # adding content clears the measurements
+        ul = UnorderedList().add(Paragraph("Lorem"))
+        ul.measure(box)
+        assert len(ul._measurements) == 1
+        ul.add(Paragraph("Ipsum"))
+        assert len(ul._measurements) == 0
+
+    def test_memoized_measurement_equals_first_measurement(self):
+        box: Rectangle = Rectangle(
+            Decimal(0), Decimal(0), Decimal(400), Decimal(800)
+        )
+        for e in _build_elements():
+            m0: Rectangle = e.measure(box)
+            m1: Rectangle = e.measure(box)
+            assert (m0.x, m0.y, m0.width, m0.height) == (
+                m1.x,
+                m1.y,
+                m1.width,
+                m1.height,
+            )
+
+if __name__ == "__main__":
+    unittest.main()
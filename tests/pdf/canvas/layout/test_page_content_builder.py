@@ -0,0 +1,87 @@
+import io
+import unittest
+from decimal import Decimal
+
+from ptext.io.read.types import Name, Stream
+from ptext.pdf.canvas.color.color import X11Color
+from ptext.pdf.canvas.geometry.rectangle import Rectangle
+from ptext.pdf.canvas.layout.page_content_builder import PageContentBuilder
+from ptext.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from ptext.pdf.canvas.layout.table.fixed_column_width_table import (
+    FixedColumnWidthTable as Table,
+)
+from ptext.pdf.canvas.layout.text.paragraph import Paragraph
+from ptext.pdf.document import Document
+from ptext.pdf.page.page import Page
+from ptext.pdf.pdf import PDF
+from ptext.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+class TestPageContentBuilder(unittest.TestCase):
+    """
+    This test checks whether the content stream of a Page is built in place during layout
+    (rewinding, and inserting content before earlier content), and compressed only when the Document is written
+    """
+
+    def test_marks(self):
+        page = Page()
+        page_content: PageContentBuilder = PageContentBuilder.get(page)
+        assert PageContentBuilder.get(page) is page_content
+        assert "Bytes" not in page["Contents"]
+
+        page_content.append_instructions("q BT ET Q ")
+        mark: int = page_content.get_mark()
+        page_content.append_instructions("0 0 m 1 1 l S ")
+        page_content.rewind(mark)
+        assert page["Contents"]["DecodedBytes"] == b"q BT ET Q "
+        page_content.insert_before(0, b"1 0 0 rg ")
+        assert page["Contents"]["DecodedBytes"] == b"1 0 0 rg q BT ET Q "
+
+    def test_existing_content(self):
+        page = Page()
+        page[Name("Contents")] = Stream()
+        page["Contents"][Name("DecodedBytes")] = b"q Q "
+        page["Contents"][Name("Bytes")] = b"<stale>"
+        PageContentBuilder.get(page).append_instructions("BT ET ")
+        assert page["Contents"]["DecodedBytes"] == b"q Q BT ET "
+        assert "Bytes" not in page["Contents"]
+
+    def test_background_is_drawn_before_content(self):
+        page = Page()
+        Paragraph("Hello World", background_color=X11Color("Red")).layout(
+            page, Rectangle(Decimal(59), Decimal(500), Decimal(476), Decimal(124))
+        )
+        content: bytes = bytes(page["Contents"]["DecodedBytes"])
+        assert 0 <= content.find(b" rg") < content.find(b"BT")
+
+    def test_write_table(self):
+        pdf = Document()
+        page = Page()
+        pdf.append_page(page)
+        t = Table(number_of_rows=10, number_of_columns=5)
+        for i in range(0, 50):
+            t.add(Paragraph("cell %d" % i))
+        SingleColumnLayout(page).add(t)
+
+        # the content stream is compressed when the Document is written
+        pdf_bytes = io.BytesIO()
+        PDF.dumps(pdf_bytes, pdf)
+        pdf_bytes.seek(0)
+        l = SimpleTextExtraction()
+        PDF.loads(pdf_bytes, [l])
+        text: str = l.get_text(0)
+        assert "cell 0" in text and "cell 49" in text
+
+    def test_every_table_cell_is_written_once(self):
+        for number_of_rows in [20, 40, 80]:
+            page = Page()
+            t = Table(number_of_rows=number_of_rows, number_of_columns=5)
+            for i in range(0, number_of_rows * 5):
+                t.add(Paragraph("%d" % i, font_size=Decimal(4)))
+            t.layout(
+                page, Rectangle(Decimal(0), Decimal(0), Decimal(595), Decimal(842))
+            )
+            assert page["Contents"]["DecodedBytes"].count(b"Tj") == number_of_rows * 5
+
+if __name__ == "__main__":
+    unittest.main()
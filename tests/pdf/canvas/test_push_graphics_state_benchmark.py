@@ -0,0 +1,80 @@
+import copy
+import time
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from ptext.pdf.canvas.canvas import Canvas
+from ptext.pdf.canvas.canvas_stream_processor import CanvasStreamProcessor
+from ptext.pdf.canvas.font.simple_font.true_type_font import TrueTypeFont
+from ptext.pdf.canvas.geometry.matrix import Matrix
+
+
+class TestPushGraphicsStateBenchmark(unittest.TestCase):
+    """
+    This test checks whether the q/Q operators save and restore the graphics state,
+    and compares the cost of the q operator to deep-copying the graphics state (as it was done before)
+    """
+
+    def _build_canvas_stream_processor(self) -> CanvasStreamProcessor:
+        canvas = Canvas()
+        canvas.graphics_state.font = TrueTypeFont.true_type_font_from_file(
+            Path(__file__).parent / "font" / "Jsfont-Regular.ttf"
+        )
+        canvas.graphics_state.font_size = Decimal(12)
+        return CanvasStreamProcessor(None, canvas, [])
+
+    def test_push_and_pop_graphics_state(self):
+        processor = self._build_canvas_stream_processor()
+        canvas = processor.get_canvas()
+        q = processor.get_operator("q")
+        Q = processor.get_operator("Q")
+        cm = processor.get_operator("cm")
+        font = canvas.graphics_state.font
+
+        # q cm Q
+        canvas.graphics_state.text_matrix = Matrix.affine_matrix()
+        q.invoke(processor, [])
+        cm.invoke(processor, [Decimal(x) for x in [2, 0, 0, 2, 10, 20]])
+        canvas.graphics_state.move_text_matrix(Decimal(100))
+        assert canvas.graphics_state.ctm[2][0] == Decimal(10)
+        assert canvas.graphics_state.text_matrix[2][0] == Decimal(100)
+
+        # the font is shared (rather than copied)
+        assert canvas.graphics_state.font is font
+
+        Q.invoke(processor, [])
+        assert canvas.graphics_state.ctm[2][0] == Decimal(0)
+        assert canvas.graphics_state.text_matrix[2][0] == Decimal(0)
+        assert canvas.graphics_state.font is font
+
+    def test_benchmark_push_graphics_state(self):
+        processor = self._build_canvas_stream_processor()
+        canvas = processor.get_canvas()
+        q = processor.get_operator("q")
+        Q = processor.get_operator("Q")
+        n: int = 2000
+
+        # before: deep copy (including the Font)
+        t0: float = time.time()
+        for _ in range(0, n):
+            canvas.graphics_state_stack.append(copy.deepcopy(canvas.graphics_state))
+            Q.invoke(processor, [])
+        delta_deepcopy: float = time.time() - t0
+
+        # after: copy-on-write
+        t0 = time.time()
+        for _ in range(0, n):
+            q.invoke(processor, [])
+            Q.invoke(processor, [])
+        delta: float = time.time() - t0
+
+        print(
+            "q/Q, deepcopy: %f ms per q, copy-on-write: %f ms per q"
+            % (delta_deepcopy * 1000 / n, delta * 1000 / n)
+        )
+        assert delta < delta_deepcopy
+
+
+if __name__ == "__main__":
+    unittest.main()
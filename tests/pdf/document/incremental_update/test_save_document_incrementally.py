@@ -0,0 +1,116 @@
+import io
+import re
+import time
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from ptext.io.read.types import Name, String
+from ptext.pdf.canvas.color.color import X11Color
+from ptext.pdf.canvas.geometry.rectangle import Rectangle
+from ptext.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from ptext.pdf.canvas.layout.text.paragraph import Paragraph
+from ptext.pdf.document import Document
+from ptext.pdf.page.page import Page
+from ptext.pdf.pdf import PDF
+from ptext.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+class TestSaveDocumentIncrementally(unittest.TestCase):
+    """
+    This test checks whether a Document can be saved incrementally,
+    leaving the original bytes untouched and appending only the objects that were modified
+    """
+
+    def _build_document_bytes(self) -> bytes:
+        pdf = Document()
+        for i in range(0, 5):
+            page = Page()
+            pdf.append_page(page)
+            SingleColumnLayout(page).add(Paragraph("Hello World %d" % i))
+        out = io.BytesIO()
+        PDF.dumps(out, pdf)
+        return out.getvalue()
+
+    def _get_appended_object_numbers(self, original: bytes, updated: bytes):
+        return [
+            int(x) for x in re.findall(rb"(\d+) \d+ obj", updated[len(original) :])
+        ]
+
+    def test_append_annotation(self):
+        original: bytes = self._build_document_bytes()
+        for lazy in [False, True]:
+            doc = PDF.loads(io.BytesIO(original), lazy=lazy)
+            doc.get_page(2).append_square_annotation(
+                Rectangle(Decimal(100), Decimal(100), Decimal(50), Decimal(50)),
+                stroke_color=X11Color("Red"),
+            )
+            out = io.BytesIO()
+            PDF.dumps(out, doc, incremental_update=True)
+            updated: bytes = out.getvalue()
+
+            # the original bytes are left untouched
+            assert updated[: len(original)] == original
+            assert b"/Prev" in updated[len(original) :]
+
+            # only the modified page (and the new annotation) are appended
+            object_numbers = self._get_appended_object_numbers(original, updated)
+            assert len(object_numbers) <= 4
+
+            # the updated Document can be read
+            l = SimpleTextExtraction()
+            doc = PDF.loads(io.BytesIO(updated), [l])
+            assert doc.get_document_info().get_number_of_pages() == 5
+            assert len(doc.get_page(2)["Annots"]) == 1
+            assert "Hello World 4" in l.get_text(4)
+
+    def test_save_unmodified_document(self):
+        original: bytes = self._build_document_bytes()
+        doc = PDF.loads(io.BytesIO(original), lazy=True)
+        out = io.BytesIO()
+        PDF.dumps(out, doc, incremental_update=True)
+        updated: bytes = out.getvalue()
+        assert updated[: len(original)] == original
+
+        # at most the document information dictionary (ModDate) is appended
+        assert len(self._get_appended_object_numbers(original, updated)) <= 1
+        doc = PDF.loads(io.BytesIO(updated))
+        assert doc.get_document_info().get_number_of_pages() == 5
+
+    def test_benchmark_save_document_incrementally(self):
+        input_file: Path = Path(__file__).parent / "../../trailer/input_001.pdf"
+        original: bytes = input_file.read_bytes()
+
+        t0: float = time.time()
+        doc = PDF.loads(io.BytesIO(original))
+        doc["XRef"]["Trailer"]["Info"][Name("Author")] = String("Joris Schellekens")
+        out = io.BytesIO()
+        PDF.dumps(out, doc)
+        delta_full: float = time.time() - t0
+        size_full: int = len(out.getvalue())
+
+        t0 = time.time()
+        doc = PDF.loads(io.BytesIO(original), lazy=True)
+        doc["XRef"]["Trailer"]["Info"][Name("Author")] = String("Joris Schellekens")
+        out = io.BytesIO()
+        PDF.dumps(out, doc, incremental_update=True)
+        delta_incremental: float = time.time() - t0
+        updated: bytes = out.getvalue()
+
+        print(
+            "full save: %f s (%d bytes), incremental save: %f s (%d bytes appended)"
+            % (
+                delta_full,
+                size_full,
+                delta_incremental,
+                len(updated) - len(original),
+            )
+        )
+        assert updated[: len(original)] == original
+        assert len(updated) - len(original) < 4096
+        doc = PDF.loads(io.BytesIO(updated))
+        assert doc.get_document_info().get_author() == "Joris Schellekens"
+
+
+if __name__ == "__main__":
+    unittest.main()
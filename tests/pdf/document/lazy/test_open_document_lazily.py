@@ -0,0 +1,152 @@
+import time
+import unittest
+from pathlib import Path
+
+from ptext.io.read.types import (
+    Dictionary,
+    IndirectObjectProxy,
+    List,
+    Name,
+    Reference,
+)
+from ptext.pdf.page.page import Page
+from ptext.pdf.pdf import PDF
+from ptext.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+class TestOpenDocumentLazily(unittest.TestCase):
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        self.input_file: Path = (
+            Path(__file__).parent.parent / "count_pages" / "input_001.pdf"
+        )
+
+    def test_get_document_info_lazily(self):
+
+        with open(self.input_file, "rb") as file_handle:
+            expected_doc = PDF.loads(file_handle)
+
+        with open(self.input_file, "rb") as file_handle:
+            doc = PDF.loads(file_handle, lazy=True)
+            assert doc.get_document_info().get_number_of_pages() == 2
+            assert (
+                doc.get_document_info().get_title()
+                == expected_doc.get_document_info().get_title()
+            )
+
+            # pages have not been read (yet)
+            kids = doc["XRef"]["Trailer"]["Root"]["Pages"]["Kids"]
+            assert all([isinstance(x, IndirectObjectProxy) for x in list.__iter__(kids)])
+
+            # pages are read on first access
+            page = doc.get_page(1)
+            assert isinstance(page, Page)
+            assert doc.get_page(1) is page
+            assert (
+                page["Contents"]["DecodedBytes"]
+                == expected_doc.get_page(1)["Contents"]["DecodedBytes"]
+            )
+
+    def test_extract_text_lazily(self):
+
+        expected_listener = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            PDF.loads(file_handle, [expected_listener])
+
+        listener = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            doc = PDF.loads(file_handle, [listener], lazy=True)
+            doc.get_page(0)
+
+        assert listener.get_text(0) == expected_listener.get_text(0)
+
+    def test_unresolvable_reference_is_none(self):
+        ref: Reference = Reference(object_number=1000)
+        proxy_001 = IndirectObjectProxy(ref, lambda: None, lambda: None)
+        proxy_002 = IndirectObjectProxy(ref, lambda: None, lambda: None)
+        d: Dictionary = Dictionary()
+        d[Name("A")] = proxy_001
+        l: List = List()
+        l.append(proxy_002)
+        assert d["A"] is None
+        assert l[0] is None
+        assert list(d.values()) == [None]
+        assert list(l) == [None]
+
+    def test_containers_without_proxies_are_not_scanned(self):
+        d: Dictionary = Dictionary()
+        d[Name("A")] = Name("B")
+        l: List = List()
+        l.append(Name("C"))
+        assert type(d) is Dictionary and type(l) is List
+        d[Name("P")] = IndirectObjectProxy(
+            Reference(object_number=1), lambda: Name("D"), lambda: None
+        )
+        l.append(d["P"])
+        assert type(d) is not Dictionary and isinstance(d, Dictionary)
+        assert type(l) is List
+        assert list(d.values()) == [Name("B"), Name("D")]
+        assert type(d) is Dictionary
+
+    def test_accessors_resolve_proxies(self):
+        def _dictionary_with_proxy() -> Dictionary:
+            d: Dictionary = Dictionary()
+            d[Name("A")] = Name("B")
+            d[Name("P")] = IndirectObjectProxy(
+                Reference(object_number=1), lambda: Name("D"), lambda: None
+            )
+            return d
+
+        d: Dictionary = _dictionary_with_proxy()
+        assert d.get(Name("P")) == Name("D")
+        assert dict.__getitem__(d, Name("P")) == Name("D")
+        assert _dictionary_with_proxy().setdefault(Name("P")) == Name("D")
+        assert list(_dictionary_with_proxy().items()) == [
+            (Name("A"), Name("B")),
+            (Name("P"), Name("D")),
+        ]
+        expected = {Name("A"): Name("B"), Name("P"): Name("D")}
+        assert _dictionary_with_proxy().copy() == expected
+        assert dict(_dictionary_with_proxy()) == expected
+        assert {**_dictionary_with_proxy()} == expected
+        out: Dictionary = Dictionary()
+        out.update(_dictionary_with_proxy())
+        assert dict.__getitem__(out, Name("P")) == Name("D")
+
+    def test_get_and_items_of_lazily_read_dictionary(self):
+
+        with open(self.input_file, "rb") as file_handle:
+            expected_doc = PDF.loads(file_handle)
+        expected_pages = expected_doc["XRef"]["Trailer"]["Root"]["Pages"]
+
+        with open(self.input_file, "rb") as file_handle:
+            doc = PDF.loads(file_handle, lazy=True)
+            pages = doc["XRef"]["Trailer"]["Root"]["Pages"]
+
+            # get() resolves the pages
+            kids = pages.get("Kids")
+            assert [x["Type"] for x in kids] == [Name("Page"), Name("Page")]
+            assert not any(
+                [isinstance(x, IndirectObjectProxy) for x in list.__iter__(kids)]
+            )
+
+            # items() resolves the values of a page
+            page = doc["XRef"]["Trailer"]["Root"]["Pages"]["Kids"][0]
+            for k, v in page.items():
+                assert not isinstance(v, IndirectObjectProxy)
+            assert len(page.items()) == len(expected_pages["Kids"][0].items())
+
+    def test_open_large_document_lazily(self):
+
+        input_file: Path = Path(__file__).parent.parent.parent / "trailer" / "input_001.pdf"
+        with open(input_file, "rb") as file_handle:
+            t0: float = time.time()
+            doc = PDF.loads(file_handle, lazy=True)
+            number_of_pages = doc.get_document_info().get_number_of_pages()
+            delta: float = time.time() - t0
+        print("read document info of %d pages in %f seconds" % (number_of_pages, delta))
+        assert number_of_pages > 0
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import mmap
+import unittest
+from pathlib import Path
+
+from ptext.pdf.pdf import PDF
+
+
+class TestOpenDocumentUsingMmap(unittest.TestCase):
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        # find output dir
+        p: Path = Path(__file__).parent
+        while "output" not in [x.stem for x in p.iterdir() if x.is_dir()]:
+            p = p.parent
+        p = p / "output"
+        self.output_dir = Path(p, Path(__file__).stem.replace(".py", ""))
+        if not self.output_dir.exists():
+            self.output_dir.mkdir()
+        self.input_file: Path = (
+            Path(__file__).parent.parent / "count_pages" / "input_001.pdf"
+        )
+
+    def _get_page_text(self, doc) -> str:
+        return str(doc.get_page(0)["Contents"]["DecodedBytes"], "latin-1")
+
+    def test_open_document_using_path(self):
+
+        with open(self.input_file, "rb") as file_handle:
+            expected_doc = PDF.loads(file_handle)
+
+        doc = PDF.loads(self.input_file)
+        assert doc.get_document_info().get_number_of_pages() == 2
+        assert self._get_page_text(doc) == self._get_page_text(expected_doc)
+
+    def test_open_document_using_mmap(self):
+
+        with open(self.input_file, "rb") as file_handle:
+            expected_doc = PDF.loads(file_handle)
+
+        with open(self.input_file, "rb") as file_handle:
+            m = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+            doc = PDF.loads(m)
+        assert doc.get_document_info().get_number_of_pages() == 2
+        assert self._get_page_text(doc) == self._get_page_text(expected_doc)
+
+    def test_open_document_with_prefix_using_path(self):
+
+        # write file with junk bytes before %PDF
+        output_file: Path = self.output_dir / "output_001.pdf"
+        with open(self.input_file, "rb") as file_handle:
+            bts = file_handle.read()
+        with open(output_file, "wb") as file_handle:
+            file_handle.write(b"junk-bytes-before-the-header\n" + bts)
+
+        doc = PDF.loads(output_file)
+        assert doc.get_document_info().get_number_of_pages() == 2
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import io
+import re
+import unittest
+
+from ptext.io.read.types import Name
+from ptext.io.write.object.write_stream_transformer import WriteStreamTransformer
+from ptext.io.write.write_base_transformer import WriteTransformerContext
+from ptext.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from ptext.pdf.canvas.layout.text.paragraph import Paragraph
+from ptext.pdf.document import Document
+from ptext.pdf.page.page import Page
+from ptext.pdf.pdf import PDF
+
+
+def _build_document(number_of_pages: int) -> Document:
+    pdf = Document()
+    for i in range(0, number_of_pages):
+        page = Page()
+        pdf.append_page(page)
+        SingleColumnLayout(page).add(Paragraph(("Hello World %d " % i) * 50))
+    return pdf
+
+
+def _write(document: Document, **kwargs) -> bytes:
+    out = io.BytesIO()
+    PDF.dumps(out, document, **kwargs)
+    return out.getvalue()
+
+
+def _to_comparable(bts: bytes) -> bytes:
+    # /ID and dates differ from one save to the next
+    return re.sub(rb"<[0-9a-fA-F]{32}>|\(D:[0-9]+Z00\)", b"", bts)
+
+
+class TestWriteDocumentUsingMultipleWorkers(unittest.TestCase):
+    """
+    This test checks whether Stream objects can be compressed by multiple workers,
+    and whether the output does not depend on the number of workers
+    """
+
+    def test_output_does_not_depend_on_number_of_workers(self):
+        doc = _build_document(20)
+        bts_001: bytes = _write(doc, number_of_workers=1)
+        bts_004: bytes = _write(doc, number_of_workers=4)
+        assert _to_comparable(bts_001) == _to_comparable(bts_004)
+        assert _to_comparable(_write(doc, number_of_workers=4)) == _to_comparable(
+            bts_004
+        )
+
+        # the output can be read
+        doc = PDF.loads(io.BytesIO(bts_004))
+        assert doc.get_document_info().get_number_of_pages() == 20
+        assert b"Hello World 19" in doc.get_page(19)["Contents"]["DecodedBytes"]
+
+    def test_compression_level(self):
+        doc = _build_document(5)
+        bts_000: bytes = _write(doc, compression_level=0, number_of_workers=2)
+        bts_009: bytes = _write(doc, compression_level=9, number_of_workers=2)
+        assert len(bts_000) > len(bts_009)
+        doc = PDF.loads(io.BytesIO(bts_000))
+        assert b"Hello World 4" in doc.get_page(4)["Contents"]["DecodedBytes"]
+        with self.assertRaises(AssertionError):
+            _write(doc, compression_level=10)
+        with self.assertRaises(AssertionError):
+            _write(doc, number_of_workers=0)
+
+    def test_streams_are_compressed_a_few_at_a_time(self):
+        doc = _build_document(20)
+        context = WriteTransformerContext(
+            destination=io.BytesIO(), root_object=doc, number_of_workers=2
+        )
+        WriteStreamTransformer._compress_streams(doc, context)
+        number_of_streams: int = len(context.compressed_bytes) + len(
+            context.streams_to_compress
+        )
+        assert number_of_streams >= 20
+        assert len(context.compressed_bytes) == 2 * (
+            WriteStreamTransformer.COMPRESSION_LOOK_AHEAD
+        )
+
+        # writing a Stream starts compressing the next one
+        s = next(iter(context.streams_to_compress.values()))
+        WriteStreamTransformer._compress(s, context)
+        assert len(context.compressed_bytes) + len(context.streams_to_compress) == (
+            number_of_streams - 1
+        )
+        assert len(context.compressed_bytes) == 2 * (
+            WriteStreamTransformer.COMPRESSION_LOOK_AHEAD
+        )
+        WriteStreamTransformer._stop_compressing_streams(context)
+        assert context.compression_executor is None
+        assert len(context.compressed_bytes) == 0
+
+    def test_incremental_update_compresses_modified_streams_only(self):
+        doc = PDF.loads(io.BytesIO(_write(_build_document(5))))
+
+        # an (equal) copy of the DecodedBytes does not modify a Stream, other bytes do
+        contents_000 = doc.get_page(0)["Contents"]
+        contents_000[Name("DecodedBytes")] = bytes(
+            bytearray(contents_000["DecodedBytes"])
+        )
+        contents_001 = doc.get_page(1)["Contents"]
+        contents_001[Name("DecodedBytes")] = contents_001["DecodedBytes"] + b"\n"
+
+        context = WriteTransformerContext(
+            destination=io.BytesIO(),
+            root_object=doc,
+            incremental_update=True,
+            number_of_workers=2,
+        )
+        context.revision = vars(doc)["_revision"]
+        WriteStreamTransformer._compress_streams(doc, context)
+        assert list(context.compressed_bytes.keys()) == [id(contents_001)]
+        assert len(context.streams_to_compress) == 0
+        WriteStreamTransformer._stop_compressing_streams(context)
+
+
+if __name__ == "__main__":
+    unittest.main()
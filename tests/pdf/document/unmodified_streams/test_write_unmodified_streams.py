@@ -0,0 +1,140 @@
+import io
+import time
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from PIL import Image as PILImage
+from PIL import ImageDraw
+
+from ptext.io.read.image.image_stream_util import get_unmodified_image_stream
+from ptext.pdf.canvas.layout.image.image import Image
+from ptext.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from ptext.pdf.canvas.layout.text.paragraph import Paragraph
+from ptext.pdf.document import Document
+from ptext.pdf.page.page import Page
+from ptext.pdf.pdf import PDF
+
+
+class TestWriteUnmodifiedStreams(unittest.TestCase):
+    """
+    This test checks whether Stream objects and Image objects that were not modified (since they were read)
+    are written using their original (encoded) bytes, and whether modified objects are (re-)encoded
+    """
+
+    def _build_document_bytes(self) -> bytes:
+        pdf = Document()
+        page = Page()
+        pdf.append_page(page)
+        image = PILImage.new("RGB", (64, 64), (255, 0, 0))
+        for i in range(0, 64):
+            image.putpixel((i, i), (0, 0, 255))
+        layout = SingleColumnLayout(page)
+        layout.add(Paragraph("Hello World"))
+        layout.add(Image(image, width=Decimal(64), height=Decimal(64)))
+        out = io.BytesIO()
+        PDF.dumps(out, pdf)
+        return out.getvalue()
+
+    def _get_images(self, doc: Document):
+        return [
+            v
+            for v in doc.get_page(0)["Resources"]["XObject"].values()
+            if isinstance(v, PILImage.Image)
+        ]
+
+    def test_write_unmodified_document(self):
+        original: bytes = self._build_document_bytes()
+        doc = PDF.loads(io.BytesIO(original))
+        content_bytes: bytes = bytes(doc.get_page(0)["Contents"]["Bytes"])
+        image_bytes = [
+            bytes(get_unmodified_image_stream(x)["Bytes"]) for x in self._get_images(doc)
+        ]
+        assert len(image_bytes) == 1
+
+        out = io.BytesIO()
+        PDF.dumps(out, doc)
+        updated: bytes = out.getvalue()
+
+        # the (encoded) bytes are written as they were read
+        assert content_bytes in updated
+        for bts in image_bytes:
+            assert bts in updated
+
+    def test_write_modified_image(self):
+        original: bytes = self._build_document_bytes()
+        doc = PDF.loads(io.BytesIO(original))
+        image = self._get_images(doc)[0]
+        image_bytes: bytes = bytes(get_unmodified_image_stream(image)["Bytes"])
+        image.putpixel((0, 63), (0, 255, 0))
+        assert get_unmodified_image_stream(image) is None
+
+        out = io.BytesIO()
+        PDF.dumps(out, doc)
+        updated: bytes = out.getvalue()
+        assert image_bytes not in updated
+
+        # the modified image can be read
+        doc = PDF.loads(io.BytesIO(updated))
+        assert len(self._get_images(doc)) == 1
+
+    def test_fingerprint_on_first_access(self):
+        original: bytes = self._build_document_bytes()
+        doc = PDF.loads(io.BytesIO(original))
+        image = self._get_images(doc)[0]
+
+        # the pixels are not checksummed until they are accessed
+        assert vars(image).get("_stream_fingerprint") is None
+        assert get_unmodified_image_stream(image) is not None
+        assert vars(image).get("_stream_fingerprint") is None
+
+        # reading pixels does not modify the Image
+        assert image.getpixel((0, 0)) is not None
+        assert vars(image).get("_stream_fingerprint") is not None
+        assert get_unmodified_image_stream(image) is not None
+
+    def test_write_image_modified_using_image_draw(self):
+        original: bytes = self._build_document_bytes()
+        doc = PDF.loads(io.BytesIO(original))
+        image = self._get_images(doc)[0]
+        ImageDraw.Draw(image).rectangle([0, 0, 8, 8], fill=(0, 255, 0))
+        assert get_unmodified_image_stream(image) is None
+
+    def test_write_image_modified_using_pixel_access(self):
+        original: bytes = self._build_document_bytes()
+        doc = PDF.loads(io.BytesIO(original))
+        image = self._get_images(doc)[0]
+        image.load()[0, 0] = (0, 255, 0)
+        assert get_unmodified_image_stream(image) is None
+
+    def test_write_modified_content_stream(self):
+        original: bytes = self._build_document_bytes()
+        doc = PDF.loads(io.BytesIO(original))
+        content_bytes: bytes = bytes(doc.get_page(0)["Contents"]["Bytes"])
+        SingleColumnLayout(doc.get_page(0)).add(Paragraph("Lorem Ipsum"))
+
+        out = io.BytesIO()
+        PDF.dumps(out, doc)
+        updated: bytes = out.getvalue()
+        assert content_bytes not in updated
+        doc = PDF.loads(io.BytesIO(updated))
+        assert b"Lorem" in doc.get_page(0)["Contents"]["DecodedBytes"]
+
+    def test_write_document_with_soft_mask(self):
+        # this document contains /FlateDecode images (with /DecodeParms, /SMask and /Matte)
+        input_file: Path = Path(__file__).parent / "../../../toolkit/ocr/input_001.pdf"
+        t0: float = time.time()
+        doc = PDF.loads(input_file.open("rb"))
+        out = io.BytesIO()
+        PDF.dumps(out, doc)
+        updated: bytes = out.getvalue()
+        print("reading and writing %s: %f s" % (input_file.name, time.time() - t0))
+
+        original: bytes = input_file.read_bytes()
+        assert updated.count(b"/DCTDecode") == original.count(b"/DCTDecode")
+        assert updated.count(b"/SMask") == original.count(b"/SMask")
+        assert b"/Matte" in updated
+
+
+if __name__ == "__main__":
+    unittest.main()
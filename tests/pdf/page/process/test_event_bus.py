@@ -0,0 +1,136 @@
+import io
+import time
+import unittest
+from pathlib import Path
+
+from ptext.pdf.canvas.canvas import Canvas
+from ptext.pdf.canvas.canvas_stream_processor import CanvasStreamProcessor
+from ptext.pdf.canvas.event.begin_page_event import BeginPageEvent
+from ptext.pdf.canvas.event.chunk_of_text_render_event import ChunkOfTextRenderEvent
+from ptext.pdf.canvas.event.end_page_event import EndPageEvent
+from ptext.pdf.canvas.event.event_bus import EventBus
+from ptext.pdf.canvas.event.event_listener import Event, EventListener
+from ptext.pdf.pdf import PDF
+from ptext.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+class EventRecorder(EventListener):
+    def __init__(self, event_types=None):
+        self.events = []
+        self._event_types = event_types
+
+    def _get_event_types(self):
+        return self._event_types
+
+    def _event_occurred(self, event: Event) -> None:
+        self.events.append(event)
+
+
+class TestEventBus(unittest.TestCase):
+    """
+    This test checks whether the EventBus only notifies the EventListener(s) subscribed to a given Event type,
+    and whether Event objects nobody listens for are built at all
+    """
+
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        self.input_file: Path = (
+            Path(__file__).parent.parent.parent / "document" / "count_pages" / "input_001.pdf"
+        )
+
+    def test_subscribe(self):
+        all_events = EventRecorder()
+        page_events = EventRecorder([BeginPageEvent, EndPageEvent])
+        event_bus = EventBus().subscribe(all_events).subscribe(page_events)
+
+        assert event_bus.has_subscribers(BeginPageEvent)
+        event_bus.publish(Event())
+        event_bus.publish(BeginPageEvent(None))
+        assert len(all_events.events) == 2
+        assert len(page_events.events) == 1
+
+        # explicit Event types, and subclasses
+        class SpecialEvent(BeginPageEvent):
+            pass
+
+        special_events = EventRecorder()
+        event_bus.subscribe(special_events, [SpecialEvent])
+        event_bus.publish(SpecialEvent(None))
+        event_bus.publish(BeginPageEvent(None))
+        assert len(special_events.events) == 1
+        assert len(page_events.events) == 3
+
+        # no subscribers
+        assert not EventBus().subscribe(page_events).has_subscribers(
+            ChunkOfTextRenderEvent
+        )
+
+    def test_skip_events_without_subscribers(self):
+
+        # count ChunkOfTextRenderEvent objects being built
+        number_of_chunks: int = 0
+        prev_init = ChunkOfTextRenderEvent.__init__
+
+        def counting_init(self, graphics_state, raw_bytes):
+            nonlocal number_of_chunks
+            number_of_chunks += 1
+            prev_init(self, graphics_state, raw_bytes)
+
+        with open(self.input_file, "rb") as file_handle:
+            doc = PDF.loads(file_handle)
+
+        ChunkOfTextRenderEvent.__init__ = counting_init
+        try:
+            # only page events
+            page_events = EventRecorder([BeginPageEvent, EndPageEvent])
+            t0: float = time.time()
+            doc.get_page(0).process([page_events])
+            delta_page_events: float = time.time() - t0
+            assert len(page_events.events) == 2
+            assert number_of_chunks == 0
+
+            # text events
+            text_extraction = SimpleTextExtraction()
+            t0 = time.time()
+            doc.get_page(0).process([text_extraction])
+            delta_text_events: float = time.time() - t0
+            assert number_of_chunks > 0
+            assert "Health and Safety" in text_extraction.get_text(0)
+        finally:
+            ChunkOfTextRenderEvent.__init__ = prev_init
+
+        print(
+            "processing page, BeginPageEvent/EndPageEvent: %f s, all text events: %f s"
+            % (delta_page_events, delta_text_events)
+        )
+
+
+    def test_event_listeners_added_later_receive_events(self):
+        with open(self.input_file, "rb") as file_handle:
+            doc = PDF.loads(file_handle)
+        page = doc.get_page(0)
+        canvas = Canvas().set_parent(page)  # type: ignore [attr-defined]
+        content: bytes = page["Contents"]["DecodedBytes"]
+
+        first_listener = EventRecorder([ChunkOfTextRenderEvent])
+        canvas.add_event_listener(first_listener)
+        CanvasStreamProcessor(page, canvas, []).read(io.BytesIO(content))
+        number_of_events: int = len(first_listener.events)
+        assert number_of_events > 0
+
+        # a listener added (to the Canvas, or one of its parents) after the first render
+        second_listener = EventRecorder([ChunkOfTextRenderEvent])
+        page.add_event_listener(second_listener)
+        CanvasStreamProcessor(page, canvas, []).read(io.BytesIO(content))
+        assert len(first_listener.events) == 2 * number_of_events
+        assert len(second_listener.events) == number_of_events
+
+        # an EventBus that is set explicitly is kept
+        third_listener = EventRecorder([ChunkOfTextRenderEvent])
+        canvas.set_event_bus(EventBus().subscribe(third_listener))
+        CanvasStreamProcessor(page, canvas, []).read(io.BytesIO(content))
+        assert len(first_listener.events) == 2 * number_of_events
+        assert len(third_listener.events) == number_of_events
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import io
+import unittest
+from pathlib import Path
+
+from ptext.pdf.canvas.event.begin_page_event import BeginPageEvent
+from ptext.pdf.canvas.event.end_page_event import EndPageEvent
+from ptext.pdf.canvas.event.event_listener import Event, EventListener
+from ptext.pdf.pdf import PDF
+from ptext.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+class EventCounter(EventListener):
+    def __init__(self):
+        self.number_of_events: int = 0
+        self.number_of_pages: int = 0
+
+    def _event_occurred(self, event: Event) -> None:
+        self.number_of_events += 1
+        if isinstance(event, BeginPageEvent):
+            self.number_of_pages += 1
+
+
+class TestProcessPageOnDemand(unittest.TestCase):
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        self.input_file: Path = (
+            Path(__file__).parent.parent.parent / "document" / "count_pages" / "input_001.pdf"
+        )
+
+    def test_process_page(self):
+
+        expected_listener = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            PDF.loads(file_handle, [expected_listener])
+
+        # reading without EventListener(s) does not process any content stream
+        with open(self.input_file, "rb") as file_handle:
+            doc = PDF.loads(file_handle)
+
+        listener = SimpleTextExtraction()
+        doc.get_page(1).process([listener])
+        assert listener.get_text(0) == expected_listener.get_text(1)
+
+    def test_iter_pages(self):
+
+        with open(self.input_file, "rb") as file_handle:
+            doc = PDF.loads(file_handle)
+
+        counter = EventCounter()
+        pages = [p for p in doc.iter_pages([counter])]
+        assert len(pages) == 2
+        assert counter.number_of_pages == 2
+        assert counter.number_of_events > 2
+
+        # listeners are only attached while a Page is being processed
+        doc.get_page(0).process()
+        assert counter.number_of_pages == 2
+
+    def test_round_trip_without_processing(self):
+
+        with open(self.input_file, "rb") as file_handle:
+            doc = PDF.loads(file_handle)
+
+        out = io.BytesIO()
+        PDF.dumps(out, doc)
+
+        listener = SimpleTextExtraction()
+        PDF.loads(io.BytesIO(out.getvalue()), [listener])
+        assert "Health and Safety" in listener.get_text(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import io
+import time
+import typing
+import unittest
+
+from ptext.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
+from ptext.io.read.types import Dictionary, Reference
+from ptext.pdf.xref.xref import XREF
+
+
+def build_object_stream(number_of_objects: int, reverse_header: bool = False) -> bytes:
+    """
+    This function builds a PDF fragment containing a single (uncompressed) object stream,
+    holding number_of_objects objects (listed in reverse order in its header if reverse_header is True)
+    """
+    objs: typing.List[bytes] = [
+        b"<< /Value %d /Name /Object%d /Array [%d 0 R 1 2 3] >>" % (i, i, i + 2)
+        for i in range(0, number_of_objects)
+    ]
+    pairs: typing.List[bytes] = []
+    offset: int = 0
+    for i, obj in enumerate(objs):
+        pairs.append(b"%d %d " % (i + 2, offset))
+        offset += len(obj) + 1
+    if reverse_header:
+        pairs.reverse()
+    header: bytes = b"".join(pairs)
+    body: bytes = header + b"\n" + b"\n".join(objs) + b"\n"
+    return (
+        b"%%PDF-1.7\n1 0 obj\n<< /Type /ObjStm /N %d /First %d /Length %d >>\nstream\n"
+        % (number_of_objects, len(header) + 1, len(body))
+        + body
+        + b"\nendstream\nendobj\n"
+    )
+
+
+def build_xref(number_of_objects: int, reverse_header: bool = False) -> XREF:
+    xref: XREF = XREF()
+    xref.append(Reference(object_number=1, byte_offset=9, generation_number=0))
+    for i in range(0, number_of_objects):
+        xref.append(
+            Reference(
+                object_number=i + 2,
+                generation_number=0,
+                parent_stream_object_number=1,
+                index_in_parent_stream=(
+                    number_of_objects - 1 - i if reverse_header else i
+                ),
+            )
+        )
+    return xref
+
+
+class TestObjectStreamBenchmark(unittest.TestCase):
+    """
+    This test checks whether objects in an object stream are looked up using the offsets in its header,
+    rather than by re-reading all objects preceding them
+    """
+
+    NUMBER_OF_OBJECTS: int = 2000
+
+    def _check_all_objects(self, xref: XREF, src: io.BytesIO) -> float:
+        tok = HighLevelTokenizer(src)
+        t0: float = time.time()
+        for i in range(0, TestObjectStreamBenchmark.NUMBER_OF_OBJECTS):
+            obj = xref.get_object(Reference(object_number=i + 2), src, tok)
+            assert isinstance(obj, Dictionary)
+            assert int(obj["Value"]) == i
+            assert str(obj["Name"]) == "Object%d" % i
+            assert obj["Array"][0].object_number == i + 2
+        return time.time() - t0
+
+    def test_lookup_objects_in_object_stream(self):
+        src = io.BytesIO(build_object_stream(TestObjectStreamBenchmark.NUMBER_OF_OBJECTS))
+        delta: float = self._check_all_objects(
+            build_xref(TestObjectStreamBenchmark.NUMBER_OF_OBJECTS), src
+        )
+        print(
+            "lookup %d objects (one at a time): %f s"
+            % (TestObjectStreamBenchmark.NUMBER_OF_OBJECTS, delta)
+        )
+
+    def test_lookup_objects_in_materialized_object_stream(self):
+        src = io.BytesIO(build_object_stream(TestObjectStreamBenchmark.NUMBER_OF_OBJECTS))
+        xref: XREF = build_xref(TestObjectStreamBenchmark.NUMBER_OF_OBJECTS)
+        xref.MATERIALIZE_OBJECT_STREAMS = True
+        delta: float = self._check_all_objects(xref, src)
+        print(
+            "lookup %d objects (materialized): %f s"
+            % (TestObjectStreamBenchmark.NUMBER_OF_OBJECTS, delta)
+        )
+
+    def test_lookup_objects_in_materialized_object_stream_out_of_order(self):
+        # the header lists the objects in reverse order of their byte offset
+        src = io.BytesIO(
+            build_object_stream(TestObjectStreamBenchmark.NUMBER_OF_OBJECTS, True)
+        )
+        xref: XREF = build_xref(TestObjectStreamBenchmark.NUMBER_OF_OBJECTS, True)
+        xref.MATERIALIZE_OBJECT_STREAMS = True
+        self._check_all_objects(xref, src)
+
+    def test_object_stream_index_is_parsed_once(self):
+        src = io.BytesIO(build_object_stream(10))
+        tok = HighLevelTokenizer(src)
+        xref: XREF = build_xref(10)
+        xref.get_object(Reference(object_number=5), src, tok)
+        stream_object = xref.get_object(1, src, tok)
+        index = vars(stream_object)["_object_stream_index"]
+        xref.get_object(Reference(object_number=7), src, tok)
+        assert vars(stream_object)["_object_stream_index"] is index
+        assert [x[0] for x in index] == [x + 2 for x in range(0, 10)]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import io
+import typing
+import unittest
+
+from ptext.io.read.types import Dictionary, List, Stream
+from ptext.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from ptext.pdf.canvas.layout.text.paragraph import Paragraph
+from ptext.pdf.document import Document
+from ptext.pdf.page.page import Page
+from ptext.pdf.pdf import PDF
+from ptext.pdf.xref.stream_xref import StreamXREF
+from tests.pdf.xref.test_write_xref_benchmark import build_document_with_filler_objects
+
+
+def to_comparable(obj: typing.Any, visited: typing.Dict[int, int]) -> typing.Any:
+    """
+    This function converts an object graph to nested tuples (objects that were seen before are replaced by their index)
+    """
+    if id(obj) in visited:
+        return ("visited", visited[id(obj)])
+    if isinstance(obj, (Dictionary, List)):
+        visited[id(obj)] = len(visited)
+    if isinstance(obj, Stream):
+        return (
+            "stream",
+            bytes(obj["DecodedBytes"]),
+            tuple(
+                [
+                    (str(k), to_comparable(v, visited))
+                    for k, v in sorted(obj.items(), key=lambda x: str(x[0]))
+                    if k not in ["Bytes", "DecodedBytes", "Filter", "Length"]
+                ]
+            ),
+        )
+    if isinstance(obj, Dictionary):
+        return tuple(
+            [
+                (str(k), to_comparable(v, visited))
+                for k, v in sorted(obj.items(), key=lambda x: str(x[0]))
+            ]
+        )
+    if isinstance(obj, List):
+        return tuple([to_comparable(v, visited) for v in obj])
+    return str(obj)
+
+
+class TestWriteObjectStreams(unittest.TestCase):
+    """
+    This test checks whether a Document can be written using object streams and a cross-reference stream,
+    and whether reading it back gives the same objects as writing it with a plaintext cross-reference table
+    """
+
+    def _write_and_read(self, document: Document, use_object_streams: bool):
+        out = io.BytesIO()
+        PDF.dumps(out, document, use_object_streams=use_object_streams)
+        return out.getvalue(), PDF.loads(io.BytesIO(out.getvalue()))
+
+    def test_write_document_with_object_streams(self):
+        pdf = Document()
+        for i in range(0, 5):
+            page = Page()
+            pdf.append_page(page)
+            SingleColumnLayout(page).add(Paragraph("Hello World %d" % i))
+
+        plaintext_bytes, plaintext_doc = self._write_and_read(pdf, False)
+        object_stream_bytes, object_stream_doc = self._write_and_read(pdf, True)
+        assert b"/ObjStm" in object_stream_bytes
+        assert b"/XRef" in object_stream_bytes
+        assert b"\nxref\n" not in object_stream_bytes
+        assert isinstance(object_stream_doc["XRef"], StreamXREF)
+
+        # same object graph
+        assert to_comparable(
+            plaintext_doc["XRef"]["Trailer"]["Root"], {}
+        ) == to_comparable(object_stream_doc["XRef"]["Trailer"]["Root"], {})
+        assert object_stream_doc.get_document_info().get_number_of_pages() == 5
+
+    def test_write_document_with_many_small_objects(self):
+        doc = build_document_with_filler_objects(1000)
+        plaintext_bytes, _ = self._write_and_read(doc, False)
+        doc = build_document_with_filler_objects(1000)
+        object_stream_bytes, object_stream_doc = self._write_and_read(doc, True)
+        print(
+            "writing 1000 small objects: %d bytes (xref table), %d bytes (object streams)"
+            % (len(plaintext_bytes), len(object_stream_bytes))
+        )
+        assert len(object_stream_bytes) < len(plaintext_bytes) / 2
+        filler = object_stream_doc["XRef"]["Trailer"]["Root"]["Filler"]
+        assert len(filler) == 1000
+        assert int(filler[999]["Value"]) == 999
+
+
+if __name__ == "__main__":
+    unittest.main()
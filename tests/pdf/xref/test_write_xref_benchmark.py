@@ -0,0 +1,64 @@
+import io
+import unittest
+
+from ptext.io.read.types import Decimal, Dictionary, List, Name
+from ptext.pdf.pdf import PDF
+from tests.pdf.xref.test_xref_benchmark import build_document_with_large_xref
+
+
+def build_document_with_filler_objects(number_of_objects: int):
+    """
+    This function builds a Document whose catalog refers to number_of_objects (filler) objects,
+    all of which have the same keys (and thus the same Dictionary.__hash__)
+    """
+    doc = PDF.loads(io.BytesIO(build_document_with_large_xref(0, 0)))
+    filler = List()
+    for i in range(0, number_of_objects):
+        d = Dictionary()
+        d[Name("Type")] = Name("Filler")
+        d[Name("Value")] = Decimal(i)
+        filler.append(d)
+    doc["XRef"]["Trailer"]["Root"][Name("Filler")] = filler
+    return doc
+
+
+class TestWriteXREFBenchmark(unittest.TestCase):
+    """
+    This test checks whether a Document with many (similar) objects is written correctly,
+    benchmarks/write_xref_benchmark.py measures how long that takes
+    """
+
+    def test_write_document_with_many_objects(self):
+        for number_of_objects in [2000, 10000]:
+            doc = build_document_with_filler_objects(number_of_objects)
+            out = io.BytesIO()
+            PDF.dumps(out, doc)
+
+            # read
+            doc = PDF.loads(io.BytesIO(out.getvalue()))
+            filler = doc["XRef"]["Trailer"]["Root"]["Filler"]
+            assert len(filler) == number_of_objects
+            assert int(filler[number_of_objects - 1]["Value"]) == number_of_objects - 1
+
+    def test_write_document_with_duplicate_objects(self):
+        doc = build_document_with_filler_objects(100)
+        filler = doc["XRef"]["Trailer"]["Root"]["Filler"]
+        for i in range(0, 100):
+            d = Dictionary()
+            d[Name("Type")] = Name("Filler")
+            d[Name("Value")] = Decimal(i)
+            filler.append(d)
+
+        out = io.BytesIO()
+        PDF.dumps(out, doc)
+
+        # duplicate objects are written only once
+        assert out.getvalue().count(b"/Filler") == 100 + 1
+        doc = PDF.loads(io.BytesIO(out.getvalue()))
+        filler = doc["XRef"]["Trailer"]["Root"]["Filler"]
+        assert len(filler) == 200
+        assert int(filler[150]["Value"]) == 50
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import io
+import time
+import typing
+import unittest
+
+from ptext.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
+from ptext.io.read.types import Decimal, Dictionary, Reference
+from ptext.pdf.pdf import PDF
+from ptext.pdf.xref.plaintext_xref import PlainTextXREF
+from ptext.pdf.xref.xref import XREF
+
+
+def build_document_with_large_xref(
+    number_of_objects: int, number_of_updated_objects: int
+) -> bytes:
+    """
+    This function builds a PDF with number_of_objects (filler) objects,
+    followed by an incremental update (with a /Prev xref section) that replaces
+    the first number_of_updated_objects of them
+    """
+    out = io.BytesIO()
+    out.write(b"%PDF-1.7\n")
+    offsets: typing.List[int] = [0]
+
+    # catalog, pages, page
+    for obj in [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] >>",
+    ]:
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (len(offsets) - 1, obj))
+
+    # filler
+    for i in range(0, number_of_objects):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n<< /Value %d >>\nendobj\n" % (len(offsets) - 1, i))
+
+    # xref
+    start_of_xref: int = out.tell()
+    out.write(b"xref\n0 %d\n" % len(offsets))
+    out.write(b"0000000000 65535 f\r\n")
+    for o in offsets[1:]:
+        out.write(b"%010d 00000 n\r\n" % o)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\n" % len(offsets))
+    out.write(b"startxref\n%d\n%%%%EOF\n" % start_of_xref)
+
+    # incremental update
+    updated_offsets: typing.List[int] = []
+    for i in range(0, number_of_updated_objects):
+        updated_offsets.append(out.tell())
+        out.write(b"%d 0 obj\n<< /Value %d /Updated true >>\nendobj\n" % (4 + i, i))
+    start_of_updated_xref: int = out.tell()
+    out.write(b"xref\n4 %d\n" % number_of_updated_objects)
+    for o in updated_offsets:
+        out.write(b"%010d 00000 n\r\n" % o)
+    out.write(
+        b"trailer\n<< /Size %d /Root 1 0 R /Prev %d >>\n"
+        % (len(offsets), start_of_xref)
+    )
+    out.write(b"startxref\n%d\n%%%%EOF\n" % start_of_updated_xref)
+    return out.getvalue()
+
+
+class TestXREFBenchmark(unittest.TestCase):
+    """
+    This test builds a PDF with a large XREF (and an incremental update),
+    and checks whether looking up / merging XREF entries scales linearly
+    """
+
+    NUMBER_OF_OBJECTS: int = 20000
+    NUMBER_OF_UPDATED_OBJECTS: int = 10000
+    LOOKUP_STRIDE: int = 10
+
+    def test_merge_and_lookup(self):
+
+        bts = build_document_with_large_xref(
+            TestXREFBenchmark.NUMBER_OF_OBJECTS,
+            TestXREFBenchmark.NUMBER_OF_UPDATED_OBJECTS,
+        )
+        src = io.BytesIO(bts)
+        tok = HighLevelTokenizer(src)
+
+        # read both XREF sections
+        t0: float = time.time()
+        most_recent_xref = PlainTextXREF()
+        most_recent_xref.read(src, tok)
+        prev = int(most_recent_xref["Trailer"]["Prev"])
+        previous_xref = PlainTextXREF()
+        previous_xref.read(src, tok, prev)
+        delta_read: float = time.time() - t0
+
+        # merge
+        t0 = time.time()
+        xref: XREF = most_recent_xref.merge(previous_xref)
+        delta_merge: float = time.time() - t0
+        assert len(xref) == TestXREFBenchmark.NUMBER_OF_OBJECTS + 4
+
+        # lookup
+        t0 = time.time()
+        number_of_lookups: int = 0
+        for i in range(
+            0, TestXREFBenchmark.NUMBER_OF_OBJECTS, TestXREFBenchmark.LOOKUP_STRIDE
+        ):
+            number_of_lookups += 1
+            obj = xref.get_object(Reference(object_number=4 + i), src, tok)
+            assert isinstance(obj, Dictionary)
+            assert int(obj["Value"]) == i
+            assert ("Updated" in obj) == (
+                i < TestXREFBenchmark.NUMBER_OF_UPDATED_OBJECTS
+            )
+        delta_lookup: float = time.time() - t0
+
+        print(
+            "read: %f s, merge: %f s, lookup %d objects: %f s"
+            % (
+                delta_read,
+                delta_merge,
+                number_of_lookups,
+                delta_lookup,
+            )
+        )
+
+    def test_read_document_with_large_xref(self):
+
+        bts = build_document_with_large_xref(
+            TestXREFBenchmark.NUMBER_OF_OBJECTS,
+            TestXREFBenchmark.NUMBER_OF_UPDATED_OBJECTS,
+        )
+        t0: float = time.time()
+        doc = PDF.loads(io.BytesIO(bts), lazy=True)
+        assert doc.get_document_info().get_number_of_pages() == Decimal(1)
+        assert len(doc["XRef"]) == TestXREFBenchmark.NUMBER_OF_OBJECTS + 4
+        print("read document: %f s" % (time.time() - t0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+import json
+import os
+import signal
+import time
+import typing
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from PIL import Image as PILImage  # type: ignore [import]
+
+from ptext.pdf.canvas.layout.image.image import Image
+from ptext.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from ptext.pdf.canvas.layout.text.paragraph import Paragraph
+from ptext.pdf.document import Document
+from ptext.pdf.page.page import Page
+from ptext.pdf.pdf import PDF
+from ptext.toolkit.batch.batch_extraction import BatchExtraction
+
+
+def _get_process_id(x: int) -> typing.Tuple[int, typing.Optional[str]]:
+    return os.getpid(), None
+
+
+def _double_or_kill_worker(x: int) -> typing.Tuple[int, typing.Optional[str]]:
+    # -1 kills the worker process (running this task), 0 never finishes
+    if x == -1:
+        os.kill(os.getpid(), signal.SIGKILL)
+    if x == 0:
+        time.sleep(3600)
+    return 2 * x, None
+
+
+class TestBatchExtraction(unittest.TestCase):
+    """
+    This test checks whether information can be extracted from many PDFs (using multiple processes),
+    whether results are merged in page order, and whether a PDF that can not be read does not affect the others
+    """
+
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        # find output dir
+        p: Path = Path(__file__).parent
+        while "output" not in [x.stem for x in p.iterdir() if x.is_dir()]:
+            p = p.parent
+        p = p / "output"
+        self.output_dir = Path(p, Path(__file__).stem.replace(".py", ""))
+        if not self.output_dir.exists():
+            self.output_dir.mkdir()
+
+    def _build_input_files(self):
+        for i, number_of_pages in enumerate([1, 7, 2]):
+            pdf = Document()
+            for j in range(0, number_of_pages):
+                page = Page()
+                pdf.append_page(page)
+                SingleColumnLayout(page).add(Paragraph("Hello World %d %d" % (i, j)))
+            with open(self.output_dir / ("input_%03d.pdf" % i), "wb") as fh:
+                PDF.dumps(fh, pdf)
+        # this file can not be read
+        (self.output_dir / "input_003.pdf").write_bytes(b"%PDF-1.7\n")
+
+    def test_extract_text(self):
+        self._build_input_files()
+        results_001 = list(
+            BatchExtraction(number_of_workers=1, pages_per_task=3).extract(
+                [self.output_dir]
+            )
+        )
+        results_002 = list(
+            BatchExtraction(number_of_workers=2, pages_per_task=3).extract(
+                [self.output_dir]
+            )
+        )
+        assert results_001 == results_002
+        assert [Path(x["file"]).name for x in results_002] == [
+            "input_%03d.pdf" % i for i in range(0, 4)
+        ]
+
+        # pages are in order
+        assert results_002[1]["number_of_pages"] == 7
+        assert [x["page"] for x in results_002[1]["pages"]] == list(range(0, 7))
+        for j, x in enumerate(results_002[1]["pages"]):
+            assert x["text"] == "Hello World 1 %d" % j
+
+        # a file that can not be read has an error
+        assert "error" in results_002[3]
+        assert "pages" not in results_002[3]
+
+        # results are JSON serializable
+        json.dumps(results_002)
+
+    def test_extract_regex(self):
+        self._build_input_files()
+        results = list(
+            BatchExtraction(
+                "regex", "World 1 [36]", number_of_workers=2, pages_per_task=2
+            ).extract([self.output_dir / "input_001.pdf"])
+        )
+        assert len(results) == 1
+        matches = [
+            (x["page"], m["string"])
+            for x in results[0]["pages"]
+            for m in x["matches"]
+        ]
+        assert matches == [(3, "World 1 3"), (6, "World 1 6")]
+
+    def test_extract_images_from_files_with_the_same_name(self):
+        # (other tests extract from every file in output_dir)
+        root_dir: Path = self.output_dir.parent / (self.output_dir.name + "_images")
+        for i, color in enumerate([(255, 0, 0), (0, 0, 255)]):
+            input_dir: Path = root_dir / ("input_%d" % i)
+            input_dir.mkdir(parents=True, exist_ok=True)
+            pdf = Document()
+            page = Page()
+            pdf.append_page(page)
+            SingleColumnLayout(page).add(
+                Image(
+                    PILImage.new("RGB", (64, 64), color),
+                    width=Decimal(64),
+                    height=Decimal(64),
+                )
+            )
+            with open(input_dir / "input.pdf", "wb") as fh:
+                PDF.dumps(fh, pdf)
+        image_dir: Path = root_dir / "images"
+        image_dir.mkdir(exist_ok=True)
+        results = list(
+            BatchExtraction("images", number_of_workers=1, output_dir=image_dir).extract(
+                [root_dir / "input_0", root_dir / "input_1"]
+            )
+        )
+
+        # both images are kept
+        paths = [Path(x["pages"][0]["images"][0]["path"]) for x in results]
+        assert paths[0] != paths[1]
+        assert PILImage.open(paths[0]).getpixel((32, 32))[0] > 200
+        assert PILImage.open(paths[1]).getpixel((32, 32))[2] > 200
+
+    def test_worker_process_dies(self):
+        batch_extraction = BatchExtraction(number_of_workers=2)
+        results = list(
+            batch_extraction._map(_double_or_kill_worker, [1, 2, -1, 3, 4, -1, 5])
+        )
+        assert [x[0] for x in results] == [2, 4, None, 6, 8, None, 10]
+        assert results[2][1].startswith("ProcessError")
+        assert results[5][1].startswith("ProcessError")
+        batch_extraction._stop_workers()
+
+    def test_timeout(self):
+        t0: float = time.time()
+        batch_extraction = BatchExtraction(number_of_workers=2, timeout=2)
+        results = list(batch_extraction._map(_double_or_kill_worker, [1, 0, 2, 3]))
+        assert [x[0] for x in results] == [2, None, 4, 6]
+        assert results[1][1].startswith("TimeoutError")
+        assert time.time() - t0 < 60
+        batch_extraction._stop_workers()
+
+    def test_single_worker_runs_in_worker_process(self):
+        batch_extraction = BatchExtraction(number_of_workers=1, tasks_per_worker=2)
+        results = list(batch_extraction._map(_get_process_id, [1, 2, 3]))
+        batch_extraction._stop_workers()
+        assert os.getpid() not in [x[0] for x in results]
+
+        # the worker process is replaced after tasks_per_worker tasks
+        assert results[0][0] == results[1][0]
+        assert results[1][0] != results[2][0]
+
+if __name__ == "__main__":
+    unittest.main()